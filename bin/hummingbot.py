@@ -3,6 +3,7 @@
 import path_util        # noqa: F401
 import asyncio
 import errno
+import logging
 import socket
 from typing import (
     List,
@@ -23,6 +24,8 @@ from hummingbot import (
 from hummingbot.client.ui import login_prompt
 from hummingbot.client.ui.stdout_redirection import patch_stdout
 from hummingbot.core.utils.async_utils import safe_gather
+from hummingbot.core.utils.http_session_registry import HTTPSessionRegistry
+from hummingbot.core.utils.import_profiler import ImportProfiler
 
 
 def detect_available_port(starting_port: int) -> int:
@@ -39,6 +42,15 @@ def detect_available_port(starting_port: int) -> int:
         return current_port
 
 
+def log_startup_import_times():
+    """
+    Stops profiling the startup imports, and logs the slowest ones at the DEBUG level.
+    """
+    profiler: ImportProfiler = ImportProfiler.startup_profiler()
+    profiler.stop()
+    logging.getLogger(__name__).debug(profiler.format_report())
+
+
 async def main():
     await create_yml_files()
 
@@ -47,6 +59,10 @@ async def main():
 
     read_system_configs_from_yml()
 
+    http_session_registry: HTTPSessionRegistry = HTTPSessionRegistry.shared_instance()
+    http_session_registry.limit_per_host = global_config_map.get("http_connection_limit_per_host").value
+    http_session_registry.keepalive_timeout = global_config_map.get("http_keepalive_timeout").value
+
     hb = HummingbotApplication.main_application()
 
     with patch_stdout(log_field=hb.app.log_field):
@@ -56,6 +72,7 @@ async def main():
         init_logging("hummingbot_logs.yml",
                      override_log_level=global_config_map.get("log_level").value,
                      dev_mode=dev_mode)
+        log_startup_import_times()
         tasks: List[Coroutine] = [hb.run()]
         if global_config_map.get("debug_console").value:
             if not hasattr(__builtins__, "help"):
@@ -31,6 +31,7 @@ from hummingbot.core.utils.async_utils import safe_gather
 from hummingbot.core.management.console import start_management_console
 from bin.hummingbot import (
     detect_available_port,
+    log_startup_import_times,
 )
 from hummingbot.client.settings import CONF_FILE_PATH
 from hummingbot.client.config.security import Security
@@ -115,6 +116,7 @@ async def quick_start(args):
         init_logging("hummingbot_logs.yml",
                      override_log_level=log_level,
                      dev_mode=dev_mode)
+        log_startup_import_times()
 
         if hb.strategy_file_name is not None and hb.strategy_name is not None:
             await write_config_to_yml(hb.strategy_name, hb.strategy_file_name)
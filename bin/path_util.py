@@ -14,3 +14,7 @@ else:
     from os.path import join, realpath
     import sys
     sys.path.insert(0, realpath(join(__file__, "../../")))
+
+# Profile the imports made from here on, until the application has started - see log_startup_import_times().
+from hummingbot.core.utils.import_profiler import ImportProfiler
+ImportProfiler.startup_profiler().start()
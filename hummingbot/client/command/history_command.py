@@ -13,7 +13,11 @@ from typing import (
     TYPE_CHECKING,
     List
 )
-from hummingbot.client.performance_analysis import calculate_trade_performance
+from hummingbot.client.performance_analysis import (
+    calculate_trade_performance,
+    calculate_trade_performance_from_asset_deltas,
+    TradePerformanceAccumulator
+)
 from hummingbot.market.market_base import MarketBase
 from hummingbot.strategy.market_trading_pair_tuple import MarketTradingPairTuple
 from datetime import datetime
@@ -87,9 +91,20 @@ class HistoryCommand:
 
     def _calculate_trade_performance(self,  # type: HummingbotApplication
                                      ) -> Tuple[Dict, Dict]:
-        raw_queried_trades = self._get_trades_from_session(self.init_time, config_file_path=self.strategy_file_name)
         current_strategy_name: str = self.markets_recorder.strategy_name
         conversion_rate = secondary_market_conversion_rate(current_strategy_name)
+        trade_performance_accumulator: Optional[TradePerformanceAccumulator] = \
+            self.markets_recorder.trade_performance_accumulator
+        if trade_performance_accumulator is not None:
+            return calculate_trade_performance_from_asset_deltas(
+                self.market_trading_pair_tuples,
+                trade_performance_accumulator.asset_delta_stats(current_strategy_name,
+                                                                self.market_trading_pair_tuples),
+                self.starting_balances,
+                secondary_market_conversion_rate=conversion_rate
+            )
+
+        raw_queried_trades = self._get_trades_from_session(self.init_time, config_file_path=self.strategy_file_name)
         trade_performance_stats, market_trading_pair_stats = calculate_trade_performance(
             current_strategy_name,
             self.market_trading_pair_tuples,
@@ -94,7 +94,7 @@ class StartCommand:
         try:
             config_path: str = self.strategy_file_name
             self.start_time = time.time() * 1e3  # Time in milliseconds
-            self.clock = Clock(ClockMode.REALTIME)
+            self.clock = Clock(ClockMode.REALTIME, tick_size=global_config_map.get("clock_tick_size").value)
             if self.wallet is not None:
                 self.clock.add_iterator(self.wallet)
             for market in self.markets.values():
@@ -19,6 +19,7 @@ from hummingbot.client.config.security import Security
 from hummingbot.user.user_balances import UserBalances
 from hummingbot.client.settings import required_exchanges, DEXES
 from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.core.utils.http_session_registry import HTTPSessionRegistry
 
 from typing import TYPE_CHECKING
 if TYPE_CHECKING:
@@ -71,6 +72,11 @@ class StatusCommand:
         if global_config_map.get("paper_trade_enabled").value:
             self._notify("\n  Paper Trading ON: All orders are simulated, and no real orders are placed.")
         self._notify(self.strategy.format_status() + "\n")
+        if self.clock is not None:
+            self._notify(self.clock.format_status() + "\n")
+        if self.markets_recorder is not None:
+            self._notify(self.markets_recorder.format_status() + "\n")
+        self._notify(HTTPSessionRegistry.shared_instance().format_status() + "\n")
         self.application_warning()
         if self._script_iterator is not None:
             self._script_iterator.request_status()
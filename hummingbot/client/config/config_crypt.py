@@ -1,7 +1,17 @@
+import asyncio
+from concurrent.futures import ProcessPoolExecutor
 from eth_account import Account
 from hummingbot.core.utils.wallet_setup import get_key_file_path
 import json
 import os
+import time
+from typing import (
+    Any,
+    Dict,
+    List,
+    Optional,
+    Tuple
+)
 from eth_keyfile.keyfile import (
     Random,
     get_default_work_factor_for_kdf,
@@ -14,7 +24,8 @@ from eth_keyfile.keyfile import (
     big_endian_to_int,
     encrypt_aes_ctr,
     keccak,
-    int_to_big_endian
+    int_to_big_endian,
+    decode_keyfile_json
 )
 from hummingbot.client.settings import ENCYPTED_CONF_PREFIX, ENCYPTED_CONF_POSTFIX
 
@@ -68,6 +79,52 @@ def decrypt_file(file_path, password):
     return secured_value.decode()
 
 
+def read_keyfile_json(file_path: str) -> Dict[str, Any]:
+    with open(file_path, 'r') as f:
+        return json.load(f)
+
+
+def decrypt_keyfile(keyfile_json: Dict[str, Any], password: str) -> Tuple[bytes, float]:
+    """
+    Decrypts a version 3 key file, like Account.decrypt() does. This runs in the processes of decrypt_keyfiles().
+
+    :return: the decrypted value and the decryption time in seconds
+    """
+    version = keyfile_json.get('version')
+    if version != 3:
+        raise ValueError(f"Unsupported key file version: {version}")
+    start = time.perf_counter()
+    value = decode_keyfile_json(keyfile_json, password.encode())
+    return value, time.perf_counter() - start
+
+
+async def decrypt_keyfiles(file_paths: List[str],
+                           password: str,
+                           decrypted: Optional[Dict[str, Tuple[bytes, float]]] = None) -> Dict[str, Tuple[bytes, float]]:
+    """
+    Decrypts key files concurrently in a process pool, so their KDFs - which are made to be slow - run on all the CPU
+    cores. Every key file has its own random salt, so each one runs its own KDF.
+
+    :param decrypted: key files already decrypted with the password, by file path - they are not decrypted again
+    :return: the decrypted value and the decryption time in seconds of each key file, by file path
+    """
+    decrypted = decrypted or {}
+    results: Dict[str, Tuple[bytes, float]] = {file_path: decrypted[file_path]
+                                               for file_path in file_paths if file_path in decrypted}
+    pending_paths: List[str] = [file_path for file_path in file_paths if file_path not in decrypted]
+    keyfile_jsons: List[Dict[str, Any]] = [read_keyfile_json(file_path) for file_path in pending_paths]
+
+    if len(pending_paths) > 0:
+        ev_loop: asyncio.AbstractEventLoop = asyncio.get_event_loop()
+        with ProcessPoolExecutor(max_workers=min(len(pending_paths), os.cpu_count() or 1)) as executor:
+            values: List[Tuple[bytes, float]] = await asyncio.gather(*[
+                ev_loop.run_in_executor(executor, decrypt_keyfile, keyfile_json, password)
+                for keyfile_json in keyfile_jsons
+            ])
+        results.update(zip(pending_paths, values))
+    return {file_path: results[file_path] for file_path in file_paths}
+
+
 def _create_v3_keyfile_json(message_to_encrypt, password, kdf="pbkdf2", work_factor=None):
     """
     Encrypt message by a given password.
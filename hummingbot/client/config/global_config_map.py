@@ -12,7 +12,8 @@ from hummingbot.client.settings import (
 )
 from hummingbot.client.config.config_validators import (
     validate_bool,
-    validate_decimal
+    validate_decimal,
+    validate_int
 )
 
 
@@ -71,6 +72,27 @@ global_config_map = {
                   type_str="float",
                   required_if=lambda: False,
                   default=900),
+    "clock_tick_size":
+        ConfigVar(key="clock_tick_size",
+                  prompt=None,
+                  type_str="float",
+                  required_if=lambda: False,
+                  validator=lambda v: validate_decimal(v, 0, 60, inclusive=False),
+                  default=1.0),
+    "http_connection_limit_per_host":
+        ConfigVar(key="http_connection_limit_per_host",
+                  prompt=None,
+                  type_str="int",
+                  required_if=lambda: False,
+                  validator=lambda v: validate_int(v, 0, 1000),
+                  default=20),
+    "http_keepalive_timeout":
+        ConfigVar(key="http_keepalive_timeout",
+                  prompt=None,
+                  type_str="float",
+                  required_if=lambda: False,
+                  validator=lambda v: validate_decimal(v, min_value=0),
+                  default=30.0),
     "logger_override_whitelist":
         ConfigVar(key="logger_override_whitelist",
                   prompt=None,
@@ -297,6 +319,13 @@ global_config_map = {
                   default=-100,
                   validator=lambda v: validate_decimal(v, Decimal(-100), Decimal(100)),
                   required_if=lambda: global_config_map["kill_switch_enabled"].value),
+    "order_book_snapshot_cache_enabled":
+        ConfigVar(key="order_book_snapshot_cache_enabled",
+                  prompt="Would you like to cache order book snapshots on disk for faster restarts? (Yes/No) >>> ",
+                  required_if=lambda: False,
+                  type_str="bool",
+                  default=False,
+                  validator=validate_bool),
     "telegram_enabled":
         ConfigVar(key="telegram_enabled",
                   prompt="Would you like to enable telegram? >>> ",
@@ -4,18 +4,26 @@ from hummingbot.client.config.config_crypt import (
     secure_config_key,
     encrypted_file_exists,
     encrypt_n_save_config_value,
-    encrypted_file_path
+    encrypted_file_path,
+    read_keyfile_json,
+    decrypt_keyfile,
+    decrypt_keyfiles
 )
 from hummingbot.core.utils.wallet_setup import (
     list_wallets,
     unlock_wallet,
-    import_and_save_wallet
+    import_and_save_wallet,
+    get_wallet_file_path
 )
 from hummingbot.client.config.global_config_map import global_config_map
 from hummingbot.core.utils.async_utils import safe_ensure_future
-from hummingbot.core.utils.async_call_scheduler import AsyncCallScheduler
+from hummingbot.logger import HummingbotLogger
 import asyncio
+from hexbytes import HexBytes
+import logging
 from os import unlink
+from os.path import basename
+from typing import Dict, Optional
 
 
 class Security:
@@ -23,7 +31,16 @@ class Security:
     password = None
     _secure_configs = {}
     _private_keys = {}
+    _login_decrypted = {}
+    _decryption_times = {}
     _decryption_done = asyncio.Event()
+    _sec_logger: Optional[HummingbotLogger] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._sec_logger is None:
+            cls._sec_logger = logging.getLogger(__name__)
+        return cls._sec_logger
 
     @staticmethod
     def new_password_required():
@@ -48,23 +65,20 @@ class Security:
     def login(cls, password):
         encrypted_files = list_encrypted_file_paths()
         wallets = list_wallets()
-        if encrypted_files:
+        cls._login_decrypted.clear()
+        if encrypted_files or wallets:
+            file_path = encrypted_files[0] if encrypted_files else get_wallet_file_path(wallets[0])
             try:
-                decrypt_file(encrypted_files[0], password)
-            except ValueError as err:
-                if str(err) == "MAC mismatch":
-                    return False
-                raise err
-        elif wallets:
-            try:
-                unlock_wallet(wallets[0], password)
+                decrypted = decrypt_keyfile(read_keyfile_json(file_path), password)
             except ValueError as err:
                 if str(err) == "MAC mismatch":
                     return False
                 raise err
+            # The key file decrypted to check the password is not decrypted again by decrypt_all().
+            cls._login_decrypted[file_path] = decrypted
         Security.password = password
-        coro = AsyncCallScheduler.shared_instance().call_async(cls.decrypt_all, timeout_seconds=30)
-        safe_ensure_future(coro)
+        cls._decryption_done.clear()
+        safe_ensure_future(cls.decrypt_all())
         return True
 
     @classmethod
@@ -79,16 +93,27 @@ class Security:
         return cls._private_keys[public_key]
 
     @classmethod
-    def decrypt_all(cls):
+    async def decrypt_all(cls):
         cls._secure_configs.clear()
         cls._private_keys.clear()
+        cls._decryption_times.clear()
         cls._decryption_done.clear()
         encrypted_files = list_encrypted_file_paths()
-        for file in encrypted_files:
-            cls.decrypt_file(file)
-        wallets = list_wallets()
-        for wallet in wallets:
-            cls.unlock_wallet(wallet)
+        wallets = {get_wallet_file_path(wallet): wallet for wallet in list_wallets()}
+        try:
+            decrypted = await decrypt_keyfiles(encrypted_files + list(wallets.keys()), Security.password,
+                                               cls._login_decrypted)
+        finally:
+            cls._login_decrypted.clear()
+        for file_path, (value, decryption_time) in decrypted.items():
+            if file_path in wallets:
+                cls._private_keys[wallets[file_path]] = HexBytes(value)
+            else:
+                cls._secure_configs[secure_config_key(file_path)] = value.decode()
+            cls._decryption_times[basename(file_path)] = decryption_time
+            cls.logger().debug(f"Decrypted {basename(file_path)} in {decryption_time:.3f}s.")
+        cls.logger().info(f"Decrypted {len(decrypted)} key files, "
+                          f"{sum(cls._decryption_times.values()):.3f}s of decryption time in total.")
         cls._decryption_done.set()
 
     @classmethod
@@ -129,6 +154,13 @@ class Security:
     def private_keys(cls):
         return cls._private_keys.copy()
 
+    @classmethod
+    def decryption_times(cls) -> Dict[str, float]:
+        """
+        Seconds it took to decrypt each key file at login, by file name.
+        """
+        return cls._decryption_times.copy()
+
     @classmethod
     async def wait_til_decryption_done(cls):
         await cls._decryption_done.wait()
@@ -3,32 +3,26 @@
 import asyncio
 from collections import deque
 import logging
+from os.path import join
 import time
-from typing import List, Dict, Optional, Tuple, Set, Deque
+from typing import List, Dict, Optional, Tuple, Set, Deque, Type, TYPE_CHECKING
 
 from hummingbot.client.command import __all__ as commands
 from hummingbot.core.clock import Clock
+from hummingbot import data_path
+from hummingbot.core.data_type.order_book_snapshot_cache import OrderBookSnapshotCache
 from hummingbot.core.data_type.order_book_tracker import OrderBookTrackerDataSourceType
 from hummingbot.core.data_type.user_stream_tracker import UserStreamTrackerDataSourceType
 from hummingbot.logger import HummingbotLogger
 from hummingbot.logger.application_warning import ApplicationWarning
-from hummingbot.market.binance.binance_market import BinanceMarket
-from hummingbot.market.bittrex.bittrex_market import BittrexMarket
-from hummingbot.market.kucoin.kucoin_market import KucoinMarket
-from hummingbot.market.coinbase_pro.coinbase_pro_market import CoinbaseProMarket
-from hummingbot.market.huobi.huobi_market import HuobiMarket
-from hummingbot.market.liquid.liquid_market import LiquidMarket
-from hummingbot.market.eterbase.eterbase_market import EterbaseMarket
+from hummingbot.market.connector_registry import (
+    CONNECTOR_SETTINGS,
+    get_market_class
+)
 from hummingbot.market.market_base import MarketBase
 from hummingbot.market.paper_trade import create_paper_trade_market
-from hummingbot.market.radar_relay.radar_relay_market import RadarRelayMarket
-from hummingbot.market.bamboo_relay.bamboo_relay_market import BambooRelayMarket
-from hummingbot.market.dolomite.dolomite_market import DolomiteMarket
-from hummingbot.market.kraken.kraken_market import KrakenMarket
 from hummingbot.model.sql_connection_manager import SQLConnectionManager
 
-from hummingbot.wallet.ethereum.ethereum_chain import EthereumChain
-from hummingbot.wallet.ethereum.web3_wallet import Web3Wallet
 from hummingbot.client.ui.keybindings import load_key_bindings
 from hummingbot.client.ui.parser import load_parser, ThrowingArgumentParser
 from hummingbot.client.ui.hummingbot_cli import HummingbotCLI
@@ -45,24 +39,19 @@ from hummingbot.notifier.notifier_base import NotifierBase
 from hummingbot.notifier.telegram_notifier import TelegramNotifier
 from hummingbot.strategy.market_trading_pair_tuple import MarketTradingPairTuple
 from hummingbot.market.markets_recorder import MarketsRecorder
+from hummingbot.client.performance_analysis import TradePerformanceAccumulator
 from hummingbot.client.config.security import Security
-
+if TYPE_CHECKING:
+    from hummingbot.wallet.ethereum.web3_wallet import Web3Wallet
 
 s_logger = None
 
-MARKET_CLASSES = {
-    "bamboo_relay": BambooRelayMarket,
-    "binance": BinanceMarket,
-    "coinbase_pro": CoinbaseProMarket,
-    "huobi": HuobiMarket,
-    "liquid": LiquidMarket,
-    "radar_relay": RadarRelayMarket,
-    "dolomite": DolomiteMarket,
-    "bittrex": BittrexMarket,
-    "kucoin": KucoinMarket,
-    "eterbase": EterbaseMarket,
-    "kraken": KrakenMarket
-}
+
+def get_market_class_or_base(market_name: str) -> Type[MarketBase]:
+    # The market modules - and their dependencies - are only imported when a market of theirs is used.
+    if market_name in CONNECTOR_SETTINGS:
+        return get_market_class(market_name)
+    return MarketBase
 
 
 class HummingbotApplication(*commands):
@@ -93,7 +82,7 @@ class HummingbotApplication(*commands):
         )
 
         self.markets: Dict[str, MarketBase] = {}
-        self.wallet: Optional[Web3Wallet] = None
+        self.wallet: Optional["Web3Wallet"] = None
         # strategy file name and name get assigned value after import or create command
         self.strategy_file_name: str = None
         self.strategy_name: str = None
@@ -199,13 +188,13 @@ class HummingbotApplication(*commands):
 
     @staticmethod
     def _initialize_market_assets(market_name: str, trading_pairs: List[str]) -> List[Tuple[str, str]]:
-        market_class: MarketBase = MARKET_CLASSES.get(market_name, MarketBase)
+        market_class: MarketBase = get_market_class_or_base(market_name)
         market_trading_pairs: List[Tuple[str, str]] = [market_class.split_trading_pair(trading_pair) for trading_pair in trading_pairs]
         return market_trading_pairs
 
     @staticmethod
     def _convert_to_exchange_trading_pair(market_name: str, hb_trading_pair: List[str]) -> List[str]:
-        market_class: MarketBase = MARKET_CLASSES.get(market_name, MarketBase)
+        market_class: MarketBase = get_market_class_or_base(market_name)
         return [market_class.convert_to_exchange_trading_pair(trading_pair) for trading_pair in hb_trading_pair]
 
     def _initialize_wallet(self, token_trading_pairs: List[str]):
@@ -217,6 +206,9 @@ class HummingbotApplication(*commands):
         ethereum_rpc_url = global_config_map.get("ethereum_rpc_url").value
         erc20_token_addresses = get_erc20_token_addresses(token_trading_pairs)
 
+        from hummingbot.wallet.ethereum.ethereum_chain import EthereumChain
+        from hummingbot.wallet.ethereum.web3_wallet import Web3Wallet
+
         chain_name: str = global_config_map.get("ethereum_chain_name").value
         self.wallet: Web3Wallet = Web3Wallet(
             private_key=private_key,
@@ -233,12 +225,13 @@ class HummingbotApplication(*commands):
         for market_name, trading_pairs in market_names:
             if market_name not in market_trading_pairs_map:
                 market_trading_pairs_map[market_name] = []
-            market_class: MarketBase = MARKET_CLASSES.get(market_name, MarketBase)
+            market_class: MarketBase = get_market_class_or_base(market_name)
             for trading_pair in trading_pairs:
                 exchange_trading_pair: str = market_class.convert_to_exchange_trading_pair(trading_pair)
                 market_trading_pairs_map[market_name].append(exchange_trading_pair)
 
         for market_name, trading_pairs in market_trading_pairs_map.items():
+            market_class: Type[MarketBase] = get_market_class_or_base(market_name)
             if global_config_map.get("paper_trade_enabled").value:
                 try:
                     market = create_paper_trade_market(market_name, trading_pairs)
@@ -251,7 +244,7 @@ class HummingbotApplication(*commands):
             elif market_name == "binance":
                 binance_api_key = global_config_map.get("binance_api_key").value
                 binance_api_secret = global_config_map.get("binance_api_secret").value
-                market = BinanceMarket(
+                market = market_class(
                     binance_api_key,
                     binance_api_secret,
                     order_book_tracker_data_source_type=OrderBookTrackerDataSourceType.EXCHANGE_API,
@@ -261,7 +254,7 @@ class HummingbotApplication(*commands):
 
             elif market_name == "radar_relay":
                 assert self.wallet is not None
-                market = RadarRelayMarket(
+                market = market_class(
                     wallet=self.wallet,
                     ethereum_rpc_url=ethereum_rpc_url,
                     trading_pairs=trading_pairs,
@@ -272,7 +265,7 @@ class HummingbotApplication(*commands):
                 assert self.wallet is not None
                 use_coordinator = global_config_map.get("bamboo_relay_use_coordinator").value
                 pre_emptive_soft_cancels = global_config_map.get("bamboo_relay_pre_emptive_soft_cancels").value
-                market = BambooRelayMarket(
+                market = market_class(
                     wallet=self.wallet,
                     ethereum_rpc_url=ethereum_rpc_url,
                     trading_pairs=trading_pairs,
@@ -286,24 +279,24 @@ class HummingbotApplication(*commands):
                 coinbase_pro_secret_key = global_config_map.get("coinbase_pro_secret_key").value
                 coinbase_pro_passphrase = global_config_map.get("coinbase_pro_passphrase").value
 
-                market = CoinbaseProMarket(coinbase_pro_api_key,
-                                           coinbase_pro_secret_key,
-                                           coinbase_pro_passphrase,
-                                           trading_pairs=trading_pairs,
-                                           trading_required=self._trading_required)
+                market = market_class(coinbase_pro_api_key,
+                                      coinbase_pro_secret_key,
+                                      coinbase_pro_passphrase,
+                                      trading_pairs=trading_pairs,
+                                      trading_required=self._trading_required)
             elif market_name == "huobi":
                 huobi_api_key = global_config_map.get("huobi_api_key").value
                 huobi_secret_key = global_config_map.get("huobi_secret_key").value
-                market = HuobiMarket(huobi_api_key,
-                                     huobi_secret_key,
-                                     order_book_tracker_data_source_type=OrderBookTrackerDataSourceType.EXCHANGE_API,
-                                     trading_pairs=trading_pairs,
-                                     trading_required=self._trading_required)
+                market = market_class(huobi_api_key,
+                                      huobi_secret_key,
+                                      order_book_tracker_data_source_type=OrderBookTrackerDataSourceType.EXCHANGE_API,
+                                      trading_pairs=trading_pairs,
+                                      trading_required=self._trading_required)
             elif market_name == "liquid":
                 liquid_api_key = global_config_map.get("liquid_api_key").value
                 liquid_secret_key = global_config_map.get("liquid_secret_key").value
 
-                market = LiquidMarket(liquid_api_key,
+                market = market_class(liquid_api_key,
                                       liquid_secret_key,
                                       order_book_tracker_data_source_type=OrderBookTrackerDataSourceType.EXCHANGE_API,
                                       user_stream_tracker_data_source_type=UserStreamTrackerDataSourceType.EXCHANGE_API,
@@ -312,7 +305,7 @@ class HummingbotApplication(*commands):
             elif market_name == "dolomite":
                 assert self.wallet is not None
                 is_test_net: bool = global_config_map.get("ethereum_chain_name").value == "DOLOMITE_TEST"
-                market = DolomiteMarket(
+                market = market_class(
                     wallet=self.wallet,
                     ethereum_rpc_url=ethereum_rpc_url,
                     order_book_tracker_data_source_type=OrderBookTrackerDataSourceType.EXCHANGE_API,
@@ -323,16 +316,16 @@ class HummingbotApplication(*commands):
             elif market_name == "bittrex":
                 bittrex_api_key = global_config_map.get("bittrex_api_key").value
                 bittrex_secret_key = global_config_map.get("bittrex_secret_key").value
-                market = BittrexMarket(bittrex_api_key,
-                                       bittrex_secret_key,
-                                       order_book_tracker_data_source_type=OrderBookTrackerDataSourceType.EXCHANGE_API,
-                                       trading_pairs=trading_pairs,
-                                       trading_required=self._trading_required)
+                market = market_class(bittrex_api_key,
+                                      bittrex_secret_key,
+                                      order_book_tracker_data_source_type=OrderBookTrackerDataSourceType.EXCHANGE_API,
+                                      trading_pairs=trading_pairs,
+                                      trading_required=self._trading_required)
             elif market_name == "kucoin":
                 kucoin_api_key = global_config_map.get("kucoin_api_key").value
                 kucoin_secret_key = global_config_map.get("kucoin_secret_key").value
                 kucoin_passphrase = global_config_map.get("kucoin_passphrase").value
-                market = KucoinMarket(kucoin_api_key,
+                market = market_class(kucoin_api_key,
                                       kucoin_passphrase,
                                       kucoin_secret_key,
                                       order_book_tracker_data_source_type=OrderBookTrackerDataSourceType.EXCHANGE_API,
@@ -342,15 +335,15 @@ class HummingbotApplication(*commands):
                 eterbase_api_key = global_config_map.get("eterbase_api_key").value
                 eterbase_secret_key = global_config_map.get("eterbase_secret_key").value
                 eterbase_account = global_config_map.get("eterbase_account").value
-                market = EterbaseMarket(eterbase_api_key,
-                                        eterbase_secret_key,
-                                        trading_pairs=trading_pairs,
-                                        trading_required=self._trading_required,
-                                        eterbase_account=eterbase_account)
+                market = market_class(eterbase_api_key,
+                                      eterbase_secret_key,
+                                      trading_pairs=trading_pairs,
+                                      trading_required=self._trading_required,
+                                      eterbase_account=eterbase_account)
             elif market_name == "kraken":
                 kraken_api_key = global_config_map.get("kraken_api_key").value
                 kraken_secret_key = global_config_map.get("kraken_secret_key").value
-                market = KrakenMarket(kraken_api_key,
+                market = market_class(kraken_api_key,
                                       kraken_secret_key,
                                       order_book_tracker_data_source_type=OrderBookTrackerDataSourceType.EXCHANGE_API,
                                       trading_pairs=trading_pairs,
@@ -358,13 +351,26 @@ class HummingbotApplication(*commands):
             else:
                 raise ValueError(f"Market name {market_name} is invalid.")
 
+            if global_config_map.get("order_book_snapshot_cache_enabled").value and \
+                    market.order_book_tracker is not None:
+                market.order_book_tracker.snapshot_cache = OrderBookSnapshotCache(
+                    join(data_path(), "order_book_snapshots", market_name)
+                )
+
             self.markets[market_name]: MarketBase = market
 
+        # The performance of the trades so far in this session is kept up to date as trades are filled, for the kill
+        # switch and the history command.
+        trade_performance_accumulator: TradePerformanceAccumulator = TradePerformanceAccumulator()
+        trade_performance_accumulator.add_trades(
+            self._get_trades_from_session(self.init_time, config_file_path=self.strategy_file_name)
+        )
         self.markets_recorder = MarketsRecorder(
             self.trade_fill_db,
             list(self.markets.values()),
             self.strategy_file_name,
             self.strategy_name,
+            trade_performance_accumulator,
         )
         self.markets_recorder.start()
 
@@ -3,7 +3,8 @@ from decimal import Decimal
 from typing import (
     Tuple,
     Dict,
-    List)
+    List,
+    Optional)
 from hummingbot.core.event.events import TradeType
 from hummingbot.model.trade_fill import TradeFill
 from hummingbot.strategy.market_trading_pair_tuple import MarketTradingPairTuple
@@ -41,6 +42,83 @@ def calculate_trade_asset_delta_with_fees(trade: TradeFill) -> Tuple[Decimal, De
     return net_base_delta, net_quote_delta
 
 
+class TradePerformanceAccumulator:
+    """
+    Keeps the spent and acquired amounts of each asset per strategy, market and trading pair up to date as trades are
+    added, so the performance can be calculated without querying and going through every past trade again.
+    """
+
+    def __init__(self):
+        self._trading_pair_stats: Dict[Tuple[str, str, str], Dict[str, any]] = {}
+
+    def add_trade(self, trade: TradeFill):
+        key: Tuple[str, str, str] = (trade.strategy, trade.market, trade.symbol)
+        stats: Optional[Dict[str, any]] = self._trading_pair_stats.get(key)
+        if stats is None:
+            stats = {
+                "starting_quote_rate": Decimal(repr(trade.price)),
+                "asset": defaultdict(lambda: {"spent": s_decimal_0, "acquired": s_decimal_0}),
+                "trade_count": 0
+            }
+            self._trading_pair_stats[key] = stats
+
+        # For each trade, calculate the spent and acquired amount of the corresponding base and quote asset
+        asset_stats: Dict[str, Dict[str, Decimal]] = stats["asset"]
+        base_asset: str = trade.base_asset.upper()
+        quote_asset: str = trade.quote_asset.upper()
+        base_delta, quote_delta = calculate_trade_asset_delta_with_fees(trade)
+        if trade.trade_type == TradeType.SELL.name:
+            asset_stats[base_asset]["spent"] += base_delta
+            asset_stats[quote_asset]["acquired"] += quote_delta
+        elif trade.trade_type == TradeType.BUY.name:
+            asset_stats[base_asset]["acquired"] += base_delta
+            asset_stats[quote_asset]["spent"] += quote_delta
+        stats["trade_count"] += 1
+
+    def add_trades(self, trades: List[TradeFill]):
+        for trade in trades:
+            self.add_trade(trade)
+
+    def asset_delta_stats(self,
+                          current_strategy_name: str,
+                          market_trading_pair_tuples: List[MarketTradingPairTuple]
+                          ) -> Dict[MarketTradingPairTuple, Dict[str, any]]:
+        """
+        Same as calculate_asset_delta_from_trades(), for the trades added so far. The returned dictionaries are copies,
+        so they can be modified by the caller.
+        """
+        market_trading_pair_stats: Dict[MarketTradingPairTuple, Dict[str, any]] = {}
+        for market_trading_pair_tuple in market_trading_pair_tuples:
+            asset_stats: Dict[str, Dict[str, Decimal]] = defaultdict(
+                lambda: {"spent": s_decimal_0, "acquired": s_decimal_0}
+            )
+            asset_stats[market_trading_pair_tuple.base_asset.upper()] = {"spent": s_decimal_0, "acquired": s_decimal_0}
+            asset_stats[market_trading_pair_tuple.quote_asset.upper()] = {"spent": s_decimal_0, "acquired": s_decimal_0}
+
+            stats: Optional[Dict[str, any]] = self._trading_pair_stats.get((
+                current_strategy_name,
+                market_trading_pair_tuple.market.display_name,
+                market_trading_pair_tuple.trading_pair
+            ))
+            if stats is None:
+                market_trading_pair_stats[market_trading_pair_tuple] = {
+                    "starting_quote_rate": market_trading_pair_tuple.get_mid_price(),
+                    "asset": asset_stats,
+                    "trade_count": 0
+                }
+                continue
+
+            for asset, amounts in stats["asset"].items():
+                asset_stats[asset] = dict(amounts)
+            market_trading_pair_stats[market_trading_pair_tuple] = {
+                "starting_quote_rate": stats["starting_quote_rate"],
+                "asset": asset_stats,
+                "trade_count": stats["trade_count"]
+            }
+
+        return market_trading_pair_stats
+
+
 def calculate_asset_delta_from_trades(current_strategy_name: str,
                                       market_trading_pair_tuples: List[MarketTradingPairTuple],
                                       raw_queried_trades: List[TradeFill],
@@ -55,51 +133,10 @@ def calculate_asset_delta_from_trades(current_strategy_name: str,
     :param raw_queried_trades: List of queried trades
     :return: Dictionary consisting of spent and acquired amount for each assets
     """
-    market_trading_pair_stats: Dict[MarketTradingPairTuple, Dict[str, Decimal]] = {}
-    for market_trading_pair_tuple in market_trading_pair_tuples:
-        asset_stats: Dict[str, Dict[str, Decimal]] = defaultdict(
-            lambda: {"spent": s_decimal_0, "acquired": s_decimal_0}
-        )
-        asset_stats[market_trading_pair_tuple.base_asset.upper()] = {"spent": s_decimal_0, "acquired": s_decimal_0}
-        asset_stats[market_trading_pair_tuple.quote_asset.upper()] = {"spent": s_decimal_0, "acquired": s_decimal_0}
-
-        if raw_queried_trades is not None:
-            queried_trades: List[TradeFill] = [t for t in raw_queried_trades if (
-                t.strategy == current_strategy_name
-                and t.market == market_trading_pair_tuple.market.display_name
-                and t.symbol == market_trading_pair_tuple.trading_pair
-            )]
-        else:
-            queried_trades = []
-
-        if not queried_trades:
-            market_trading_pair_stats[market_trading_pair_tuple] = {
-                "starting_quote_rate": market_trading_pair_tuple.get_mid_price(),
-                "asset": asset_stats,
-                "trade_count": 0
-            }
-            continue
-
-        for trade in queried_trades:
-            # For each trade, calculate the spent and acquired amount of the corresponding base and quote asset
-            trade_side: str = trade.trade_type
-            base_asset: str = trade.base_asset.upper()
-            quote_asset: str = trade.quote_asset.upper()
-            base_delta, quote_delta = calculate_trade_asset_delta_with_fees(trade)
-            if trade_side == TradeType.SELL.name:
-                asset_stats[base_asset]["spent"] += base_delta
-                asset_stats[quote_asset]["acquired"] += quote_delta
-            elif trade_side == TradeType.BUY.name:
-                asset_stats[base_asset]["acquired"] += base_delta
-                asset_stats[quote_asset]["spent"] += quote_delta
-
-        market_trading_pair_stats[market_trading_pair_tuple] = {
-            "starting_quote_rate": Decimal(repr(queried_trades[0].price)),
-            "asset": asset_stats,
-            "trade_count": len(queried_trades)
-        }
-
-    return market_trading_pair_stats
+    accumulator: TradePerformanceAccumulator = TradePerformanceAccumulator()
+    if raw_queried_trades is not None:
+        accumulator.add_trades(raw_queried_trades)
+    return accumulator.asset_delta_stats(current_strategy_name, market_trading_pair_tuples)
 
 
 def calculate_trade_performance(current_strategy_name: str,
@@ -120,13 +157,37 @@ def calculate_trade_performance(current_strategy_name: str,
     :return: Dictionary consisting of total spent and acquired across whole portfolio in quote value,
              as well as individual assets
     """
-    trade_performance_stats: Dict[str, Decimal] = {}
-    # The final stats will be in primary quote unit for arbitrage and maker quote unit for xemm
-    primary_trading_pair: str = market_trading_pair_tuples[0].trading_pair
-    market_trading_pair_stats: Dict[str, Dict[str, Decimal]] = calculate_asset_delta_from_trades(
+    market_trading_pair_stats: Dict[MarketTradingPairTuple, Dict[str, any]] = calculate_asset_delta_from_trades(
         current_strategy_name,
         market_trading_pair_tuples,
         raw_queried_trades)
+    return calculate_trade_performance_from_asset_deltas(market_trading_pair_tuples,
+                                                         market_trading_pair_stats,
+                                                         starting_balances,
+                                                         secondary_market_conversion_rate)
+
+
+def calculate_trade_performance_from_asset_deltas(market_trading_pair_tuples: List[MarketTradingPairTuple],
+                                                  market_trading_pair_stats: Dict[MarketTradingPairTuple,
+                                                                                  Dict[str, any]],
+                                                  starting_balances: Dict[str, Dict[str, Decimal]],
+                                                  secondary_market_conversion_rate: Decimal = Decimal("1")) \
+        -> Tuple[Dict, Dict]:
+    """
+    Calculate total spent and acquired amount for the whole portfolio in quote value, from the spent and acquired
+    amounts of calculate_asset_delta_from_trades() or TradePerformanceAccumulator.asset_delta_stats().
+
+    :param market_trading_pair_tuples: Current MarketTradingPairTuple
+    :param market_trading_pair_stats: Spent and acquired amount for each asset, updated in place with the results
+    :param starting_balances: Dictionary of starting asset balance for each market, as balance_snapshot on
+    history command.
+    :param secondary_market_conversion_rate: A conversion rate for a secondary market if it differs from the primary.
+    :return: Dictionary consisting of total spent and acquired across whole portfolio in quote value,
+             as well as individual assets
+    """
+    trade_performance_stats: Dict[str, Decimal] = {}
+    # The final stats will be in primary quote unit for arbitrage and maker quote unit for xemm
+    primary_trading_pair: str = market_trading_pair_tuples[0].trading_pair
 
     # Calculate total spent and acquired amount for each trading pair in primary quote value
     for market_trading_pair_tuple, trading_pair_stats in market_trading_pair_stats.items():
@@ -1,5 +1,7 @@
 # distutils: language=c++
 
+from libc.stdint cimport int64_t
+
 cdef class Clock:
     cdef:
         object _clock_mode
@@ -10,3 +12,12 @@ cdef class Clock:
         list _current_context
         double _current_tick
         bint _started
+        dict _tick_duration_histograms
+        int64_t _tick_count
+        int64_t _overrun_count
+        int64_t _skipped_tick_count
+        double _last_overrun_log_time
+        bint _fast_forward
+
+    cdef double c_get_next_wakeup_time(self)
+    cdef c_record_tick(self, double tick_end_time, object slowest_iterator, double slowest_duration)
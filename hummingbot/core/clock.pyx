@@ -1,19 +1,37 @@
 # distutils: language=c++
 
+from libc.math cimport (
+    ceil,
+    INFINITY,
+    isfinite
+)
 import asyncio
 import logging
+import pandas as pd
 import time
-from typing import List
+from typing import (
+    Dict,
+    List
+)
 
 from hummingbot.core.time_iterator import TimeIterator
 from hummingbot.core.time_iterator cimport TimeIterator
 from hummingbot.core.clock_mode import ClockMode
+from hummingbot.core.utils.duration_histogram import DurationHistogram
 from hummingbot.logger import HummingbotLogger
 
 s_logger = None
 
 
+def iterator_name(iterator: TimeIterator) -> str:
+    display_name = getattr(iterator, "display_name", None)
+    return display_name if isinstance(display_name, str) else type(iterator).__name__
+
+
 cdef class Clock:
+    TICK_DURATION_BUCKETS = (0.001, 0.005, 0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 5.0)
+    OVERRUN_LOG_INTERVAL = 60.0
+
     @classmethod
     def logger(cls) -> HummingbotLogger:
         global s_logger
@@ -21,13 +39,22 @@ cdef class Clock:
             s_logger = logging.getLogger(__name__)
         return s_logger
 
-    def __init__(self, clock_mode: ClockMode, tick_size: float = 1.0, start_time: float = 0.0, end_time: float = 0.0):
+    def __init__(self,
+                 clock_mode: ClockMode,
+                 tick_size: float = 1.0,
+                 start_time: float = 0.0,
+                 end_time: float = 0.0,
+                 fast_forward: bool = False):
         """
         :param clock_mode: either real time mode or back testing mode
-        :param tick_size: time interval of each tick
+        :param tick_size: time interval of each tick, in seconds - it can be a fraction of a second
         :param start_time: (back testing mode only) start of simulation in UNIX timestamp
         :param end_time: (back testing mode only) end of simulation in UNIX timestamp. NaN to simulate to end of data.
+        :param fast_forward: (back testing mode only) skip the ticks before the earliest next wake up time of the child
+                             iterators, see TimeIterator.c_get_next_wakeup_time()
         """
+        if not tick_size > 0:
+            raise ValueError(f"tick_size must be positive, got {tick_size}.")
         self._clock_mode = clock_mode
         self._tick_size = tick_size
         self._start_time = start_time
@@ -36,6 +63,12 @@ cdef class Clock:
         self._child_iterators = []
         self._current_context = None
         self._started = False
+        self._tick_duration_histograms = {}
+        self._tick_count = 0
+        self._overrun_count = 0
+        self._skipped_tick_count = 0
+        self._last_overrun_log_time = -1e10
+        self._fast_forward = fast_forward
 
     @property
     def clock_mode(self) -> ClockMode:
@@ -57,6 +90,36 @@ cdef class Clock:
     def current_timestamp(self) -> float:
         return self._current_tick
 
+    @property
+    def fast_forward(self) -> bool:
+        return self._fast_forward
+
+    @property
+    def tick_duration_histograms(self) -> Dict[TimeIterator, DurationHistogram]:
+        """
+        (real time mode only) How long the c_tick() calls of each child iterator took.
+        """
+        return self._tick_duration_histograms.copy()
+
+    @property
+    def tick_count(self) -> int:
+        return self._tick_count
+
+    @property
+    def overrun_count(self) -> int:
+        """
+        (real time mode only) Number of ticks that were still running when the next tick was due.
+        """
+        return self._overrun_count
+
+    @property
+    def skipped_tick_count(self) -> int:
+        """
+        Number of ticks skipped - in real time mode because they were due while an overrunning tick was running, and in
+        fast forward back tests because no child iterator had work to do at them.
+        """
+        return self._skipped_tick_count
+
     def __enter__(self) -> Clock:
         if self._current_context is not None:
             raise EnvironmentError("Clock context is not re-entrant.")
@@ -81,6 +144,22 @@ cdef class Clock:
             (<TimeIterator>iterator).c_stop(self)
             self._current_context.remove(iterator)
         self._child_iterators.remove(iterator)
+        self._tick_duration_histograms.pop(iterator, None)
+
+    def format_status(self) -> str:
+        lines = [f"  Clock: {self._tick_count} ticks of {self._tick_size}s, {self._overrun_count} overran, "
+                 f"{self._skipped_tick_count} skipped."]
+        if len(self._tick_duration_histograms) > 0:
+            durations_df = pd.DataFrame(
+                data=[[iterator_name(iterator),
+                       histogram.count,
+                       f"{histogram.average * 1e3:.3f}",
+                       f"{histogram.max * 1e3:.3f}"]
+                      for iterator, histogram in self._tick_duration_histograms.items()],
+                columns=["Iterator", "Ticks", "Avg (ms)", "Max (ms)"]
+            )
+            lines.extend(["    " + line for line in durations_df.to_string(index=False).split("\n")])
+        return "\n".join(lines)
 
     async def run(self):
         await self.run_til(float("nan"))
@@ -88,13 +167,26 @@ cdef class Clock:
     async def run_til(self, timestamp: float):
         cdef:
             TimeIterator child_iterator
+            object ev_loop = asyncio.get_event_loop()
             double now = time.time()
-            double next_tick_time
+            double wall_clock_offset
+            int64_t tick_index
+            int64_t next_tick_index
+            double iterator_start
+            double iterator_duration
+            double slowest_duration
+            object slowest_iterator
+            object histogram
 
         if self._current_context is None:
             raise EnvironmentError("run() and run_til() can only be used within the context of a `with...` statement.")
 
-        self._current_tick = (now // self._tick_size) * self._tick_size
+        # The ticks are scheduled on the event loop's monotonic clock, so wall clock adjustments neither bunch them up
+        # nor stall them. Their timestamps are multiples of the tick size computed from the tick index, so they don't
+        # accumulate rounding errors with fractional tick sizes.
+        wall_clock_offset = now - ev_loop.time()
+        tick_index = <int64_t>(now // self._tick_size)
+        self._current_tick = tick_index * self._tick_size
         if not self._started:
             for ci in self._current_context:
                 child_iterator = ci
@@ -103,18 +195,23 @@ cdef class Clock:
 
         try:
             while True:
-                now = time.time()
+                now = ev_loop.time() + wall_clock_offset
                 if now >= timestamp:
                     return
 
-                # Sleep until the next tick
-                next_tick_time = ((now // self._tick_size) + 1) * self._tick_size
-                await asyncio.sleep(next_tick_time - now)
-                self._current_tick = next_tick_time
+                # Sleep until the next tick. The ticks that came due while the last one overran are skipped.
+                next_tick_index = max(<int64_t>(now // self._tick_size) + 1, tick_index + 1)
+                self._skipped_tick_count += next_tick_index - tick_index - 1
+                tick_index = next_tick_index
+                self._current_tick = tick_index * self._tick_size
+                await asyncio.sleep(self._current_tick - now)
 
                 # Run through all the child iterators.
+                slowest_iterator = None
+                slowest_duration = 0
                 for ci in self._current_context:
                     child_iterator = ci
+                    iterator_start = time.perf_counter()
                     try:
                         child_iterator.c_tick(self._current_tick)
                     except StopIteration:
@@ -122,13 +219,42 @@ cdef class Clock:
                         return
                     except Exception:
                         self.logger().error("Unexpected error running clock tick.", exc_info=True)
+                    iterator_duration = time.perf_counter() - iterator_start
+                    histogram = self._tick_duration_histograms.get(child_iterator)
+                    if histogram is None:
+                        histogram = DurationHistogram(self.TICK_DURATION_BUCKETS)
+                        self._tick_duration_histograms[child_iterator] = histogram
+                    histogram.add(iterator_duration)
+                    if iterator_duration > slowest_duration:
+                        slowest_iterator = child_iterator
+                        slowest_duration = iterator_duration
+                self.c_record_tick(ev_loop.time() + wall_clock_offset, slowest_iterator, slowest_duration)
         finally:
             for ci in self._current_context:
                 child_iterator = ci
                 child_iterator._clock = None
 
+    cdef c_record_tick(self, double tick_end_time, object slowest_iterator, double slowest_duration):
+        self._tick_count += 1
+        if tick_end_time <= self._current_tick + self._tick_size:
+            return
+
+        # The tick was still running when the next one was due.
+        self._overrun_count += 1
+        if tick_end_time - self._last_overrun_log_time >= self.OVERRUN_LOG_INTERVAL:
+            self._last_overrun_log_time = tick_end_time
+            self.logger().warning(
+                f"Clock tick at {self._current_tick} ended {tick_end_time - self._current_tick:.3f}s later, over the "
+                f"{self._tick_size}s tick size. The slowest iterator was "
+                f"{iterator_name(slowest_iterator) if slowest_iterator is not None else None} at "
+                f"{slowest_duration:.3f}s. {self._overrun_count} of {self._tick_count} ticks overran, and "
+                f"{self._skipped_tick_count} ticks were skipped so far."
+            )
+
     def backtest_til(self, timestamp: float):
-        cdef TimeIterator child_iterator
+        cdef:
+            TimeIterator child_iterator
+            double ticks_to_wakeup
 
         if not self._started:
             for ci in self._child_iterators:
@@ -138,6 +264,17 @@ cdef class Clock:
 
         try:
             while not (self._current_tick >= timestamp):
+                if self._fast_forward:
+                    # Jump to the tick before the first one at or after the next wake up time, or the end time.
+                    # The tolerance keeps rounding errors of the tick sum from overshooting a wake up time by a tick.
+                    ticks_to_wakeup = ceil((self.c_get_next_wakeup_time() - self._current_tick) / self._tick_size
+                                           - 1e-6)
+                    if timestamp == timestamp:
+                        ticks_to_wakeup = min(ticks_to_wakeup,
+                                              ceil((timestamp - self._current_tick) / self._tick_size - 1e-6))
+                    if isfinite(ticks_to_wakeup) and ticks_to_wakeup > 1:
+                        self._current_tick += (ticks_to_wakeup - 1) * self._tick_size
+                        self._skipped_tick_count += <int64_t>ticks_to_wakeup - 1
                 self._current_tick += self._tick_size
                 for ci in self._child_iterators:
                     child_iterator = ci
@@ -154,6 +291,19 @@ cdef class Clock:
                 child_iterator = ci
                 child_iterator._clock = None
 
+    cdef double c_get_next_wakeup_time(self):
+        cdef:
+            TimeIterator child_iterator
+            double next_wakeup_time = INFINITY
+            double wakeup_time
+
+        for ci in self._child_iterators:
+            child_iterator = ci
+            wakeup_time = child_iterator.c_get_next_wakeup_time()
+            if wakeup_time < next_wakeup_time:
+                next_wakeup_time = wakeup_time
+        return next_wakeup_time
+
     def backtest(self):
         self.backtest_til(self._end_time)
 
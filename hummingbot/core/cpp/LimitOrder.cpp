@@ -8,6 +8,7 @@ LimitOrder::LimitOrder() {
     this->quoteCurrency = "";
     this->price = NULL;
     this->quantity = NULL;
+    this->doublePrice = 0;
 }
 
 LimitOrder::LimitOrder(std::string clientOrderID,
@@ -26,6 +27,12 @@ LimitOrder::LimitOrder(std::string clientOrderID,
     this->quantity = quantity;
     Py_XINCREF(price);
     Py_XINCREF(quantity);
+    // The price is also kept as a double, so orders are compared and matched without calling into Python.
+    this->doublePrice = PyFloat_AsDouble(price);
+    if (this->doublePrice == -1.0 && PyErr_Occurred()) {
+        PyErr_Clear();
+        this->doublePrice = Py_NAN;
+    }
 }
 
 LimitOrder::LimitOrder(const LimitOrder &other) {
@@ -36,6 +43,7 @@ LimitOrder::LimitOrder(const LimitOrder &other) {
     this->quoteCurrency = other.quoteCurrency;
     this->price = other.price;
     this->quantity = other.quantity;
+    this->doublePrice = other.doublePrice;
     Py_XINCREF(this->price);
     Py_XINCREF(this->quantity);
 }
@@ -45,6 +53,7 @@ LimitOrder::~LimitOrder() {
     Py_XDECREF(this->quantity);
     this->price = NULL;
     this->quantity = NULL;
+    this->doublePrice = 0;
 }
 
 LimitOrder &LimitOrder::operator=(const LimitOrder &other) {
@@ -55,6 +64,7 @@ LimitOrder &LimitOrder::operator=(const LimitOrder &other) {
     this->quoteCurrency = other.quoteCurrency;
     this->price = other.price;
     this->quantity = other.quantity;
+    this->doublePrice = other.doublePrice;
     Py_XINCREF(this->price);
     Py_XINCREF(this->quantity);
 
@@ -62,7 +72,11 @@ LimitOrder &LimitOrder::operator=(const LimitOrder &other) {
 }
 
 bool operator<(LimitOrder const &a, LimitOrder const &b) {
-    return (bool)(PyObject_RichCompareBool(a.price, b.price, Py_LT));
+    if (a.doublePrice == b.doublePrice) {
+        // Orders at the same price are all kept, ordered by their client order IDs.
+        return a.clientOrderID < b.clientOrderID;
+    }
+    return a.doublePrice < b.doublePrice;
 }
 
 std::string LimitOrder::getClientOrderID() const {
@@ -89,6 +103,10 @@ PyObject *LimitOrder::getPrice() const {
     return this->price;
 }
 
+double LimitOrder::getDoublePrice() const {
+    return this->doublePrice;
+}
+
 PyObject *LimitOrder::getQuantity() const {
     return this->quantity;
 }
@@ -12,6 +12,7 @@ class LimitOrder {
     std::string quoteCurrency;
     PyObject *price;
     PyObject *quantity;
+    double doublePrice;
 
     public:
         LimitOrder();
@@ -33,6 +34,7 @@ class LimitOrder {
         std::string getBaseCurrency() const;
         std::string getQuoteCurrency() const;
         PyObject *getPrice() const;
+        double getDoublePrice() const;
         PyObject *getQuantity() const;
 };
 
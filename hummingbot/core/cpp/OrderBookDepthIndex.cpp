@@ -0,0 +1,408 @@
+#include "OrderBookDepthIndex.h"
+
+// Node 0 is the empty subtree, with a size and sums of 0.
+static const int32_t NIL = 0;
+
+OrderBookDepthIndex::OrderBookDepthIndex() {
+    Node nil = {0, 0, 0, 0, 0, NIL, NIL, 0};
+    this->nodes.push_back(nil);
+    this->root = NIL;
+    this->randomState = 2463534242u;
+    this->dirty = true;
+}
+
+void OrderBookDepthIndex::rebuild(const std::set<OrderBookEntry> &book) {
+    std::vector<int32_t> rightSpine;
+
+    this->nodes.resize(1);
+    this->freeNodes.clear();
+    this->nodes.reserve(book.size() + 1);
+
+    // Linear time treap construction from the sorted levels, keeping the nodes with the highest priorities on the
+    // right spine of the tree built so far.
+    for (std::set<OrderBookEntry>::const_iterator it = book.begin(); it != book.end(); ++it) {
+        int32_t node = this->newNode(it->getPrice(), it->getAmount(), this->nextPriority());
+        int32_t last = NIL;
+        while (!rightSpine.empty() && this->nodes[rightSpine.back()].priority < this->nodes[node].priority) {
+            last = rightSpine.back();
+            rightSpine.pop_back();
+        }
+        this->nodes[node].left = last;
+        if (!rightSpine.empty()) {
+            this->nodes[rightSpine.back()].right = node;
+        }
+        rightSpine.push_back(node);
+    }
+    this->root = rightSpine.empty() ? NIL : rightSpine.front();
+    this->pullAll(this->root);
+    this->dirty = false;
+}
+
+void OrderBookDepthIndex::update(double price, double amount) {
+    if (this->dirty) {
+        return;
+    }
+    if (amount > 0) {
+        this->root = this->insert(this->root, price, amount);
+    } else {
+        this->root = this->erase(this->root, price);
+    }
+}
+
+void OrderBookDepthIndex::eraseAbove(double price) {
+    // Removes the levels priced above price, e.g. the bids that were truncated off a crossed book.
+    while (!this->dirty && this->root != NIL) {
+        int32_t node = this->root;
+        while (this->nodes[node].right != NIL) {
+            node = this->nodes[node].right;
+        }
+        if (!(this->nodes[node].price > price)) {
+            break;
+        }
+        this->root = this->erase(this->root, this->nodes[node].price);
+    }
+}
+
+void OrderBookDepthIndex::eraseBelow(double price) {
+    while (!this->dirty && this->root != NIL) {
+        int32_t node = this->root;
+        while (this->nodes[node].left != NIL) {
+            node = this->nodes[node].left;
+        }
+        if (!(this->nodes[node].price < price)) {
+            break;
+        }
+        this->root = this->erase(this->root, this->nodes[node].price);
+    }
+}
+
+void OrderBookDepthIndex::markDirty() {
+    this->dirty = true;
+}
+
+bool OrderBookDepthIndex::isDirty() const {
+    return this->dirty;
+}
+
+size_t OrderBookDepthIndex::size() const {
+    return this->nodes[this->root].size;
+}
+
+double OrderBookDepthIndex::getPrice(size_t index) const {
+    return this->nodes[this->select(index)].price;
+}
+
+double OrderBookDepthIndex::getAmount(size_t index) const {
+    return this->nodes[this->select(index)].amount;
+}
+
+size_t OrderBookDepthIndex::countBelow(double price) const {
+    size_t count = 0;
+    int32_t node = this->root;
+    while (node != NIL) {
+        const Node &current = this->nodes[node];
+        if (current.price < price) {
+            count += this->nodes[current.left].size + 1;
+            node = current.right;
+        } else {
+            node = current.left;
+        }
+    }
+    return count;
+}
+
+size_t OrderBookDepthIndex::countAtOrBelow(double price) const {
+    size_t count = 0;
+    int32_t node = this->root;
+    while (node != NIL) {
+        const Node &current = this->nodes[node];
+        if (current.price <= price) {
+            count += this->nodes[current.left].size + 1;
+            node = current.right;
+        } else {
+            node = current.left;
+        }
+    }
+    return count;
+}
+
+double OrderBookDepthIndex::basePrefix(size_t count) const {
+    return this->prefixSum(count, false);
+}
+
+double OrderBookDepthIndex::quotePrefix(size_t count) const {
+    return this->prefixSum(count, true);
+}
+
+double OrderBookDepthIndex::baseSuffix(size_t start) const {
+    return this->suffixSum(start, false);
+}
+
+double OrderBookDepthIndex::quoteSuffix(size_t start) const {
+    return this->suffixSum(start, true);
+}
+
+double OrderBookDepthIndex::baseTotal() const {
+    return this->nodes[this->root].baseSum;
+}
+
+double OrderBookDepthIndex::quoteTotal() const {
+    return this->nodes[this->root].quoteSum;
+}
+
+size_t OrderBookDepthIndex::searchBase(double target) const {
+    return this->search(target, false);
+}
+
+size_t OrderBookDepthIndex::searchQuote(double target) const {
+    return this->search(target, true);
+}
+
+size_t OrderBookDepthIndex::searchBaseFromTop(double target) const {
+    return this->searchFromTop(target, false);
+}
+
+size_t OrderBookDepthIndex::searchQuoteFromTop(double target) const {
+    return this->searchFromTop(target, true);
+}
+
+uint32_t OrderBookDepthIndex::nextPriority() {
+    // xorshift32
+    uint32_t x = this->randomState;
+    x ^= x << 13;
+    x ^= x >> 17;
+    x ^= x << 5;
+    this->randomState = x;
+    return x;
+}
+
+int32_t OrderBookDepthIndex::newNode(double price, double amount, uint32_t priority) {
+    Node node = {price, amount, amount, amount * price, priority, NIL, NIL, 1};
+    if (!this->freeNodes.empty()) {
+        int32_t index = this->freeNodes.back();
+        this->freeNodes.pop_back();
+        this->nodes[index] = node;
+        return index;
+    }
+    this->nodes.push_back(node);
+    return (int32_t)(this->nodes.size() - 1);
+}
+
+void OrderBookDepthIndex::freeNode(int32_t node) {
+    this->freeNodes.push_back(node);
+}
+
+void OrderBookDepthIndex::pull(int32_t node) {
+    Node &current = this->nodes[node];
+    const Node &left = this->nodes[current.left];
+    const Node &right = this->nodes[current.right];
+    current.size = left.size + right.size + 1;
+    current.baseSum = left.baseSum + current.amount + right.baseSum;
+    current.quoteSum = left.quoteSum + current.amount * current.price + right.quoteSum;
+}
+
+void OrderBookDepthIndex::pullAll(int32_t node) {
+    if (node == NIL) {
+        return;
+    }
+    this->pullAll(this->nodes[node].left);
+    this->pullAll(this->nodes[node].right);
+    this->pull(node);
+}
+
+int32_t OrderBookDepthIndex::rotateLeft(int32_t node) {
+    int32_t right = this->nodes[node].right;
+    this->nodes[node].right = this->nodes[right].left;
+    this->nodes[right].left = node;
+    this->pull(node);
+    this->pull(right);
+    return right;
+}
+
+int32_t OrderBookDepthIndex::rotateRight(int32_t node) {
+    int32_t left = this->nodes[node].left;
+    this->nodes[node].left = this->nodes[left].right;
+    this->nodes[left].right = node;
+    this->pull(node);
+    this->pull(left);
+    return left;
+}
+
+int32_t OrderBookDepthIndex::merge(int32_t left, int32_t right) {
+    if (left == NIL) {
+        return right;
+    }
+    if (right == NIL) {
+        return left;
+    }
+    if (this->nodes[left].priority > this->nodes[right].priority) {
+        int32_t child = this->merge(this->nodes[left].right, right);
+        this->nodes[left].right = child;
+        this->pull(left);
+        return left;
+    }
+    int32_t child = this->merge(left, this->nodes[right].left);
+    this->nodes[right].left = child;
+    this->pull(right);
+    return right;
+}
+
+int32_t OrderBookDepthIndex::insert(int32_t node, double price, double amount) {
+    // Child indices are read back from the node vector after each recursive call, since newNode() may reallocate it.
+    if (node == NIL) {
+        return this->newNode(price, amount, this->nextPriority());
+    }
+    if (price == this->nodes[node].price) {
+        this->nodes[node].amount = amount;
+        this->pull(node);
+        return node;
+    }
+    if (price < this->nodes[node].price) {
+        int32_t child = this->insert(this->nodes[node].left, price, amount);
+        this->nodes[node].left = child;
+        if (this->nodes[child].priority > this->nodes[node].priority) {
+            return this->rotateRight(node);
+        }
+    } else {
+        int32_t child = this->insert(this->nodes[node].right, price, amount);
+        this->nodes[node].right = child;
+        if (this->nodes[child].priority > this->nodes[node].priority) {
+            return this->rotateLeft(node);
+        }
+    }
+    this->pull(node);
+    return node;
+}
+
+int32_t OrderBookDepthIndex::erase(int32_t node, double price) {
+    if (node == NIL) {
+        return NIL;
+    }
+    if (price == this->nodes[node].price) {
+        int32_t merged = this->merge(this->nodes[node].left, this->nodes[node].right);
+        this->freeNode(node);
+        return merged;
+    }
+    if (price < this->nodes[node].price) {
+        int32_t child = this->erase(this->nodes[node].left, price);
+        this->nodes[node].left = child;
+    } else {
+        int32_t child = this->erase(this->nodes[node].right, price);
+        this->nodes[node].right = child;
+    }
+    this->pull(node);
+    return node;
+}
+
+int32_t OrderBookDepthIndex::select(size_t index) const {
+    int32_t node = this->root;
+    while (node != NIL) {
+        const Node &current = this->nodes[node];
+        size_t leftSize = this->nodes[current.left].size;
+        if (index < leftSize) {
+            node = current.left;
+        } else if (index == leftSize) {
+            return node;
+        } else {
+            index -= leftSize + 1;
+            node = current.right;
+        }
+    }
+    return NIL;
+}
+
+double OrderBookDepthIndex::prefixSum(size_t count, bool quote) const {
+    // Sum of the lowest priced count levels.
+    double sum = 0;
+    int32_t node = this->root;
+    while (node != NIL && count > 0) {
+        const Node &current = this->nodes[node];
+        const Node &left = this->nodes[current.left];
+        if (count <= left.size) {
+            node = current.left;
+        } else {
+            sum += quote ? left.quoteSum + current.amount * current.price : left.baseSum + current.amount;
+            count -= left.size + 1;
+            node = current.right;
+        }
+    }
+    return sum;
+}
+
+double OrderBookDepthIndex::suffixSum(size_t start, bool quote) const {
+    // Sum of the levels from index start to the highest priced one. Summed directly rather than as the total minus a
+    // prefix, so that an empty range is exactly 0.
+    double sum = 0;
+    int32_t node = this->root;
+    while (node != NIL) {
+        const Node &current = this->nodes[node];
+        const Node &right = this->nodes[current.right];
+        size_t leftSize = this->nodes[current.left].size;
+        if (start <= leftSize) {
+            sum += quote ? right.quoteSum + current.amount * current.price : right.baseSum + current.amount;
+            node = current.left;
+        } else {
+            start -= leftSize + 1;
+            node = current.right;
+        }
+    }
+    return sum;
+}
+
+size_t OrderBookDepthIndex::search(double target, bool quote) const {
+    // Finds the smallest level index whose inclusive prefix sum is >= target. Returns size() if the total is not enough.
+    size_t result = this->size();
+    size_t position = 0;
+    double remaining = target;
+    int32_t node = this->root;
+    while (node != NIL) {
+        const Node &current = this->nodes[node];
+        const Node &left = this->nodes[current.left];
+        double leftSum = quote ? left.quoteSum : left.baseSum;
+        double value = quote ? current.amount * current.price : current.amount;
+        if (current.left != NIL && remaining <= leftSum) {
+            // The current level is reached too, should rounding keep the left subtree from reaching the target.
+            result = position + left.size;
+            node = current.left;
+            continue;
+        }
+        remaining -= leftSum;
+        if (remaining <= value) {
+            return position + left.size;
+        }
+        remaining -= value;
+        position += left.size + 1;
+        node = current.right;
+    }
+    return result;
+}
+
+size_t OrderBookDepthIndex::searchFromTop(double target, bool quote) const {
+    // Finds the highest level index at which the cumulative sum, walking down from the highest price, is >= target.
+    // Returns size() if the total is not enough. Mirrors search() rather than searching for the total minus the
+    // target, which would round differently from walking the levels.
+    size_t result = this->size();
+    size_t position = 0;
+    double remaining = target;
+    int32_t node = this->root;
+    while (node != NIL) {
+        const Node &current = this->nodes[node];
+        const Node &right = this->nodes[current.right];
+        size_t index = position + this->nodes[current.left].size;
+        double rightSum = quote ? right.quoteSum : right.baseSum;
+        double value = quote ? current.amount * current.price : current.amount;
+        if (current.right != NIL && remaining <= rightSum) {
+            result = index;
+            position = index + 1;
+            node = current.right;
+            continue;
+        }
+        remaining -= rightSum;
+        if (remaining <= value) {
+            return index;
+        }
+        remaining -= value;
+        node = current.left;
+    }
+    return result;
+}
@@ -0,0 +1,78 @@
+#ifndef _ORDER_BOOK_DEPTH_INDEX_H
+#define _ORDER_BOOK_DEPTH_INDEX_H
+
+#include <stdint.h>
+#include <set>
+#include <vector>
+#include "OrderBookEntry.h"
+
+/**
+ * Cumulative base and quote volume index over one side of an order book.
+ *
+ * Price levels are kept in a treap ordered by price, with the level count and the base and quote volume
+ * (price * amount) sums of each subtree in its root node. Amount changes, new price levels and removed price levels
+ * are all applied in O(log n) expected time, and so are the positional queries below. Only snapshots, which replace
+ * the whole book side, mark the index dirty - it is then rebuilt from the order book side in O(n) on the next query.
+ */
+class OrderBookDepthIndex {
+    struct Node {
+        double price;
+        double amount;
+        double baseSum;
+        double quoteSum;
+        uint32_t priority;
+        int32_t left;
+        int32_t right;
+        size_t size;
+    };
+
+    std::vector<Node> nodes;
+    std::vector<int32_t> freeNodes;
+    int32_t root;
+    uint32_t randomState;
+    bool dirty;
+
+    uint32_t nextPriority();
+    int32_t newNode(double price, double amount, uint32_t priority);
+    void freeNode(int32_t node);
+    void pull(int32_t node);
+    void pullAll(int32_t node);
+    int32_t rotateLeft(int32_t node);
+    int32_t rotateRight(int32_t node);
+    int32_t merge(int32_t left, int32_t right);
+    int32_t insert(int32_t node, double price, double amount);
+    int32_t erase(int32_t node, double price);
+    int32_t select(size_t index) const;
+    double prefixSum(size_t count, bool quote) const;
+    double suffixSum(size_t start, bool quote) const;
+    size_t search(double target, bool quote) const;
+    size_t searchFromTop(double target, bool quote) const;
+
+    public:
+        OrderBookDepthIndex();
+
+        void rebuild(const std::set<OrderBookEntry> &book);
+        void update(double price, double amount);
+        void eraseAbove(double price);
+        void eraseBelow(double price);
+        void markDirty();
+        bool isDirty() const;
+
+        size_t size() const;
+        double getPrice(size_t index) const;
+        double getAmount(size_t index) const;
+        size_t countBelow(double price) const;
+        size_t countAtOrBelow(double price) const;
+        double basePrefix(size_t count) const;
+        double quotePrefix(size_t count) const;
+        double baseSuffix(size_t start) const;
+        double quoteSuffix(size_t start) const;
+        double baseTotal() const;
+        double quoteTotal() const;
+        size_t searchBase(double target) const;
+        size_t searchQuote(double target) const;
+        size_t searchBaseFromTop(double target) const;
+        size_t searchQuoteFromTop(double target) const;
+};
+
+#endif
@@ -0,0 +1,120 @@
+#include "OrderBookLadder.h"
+#include <cmath>
+
+OrderBookLadder::OrderBookLadder() {
+    this->tickSize = 1;
+    this->isAskSide = false;
+}
+
+OrderBookLadder::OrderBookLadder(double tickSize, bool isAskSide) {
+    this->tickSize = tickSize;
+    this->isAskSide = isAskSide;
+}
+
+OrderBookLadder::OrderBookLadder(const OrderBookLadder &other) {
+    this->tickSize = other.tickSize;
+    this->isAskSide = other.isAskSide;
+    this->ticks = other.ticks;
+    this->entries = other.entries;
+}
+
+OrderBookLadder &OrderBookLadder::operator=(const OrderBookLadder &other) {
+    this->tickSize = other.tickSize;
+    this->isAskSide = other.isAskSide;
+    this->ticks = other.ticks;
+    this->entries = other.entries;
+    return *this;
+}
+
+int64_t OrderBookLadder::getTick(double price) const {
+    return (int64_t) std::llround(price / this->tickSize);
+}
+
+size_t OrderBookLadder::lowerBound(int64_t tick) const {
+    // Binary search for the position of tick, in the array's sort order - descending for asks, ascending for bids.
+    size_t low = 0;
+    size_t high = this->ticks.size();
+    while (low < high) {
+        size_t middle = low + (high - low) / 2;
+        bool before = this->isAskSide ? (this->ticks[middle] > tick) : (this->ticks[middle] < tick);
+        if (before) {
+            low = middle + 1;
+        } else {
+            high = middle;
+        }
+    }
+    return low;
+}
+
+void OrderBookLadder::clear() {
+    this->ticks.clear();
+    this->entries.clear();
+}
+
+void OrderBookLadder::reserve(size_t capacity) {
+    this->ticks.reserve(capacity);
+    this->entries.reserve(capacity);
+}
+
+void OrderBookLadder::set(const OrderBookEntry &entry) {
+    int64_t tick = this->getTick(entry.getPrice());
+    size_t position = this->lowerBound(tick);
+    bool found = position < this->ticks.size() && this->ticks[position] == tick;
+
+    if (entry.getAmount() > 0) {
+        if (found) {
+            this->entries[position] = entry;
+        } else {
+            this->ticks.insert(this->ticks.begin() + position, tick);
+            this->entries.insert(this->entries.begin() + position, entry);
+        }
+    } else if (found) {
+        this->ticks.erase(this->ticks.begin() + position);
+        this->entries.erase(this->entries.begin() + position);
+    }
+}
+
+void OrderBookLadder::popBest() {
+    this->ticks.pop_back();
+    this->entries.pop_back();
+}
+
+size_t OrderBookLadder::size() const {
+    return this->entries.size();
+}
+
+bool OrderBookLadder::empty() const {
+    return this->entries.empty();
+}
+
+const OrderBookEntry &OrderBookLadder::getBest() const {
+    return this->entries.back();
+}
+
+const OrderBookEntry &OrderBookLadder::getLevel(size_t depth) const {
+    // Level 0 is the best price level.
+    return this->entries[this->entries.size() - 1 - depth];
+}
+
+void truncateOverlapLadders(OrderBookLadder &bidLadder, OrderBookLadder &askLadder, const int &dex) {
+    // Same overlap resolution as truncateOverlapEntries() in OrderBookEntry.cpp. Centralised: the newer entry wins.
+    // Dex: the entry with the larger quote volume wins.
+    while (!bidLadder.empty() && !askLadder.empty()) {
+        const OrderBookEntry &topBid = bidLadder.getBest();
+        const OrderBookEntry &topAsk = askLadder.getBest();
+        if (topBid.getPrice() < topAsk.getPrice()) {
+            break;
+        }
+        bool bidWins;
+        if (dex != 0) {
+            bidWins = topBid.getAmount() * topBid.getPrice() > topAsk.getAmount() * topAsk.getPrice();
+        } else {
+            bidWins = topBid.getUpdateId() > topAsk.getUpdateId();
+        }
+        if (bidWins) {
+            askLadder.popBest();
+        } else {
+            bidLadder.popBest();
+        }
+    }
+}
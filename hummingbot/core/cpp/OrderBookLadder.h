@@ -0,0 +1,44 @@
+#ifndef _ORDER_BOOK_LADDER_H
+#define _ORDER_BOOK_LADDER_H
+
+#include <stdint.h>
+#include <vector>
+#include "OrderBookEntry.h"
+
+/**
+ * One side of an order book, stored as contiguous arrays sorted by price tick.
+ *
+ * Prices are keyed by their integer tick index (price / tickSize), so lookups are exact binary searches over a flat
+ * array of ticks. The best price level is kept at the back of the arrays - asks are sorted by descending price and bids
+ * by ascending price - so the frequent updates near the top of the book only move a few elements, and removing the
+ * best level is a pop_back(). Memory is only allocated when the arrays grow beyond their capacity.
+ */
+class OrderBookLadder {
+    double tickSize;
+    bool isAskSide;
+    std::vector<int64_t> ticks;
+    std::vector<OrderBookEntry> entries;
+
+    size_t lowerBound(int64_t tick) const;
+
+    public:
+        OrderBookLadder();
+        OrderBookLadder(double tickSize, bool isAskSide);
+        OrderBookLadder(const OrderBookLadder &other);
+        OrderBookLadder &operator=(const OrderBookLadder &other);
+
+        int64_t getTick(double price) const;
+        void clear();
+        void reserve(size_t capacity);
+        void set(const OrderBookEntry &entry);
+        void popBest();
+        size_t size() const;
+        bool empty() const;
+        const OrderBookEntry &getBest() const;
+        const OrderBookEntry &getLevel(size_t depth) const;
+        friend void truncateOverlapLadders(OrderBookLadder &bidLadder, OrderBookLadder &askLadder, const int &dex);
+};
+
+void truncateOverlapLadders(OrderBookLadder &bidLadder, OrderBookLadder &askLadder, const int &dex);
+
+#endif
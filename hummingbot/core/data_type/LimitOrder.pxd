@@ -23,4 +23,5 @@ cdef extern from "../cpp/LimitOrder.h":
         string getBaseCurrency();
         string getQuoteCurrency();
         PyObject *getPrice();
+        double getDoublePrice();
         PyObject *getQuantity();
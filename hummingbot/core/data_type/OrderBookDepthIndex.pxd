@@ -0,0 +1,30 @@
+# distutils: language=c++
+
+from libcpp cimport bool
+from libcpp.set cimport set
+from hummingbot.core.data_type.OrderBookEntry cimport OrderBookEntry
+
+cdef extern from "../cpp/OrderBookDepthIndex.h":
+    cdef cppclass OrderBookDepthIndex:
+        OrderBookDepthIndex()
+        void rebuild(const set[OrderBookEntry] &book)
+        void update(double price, double amount)
+        void eraseAbove(double price)
+        void eraseBelow(double price)
+        void markDirty()
+        bool isDirty() const
+        size_t size() const
+        double getPrice(size_t index) const
+        double getAmount(size_t index) const
+        size_t countBelow(double price) const
+        size_t countAtOrBelow(double price) const
+        double basePrefix(size_t count) const
+        double quotePrefix(size_t count) const
+        double baseSuffix(size_t start) const
+        double quoteSuffix(size_t start) const
+        double baseTotal() const
+        double quoteTotal() const
+        size_t searchBase(double target) const
+        size_t searchQuote(double target) const
+        size_t searchBaseFromTop(double target) const
+        size_t searchQuoteFromTop(double target) const
@@ -0,0 +1,23 @@
+# distutils: language=c++
+
+from libc.stdint cimport int64_t
+from libcpp cimport bool
+from hummingbot.core.data_type.OrderBookEntry cimport OrderBookEntry
+
+cdef extern from "../cpp/OrderBookLadder.h":
+    cdef cppclass OrderBookLadder:
+        OrderBookLadder()
+        OrderBookLadder(double tickSize, bool isAskSide)
+        OrderBookLadder(const OrderBookLadder &other)
+        OrderBookLadder &operator=(const OrderBookLadder &other)
+        int64_t getTick(double price) const
+        void clear()
+        void reserve(size_t capacity)
+        void set(const OrderBookEntry &entry)
+        void popBest()
+        size_t size() const
+        bool empty() const
+        const OrderBookEntry &getBest() const
+        const OrderBookEntry &getLevel(size_t depth) const
+
+    void truncateOverlapLadders(OrderBookLadder &bid_ladder, OrderBookLadder &ask_ladder, const bint &dex)
@@ -1,8 +1,13 @@
 # distutils: language=c++
 # distutils: sources=hummingbot/core/cpp/OrderBookEntry.cpp
 
-from typing import Iterator
+from typing import (
+    Dict,
+    Iterator
+)
+from libc.stdint cimport int64_t
 from libcpp.set cimport set
+from libcpp.unordered_map cimport unordered_map
 from cython.operator cimport (
     postincrement as inc,
     dereference as deref,
@@ -13,6 +18,16 @@ from libcpp.vector cimport vector
 from hummingbot.core.event.events import TradeType
 from hummingbot.core.data_type.order_book_row import OrderBookRow
 from hummingbot.core.data_type.OrderBookEntry cimport OrderBookEntry
+from hummingbot.core.data_type.order_book_query_result cimport OrderBookQueryResult
+
+NaN = float("nan")
+
+
+cdef inline void c_record_level_minimum(unordered_map[double, double] &level_minimums, double price, double amount):
+    cdef:
+        unordered_map[double, double].iterator it = level_minimums.find(price)
+    if it == level_minimums.end() or amount < deref(it).second:
+        level_minimums[price] = amount
 
 
 cdef class CompositeOrderBook(OrderBook):
@@ -76,6 +91,85 @@ cdef class CompositeOrderBook(OrderBook):
 
         self._traded_order_book.c_apply_diffs(cpp_bids, cpp_asks, timestamp)
 
+    cdef c_apply_diffs(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id):
+        OrderBook.c_apply_diffs(self, bids, asks, update_id)
+        if not self._watched_bid_levels.empty():
+            for bid in bids:
+                if self._watched_bid_levels.count(bid.getPrice()) > 0:
+                    c_record_level_minimum(self._bid_level_minimums, bid.getPrice(), bid.getAmount())
+        if not self._watched_ask_levels.empty():
+            for ask in asks:
+                if self._watched_ask_levels.count(ask.getPrice()) > 0:
+                    c_record_level_minimum(self._ask_level_minimums, ask.getPrice(), ask.getAmount())
+
+    cdef c_apply_snapshot(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id):
+        OrderBook.c_apply_snapshot(self, bids, asks, update_id)
+        for level in self._watched_bid_levels:
+            c_record_level_minimum(self._bid_level_minimums, level.first, self.c_get_level_amount(True, level.first))
+        for level in self._watched_ask_levels:
+            c_record_level_minimum(self._ask_level_minimums, level.first, self.c_get_level_amount(False, level.first))
+
+    cdef c_watch_level(self, bint is_bid, double price):
+        """
+        Starts recording the smallest amount the price level goes down to with each update - see
+        c_pop_level_minimums(). Every call needs a matching c_unwatch_level() call.
+        """
+        if is_bid:
+            self._watched_bid_levels[price] += 1
+        else:
+            self._watched_ask_levels[price] += 1
+
+    cdef c_unwatch_level(self, bint is_bid, double price):
+        cdef:
+            unordered_map[double, int] *watched_levels = (ref(self._watched_bid_levels)
+                                                          if is_bid
+                                                          else ref(self._watched_ask_levels))
+            unordered_map[double, int].iterator it = watched_levels.find(price)
+        if it == watched_levels.end():
+            return
+        deref(it).second -= 1
+        if deref(it).second <= 0:
+            watched_levels.erase(it)
+            if is_bid:
+                self._bid_level_minimums.erase(price)
+            else:
+                self._ask_level_minimums.erase(price)
+
+    cdef double c_get_level_amount(self, bint is_bid, double price):
+        cdef:
+            set[OrderBookEntry] *book = ref(self._bid_book) if is_bid else ref(self._ask_book)
+            set[OrderBookEntry].iterator it = book.find(OrderBookEntry(price, 0, 0))
+        if it == book.end():
+            return 0
+        return deref(it).getAmount()
+
+    cdef dict c_pop_level_minimums(self, bint is_bid):
+        """
+        Returns the smallest amount each watched price level went down to since the last call, for the levels updated
+        since then - by price - and starts over.
+        """
+        cdef:
+            dict retval
+        if is_bid:
+            retval = self._bid_level_minimums
+            self._bid_level_minimums.clear()
+        else:
+            retval = self._ask_level_minimums
+            self._ask_level_minimums.clear()
+        return retval
+
+    def watch_level(self, is_bid: bool, price: float):
+        self.c_watch_level(is_bid, price)
+
+    def unwatch_level(self, is_bid: bool, price: float):
+        self.c_unwatch_level(is_bid, price)
+
+    def get_level_amount(self, is_bid: bool, price: float) -> float:
+        return self.c_get_level_amount(is_bid, price)
+
+    def pop_level_minimums(self, is_bid: bool) -> Dict[float, float]:
+        return self.c_pop_level_minimums(is_bid)
+
     def original_bid_entries(self) -> Iterator[OrderBookRow]:
         return super().bid_entries()
 
@@ -183,17 +277,171 @@ cdef class CompositeOrderBook(OrderBook):
     cdef double c_get_price(self, bint is_buy) except? -1:
         cdef:
             set[OrderBookEntry] *book = ref(self._ask_book) if is_buy else ref(self._bid_book)
+            set[OrderBookEntry] *traded_book = (ref(self._traded_order_book._ask_book)
+                                                if is_buy
+                                                else ref(self._traded_order_book._bid_book))
+            set[OrderBookEntry].iterator order_it
+            set[OrderBookEntry].reverse_iterator order_rit
+            set[OrderBookEntry].iterator traded_order_it
+            OrderBookEntry entry
         if deref(book).size() < 1:
             raise EnvironmentError("Order book is empty - no price quote is possible.")
 
-        ask_it = self.ask_entries()
-        bid_it = self.bid_entries()
-        try:
-            if is_buy:
-                best_ask = next(ask_it)
-                return best_ask.price
-            else:
-                best_bid = next(bid_it)
-                return best_bid.price
-        except Exception:
-            raise
+        # The best price level with some amount left after the recorded fills, like the first composite entry.
+        if is_buy:
+            order_it = book.begin()
+            while order_it != book.end():
+                entry = deref(order_it)
+                traded_order_it = traded_book.find(entry)
+                if traded_order_it == traded_book.end() or entry.getAmount() > deref(traded_order_it).getAmount():
+                    return entry.getPrice()
+                inc(order_it)
+        else:
+            order_rit = book.rbegin()
+            while order_rit != book.rend():
+                entry = deref(order_rit)
+                traded_order_it = traded_book.find(entry)
+                if traded_order_it == traded_book.end() or entry.getAmount() > deref(traded_order_it).getAmount():
+                    return entry.getPrice()
+                inc(order_rit)
+        raise EnvironmentError("Order book is empty - no price quote is possible.")
+
+    # The depth queries walk the composite entries, so that recorded fills are deducted from the book.
+    cdef OrderBookQueryResult c_get_price_for_volume(self, bint is_buy, double volume):
+        cdef:
+            double cumulative_volume = 0
+            double result_price = NaN
+
+        if is_buy:
+            for order_book_row in self.ask_entries():
+                cumulative_volume += order_book_row.amount
+                if cumulative_volume >= volume:
+                    result_price = order_book_row.price
+                    break
+        else:
+            for order_book_row in self.bid_entries():
+                cumulative_volume += order_book_row.amount
+                if cumulative_volume >= volume:
+                    result_price = order_book_row.price
+                    break
+
+        return OrderBookQueryResult(NaN, volume, result_price, min(cumulative_volume, volume))
+
+    cdef OrderBookQueryResult c_get_vwap_for_volume(self, bint is_buy, double volume):
+        cdef:
+            double total_cost = 0
+            double total_volume = 0
+            double result_vwap = NaN
+        if is_buy:
+            for order_book_row in self.ask_entries():
+                total_cost += order_book_row.amount * order_book_row.price
+                total_volume += order_book_row.amount
+                if total_volume >= volume:
+                    total_cost -= order_book_row.amount * order_book_row.price
+                    total_volume -= order_book_row.amount
+                    incremental_amount = volume - total_volume
+                    total_cost += incremental_amount * order_book_row.price
+                    total_volume += incremental_amount
+                    result_vwap = total_cost / total_volume
+                    break
+        else:
+            for order_book_row in self.bid_entries():
+                total_cost += order_book_row.amount * order_book_row.price
+                total_volume += order_book_row.amount
+                if total_volume >= volume:
+                    total_cost -= order_book_row.amount * order_book_row.price
+                    total_volume -= order_book_row.amount
+                    incremental_amount = volume - total_volume
+                    total_cost += incremental_amount * order_book_row.price
+                    total_volume += incremental_amount
+                    result_vwap = total_cost / total_volume
+                    break
+
+        return OrderBookQueryResult(NaN, volume, result_vwap, min(total_volume, volume))
+
+    cdef OrderBookQueryResult c_get_price_for_quote_volume(self, bint is_buy, double quote_volume):
+        cdef:
+            double cumulative_volume = 0
+            double result_price = NaN
+
+        if is_buy:
+            for order_book_row in self.ask_entries():
+                cumulative_volume += order_book_row.amount * order_book_row.price
+                if cumulative_volume >= quote_volume:
+                    result_price = order_book_row.price
+                    break
+        else:
+            for order_book_row in self.bid_entries():
+                cumulative_volume += order_book_row.amount * order_book_row.price
+                if cumulative_volume >= quote_volume:
+                    result_price = order_book_row.price
+                    break
+
+        return OrderBookQueryResult(NaN, quote_volume, result_price, min(cumulative_volume, quote_volume))
+
+    cdef OrderBookQueryResult c_get_quote_volume_for_base_amount(self, bint is_buy, double base_amount):
+        cdef:
+            double cumulative_volume = 0
+            double cumulative_base_amount = 0
+            double row_amount = 0
+
+        if is_buy:
+            for order_book_row in self.ask_entries():
+                row_amount = order_book_row.amount
+                if row_amount + cumulative_base_amount >= base_amount:
+                    row_amount = base_amount - cumulative_base_amount
+                cumulative_base_amount += row_amount
+                cumulative_volume += row_amount * order_book_row.price
+                if cumulative_base_amount >= base_amount:
+                    break
+        else:
+            for order_book_row in self.bid_entries():
+                row_amount = order_book_row.amount
+                if row_amount + cumulative_base_amount >= base_amount:
+                    row_amount = base_amount - cumulative_base_amount
+                cumulative_base_amount += row_amount
+                cumulative_volume += row_amount * order_book_row.price
+                if cumulative_base_amount >= base_amount:
+                    break
+
+        return OrderBookQueryResult(NaN, base_amount, NaN, cumulative_volume)
+
+    cdef OrderBookQueryResult c_get_volume_for_price(self, bint is_buy, double price):
+        cdef:
+            double cumulative_volume = 0
+            double result_price = NaN
+
+        if is_buy:
+            for order_book_row in self.ask_entries():
+                if order_book_row.price > price:
+                    break
+                cumulative_volume += order_book_row.amount
+                result_price = order_book_row.price
+        else:
+            for order_book_row in self.bid_entries():
+                if order_book_row.price < price:
+                    break
+                cumulative_volume += order_book_row.amount
+                result_price = order_book_row.price
+
+        return OrderBookQueryResult(price, NaN, result_price, cumulative_volume)
+
+    cdef OrderBookQueryResult c_get_quote_volume_for_price(self, bint is_buy, double price):
+        cdef:
+            double cumulative_volume = 0
+            double result_price = NaN
+
+        if is_buy:
+            for order_book_row in self.ask_entries():
+                if order_book_row.price > price:
+                    break
+                cumulative_volume += order_book_row.amount * order_book_row.price
+                result_price = order_book_row.price
+        else:
+            for order_book_row in self.bid_entries():
+                if order_book_row.price < price:
+                    break
+                cumulative_volume += order_book_row.amount * order_book_row.price
+                result_price = order_book_row.price
+
+        return OrderBookQueryResult(price, NaN, result_price, cumulative_volume)
@@ -0,0 +1,12 @@
+cdef class ExpiryScheduler:
+    cdef:
+        dict _entries
+        list _heap
+        long long _sequence
+
+    cdef c_schedule(self, object key, double deadline)
+    cdef c_cancel(self, object key)
+    cdef bint c_contains(self, object key)
+    cdef double c_get_deadline(self, object key)
+    cdef list c_pop_expired(self, double timestamp)
+    cdef c_compact(self)
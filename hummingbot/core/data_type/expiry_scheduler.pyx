@@ -0,0 +1,97 @@
+from heapq import (
+    heapify,
+    heappop,
+    heappush
+)
+from typing import List
+
+NaN = float("nan")
+
+
+cdef class ExpiryScheduler:
+    """
+    Keeps the deadlines of tracked items - like transactions or orders - in a min-heap, so the items that are due can be
+    found without walking all of them on every tick.
+
+    Cancelled and rescheduled items leave their old heap entries behind. These are skipped when they come up, and the
+    heap is rebuilt once they outnumber the scheduled items.
+    """
+    # Number of stale heap entries allowed on top of one per scheduled item, before the heap is rebuilt.
+    STALE_ENTRIES_LIMIT = 64
+
+    def __init__(self):
+        self._entries = {}
+        self._heap = []
+        self._sequence = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._entries
+
+    @property
+    def keys(self) -> List[object]:
+        return list(self._entries.keys())
+
+    def schedule(self, key: object, deadline: float):
+        self.c_schedule(key, deadline)
+
+    def cancel(self, key: object):
+        self.c_cancel(key)
+
+    def get_deadline(self, key: object) -> float:
+        return self.c_get_deadline(key)
+
+    def pop_expired(self, timestamp: float) -> List[object]:
+        return self.c_pop_expired(timestamp)
+
+    cdef c_schedule(self, object key, double deadline):
+        """
+        Schedules an item, or moves the deadline of an item that is already scheduled.
+        """
+        # The sequence number keeps items with the same deadline in scheduling order, without comparing the keys.
+        cdef tuple entry = (deadline, self._sequence, key)
+        self._sequence += 1
+        self._entries[key] = entry
+        heappush(self._heap, entry)
+        if len(self._heap) > 2 * len(self._entries) + self.STALE_ENTRIES_LIMIT:
+            self.c_compact()
+
+    cdef c_cancel(self, object key):
+        if key not in self._entries:
+            return
+        del self._entries[key]
+        if len(self._entries) == 0:
+            self._heap = []
+
+    cdef bint c_contains(self, object key):
+        return key in self._entries
+
+    cdef double c_get_deadline(self, object key):
+        cdef tuple entry = self._entries.get(key)
+        return entry[0] if entry is not None else NaN
+
+    cdef list c_pop_expired(self, double timestamp):
+        """
+        Unschedules the items with a deadline before the timestamp.
+
+        :param timestamp: the current time, or the time the deadlines are compared to
+        :return: the keys of the expired items, earliest deadline first
+        """
+        cdef:
+            list expired_keys = []
+            list heap = self._heap
+            tuple entry
+
+        while len(heap) > 0 and heap[0][0] < timestamp:
+            entry = heappop(heap)
+            key = entry[2]
+            if self._entries.get(key) is entry:
+                del self._entries[key]
+                expired_keys.append(key)
+        return expired_keys
+
+    cdef c_compact(self):
+        self._heap = [entry for entry in self._heap if self._entries.get(entry[2]) is entry]
+        heapify(self._heap)
@@ -4,9 +4,9 @@ from libc.stdint cimport int64_t
 from libcpp.set cimport set
 from libcpp.vector cimport vector
 from hummingbot.core.data_type.OrderBookEntry cimport OrderBookEntry
+from hummingbot.core.data_type.OrderBookDepthIndex cimport OrderBookDepthIndex
 from hummingbot.core.pubsub cimport PubSub
 from .order_book_query_result cimport OrderBookQueryResult
-cimport numpy as np
 
 
 cdef class OrderBook(PubSub):
@@ -20,16 +20,31 @@ cdef class OrderBook(PubSub):
     cdef double _last_applied_trade
     cdef double _last_trade_price_rest_updated
     cdef bint _dex
+    cdef bint _depth_index_enabled
+    cdef OrderBookDepthIndex _bid_depth_index
+    cdef OrderBookDepthIndex _ask_depth_index
+    cdef double _change_event_depth_range
 
     cdef c_apply_diffs(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id)
     cdef c_apply_snapshot(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id)
     cdef c_apply_trade(self, object trade_event)
+    cdef c_trigger_change_event(self,
+                                vector[OrderBookEntry] &bids,
+                                vector[OrderBookEntry] &asks,
+                                double previous_best_bid,
+                                double previous_best_ask,
+                                bint is_snapshot)
     cdef c_apply_numpy_diffs(self,
-                             np.ndarray[np.float64_t, ndim=2] bids_array,
-                             np.ndarray[np.float64_t, ndim=2] asks_array)
+                             const double[:, :] bids_array,
+                             const double[:, :] asks_array,
+                             int64_t update_id=*)
+    cdef c_apply_numpy_diffs_batch(self, const double[:, :] bids_array, const double[:, :] asks_array)
     cdef c_apply_numpy_snapshot(self,
-                                np.ndarray[np.float64_t, ndim=2] bids_array,
-                                np.ndarray[np.float64_t, ndim=2] asks_array)
+                                const double[:, :] bids_array,
+                                const double[:, :] asks_array,
+                                int64_t update_id=*)
+    cdef object c_get_numpy_entries(self, bint is_bid)
+    cdef OrderBookDepthIndex *c_get_depth_index(self, bint is_buy)
     cdef double c_get_price(self, bint is_buy) except? -1
     cdef OrderBookQueryResult c_get_price_for_volume(self, bint is_buy, double volume)
     cdef OrderBookQueryResult c_get_price_for_quote_volume(self, bint is_buy, double quote_volume)
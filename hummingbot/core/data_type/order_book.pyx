@@ -1,14 +1,16 @@
 # distutils: language=c++
-# distutils: sources=hummingbot/core/cpp/OrderBookEntry.cpp
+# distutils: sources=['hummingbot/core/cpp/OrderBookEntry.cpp', 'hummingbot/core/cpp/OrderBookDepthIndex.cpp']
 from cython.operator cimport(
     postincrement as inc,
     dereference as deref,
     address as ref
 )
+from libc.math cimport isnan, INFINITY
 from hummingbot.core.data_type.OrderBookEntry cimport truncateOverlapEntries
 from hummingbot.logger import HummingbotLogger
 from hummingbot.core.event.events import (
     OrderBookEvent,
+    OrderBookChangedEvent,
     OrderBookTradeEvent
 )
 from typing import (
@@ -29,12 +31,50 @@ from sqlalchemy.engine import RowProxy
 import bisect
 import logging
 cimport numpy as np
+cimport cython
 ob_logger = None
 NaN = float("nan")
+cdef int64_t ORDER_BOOK_CHANGED_EVENT_TAG = OrderBookEvent.OrderBookChangedEvent.value
+
+
+cdef inline bint c_price_changed(double previous_price, double price):
+    return previous_price != price and not (isnan(previous_price) and isnan(price))
+
+
+cdef c_check_numpy_entries(const double[:, :] array):
+    if array.shape[0] > 0 and array.shape[1] < 3:
+        raise ValueError(f"Order book entry arrays must have 3 columns [price, amount, update_id], "
+                         f"got {array.shape[1]}.")
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cdef int64_t c_read_numpy_entries(const double[:, :] array,
+                                  Py_ssize_t start,
+                                  Py_ssize_t end,
+                                  vector[OrderBookEntry] &entries,
+                                  int64_t last_update_id) except? -1:
+    """
+    Reads rows [start, end) of a [price, amount, update_id] array into entries, straight from the array's memory.
+    Returns the largest update ID seen, starting from last_update_id.
+    """
+    cdef:
+        Py_ssize_t i
+        int64_t row_update_id
+
+    c_check_numpy_entries(array)
+    entries.reserve(entries.size() + (end - start))
+    for i in range(start, end):
+        row_update_id = <int64_t>array[i, 2]
+        entries.push_back(OrderBookEntry(array[i, 0], array[i, 1], row_update_id))
+        if row_update_id > last_update_id:
+            last_update_id = row_update_id
+    return last_update_id
 
 
 cdef class OrderBook(PubSub):
     ORDER_BOOK_TRADE_EVENT_TAG = OrderBookEvent.TradeEvent.value
+    ORDER_BOOK_CHANGED_EVENT_TAG = OrderBookEvent.OrderBookChangedEvent.value
 
     @classmethod
     def logger(cls) -> HummingbotLogger:
@@ -43,7 +83,12 @@ cdef class OrderBook(PubSub):
             ob_logger = logging.getLogger(__name__)
         return ob_logger
 
-    def __init__(self, dex=False):
+    def __init__(self, dex=False, depth_index=False):
+        """
+        :param dex: whether the order book belongs to a decentralized exchange, see OrderBookEntry.cpp
+        :param depth_index: whether to keep a cumulative volume index per side, which makes the volume and price depth
+                            queries logarithmic in the number of price levels at a small cost on every diff
+        """
         super().__init__()
         self._snapshot_uid = 0
         self._last_diff_uid = 0
@@ -52,6 +97,8 @@ cdef class OrderBook(PubSub):
         self._last_applied_trade = -1000.0
         self._last_trade_price_rest_updated = -1000
         self._dex = dex
+        self._depth_index_enabled = depth_index
+        self._change_event_depth_range = 0.0
 
     cdef c_apply_diffs(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id):
         cdef:
@@ -62,6 +109,10 @@ cdef class OrderBook(PubSub):
             set[OrderBookEntry].iterator result
             OrderBookEntry top_bid
             OrderBookEntry top_ask
+            size_t bid_book_size
+            size_t ask_book_size
+            double previous_best_bid = self._best_bid
+            double previous_best_ask = self._best_ask
 
         # Apply the diffs. Diffs with 0 amounts mean deletion.
         for bid in bids:
@@ -70,15 +121,29 @@ cdef class OrderBook(PubSub):
                 self._bid_book.erase(result)
             if bid.getAmount() > 0:
                 self._bid_book.insert(bid)
+            if self._depth_index_enabled:
+                self._bid_depth_index.update(bid.getPrice(), bid.getAmount())
         for ask in asks:
             result = self._ask_book.find(ask)
             if result != ask_book_end:
                 self._ask_book.erase(result)
             if ask.getAmount() > 0:
                 self._ask_book.insert(ask)
+            if self._depth_index_enabled:
+                self._ask_depth_index.update(ask.getPrice(), ask.getAmount())
 
         # If any overlapping entries between the bid and ask books, centralised: newer entries win, dex: see OrderBookEntry.cpp
+        bid_book_size = self._bid_book.size()
+        ask_book_size = self._ask_book.size()
         truncateOverlapEntries(self._bid_book, self._ask_book, self._dex)
+        # The truncation only takes levels off the top of the book sides, so the indexes drop the levels past the new
+        # best prices.
+        if bid_book_size != self._bid_book.size():
+            self._bid_depth_index.eraseAbove(deref(self._bid_book.rbegin()).getPrice()
+                                             if not self._bid_book.empty() else -INFINITY)
+        if ask_book_size != self._ask_book.size():
+            self._ask_depth_index.eraseBelow(deref(self._ask_book.begin()).getPrice()
+                                             if not self._ask_book.empty() else INFINITY)
 
         # Record the current best prices, for faster c_get_price() calls.
         bid_iterator = self._bid_book.rbegin()
@@ -92,11 +157,14 @@ cdef class OrderBook(PubSub):
 
         # Remember the last diff update ID.
         self._last_diff_uid = update_id
+        self.c_trigger_change_event(bids, asks, previous_best_bid, previous_best_ask, False)
 
     cdef c_apply_snapshot(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id):
         cdef:
             double best_bid_price = float("NaN")
             double best_ask_price = float("NaN")
+            double previous_best_bid = self._best_bid
+            double previous_best_ask = self._best_ask
             set[OrderBookEntry].reverse_iterator bid_iterator
             set[OrderBookEntry].iterator ask_iterator
             OrderBookEntry top_bid
@@ -105,6 +173,8 @@ cdef class OrderBook(PubSub):
         # Start with an empty order book, and then insert all entries.
         self._bid_book.clear()
         self._ask_book.clear()
+        self._bid_depth_index.markDirty()
+        self._ask_depth_index.markDirty()
         for bid in bids:
             self._bid_book.insert(bid)
             if not (bid.getPrice() <= best_bid_price):
@@ -132,12 +202,66 @@ cdef class OrderBook(PubSub):
 
         # Remember the last snapshot update ID.
         self._snapshot_uid = update_id
+        self.c_trigger_change_event(bids, asks, previous_best_bid, previous_best_ask, True)
 
     cdef c_apply_trade(self, object trade_event):
         self._last_trade_price = trade_event.price
         self._last_applied_trade = time.perf_counter()
         self.c_trigger_event(self.ORDER_BOOK_TRADE_EVENT_TAG, trade_event)
 
+    cdef c_trigger_change_event(self,
+                                vector[OrderBookEntry] &bids,
+                                vector[OrderBookEntry] &asks,
+                                double previous_best_bid,
+                                double previous_best_ask,
+                                bint is_snapshot):
+        """
+        Publishes an OrderBookChangedEvent after an update, if the best bid or ask price moved, or if the update changed
+        a price level within change_event_depth_range of the best prices. Snapshots replace the whole book, so they
+        always publish one.
+        """
+        cdef:
+            bint top_of_book_changed
+            bint depth_changed = is_snapshot
+            double min_bid_price
+            double max_ask_price
+
+        # Nothing to compute if no one is listening, which is the common case.
+        if self._events.find(ORDER_BOOK_CHANGED_EVENT_TAG) == self._events.end():
+            return
+
+        top_of_book_changed = (c_price_changed(previous_best_bid, self._best_bid) or
+                               c_price_changed(previous_best_ask, self._best_ask))
+        if not (top_of_book_changed or depth_changed):
+            min_bid_price = self._best_bid * (1.0 - self._change_event_depth_range)
+            max_ask_price = self._best_ask * (1.0 + self._change_event_depth_range)
+            for bid in bids:
+                if bid.getPrice() >= min_bid_price:
+                    depth_changed = True
+                    break
+            if not depth_changed:
+                for ask in asks:
+                    if ask.getPrice() <= max_ask_price:
+                        depth_changed = True
+                        break
+        if top_of_book_changed or depth_changed:
+            self.c_trigger_event(ORDER_BOOK_CHANGED_EVENT_TAG,
+                                 OrderBookChangedEvent(self._best_bid, self._best_ask, top_of_book_changed))
+
+    @property
+    def change_event_depth_range(self) -> float:
+        """
+        How far from the best prices, as a ratio of them, an update to a price level triggers an order book changed
+        event. At 0, only updates to the top of book levels do.
+        """
+        return self._change_event_depth_range
+
+    @change_event_depth_range.setter
+    def change_event_depth_range(self, value: float):
+        if not value >= 0:
+            raise ValueError(f"change_event_depth_range must not be negative, got {value}.")
+        self._change_event_depth_range = value
+
     @property
     def last_trade_price(self) -> float:
         return self._last_trade_price
@@ -158,6 +282,10 @@ cdef class OrderBook(PubSub):
     def last_trade_price_rest_updated(self, value: float):
         self._last_trade_price_rest_updated = value
 
+    @property
+    def depth_index_enabled(self) -> bool:
+        return self._depth_index_enabled
+
     @property
     def snapshot_uid(self) -> int:
         return self._snapshot_uid
@@ -174,6 +302,41 @@ cdef class OrderBook(PubSub):
         asks_df = pd.DataFrame(data=asks_rows, columns=OrderBookRow._fields, dtype="float64")
         return bids_df, asks_df
 
+    @property
+    def numpy_snapshot(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        The bid and ask entries as float64 arrays with the columns [price, amount, update_id], best prices first. They
+        can be passed back to apply_numpy_snapshot().
+        """
+        return self.c_get_numpy_entries(True), self.c_get_numpy_entries(False)
+
+    @cython.boundscheck(False)
+    @cython.wraparound(False)
+    cdef object c_get_numpy_entries(self, bint is_bid):
+        cdef:
+            size_t num_entries = self._bid_book.size() if is_bid else self._ask_book.size()
+            object array = np.empty((num_entries, 3), dtype=np.float64)
+            double[:, :] rows = array
+            Py_ssize_t i = 0
+            set[OrderBookEntry].reverse_iterator bid_it = self._bid_book.rbegin()
+            set[OrderBookEntry].iterator ask_it = self._ask_book.begin()
+
+        if is_bid:
+            while bid_it != self._bid_book.rend():
+                rows[i, 0] = deref(bid_it).getPrice()
+                rows[i, 1] = deref(bid_it).getAmount()
+                rows[i, 2] = deref(bid_it).getUpdateId()
+                inc(bid_it)
+                i += 1
+        else:
+            while ask_it != self._ask_book.end():
+                rows[i, 0] = deref(ask_it).getPrice()
+                rows[i, 1] = deref(ask_it).getAmount()
+                rows[i, 2] = deref(ask_it).getUpdateId()
+                inc(ask_it)
+                i += 1
+        return array
+
     def apply_diffs(self, bids: List[OrderBookRow], asks: List[OrderBookRow], update_id: int):
         cdef:
             vector[OrderBookEntry] cpp_bids
@@ -205,16 +368,19 @@ cdef class OrderBook(PubSub):
         """
         self.apply_numpy_diffs(bids_df.values, asks_df.values)
 
-    def apply_numpy_diffs(self, bids_array: np.ndarray, asks_array: np.ndarray):
+    def apply_numpy_diffs(self, bids_array: np.ndarray, asks_array: np.ndarray, update_id: Optional[int] = None):
         """
         The diffs data frame must have 3 columns, [price, amount, update_id].
         All columns are of double type.
+
+        If update_id is not given, the largest update ID in the arrays is used.
         """
-        self.c_apply_numpy_diffs(bids_array, asks_array)
+        self.c_apply_numpy_diffs(bids_array, asks_array, -1 if update_id is None else update_id)
 
     cdef c_apply_numpy_diffs(self,
-                             np.ndarray[np.float64_t, ndim=2] bids_array,
-                             np.ndarray[np.float64_t, ndim=2] asks_array):
+                             const double[:, :] bids_array,
+                             const double[:, :] asks_array,
+                             int64_t update_id=-1):
         """
         The diffs data frame must have 3 columns, [price, amount, update_id].
         All columns are of double type.
@@ -224,24 +390,69 @@ cdef class OrderBook(PubSub):
             vector[OrderBookEntry] cpp_asks
             int64_t last_update_id = 0
 
-        for row in bids_array:
-            cpp_bids.push_back(OrderBookEntry(row[0], row[1], <int64_t>(row[2])))
-            last_update_id = max(last_update_id, <int64_t>row[2])
-        for row in asks_array:
-            cpp_asks.push_back(OrderBookEntry(row[0], row[1], <int64_t>(row[2])))
-            last_update_id = max(last_update_id, <int64_t>row[2])
-        self.c_apply_diffs(cpp_bids, cpp_asks, last_update_id)
+        last_update_id = c_read_numpy_entries(bids_array, 0, bids_array.shape[0], cpp_bids, last_update_id)
+        last_update_id = c_read_numpy_entries(asks_array, 0, asks_array.shape[0], cpp_asks, last_update_id)
+        self.c_apply_diffs(cpp_bids, cpp_asks, last_update_id if update_id < 0 else update_id)
+
+    def apply_numpy_diffs_batch(self, bids_array: np.ndarray, asks_array: np.ndarray):
+        """
+        Applies many diff messages, stacked into one bids array and one asks array, in a single call.
 
-    def apply_numpy_snapshot(self, bids_array: np.ndarray, asks_array: np.ndarray):
+        The arrays must have 3 columns, [price, amount, update_id], with rows ordered by update_id. Rows sharing an
+        update ID make up one diff message, and the messages are applied in update ID order - each exactly as
+        apply_numpy_diffs() would apply it.
+        """
+        self.c_apply_numpy_diffs_batch(bids_array, asks_array)
+
+    cdef c_apply_numpy_diffs_batch(self, const double[:, :] bids_array, const double[:, :] asks_array):
+        cdef:
+            vector[OrderBookEntry] cpp_bids
+            vector[OrderBookEntry] cpp_asks
+            Py_ssize_t num_bids = bids_array.shape[0]
+            Py_ssize_t num_asks = asks_array.shape[0]
+            Py_ssize_t bid_index = 0
+            Py_ssize_t ask_index = 0
+            Py_ssize_t bid_end
+            Py_ssize_t ask_end
+            int64_t update_id
+
+        c_check_numpy_entries(bids_array)
+        c_check_numpy_entries(asks_array)
+        while bid_index < num_bids or ask_index < num_asks:
+            # The next message is the one with the smallest update ID left on either side.
+            if ask_index >= num_asks or (bid_index < num_bids and
+                                         bids_array[bid_index, 2] <= asks_array[ask_index, 2]):
+                update_id = <int64_t>bids_array[bid_index, 2]
+            else:
+                update_id = <int64_t>asks_array[ask_index, 2]
+            bid_end = bid_index
+            while bid_end < num_bids and <int64_t>bids_array[bid_end, 2] == update_id:
+                bid_end += 1
+            ask_end = ask_index
+            while ask_end < num_asks and <int64_t>asks_array[ask_end, 2] == update_id:
+                ask_end += 1
+
+            cpp_bids.clear()
+            cpp_asks.clear()
+            c_read_numpy_entries(bids_array, bid_index, bid_end, cpp_bids, 0)
+            c_read_numpy_entries(asks_array, ask_index, ask_end, cpp_asks, 0)
+            self.c_apply_diffs(cpp_bids, cpp_asks, update_id)
+            bid_index = bid_end
+            ask_index = ask_end
+
+    def apply_numpy_snapshot(self, bids_array: np.ndarray, asks_array: np.ndarray, update_id: Optional[int] = None):
         """
         The diffs data frame must have 3 columns, [price, amount, update_id].
         All columns are of double type.
+
+        If update_id is not given, the largest update ID in the arrays is used.
         """
-        self.c_apply_numpy_snapshot(bids_array, asks_array)
+        self.c_apply_numpy_snapshot(bids_array, asks_array, -1 if update_id is None else update_id)
 
     cdef c_apply_numpy_snapshot(self,
-                                np.ndarray[np.float64_t, ndim=2] bids_array,
-                                np.ndarray[np.float64_t, ndim=2] asks_array):
+                                const double[:, :] bids_array,
+                                const double[:, :] asks_array,
+                                int64_t update_id=-1):
         """
         The diffs data frame must have 3 columns, [price, amount, update_id].
         All columns are of double type.
@@ -251,13 +462,9 @@ cdef class OrderBook(PubSub):
             vector[OrderBookEntry] cpp_asks
             int64_t last_update_id = 0
 
-        for row in bids_array:
-            cpp_bids.push_back(OrderBookEntry(row[0], row[1], <int64_t>(row[2])))
-            last_update_id = max(last_update_id, <int64_t>row[2])
-        for row in asks_array:
-            cpp_asks.push_back(OrderBookEntry(row[0], row[1], <int64_t>(row[2])))
-            last_update_id = max(last_update_id, <int64_t>row[2])
-        self.c_apply_snapshot(cpp_bids, cpp_asks, last_update_id)
+        last_update_id = c_read_numpy_entries(bids_array, 0, bids_array.shape[0], cpp_bids, last_update_id)
+        last_update_id = c_read_numpy_entries(asks_array, 0, asks_array.shape[0], cpp_asks, last_update_id)
+        self.c_apply_snapshot(cpp_bids, cpp_asks, last_update_id if update_id < 0 else update_id)
 
     def bid_entries(self) -> Iterator[OrderBookRow]:
         cdef:
@@ -315,142 +522,291 @@ cdef class OrderBook(PubSub):
     def get_price(self, is_buy: bool) -> float:
         return self.c_get_price(is_buy)
 
+    cdef OrderBookDepthIndex *c_get_depth_index(self, bint is_buy):
+        """
+        Returns the cumulative volume index of the side taken by a buy or sell, rebuilding it first if it is stale.
+        """
+        cdef:
+            OrderBookDepthIndex *index
+        if is_buy:
+            index = ref(self._ask_depth_index)
+            if deref(index).isDirty():
+                deref(index).rebuild(self._ask_book)
+        else:
+            index = ref(self._bid_depth_index)
+            if deref(index).isDirty():
+                deref(index).rebuild(self._bid_book)
+        return index
+
     cdef OrderBookQueryResult c_get_price_for_volume(self, bint is_buy, double volume):
         cdef:
+            set[OrderBookEntry].iterator ask_it
+            set[OrderBookEntry].reverse_iterator bid_it
+            OrderBookDepthIndex *index
+            size_t level
             double cumulative_volume = 0
             double result_price = NaN
 
+        if self._depth_index_enabled:
+            index = self.c_get_depth_index(is_buy)
+            level = deref(index).searchBase(volume) if is_buy else deref(index).searchBaseFromTop(volume)
+            if level < deref(index).size():
+                return OrderBookQueryResult(NaN, volume, deref(index).getPrice(level), volume)
+            return OrderBookQueryResult(NaN, volume, NaN, min(deref(index).baseTotal(), volume))
+
+        # The book sides are walked directly over the C++ iterators, so no Python object is created per level.
         if is_buy:
-            for order_book_row in self.ask_entries():
-                cumulative_volume += order_book_row.amount
+            ask_it = self._ask_book.begin()
+            while ask_it != self._ask_book.end():
+                cumulative_volume += deref(ask_it).getAmount()
                 if cumulative_volume >= volume:
-                    result_price = order_book_row.price
+                    result_price = deref(ask_it).getPrice()
                     break
+                inc(ask_it)
         else:
-            for order_book_row in self.bid_entries():
-                cumulative_volume += order_book_row.amount
+            bid_it = self._bid_book.rbegin()
+            while bid_it != self._bid_book.rend():
+                cumulative_volume += deref(bid_it).getAmount()
                 if cumulative_volume >= volume:
-                    result_price = order_book_row.price
+                    result_price = deref(bid_it).getPrice()
                     break
+                inc(bid_it)
 
         return OrderBookQueryResult(NaN, volume, result_price, min(cumulative_volume, volume))
 
     cdef OrderBookQueryResult c_get_vwap_for_volume(self, bint is_buy, double volume):
         cdef:
+            set[OrderBookEntry].iterator ask_it
+            set[OrderBookEntry].reverse_iterator bid_it
+            double price
+            double amount
             double total_cost = 0
             double total_volume = 0
+            double incremental_amount
             double result_vwap = NaN
+            OrderBookDepthIndex *index
+            size_t level
+
+        if self._depth_index_enabled:
+            index = self.c_get_depth_index(is_buy)
+            if is_buy:
+                level = deref(index).searchBase(volume)
+            else:
+                level = deref(index).searchBaseFromTop(volume)
+            if level >= deref(index).size():
+                return OrderBookQueryResult(NaN, volume, NaN, min(deref(index).baseTotal(), volume))
+            # Volume and cost of the levels walked before reaching the last (partially taken) level.
+            if is_buy:
+                total_volume = deref(index).basePrefix(level)
+                total_cost = deref(index).quotePrefix(level)
+            else:
+                total_volume = deref(index).baseSuffix(level + 1)
+                total_cost = deref(index).quoteSuffix(level + 1)
+            incremental_amount = volume - total_volume
+            total_cost += incremental_amount * deref(index).getPrice(level)
+            total_volume += incremental_amount
+            return OrderBookQueryResult(NaN, volume, total_cost / total_volume, min(total_volume, volume))
+
         if is_buy:
-            for order_book_row in self.ask_entries():
-                total_cost += order_book_row.amount * order_book_row.price
-                total_volume += order_book_row.amount
+            ask_it = self._ask_book.begin()
+            while ask_it != self._ask_book.end():
+                price = deref(ask_it).getPrice()
+                amount = deref(ask_it).getAmount()
+                total_cost += amount * price
+                total_volume += amount
                 if total_volume >= volume:
-                    total_cost -= order_book_row.amount * order_book_row.price
-                    total_volume -= order_book_row.amount
+                    total_cost -= amount * price
+                    total_volume -= amount
                     incremental_amount = volume - total_volume
-                    total_cost += incremental_amount * order_book_row.price
+                    total_cost += incremental_amount * price
                     total_volume += incremental_amount
                     result_vwap = total_cost / total_volume
                     break
+                inc(ask_it)
         else:
-            for order_book_row in self.bid_entries():
-                total_cost += order_book_row.amount * order_book_row.price
-                total_volume += order_book_row.amount
+            bid_it = self._bid_book.rbegin()
+            while bid_it != self._bid_book.rend():
+                price = deref(bid_it).getPrice()
+                amount = deref(bid_it).getAmount()
+                total_cost += amount * price
+                total_volume += amount
                 if total_volume >= volume:
-                    total_cost -= order_book_row.amount * order_book_row.price
-                    total_volume -= order_book_row.amount
+                    total_cost -= amount * price
+                    total_volume -= amount
                     incremental_amount = volume - total_volume
-                    total_cost += incremental_amount * order_book_row.price
+                    total_cost += incremental_amount * price
                     total_volume += incremental_amount
                     result_vwap = total_cost / total_volume
                     break
+                inc(bid_it)
 
         return OrderBookQueryResult(NaN, volume, result_vwap, min(total_volume, volume))
 
     cdef OrderBookQueryResult c_get_price_for_quote_volume(self, bint is_buy, double quote_volume):
         cdef:
+            set[OrderBookEntry].iterator ask_it
+            set[OrderBookEntry].reverse_iterator bid_it
+            OrderBookDepthIndex *index
+            size_t level
             double cumulative_volume = 0
             double result_price = NaN
 
+        if self._depth_index_enabled:
+            index = self.c_get_depth_index(is_buy)
+            level = deref(index).searchQuote(quote_volume) if is_buy else deref(index).searchQuoteFromTop(quote_volume)
+            if level < deref(index).size():
+                return OrderBookQueryResult(NaN, quote_volume, deref(index).getPrice(level), quote_volume)
+            return OrderBookQueryResult(NaN, quote_volume, NaN, min(deref(index).quoteTotal(), quote_volume))
+
         if is_buy:
-            for order_book_row in self.ask_entries():
-                cumulative_volume += order_book_row.amount * order_book_row.price
+            ask_it = self._ask_book.begin()
+            while ask_it != self._ask_book.end():
+                cumulative_volume += deref(ask_it).getAmount() * deref(ask_it).getPrice()
                 if cumulative_volume >= quote_volume:
-                    result_price = order_book_row.price
+                    result_price = deref(ask_it).getPrice()
                     break
+                inc(ask_it)
         else:
-            for order_book_row in self.bid_entries():
-                cumulative_volume += order_book_row.amount * order_book_row.price
+            bid_it = self._bid_book.rbegin()
+            while bid_it != self._bid_book.rend():
+                cumulative_volume += deref(bid_it).getAmount() * deref(bid_it).getPrice()
                 if cumulative_volume >= quote_volume:
-                    result_price = order_book_row.price
+                    result_price = deref(bid_it).getPrice()
                     break
+                inc(bid_it)
 
         return OrderBookQueryResult(NaN, quote_volume, result_price, min(cumulative_volume, quote_volume))
 
     cdef OrderBookQueryResult c_get_quote_volume_for_base_amount(self, bint is_buy, double base_amount):
         cdef:
+            set[OrderBookEntry].iterator ask_it
+            set[OrderBookEntry].reverse_iterator bid_it
             double cumulative_volume = 0
             double cumulative_base_amount = 0
             double row_amount = 0
+            OrderBookDepthIndex *index
+            size_t level
+
+        if self._depth_index_enabled:
+            index = self.c_get_depth_index(is_buy)
+            level = deref(index).searchBase(base_amount) if is_buy else deref(index).searchBaseFromTop(base_amount)
+            if level >= deref(index).size():
+                return OrderBookQueryResult(NaN, base_amount, NaN, deref(index).quoteTotal())
+            if is_buy:
+                cumulative_base_amount = deref(index).basePrefix(level)
+                cumulative_volume = deref(index).quotePrefix(level)
+            else:
+                cumulative_base_amount = deref(index).baseSuffix(level + 1)
+                cumulative_volume = deref(index).quoteSuffix(level + 1)
+            cumulative_volume += (base_amount - cumulative_base_amount) * deref(index).getPrice(level)
+            return OrderBookQueryResult(NaN, base_amount, NaN, cumulative_volume)
 
         if is_buy:
-            for order_book_row in self.ask_entries():
-                row_amount = order_book_row.amount
+            ask_it = self._ask_book.begin()
+            while ask_it != self._ask_book.end():
+                row_amount = deref(ask_it).getAmount()
                 if row_amount + cumulative_base_amount >= base_amount:
                     row_amount = base_amount - cumulative_base_amount
                 cumulative_base_amount += row_amount
-                cumulative_volume += row_amount * order_book_row.price
+                cumulative_volume += row_amount * deref(ask_it).getPrice()
                 if cumulative_base_amount >= base_amount:
                     break
+                inc(ask_it)
         else:
-            for order_book_row in self.bid_entries():
-                row_amount = order_book_row.amount
+            bid_it = self._bid_book.rbegin()
+            while bid_it != self._bid_book.rend():
+                row_amount = deref(bid_it).getAmount()
                 if row_amount + cumulative_base_amount >= base_amount:
                     row_amount = base_amount - cumulative_base_amount
                 cumulative_base_amount += row_amount
-                cumulative_volume += row_amount * order_book_row.price
+                cumulative_volume += row_amount * deref(bid_it).getPrice()
                 if cumulative_base_amount >= base_amount:
                     break
+                inc(bid_it)
 
         return OrderBookQueryResult(NaN, base_amount, NaN, cumulative_volume)
 
     cdef OrderBookQueryResult c_get_volume_for_price(self, bint is_buy, double price):
         cdef:
+            set[OrderBookEntry].iterator ask_it
+            set[OrderBookEntry].reverse_iterator bid_it
+            OrderBookDepthIndex *index
+            size_t count
             double cumulative_volume = 0
             double result_price = NaN
 
+        if self._depth_index_enabled:
+            index = self.c_get_depth_index(is_buy)
+            if is_buy:
+                count = deref(index).countAtOrBelow(price)
+                cumulative_volume = deref(index).basePrefix(count)
+                if count > 0:
+                    result_price = deref(index).getPrice(count - 1)
+            else:
+                count = deref(index).countBelow(price)
+                cumulative_volume = deref(index).baseSuffix(count)
+                if count < deref(index).size():
+                    result_price = deref(index).getPrice(count)
+            return OrderBookQueryResult(price, NaN, result_price, cumulative_volume)
+
         if is_buy:
-            for order_book_row in self.ask_entries():
-                if order_book_row.price > price:
+            ask_it = self._ask_book.begin()
+            while ask_it != self._ask_book.end():
+                if deref(ask_it).getPrice() > price:
                     break
-                cumulative_volume += order_book_row.amount
-                result_price = order_book_row.price
+                cumulative_volume += deref(ask_it).getAmount()
+                result_price = deref(ask_it).getPrice()
+                inc(ask_it)
         else:
-            for order_book_row in self.bid_entries():
-                if order_book_row.price < price:
+            bid_it = self._bid_book.rbegin()
+            while bid_it != self._bid_book.rend():
+                if deref(bid_it).getPrice() < price:
                     break
-                cumulative_volume += order_book_row.amount
-                result_price = order_book_row.price
+                cumulative_volume += deref(bid_it).getAmount()
+                result_price = deref(bid_it).getPrice()
+                inc(bid_it)
 
         return OrderBookQueryResult(price, NaN, result_price, cumulative_volume)
 
     cdef OrderBookQueryResult c_get_quote_volume_for_price(self, bint is_buy, double price):
         cdef:
+            set[OrderBookEntry].iterator ask_it
+            set[OrderBookEntry].reverse_iterator bid_it
+            OrderBookDepthIndex *index
+            size_t count
             double cumulative_volume = 0
             double result_price = NaN
 
+        if self._depth_index_enabled:
+            index = self.c_get_depth_index(is_buy)
+            if is_buy:
+                count = deref(index).countAtOrBelow(price)
+                cumulative_volume = deref(index).quotePrefix(count)
+                if count > 0:
+                    result_price = deref(index).getPrice(count - 1)
+            else:
+                count = deref(index).countBelow(price)
+                cumulative_volume = deref(index).quoteSuffix(count)
+                if count < deref(index).size():
+                    result_price = deref(index).getPrice(count)
+            return OrderBookQueryResult(price, NaN, result_price, cumulative_volume)
+
         if is_buy:
-            for order_book_row in self.ask_entries():
-                if order_book_row.price > price:
+            ask_it = self._ask_book.begin()
+            while ask_it != self._ask_book.end():
+                if deref(ask_it).getPrice() > price:
                     break
-                cumulative_volume += order_book_row.amount * order_book_row.price
-                result_price = order_book_row.price
+                cumulative_volume += deref(ask_it).getAmount() * deref(ask_it).getPrice()
+                result_price = deref(ask_it).getPrice()
+                inc(ask_it)
         else:
-            for order_book_row in self.bid_entries():
-                if order_book_row.price < price:
+            bid_it = self._bid_book.rbegin()
+            while bid_it != self._bid_book.rend():
+                if deref(bid_it).getPrice() < price:
                     break
-                cumulative_volume += order_book_row.amount * order_book_row.price
-                result_price = order_book_row.price
+                cumulative_volume += deref(bid_it).getAmount() * deref(bid_it).getPrice()
+                result_price = deref(bid_it).getPrice()
+                inc(bid_it)
 
         return OrderBookQueryResult(price, NaN, result_price, cumulative_volume)
 
@@ -495,6 +851,10 @@ cdef class OrderBook(PubSub):
     def restore_from_snapshot_and_diffs(self, snapshot: OrderBookMessage, diffs: List[OrderBookMessage]):
         replay_position = bisect.bisect_right(diffs, snapshot)
         replay_diffs = diffs[replay_position:]
-        self.apply_snapshot(snapshot.bids, snapshot.asks, snapshot.update_id)
-        for diff in replay_diffs:
-            self.apply_diffs(diff.bids, diff.asks, diff.update_id)
+        self.apply_numpy_snapshot(snapshot.bids_array, snapshot.asks_array, snapshot.update_id)
+        if len(replay_diffs) > 0:
+            # The message arrays carry their update IDs in the last column, so they stack into a single batch call.
+            self.c_apply_numpy_diffs_batch(np.vstack([diff.bids_array for diff in replay_diffs]),
+                                           np.vstack([diff.asks_array for diff in replay_diffs]))
+            # Messages without any entries aren't in the batch, but are still the last diff applied.
+            self._last_diff_uid = max(self._last_diff_uid, replay_diffs[-1].update_id)
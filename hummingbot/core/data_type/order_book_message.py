@@ -1,9 +1,10 @@
 #!/usr/bin/env python
 
-from collections import namedtuple
 from enum import Enum
 from functools import total_ordering
+import numpy as np
 from typing import (
+    Any,
     Dict,
     List,
     Optional,
@@ -19,7 +20,17 @@ class OrderBookMessageType(Enum):
 
 
 @total_ordering
-class OrderBookMessage(namedtuple("_OrderBookMessage", "type, content, timestamp")):
+class OrderBookMessage:
+    """
+    Order book snapshot, diff or trade message.
+
+    The bid and ask sides are parsed once, on first access, into float64 arrays with the columns
+    [price, amount, update_id], which can be passed to OrderBook.apply_numpy_diffs() directly. The OrderBookRow lists
+    returned by bids and asks are built from those arrays and cached as well, so replaying the same message - e.g.
+    in OrderBook.restore_from_snapshot_and_diffs() - does not parse it again.
+    """
+    __slots__ = ("type", "content", "timestamp", "_update_id", "_bids_array", "_asks_array", "_bids", "_asks")
+
     type: OrderBookMessageType
     content: Dict[str, any]
     timestamp: float
@@ -32,14 +43,37 @@ class OrderBookMessage(namedtuple("_OrderBookMessage", "type, content, timestamp
         *args,
         **kwargs,
     ):
-        return super(OrderBookMessage, cls).__new__(cls, message_type, content, timestamp, *args, **kwargs)
+        # The fields are set here rather than in __init__(), since subclasses adjust the arguments in their __new__().
+        message = super(OrderBookMessage, cls).__new__(cls)
+        message.type = message_type
+        message.content = content
+        message.timestamp = timestamp
+        message._update_id = None
+        message._bids_array = None
+        message._asks_array = None
+        message._bids = None
+        message._asks = None
+        return message
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(type={self.type!r}, content={self.content!r}, timestamp={self.timestamp!r})"
 
     @property
     def update_id(self) -> int:
-        if self.type in [OrderBookMessageType.DIFF, OrderBookMessageType.SNAPSHOT]:
-            return self.content["update_id"]
-        else:
-            return -1
+        if self._update_id is None:
+            if self.type in [OrderBookMessageType.DIFF, OrderBookMessageType.SNAPSHOT]:
+                self._update_id = self.content["update_id"]
+            else:
+                self._update_id = -1
+        return self._update_id
+
+    @property
+    def first_update_id(self) -> int:
+        """
+        The update ID of the first change in a diff message, for exchanges whose diff messages cover a range of update
+        IDs. It is the update ID of the message otherwise.
+        """
+        return self.content.get("first_update_id", self.update_id)
 
     @property
     def trade_id(self) -> int:
@@ -51,17 +85,40 @@ class OrderBookMessage(namedtuple("_OrderBookMessage", "type, content, timestamp
     def trading_pair(self) -> str:
         return self.content["trading_pair"]
 
+    def _parse_side(self, side: str) -> np.ndarray:
+        rows: List[Any] = self.content.get(side, [])
+        array: np.ndarray = np.empty((len(rows), 3), dtype=np.float64)
+        if len(rows) > 0:
+            # Entries may carry extra fields after price and amount, and are often strings - numpy converts them.
+            array[:, :2] = np.array([row[:2] for row in rows], dtype=np.float64)
+        array[:, 2] = self.update_id
+        return array
+
+    @property
+    def asks_array(self) -> np.ndarray:
+        if self._asks_array is None:
+            self._asks_array = self._parse_side("asks")
+        return self._asks_array
+
+    @property
+    def bids_array(self) -> np.ndarray:
+        if self._bids_array is None:
+            self._bids_array = self._parse_side("bids")
+        return self._bids_array
+
     @property
     def asks(self) -> List[OrderBookRow]:
-        return [
-            OrderBookRow(float(price), float(amount), self.update_id) for price, amount, *trash in self.content["asks"]
-        ]
+        if self._asks is None:
+            update_id: int = self.update_id
+            self._asks = [OrderBookRow(price, amount, update_id) for price, amount, _ in self.asks_array.tolist()]
+        return self._asks
 
     @property
     def bids(self) -> List[OrderBookRow]:
-        return [
-            OrderBookRow(float(price), float(amount), self.update_id) for price, amount, *trash in self.content["bids"]
-        ]
+        if self._bids is None:
+            update_id: int = self.update_id
+            self._bids = [OrderBookRow(price, amount, update_id) for price, amount, _ in self.bids_array.tolist()]
+        return self._bids
 
     @property
     def has_update_id(self) -> bool:
@@ -0,0 +1,301 @@
+#!/usr/bin/env python
+
+import asyncio
+import logging
+import numpy as np
+import os
+import re
+import time
+from typing import (
+    Any,
+    Dict,
+    List,
+    Optional,
+    Set,
+    Tuple
+)
+
+from hummingbot.logger import HummingbotLogger
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_message import (
+    OrderBookMessage,
+    OrderBookMessageType
+)
+from hummingbot.core.utils.async_utils import safe_ensure_future
+
+
+class OrderBookRecordChunk:
+    """
+    Recorded order book messages of a trading pair, in columns.
+
+    Every message has a type, a receive timestamp, an update ID - the trade ID for trades, -1 if it isn't numeric -
+    a trade type (0 for snapshots and diffs) and a number of bid and ask rows. The rows of all the messages are kept
+    in a single float64 array with the columns [price, amount], the bids of each message before its asks. A trade has
+    a single [price, amount] row, counted as a bid row.
+    """
+    FORMAT_VERSION: int = 1
+    COLUMNS: Tuple[str, ...] = ("type", "timestamp", "update_id", "trade_type", "num_bids", "num_asks", "rows")
+
+    def __init__(self,
+                 message_types: np.ndarray,
+                 timestamps: np.ndarray,
+                 update_ids: np.ndarray,
+                 trade_types: np.ndarray,
+                 num_bids: np.ndarray,
+                 num_asks: np.ndarray,
+                 rows: np.ndarray):
+        self.message_types: np.ndarray = message_types
+        self.timestamps: np.ndarray = timestamps
+        self.update_ids: np.ndarray = update_ids
+        self.trade_types: np.ndarray = trade_types
+        self.num_bids: np.ndarray = num_bids
+        self.num_asks: np.ndarray = num_asks
+        self.rows: np.ndarray = rows
+
+    def __len__(self) -> int:
+        return len(self.timestamps)
+
+    def save(self, path: str):
+        temp_path: str = f"{path}.tmp"
+        # Write to a temporary file first, so a crash mid-write never leaves a truncated chunk behind.
+        with open(temp_path, "wb") as fd:
+            np.savez_compressed(fd,
+                                version=np.array([self.FORMAT_VERSION]),
+                                type=self.message_types,
+                                timestamp=self.timestamps,
+                                update_id=self.update_ids,
+                                trade_type=self.trade_types,
+                                num_bids=self.num_bids,
+                                num_asks=self.num_asks,
+                                rows=self.rows)
+        os.replace(temp_path, path)
+
+    @classmethod
+    def load(cls, path: str) -> "OrderBookRecordChunk":
+        with np.load(path) as data:
+            version: int = int(data["version"][0])
+            if version != cls.FORMAT_VERSION:
+                raise ValueError(f"Unknown order book record format version {version} in {path}.")
+            return OrderBookRecordChunk(*[data[column] for column in cls.COLUMNS])
+
+
+class OrderBookRecordChunkBuilder:
+    """
+    Collects the messages of a chunk as they are recorded, and builds the chunk columns when it is written.
+    """
+    def __init__(self):
+        self._messages: List[Tuple[int, float, int, int, int, int]] = []
+        self._rows: List[np.ndarray] = []
+
+    def __len__(self) -> int:
+        return len(self._messages)
+
+    @property
+    def start_timestamp(self) -> float:
+        return self._messages[0][1]
+
+    def add_book_update(self,
+                        message_type: OrderBookMessageType,
+                        timestamp: float,
+                        update_id: int,
+                        bids: np.ndarray,
+                        asks: np.ndarray):
+        self._messages.append((message_type.value, timestamp, update_id, 0, len(bids), len(asks)))
+        self._rows.append(bids[:, :2])
+        self._rows.append(asks[:, :2])
+
+    def add_trade(self, timestamp: float, trade_id: int, trade_type: int, price: float, amount: float):
+        self._messages.append((OrderBookMessageType.TRADE.value, timestamp, trade_id, trade_type, 1, 0))
+        self._rows.append(np.array([[price, amount]], dtype=np.float64))
+
+    def build(self) -> OrderBookRecordChunk:
+        columns: List[Any] = list(zip(*self._messages)) if len(self._messages) > 0 else [()] * 6
+        return OrderBookRecordChunk(np.array(columns[0], dtype=np.uint8),
+                                    np.array(columns[1], dtype=np.float64),
+                                    np.array(columns[2], dtype=np.int64),
+                                    np.array(columns[3], dtype=np.uint8),
+                                    np.array(columns[4], dtype=np.uint32),
+                                    np.array(columns[5], dtype=np.uint32),
+                                    np.concatenate(self._rows) if len(self._rows) > 0 else np.empty((0, 2)))
+
+
+class OrderBookRecordingQueue(asyncio.Queue):
+    """
+    Message queue between an order book data source and its tracker, which records the messages put into it.
+    """
+    def __init__(self, recorder: "OrderBookRecorder"):
+        super().__init__()
+        self._recorder: OrderBookRecorder = recorder
+
+    def put_nowait(self, message: OrderBookMessage):
+        self._recorder.record_message(message)
+        super().put_nowait(message)
+
+
+class OrderBookRecorder:
+    """
+    Records the order book snapshots, diffs and trades of an order book tracker to compact columnar files, which
+    OrderBookReplayDataSource replays in back tests.
+
+    The messages are recorded as the data source sends them to the tracker, stamped with their receive time, and
+    written in chunks of chunk_duration seconds - one compressed numpy archive per trading pair and chunk, named after
+    the receive time of its first message in milliseconds. Every chunk starts with a snapshot of the tracked order book,
+    so a replay can start from any chunk. The tracked order books are also recorded as snapshots as soon as they are
+    initialized.
+    """
+    FILE_EXTENSION: str = ".npz"
+    CHECK_INTERVAL: float = 1.0
+
+    _obr_logger: Optional[HummingbotLogger] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._obr_logger is None:
+            cls._obr_logger = logging.getLogger(__name__)
+        return cls._obr_logger
+
+    @classmethod
+    def trading_pair_dir(cls, record_dir: str, trading_pair: str) -> str:
+        return os.path.join(record_dir, re.sub(r"[^\w\-.]", "_", trading_pair))
+
+    @classmethod
+    def chunk_paths(cls, record_dir: str, trading_pair: str) -> List[Tuple[float, str]]:
+        """
+        Returns the start timestamps and the paths of the recorded chunks of a trading pair, oldest first.
+        """
+        pair_dir: str = cls.trading_pair_dir(record_dir, trading_pair)
+        if not os.path.isdir(pair_dir):
+            return []
+        return sorted((int(file_name[:-len(cls.FILE_EXTENSION)]) / 1e3, os.path.join(pair_dir, file_name))
+                      for file_name in os.listdir(pair_dir)
+                      if file_name.endswith(cls.FILE_EXTENSION) and file_name[:-len(cls.FILE_EXTENSION)].isdigit())
+
+    def __init__(self, record_dir: str, chunk_duration: float = 3600.0):
+        """
+        :param record_dir: directory of the recorded chunks, with a sub-directory per trading pair
+        :param chunk_duration: seconds of messages in each chunk
+        """
+        self._record_dir: str = record_dir
+        self._chunk_duration: float = chunk_duration
+        self._chunk_builders: Dict[str, OrderBookRecordChunkBuilder] = {}
+        self._chunk_indices: Dict[str, int] = {}
+        self._snapshot_trading_pairs: Set[str] = set()
+        self._order_books: Dict[str, OrderBook] = {}
+        self._check_chunks_task: Optional[asyncio.Task] = None
+
+    @property
+    def record_dir(self) -> str:
+        return self._record_dir
+
+    @property
+    def chunk_duration(self) -> float:
+        return self._chunk_duration
+
+    def start(self, order_books: Dict[str, OrderBook]):
+        """
+        :param order_books: the order books of the tracker, by trading pair - they are recorded as snapshots when they
+                            are added and at the start of every chunk
+        """
+        self.stop()
+        self._order_books = order_books
+        self._check_chunks_task = safe_ensure_future(self._check_chunks_loop())
+
+    def stop(self):
+        if self._check_chunks_task is not None:
+            self._check_chunks_task.cancel()
+            self._check_chunks_task = None
+        self.flush()
+
+    def record_message(self, message: OrderBookMessage, timestamp: Optional[float] = None):
+        timestamp = time.time() if timestamp is None else timestamp
+        builder: OrderBookRecordChunkBuilder = self._chunk_builder(message.trading_pair, timestamp)
+        if message.type is OrderBookMessageType.TRADE:
+            try:
+                trade_id: int = int(message.trade_id)
+            except (TypeError, ValueError):
+                trade_id: int = -1
+            builder.add_trade(timestamp,
+                              trade_id,
+                              int(float(message.content["trade_type"])),
+                              float(message.content["price"]),
+                              float(message.content["amount"]))
+        else:
+            builder.add_book_update(message.type, timestamp, message.update_id, message.bids_array, message.asks_array)
+
+    def record_order_book(self, trading_pair: str, order_book: OrderBook, timestamp: Optional[float] = None):
+        timestamp = time.time() if timestamp is None else timestamp
+        bids, asks = order_book.numpy_snapshot
+        self._chunk_builder(trading_pair, timestamp).add_book_update(
+            OrderBookMessageType.SNAPSHOT,
+            timestamp,
+            max(order_book.snapshot_uid, order_book.last_diff_uid),
+            bids,
+            asks
+        )
+        self._snapshot_trading_pairs.add(trading_pair)
+
+    def flush(self):
+        """
+        Writes the messages recorded so far. The next messages of each trading pair go to a new chunk.
+        """
+        for trading_pair in list(self._chunk_builders.keys()):
+            self._write_chunk(trading_pair, self._chunk_builders.pop(trading_pair))
+        self._snapshot_trading_pairs.clear()
+
+    def check_chunks(self, timestamp: Optional[float] = None):
+        """
+        Writes the chunks that are over, and records the order books added since the last check - which includes the
+        order books of the trading pairs whose chunk is over, to start their new chunks.
+        """
+        timestamp = time.time() if timestamp is None else timestamp
+        for trading_pair, builder in self._end_chunks(timestamp):
+            self._write_chunk(trading_pair, builder)
+        self._record_new_order_books(timestamp)
+
+    def _end_chunks(self, timestamp: float) -> List[Tuple[str, OrderBookRecordChunkBuilder]]:
+        chunk_index: int = int(timestamp // self._chunk_duration)
+        ended_chunks: List[Tuple[str, OrderBookRecordChunkBuilder]] = []
+        for trading_pair, builder in list(self._chunk_builders.items()):
+            if self._chunk_indices[trading_pair] != chunk_index:
+                del self._chunk_builders[trading_pair]
+                self._snapshot_trading_pairs.discard(trading_pair)
+                ended_chunks.append((trading_pair, builder))
+        return ended_chunks
+
+    def _record_new_order_books(self, timestamp: float):
+        for trading_pair, order_book in list(self._order_books.items()):
+            if trading_pair not in self._snapshot_trading_pairs:
+                self.record_order_book(trading_pair, order_book, timestamp)
+
+    def _chunk_builder(self, trading_pair: str, timestamp: float) -> OrderBookRecordChunkBuilder:
+        builder: Optional[OrderBookRecordChunkBuilder] = self._chunk_builders.get(trading_pair)
+        if builder is None:
+            builder = self._chunk_builders[trading_pair] = OrderBookRecordChunkBuilder()
+            self._chunk_indices[trading_pair] = int(timestamp // self._chunk_duration)
+        return builder
+
+    def _write_chunk(self, trading_pair: str, builder: OrderBookRecordChunkBuilder):
+        if len(builder) == 0:
+            return
+        pair_dir: str = self.trading_pair_dir(self._record_dir, trading_pair)
+        path: str = os.path.join(pair_dir, f"{int(builder.start_timestamp * 1e3)}{self.FILE_EXTENSION}")
+        try:
+            os.makedirs(pair_dir, exist_ok=True)
+            builder.build().save(path)
+        except Exception:
+            self.logger().error(f"Error writing the order book record chunk {path}.", exc_info=True)
+
+    async def _check_chunks_loop(self):
+        ev_loop: asyncio.BaseEventLoop = asyncio.get_event_loop()
+        while True:
+            try:
+                await asyncio.sleep(self.CHECK_INTERVAL)
+                now: float = time.time()
+                # Compressing a whole chunk takes a while - it is written off the event loop.
+                for trading_pair, builder in self._end_chunks(now):
+                    await ev_loop.run_in_executor(None, self._write_chunk, trading_pair, builder)
+                self._record_new_order_books(now)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                self.logger().error("Unexpected error checking the order book record chunks.", exc_info=True)
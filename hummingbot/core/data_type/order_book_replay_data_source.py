@@ -0,0 +1,241 @@
+#!/usr/bin/env python
+
+import asyncio
+from collections import deque
+import math
+import numpy as np
+from typing import (
+    Deque,
+    Dict,
+    List,
+    Optional,
+    Set,
+    Tuple
+)
+
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_message import OrderBookMessageType
+from hummingbot.core.data_type.order_book_recorder import (
+    OrderBookRecordChunk,
+    OrderBookRecorder
+)
+from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
+from hummingbot.core.event.events import (
+    OrderBookTradeEvent,
+    TradeType
+)
+from hummingbot.core.py_time_iterator import PyTimeIterator
+
+SNAPSHOT_TYPE = OrderBookMessageType.SNAPSHOT.value
+DIFF_TYPE = OrderBookMessageType.DIFF.value
+TRADE_TYPE = OrderBookMessageType.TRADE.value
+
+
+class OrderBookReplayCursor:
+    """
+    Replay position in the recorded chunks of a trading pair. The chunks are loaded one at a time, as the replay
+    reaches them.
+    """
+    def __init__(self, chunk_paths: List[str]):
+        self._chunk_paths: Deque[str] = deque(chunk_paths)
+        self._chunk: Optional[OrderBookRecordChunk] = None
+        self._rows: np.ndarray = np.empty((0, 3), dtype=np.float64)
+        self._row_offsets: np.ndarray = np.empty(0, dtype=np.int64)
+        self._position: int = 0
+        self._next_timestamp: float = math.inf
+        self._load_next_chunk()
+
+    @property
+    def next_timestamp(self) -> float:
+        """
+        Receive time of the next message, infinity once all of them are replayed.
+        """
+        return self._next_timestamp
+
+    def _load_next_chunk(self):
+        while len(self._chunk_paths) > 0:
+            chunk: OrderBookRecordChunk = OrderBookRecordChunk.load(self._chunk_paths.popleft())
+            if len(chunk) == 0:
+                continue
+            row_counts: np.ndarray = chunk.num_bids.astype(np.int64) + chunk.num_asks
+            # The rows get the update ID of their message as a third column, so the bid and ask rows of a message are
+            # the [price, amount, update_id] arrays OrderBook.apply_numpy_diffs() takes, as they are.
+            self._rows = np.empty((len(chunk.rows), 3), dtype=np.float64)
+            self._rows[:, :2] = chunk.rows
+            self._rows[:, 2] = np.repeat(chunk.update_ids, row_counts)
+            self._row_offsets = np.concatenate(([0], np.cumsum(row_counts)[:-1]))
+            self._chunk = chunk
+            self._position = 0
+            self._next_timestamp = chunk.timestamps[0]
+            return
+        self._chunk = None
+        self._next_timestamp = math.inf
+
+    def next_message(self) -> Tuple[int, float, int, int, np.ndarray, np.ndarray]:
+        """
+        Returns the type, receive timestamp, update ID, trade type, bid rows and ask rows of the next message, and moves
+        past it.
+        """
+        position: int = self._position
+        chunk: OrderBookRecordChunk = self._chunk
+        offset: int = self._row_offsets[position]
+        bids_end: int = offset + chunk.num_bids[position]
+        asks_end: int = bids_end + chunk.num_asks[position]
+        message: Tuple[int, float, int, int, np.ndarray, np.ndarray] = (
+            chunk.message_types[position],
+            chunk.timestamps[position],
+            chunk.update_ids[position],
+            chunk.trade_types[position],
+            self._rows[offset:bids_end],
+            self._rows[bids_end:asks_end]
+        )
+        self._position += 1
+        if self._position < len(chunk):
+            self._next_timestamp = chunk.timestamps[self._position]
+        else:
+            self._load_next_chunk()
+        return message
+
+
+class OrderBookReplayDataSource(OrderBookTrackerDataSource):
+    """
+    Order book data source of the messages recorded by OrderBookRecorder, for back tests.
+
+    The initial order books are the recorded ones at start_time. From there, the messages are applied to the order
+    books directly - rather than through the tracker's message queues - by replay_til(), in the order they were received
+    and as fast as the clock ticks, through the time iterator of the data source. Add the iterator to the back test
+    clock before the markets and strategies, so they see the order books of each tick.
+    """
+    PAST_DIFF_WINDOW_SIZE: int = 32
+
+    def __init__(self, record_dir: str, trading_pairs: List[str], start_time: float = 0.0):
+        """
+        :param record_dir: directory of the recorded chunks, see OrderBookRecorder
+        :param trading_pairs: trading pairs to replay
+        :param start_time: UNIX timestamp to start the replay at
+        """
+        super().__init__(trading_pairs)
+        self._record_dir: str = record_dir
+        self._start_time: float = start_time
+        self._replay_timestamp: float = start_time
+        self._cursors: Dict[str, OrderBookReplayCursor] = {}
+        self._order_books: Dict[str, OrderBook] = {}
+        self._past_diffs_windows: Dict[str, Deque[Tuple[int, np.ndarray, np.ndarray]]] = {}
+        self._snapshot_trading_pairs: Set[str] = set()
+        self._time_iterator: OrderBookReplayIterator = OrderBookReplayIterator(self)
+
+        for trading_pair in trading_pairs:
+            chunk_paths: List[Tuple[float, str]] = OrderBookRecorder.chunk_paths(record_dir, trading_pair)
+            if len(chunk_paths) == 0:
+                raise ValueError(f"No recorded order book data for {trading_pair} in {record_dir}.")
+            # Every chunk starts with a snapshot, so the replay starts from the last chunk started by the start time.
+            first_chunk_index: int = max(0, sum(1 for timestamp, _ in chunk_paths if timestamp <= start_time) - 1)
+            self._cursors[trading_pair] = OrderBookReplayCursor([path for _, path in chunk_paths[first_chunk_index:]])
+
+    @property
+    def record_dir(self) -> str:
+        return self._record_dir
+
+    @property
+    def start_time(self) -> float:
+        return self._start_time
+
+    @property
+    def replay_timestamp(self) -> float:
+        """
+        The messages received up to this time have been replayed.
+        """
+        return self._replay_timestamp
+
+    @property
+    def next_message_timestamp(self) -> float:
+        """
+        Receive time of the next message to replay, infinity once all of them are replayed.
+        """
+        return min([self._cursors[trading_pair].next_timestamp for trading_pair in self._order_books] + [math.inf])
+
+    @property
+    def time_iterator(self) -> "OrderBookReplayIterator":
+        return self._time_iterator
+
+    async def get_last_traded_prices(self, trading_pairs: List[str]) -> Dict[str, float]:
+        return {trading_pair: self._order_books[trading_pair].last_trade_price
+                for trading_pair in trading_pairs
+                if trading_pair in self._order_books}
+
+    async def get_new_order_book(self, trading_pair: str) -> OrderBook:
+        return self.create_order_book(trading_pair)
+
+    def create_order_book(self, trading_pair: str) -> OrderBook:
+        """
+        Creates the replayed order book of a trading pair, as of the current replay timestamp.
+        """
+        if trading_pair not in self._order_books:
+            self._order_books[trading_pair] = self._order_book_create_function()
+            self._past_diffs_windows[trading_pair] = deque(maxlen=self.PAST_DIFF_WINDOW_SIZE)
+            self._replay_trading_pair_til(trading_pair, self._replay_timestamp)
+        return self._order_books[trading_pair]
+
+    def replay_til(self, timestamp: float):
+        """
+        Applies the messages received up to timestamp to the order books.
+        """
+        for trading_pair in self._order_books:
+            self._replay_trading_pair_til(trading_pair, timestamp)
+        self._replay_timestamp = max(self._replay_timestamp, timestamp)
+
+    def _replay_trading_pair_til(self, trading_pair: str, timestamp: float):
+        cursor: OrderBookReplayCursor = self._cursors[trading_pair]
+        order_book: OrderBook = self._order_books[trading_pair]
+        past_diffs_window: Deque[Tuple[int, np.ndarray, np.ndarray]] = self._past_diffs_windows[trading_pair]
+
+        while cursor.next_timestamp <= timestamp and not math.isinf(cursor.next_timestamp):
+            message_type, message_timestamp, update_id, trade_type, bids, asks = cursor.next_message()
+            if message_type == DIFF_TYPE:
+                past_diffs_window.append((update_id, bids, asks))
+                # Diffs older than the order book's snapshot are already in it, like in OrderBookTracker.
+                if trading_pair in self._snapshot_trading_pairs and order_book.snapshot_uid <= update_id:
+                    order_book.apply_numpy_diffs(bids, asks, update_id)
+            elif message_type == SNAPSHOT_TYPE:
+                # Recorded snapshots may miss the latest diffs, which are applied again on top.
+                order_book.apply_numpy_snapshot(bids, asks, update_id)
+                self._snapshot_trading_pairs.add(trading_pair)
+                for diff_update_id, diff_bids, diff_asks in past_diffs_window:
+                    if diff_update_id > update_id:
+                        order_book.apply_numpy_diffs(diff_bids, diff_asks, diff_update_id)
+            elif message_type == TRADE_TYPE:
+                order_book.apply_trade(OrderBookTradeEvent(
+                    trading_pair=trading_pair,
+                    timestamp=message_timestamp,
+                    price=bids[0, 0],
+                    amount=bids[0, 1],
+                    type=TradeType.BUY if trade_type == TradeType.BUY.value else TradeType.SELL
+                ))
+
+    async def listen_for_order_book_diffs(self, ev_loop: asyncio.BaseEventLoop, output: asyncio.Queue):
+        # The diffs are applied to the order books by replay_til().
+        pass
+
+    async def listen_for_order_book_snapshots(self, ev_loop: asyncio.BaseEventLoop, output: asyncio.Queue):
+        pass
+
+    async def listen_for_trades(self, ev_loop: asyncio.BaseEventLoop, output: asyncio.Queue):
+        pass
+
+
+class OrderBookReplayIterator(PyTimeIterator):
+    """
+    Replays the messages of an OrderBookReplayDataSource on every clock tick, and stops the clock once they are all
+    replayed. In fast forward back tests, the clock skips to the ticks with messages to replay.
+    """
+    def __init__(self, data_source: OrderBookReplayDataSource):
+        super().__init__()
+        self._data_source: OrderBookReplayDataSource = data_source
+
+    def tick(self, timestamp: float):
+        if math.isinf(self._data_source.next_message_timestamp):
+            raise StopIteration
+        self._data_source.replay_til(timestamp)
+
+    def get_next_wakeup_time(self) -> float:
+        return self._data_source.next_message_timestamp
@@ -0,0 +1,34 @@
+#!/usr/bin/env python
+
+from typing import List
+
+from hummingbot.core.data_type.order_book_replay_data_source import (
+    OrderBookReplayDataSource,
+    OrderBookReplayIterator
+)
+from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
+
+
+class OrderBookReplayTracker(OrderBookTracker):
+    """
+    Order book tracker of recorded order book data, for back tests on PaperTradeMarket - see
+    OrderBookReplayDataSource.
+    """
+    SNAPSHOT_INIT_CONCURRENCY: int = 100
+    SNAPSHOT_RATE_LIMIT = None
+
+    def __init__(self,
+                 record_dir: str,
+                 trading_pairs: List[str],
+                 start_time: float = 0.0,
+                 exchange_name: str = "replay"):
+        super().__init__(OrderBookReplayDataSource(record_dir, trading_pairs, start_time), trading_pairs)
+        self._exchange_name: str = exchange_name
+
+    @property
+    def exchange_name(self) -> str:
+        return self._exchange_name
+
+    @property
+    def time_iterator(self) -> OrderBookReplayIterator:
+        return self._data_source.time_iterator
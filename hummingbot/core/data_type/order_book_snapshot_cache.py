@@ -0,0 +1,132 @@
+#!/usr/bin/env python
+
+import logging
+import numpy as np
+import os
+import re
+import struct
+import time
+from typing import (
+    NamedTuple,
+    Optional
+)
+
+from hummingbot.logger import HummingbotLogger
+from hummingbot.core.data_type.order_book import OrderBook
+
+
+class OrderBookSnapshotCacheEntry(NamedTuple):
+    timestamp: float
+    update_id: int
+    bids: np.ndarray
+    asks: np.ndarray
+
+
+class OrderBookSnapshotCache:
+    """
+    On-disk cache of order book snapshots, one file per trading pair, so restarted order book trackers can seed their
+    order books without waiting for the REST snapshots.
+
+    The file format is a fixed size little endian header - magic, format version, saved timestamp, update ID and the
+    number of bid and ask rows - followed by the bid and the ask rows as float64 [price, amount, update_id] triples.
+    The rows are memory mapped when loaded and passed to OrderBook.apply_numpy_snapshot() as they are.
+    """
+    MAGIC: bytes = b"HBOBSNAP"
+    VERSION: int = 1
+    HEADER_FORMAT: str = "<8sIIdqQQ"
+    HEADER_SIZE: int = struct.calcsize(HEADER_FORMAT)
+    FILE_EXTENSION: str = ".obsnap"
+
+    _obsc_logger: Optional[HummingbotLogger] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._obsc_logger is None:
+            cls._obsc_logger = logging.getLogger(__name__)
+        return cls._obsc_logger
+
+    def __init__(self, cache_dir: str, max_age: float = 600.0):
+        """
+        :param cache_dir: directory of the snapshot files, usually one per exchange
+        :param max_age: snapshots saved longer than max_age seconds ago are not loaded
+        """
+        self._cache_dir: str = cache_dir
+        self._max_age: float = max_age
+
+    @property
+    def cache_dir(self) -> str:
+        return self._cache_dir
+
+    @property
+    def max_age(self) -> float:
+        return self._max_age
+
+    def path(self, trading_pair: str) -> str:
+        return os.path.join(self._cache_dir, re.sub(r"[^\w\-.]", "_", trading_pair) + self.FILE_EXTENSION)
+
+    def save(self, trading_pair: str, order_book: OrderBook, timestamp: Optional[float] = None):
+        bids, asks = order_book.numpy_snapshot
+        update_id: int = max(order_book.snapshot_uid, order_book.last_diff_uid)
+        header: bytes = struct.pack(self.HEADER_FORMAT,
+                                    self.MAGIC,
+                                    self.VERSION,
+                                    0,
+                                    time.time() if timestamp is None else timestamp,
+                                    update_id,
+                                    len(bids),
+                                    len(asks))
+        path: str = self.path(trading_pair)
+        temp_path: str = f"{path}.tmp"
+        os.makedirs(self._cache_dir, exist_ok=True)
+        # Write to a temporary file first, so a crash mid-write never leaves a truncated snapshot behind.
+        with open(temp_path, "wb") as fd:
+            fd.write(header)
+            fd.write(np.ascontiguousarray(bids, dtype="<f8").tobytes())
+            fd.write(np.ascontiguousarray(asks, dtype="<f8").tobytes())
+        os.replace(temp_path, path)
+
+    def load(self, trading_pair: str) -> Optional[OrderBookSnapshotCacheEntry]:
+        """
+        Returns the cached snapshot of the trading pair, or None if there is no usable snapshot.
+        """
+        path: str = self.path(trading_pair)
+        try:
+            with open(path, "rb") as fd:
+                header: bytes = fd.read(self.HEADER_SIZE)
+            if len(header) < self.HEADER_SIZE:
+                raise ValueError("Truncated header.")
+            magic, version, _, timestamp, update_id, num_bids, num_asks = struct.unpack(self.HEADER_FORMAT, header)
+            if magic != self.MAGIC or version != self.VERSION:
+                raise ValueError(f"Unknown snapshot format {magic!r} version {version}.")
+            if os.path.getsize(path) != self.HEADER_SIZE + (num_bids + num_asks) * 3 * 8:
+                raise ValueError("Truncated snapshot rows.")
+        except FileNotFoundError:
+            return None
+        except Exception:
+            self.logger().warning(f"Ignoring unreadable order book snapshot cache file {path}.", exc_info=True)
+            return None
+
+        if time.time() - timestamp > self._max_age:
+            return None
+        if num_bids + num_asks > 0:
+            rows: np.ndarray = np.memmap(path, dtype="<f8", mode="r", offset=self.HEADER_SIZE,
+                                         shape=(num_bids + num_asks, 3))
+        else:
+            rows: np.ndarray = np.empty((0, 3), dtype=np.float64)
+        return OrderBookSnapshotCacheEntry(timestamp, update_id, rows[:num_bids], rows[num_bids:])
+
+    def restore(self, trading_pair: str, order_book: OrderBook) -> bool:
+        """
+        Applies the cached snapshot of the trading pair to order_book. Returns whether there was one to apply.
+        """
+        entry: Optional[OrderBookSnapshotCacheEntry] = self.load(trading_pair)
+        if entry is None:
+            return False
+        order_book.apply_numpy_snapshot(entry.bids, entry.asks, entry.update_id)
+        return True
+
+    def remove(self, trading_pair: str):
+        try:
+            os.unlink(self.path(trading_pair))
+        except FileNotFoundError:
+            pass
@@ -1,7 +1,10 @@
 #!/usr/bin/env python
 import asyncio
 from abc import ABC
-from collections import deque
+from collections import (
+    defaultdict,
+    deque
+)
 from enum import Enum
 import logging
 import pandas as pd
@@ -10,13 +13,23 @@ from typing import (
     Dict,
     Deque,
     Optional,
+    Set,
     Tuple,
     List)
 import time
 from hummingbot.core.event.events import OrderBookTradeEvent, TradeType
 from hummingbot.logger import HummingbotLogger
 from hummingbot.core.data_type.order_book import OrderBook
-from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.core.data_type.order_book_recorder import (
+    OrderBookRecorder,
+    OrderBookRecordingQueue
+)
+from hummingbot.core.data_type.order_book_snapshot_cache import OrderBookSnapshotCache
+from hummingbot.core.utils.async_utils import (
+    safe_ensure_future,
+    safe_gather
+)
+from hummingbot.core.utils.asyncio_throttle import Throttler
 from .order_book_message import (
     OrderBookMessageType,
     OrderBookMessage,
@@ -34,6 +47,15 @@ class OrderBookTrackerDataSourceType(Enum):
 
 class OrderBookTracker(ABC):
     PAST_DIFF_WINDOW_SIZE: int = 32
+    SAVED_MESSAGES_QUEUE_SIZE: int = 1000
+    # Initial order book snapshots are fetched concurrently, at most SNAPSHOT_INIT_CONCURRENCY at a time, and within
+    # a request weight budget of SNAPSHOT_RATE_LIMIT. Exchange specific trackers override these with the weight of
+    # their snapshot requests and their rate limits - or set SNAPSHOT_RATE_LIMIT to None if their data source already
+    # takes the snapshot requests from the budget it shares with the market's other REST API calls.
+    SNAPSHOT_INIT_CONCURRENCY: int = 5
+    SNAPSHOT_REQUEST_WEIGHT: int = 1
+    SNAPSHOT_RATE_LIMIT: Optional[Tuple[int, float]] = (5, 1.0)
+    SNAPSHOT_CACHE_SAVE_INTERVAL: float = 60.0
     _obt_logger: Optional[HummingbotLogger] = None
 
     @classmethod
@@ -50,6 +72,20 @@ class OrderBookTracker(ABC):
         self._order_books: Dict[str, OrderBook] = {}
         self._tracking_message_queues: Dict[str, asyncio.Queue] = {}
         self._past_diffs_windows: Dict[str, Deque] = {}
+        self._saved_message_queues: Dict[str, Deque[OrderBookMessage]] = defaultdict(
+            lambda: deque(maxlen=self.SAVED_MESSAGES_QUEUE_SIZE)
+        )
+        self._saved_trade_messages: Dict[str, Deque[OrderBookMessage]] = defaultdict(
+            lambda: deque(maxlen=self.SAVED_MESSAGES_QUEUE_SIZE)
+        )
+        self._snapshot_init_concurrency: int = self.SNAPSHOT_INIT_CONCURRENCY
+        self._snapshot_throttler: Optional[Throttler] = (Throttler(self.SNAPSHOT_RATE_LIMIT)
+                                                         if self.SNAPSHOT_RATE_LIMIT is not None else None)
+        self._snapshot_cache: Optional[OrderBookSnapshotCache] = None
+        self._order_book_recorder: Optional[OrderBookRecorder] = None
+        self._rest_snapshot_trading_pairs: Set[str] = set()
+        self._cached_trading_pairs: Set[str] = set()
+        self._pending_cached_order_books: Dict[str, OrderBook] = {}
         self._order_book_diff_stream: asyncio.Queue = asyncio.Queue()
         self._order_book_snapshot_stream: asyncio.Queue = asyncio.Queue()
         self._order_book_trade_stream: asyncio.Queue = asyncio.Queue()
@@ -63,6 +99,7 @@ class OrderBookTracker(ABC):
         self._order_book_diff_router_task: Optional[asyncio.Task] = None
         self._order_book_snapshot_router_task: Optional[asyncio.Task] = None
         self._update_last_trade_prices_task: Optional[asyncio.Task] = None
+        self._snapshot_cache_save_task: Optional[asyncio.Task] = None
 
     @property
     def data_source(self) -> OrderBookTrackerDataSource:
@@ -76,6 +113,48 @@ class OrderBookTracker(ABC):
     def ready(self) -> bool:
         return self._order_books_initialized.is_set()
 
+    @property
+    def snapshot_init_concurrency(self) -> int:
+        return self._snapshot_init_concurrency
+
+    @snapshot_init_concurrency.setter
+    def snapshot_init_concurrency(self, value: int):
+        self._snapshot_init_concurrency = value
+
+    @property
+    def snapshot_cache(self) -> Optional[OrderBookSnapshotCache]:
+        return self._snapshot_cache
+
+    @snapshot_cache.setter
+    def snapshot_cache(self, snapshot_cache: Optional[OrderBookSnapshotCache]):
+        """
+        With a snapshot cache, order books are seeded from the cached snapshots on start, and refreshed from the REST
+        snapshots in the background. A cached snapshot is only used once the first live diff newer than it continues
+        from its update ID - otherwise the order book waits for its REST snapshot. The order books are saved to the
+        cache periodically and on stop.
+        """
+        self._snapshot_cache = snapshot_cache
+
+    @property
+    def order_book_recorder(self) -> Optional[OrderBookRecorder]:
+        return self._order_book_recorder
+
+    @order_book_recorder.setter
+    def order_book_recorder(self, order_book_recorder: Optional[OrderBookRecorder]):
+        """
+        With an order book recorder, the messages from the data source and the tracked order books are recorded while
+        the tracker runs. Set it before the tracker is started.
+        """
+        self._order_book_recorder = order_book_recorder
+        if order_book_recorder is not None:
+            self._order_book_diff_stream = OrderBookRecordingQueue(order_book_recorder)
+            self._order_book_snapshot_stream = OrderBookRecordingQueue(order_book_recorder)
+            self._order_book_trade_stream = OrderBookRecordingQueue(order_book_recorder)
+        else:
+            self._order_book_diff_stream = asyncio.Queue()
+            self._order_book_snapshot_stream = asyncio.Queue()
+            self._order_book_trade_stream = asyncio.Queue()
+
     @property
     def snapshot(self) -> Dict[str, Tuple[pd.DataFrame, pd.DataFrame]]:
         return {
@@ -109,8 +188,24 @@ class OrderBookTracker(ABC):
         self._update_last_trade_prices_task = safe_ensure_future(
             self._update_last_trade_prices_loop()
         )
+        if self._snapshot_cache is not None:
+            self._snapshot_cache_save_task = safe_ensure_future(
+                self._snapshot_cache_save_loop()
+            )
+        if self._order_book_recorder is not None:
+            self._order_book_recorder.start(self._order_books)
 
     def stop(self):
+        if self._snapshot_cache_save_task is not None:
+            self._snapshot_cache_save_task.cancel()
+            self._snapshot_cache_save_task = None
+        # The order books stop being updated from here, so they are saved only once.
+        self.save_snapshot_cache()
+        if self._order_book_recorder is not None:
+            self._order_book_recorder.stop()
+        self._rest_snapshot_trading_pairs.clear()
+        self._cached_trading_pairs.clear()
+        self._pending_cached_order_books.clear()
         if self._init_order_books_task is not None:
             self._init_order_books_task.cancel()
             self._init_order_books_task = None
@@ -168,32 +263,164 @@ class OrderBookTracker(ABC):
 
     async def _init_order_books(self):
         """
-        Initialize order books
+        Initialize order books. The snapshots are fetched concurrently, and each order book is tracked as soon as its
+        snapshot arrives. Order books with a recent enough snapshot in the snapshot cache are tracked as soon as the
+        live diffs are found to continue from it, and their REST snapshots are applied on top when they arrive.
         """
-        for index, trading_pair in enumerate(self._trading_pairs):
-            self._order_books[trading_pair] = await self._data_source.get_new_order_book(trading_pair)
-            self._tracking_message_queues[trading_pair] = asyncio.Queue()
-            self._tracking_tasks[trading_pair] = safe_ensure_future(self._track_single_book(trading_pair))
+        semaphore: asyncio.Semaphore = asyncio.Semaphore(self._snapshot_init_concurrency)
+        self._rest_snapshot_trading_pairs.clear()
+        self._cached_trading_pairs.clear()
+        self._pending_cached_order_books.clear()
+
+        if self._snapshot_cache is not None:
+            for trading_pair in self._trading_pairs:
+                order_book: OrderBook = self._data_source.order_book_create_function()
+                if self._snapshot_cache.restore(trading_pair, order_book):
+                    self._pending_cached_order_books[trading_pair] = order_book
+                    self._check_cached_order_book(trading_pair)
+
+        async def init_order_book(trading_pair: str):
+            while True:
+                try:
+                    async with semaphore:
+                        order_book: OrderBook = await self._get_new_order_book(trading_pair)
+                    break
+                except asyncio.CancelledError:
+                    raise
+                except Exception:
+                    self.logger().network(
+                        f"Unexpected error fetching order book snapshot for {trading_pair}.",
+                        exc_info=True,
+                        app_warning_msg=f"Unexpected error fetching order book snapshot for {trading_pair}. "
+                                        f"Retrying after 5 seconds."
+                    )
+                    await asyncio.sleep(5.0)
+            self._rest_snapshot_trading_pairs.add(trading_pair)
+            if trading_pair in self._cached_trading_pairs:
+                # The REST snapshot goes through the tracking queue like any other, and replaces the cached one.
+                bids, asks = order_book.numpy_snapshot
+                await self._tracking_message_queues[trading_pair].put(OrderBookMessage(
+                    OrderBookMessageType.SNAPSHOT,
+                    {"trading_pair": trading_pair, "update_id": order_book.snapshot_uid, "bids": bids, "asks": asks},
+                    timestamp=time.time()
+                ))
+                return
+            # A cached snapshot that the live diffs haven't confirmed yet is no longer needed.
+            self._pending_cached_order_books.pop(trading_pair, None)
+            self._start_tracking_order_book(trading_pair, order_book)
             self.logger().info(f"Initialized order book for {trading_pair}. "
-                               f"{index + 1}/{len(self._trading_pairs)} completed.")
-            await asyncio.sleep(1)
+                               f"{len(self._rest_snapshot_trading_pairs)}/{len(self._trading_pairs)} completed.")
+            self._check_order_books_initialized()
+
+        await safe_gather(*[init_order_book(trading_pair) for trading_pair in self._trading_pairs])
         self._order_books_initialized.set()
 
+    async def _get_new_order_book(self, trading_pair: str) -> OrderBook:
+        if self._snapshot_throttler is None:
+            return await self._data_source.get_new_order_book(trading_pair)
+        async with self._snapshot_throttler.weighted_task(self.SNAPSHOT_REQUEST_WEIGHT):
+            return await self._data_source.get_new_order_book(trading_pair)
+
+    def _check_order_books_initialized(self):
+        if len(self._cached_trading_pairs | self._rest_snapshot_trading_pairs) == len(self._trading_pairs):
+            self._order_books_initialized.set()
+
+    def _check_cached_order_book(self, trading_pair: str):
+        """
+        Starts tracking the order book restored from the snapshot cache for trading_pair, if the first saved diff newer
+        than the cached snapshot continues from its update ID. The cached order book is dropped if there is a gap in
+        the update IDs, and kept pending if no newer diff has been received yet.
+        """
+        order_book: OrderBook = self._pending_cached_order_books[trading_pair]
+        snapshot_uid: int = order_book.snapshot_uid
+        first_message: Optional[OrderBookMessage] = next(
+            (message for message in self._saved_message_queues.get(trading_pair, ())
+             if message.type is OrderBookMessageType.DIFF and message.update_id > snapshot_uid),
+            None
+        )
+        if first_message is None:
+            return
+        del self._pending_cached_order_books[trading_pair]
+        if first_message.first_update_id > snapshot_uid + 1:
+            self.logger().info(f"The cached order book snapshot of {trading_pair} (update ID {snapshot_uid}) is behind "
+                               f"the live diffs (update ID {first_message.first_update_id}). Waiting for the REST "
+                               f"snapshot.")
+            return
+        self._start_tracking_order_book(trading_pair, order_book)
+        self._cached_trading_pairs.add(trading_pair)
+        self.logger().info(f"Initialized order book for {trading_pair} from the snapshot cache.")
+        self._check_order_books_initialized()
+
+    def _save_order_book_diff(self, ob_message: OrderBookMessage):
+        """
+        Saves a diff message received before its order book is tracked, to be replayed on top of the snapshot. The diff
+        routers of the exchange trackers save their early diffs through here too, so a cached order book waiting for
+        its first live diff is checked whichever router received it.
+        """
+        trading_pair: str = ob_message.trading_pair
+        self._saved_message_queues[trading_pair].append(ob_message)
+        if trading_pair in self._pending_cached_order_books:
+            self._check_cached_order_book(trading_pair)
+
+    def _start_tracking_order_book(self, trading_pair: str, order_book: OrderBook):
+        message_queue: asyncio.Queue = asyncio.Queue()
+        # Diff and snapshot messages received while the snapshot was being fetched are replayed first, and so are the
+        # trades.
+        for message in self._saved_message_queues.pop(trading_pair, []):
+            if order_book.snapshot_uid <= message.update_id:
+                message_queue.put_nowait(message)
+        for trade_message in self._saved_trade_messages.pop(trading_pair, []):
+            self._apply_trade_message(order_book, trade_message)
+        self._order_books[trading_pair] = order_book
+        self._tracking_message_queues[trading_pair] = message_queue
+        self._tracking_tasks[trading_pair] = safe_ensure_future(self._track_single_book(trading_pair))
+
+    def save_snapshot_cache(self):
+        """
+        Saves the order books that have been synced with a REST snapshot since start to the snapshot cache.
+        """
+        if self._snapshot_cache is None:
+            return
+        for trading_pair in self._rest_snapshot_trading_pairs:
+            order_book: Optional[OrderBook] = self._order_books.get(trading_pair)
+            if order_book is None:
+                continue
+            try:
+                self._snapshot_cache.save(trading_pair, order_book)
+            except Exception:
+                self.logger().error(f"Error saving the order book snapshot of {trading_pair} to the snapshot cache.",
+                                    exc_info=True)
+
+    async def _snapshot_cache_save_loop(self):
+        while True:
+            try:
+                await asyncio.sleep(self.SNAPSHOT_CACHE_SAVE_INTERVAL)
+                self.save_snapshot_cache()
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                self.logger().error("Unexpected error saving the order book snapshot cache.", exc_info=True)
+
     async def _order_book_diff_router(self):
         """
         Route the real-time order book diff messages to the correct order book.
         """
         last_message_timestamp: float = time.time()
+        messages_queued: int = 0
         messages_accepted: int = 0
         messages_rejected: int = 0
-        await self._order_books_initialized.wait()
         while True:
             try:
                 ob_message: OrderBookMessage = await self._order_book_diff_stream.get()
                 trading_pair: str = ob_message.trading_pair
 
                 if trading_pair not in self._tracking_message_queues:
-                    messages_rejected += 1
+                    if trading_pair in self._trading_pairs:
+                        # Save diff messages received before the order book snapshot is ready.
+                        self._save_order_book_diff(ob_message)
+                        messages_queued += 1
+                    else:
+                        messages_rejected += 1
                     continue
                 message_queue: asyncio.Queue = self._tracking_message_queues[trading_pair]
                 # Check the order book's initial update ID. If it's larger, don't bother.
@@ -208,11 +435,13 @@ class OrderBookTracker(ABC):
                 # Log some statistics.
                 now: float = time.time()
                 if int(now / 60.0) > int(last_message_timestamp / 60.0):
-                    self.logger().info("Diff messages processed: %d, rejected: %d",
+                    self.logger().info("Diff messages processed: %d, rejected: %d, queued: %d",
                                        messages_accepted,
-                                       messages_rejected)
+                                       messages_rejected,
+                                       messages_queued)
                     messages_accepted = 0
                     messages_rejected = 0
+                    messages_queued = 0
 
                 last_message_timestamp = now
             except asyncio.CancelledError:
@@ -225,12 +454,14 @@ class OrderBookTracker(ABC):
         """
         Route the real-time order book snapshot messages to the correct order book.
         """
-        await self._order_books_initialized.wait()
         while True:
             try:
                 ob_message: OrderBookMessage = await self._order_book_snapshot_stream.get()
                 trading_pair: str = ob_message.trading_pair
                 if trading_pair not in self._tracking_message_queues:
+                    if trading_pair in self._trading_pairs:
+                        # Save snapshot messages received before the order book snapshot is ready.
+                        self._saved_message_queues[trading_pair].append(ob_message)
                     continue
                 message_queue: asyncio.Queue = self._tracking_message_queues[trading_pair]
                 await message_queue.put(ob_message)
@@ -253,7 +484,7 @@ class OrderBookTracker(ABC):
             try:
                 message: OrderBookMessage = await message_queue.get()
                 if message.type is OrderBookMessageType.DIFF:
-                    order_book.apply_diffs(message.bids, message.asks, message.update_id)
+                    order_book.apply_numpy_diffs(message.bids_array, message.asks_array, message.update_id)
                     past_diffs_window.append(message)
                     while len(past_diffs_window) > self.PAST_DIFF_WINDOW_SIZE:
                         past_diffs_window.popleft()
@@ -278,38 +509,36 @@ class OrderBookTracker(ABC):
 
     async def _emit_trade_event_loop(self):
         last_message_timestamp: float = time.time()
+        messages_queued: int = 0
         messages_accepted: int = 0
         messages_rejected: int = 0
-        await self._order_books_initialized.wait()
         while True:
             try:
                 trade_message: OrderBookMessage = await self._order_book_trade_stream.get()
                 trading_pair: str = trade_message.trading_pair
 
                 if trading_pair not in self._order_books:
-                    messages_rejected += 1
+                    if trading_pair in self._trading_pairs:
+                        # Save trade messages received before the order book snapshot is ready.
+                        self._saved_trade_messages[trading_pair].append(trade_message)
+                        messages_queued += 1
+                    else:
+                        messages_rejected += 1
                     continue
 
-                order_book: OrderBook = self._order_books[trading_pair]
-                order_book.apply_trade(OrderBookTradeEvent(
-                    trading_pair=trade_message.trading_pair,
-                    timestamp=trade_message.timestamp,
-                    price=float(trade_message.content["price"]),
-                    amount=float(trade_message.content["amount"]),
-                    type=TradeType.SELL if
-                    trade_message.content["trade_type"] == float(TradeType.SELL.value) else TradeType.SELL
-                ))
-
+                self._apply_trade_message(self._order_books[trading_pair], trade_message)
                 messages_accepted += 1
 
                 # Log some statistics.
                 now: float = time.time()
                 if int(now / 60.0) > int(last_message_timestamp / 60.0):
-                    self.logger().debug("Trade messages processed: %d, rejected: %d",
+                    self.logger().debug("Trade messages processed: %d, rejected: %d, queued: %d",
                                         messages_accepted,
-                                        messages_rejected)
+                                        messages_rejected,
+                                        messages_queued)
                     messages_accepted = 0
                     messages_rejected = 0
+                    messages_queued = 0
 
                 last_message_timestamp = now
             except asyncio.CancelledError:
@@ -321,3 +550,14 @@ class OrderBookTracker(ABC):
                     app_warning_msg=f"Unexpected error routing order book messages. Retrying after 5 seconds."
                 )
                 await asyncio.sleep(5.0)
+
+    @staticmethod
+    def _apply_trade_message(order_book: OrderBook, trade_message: OrderBookMessage):
+        order_book.apply_trade(OrderBookTradeEvent(
+            trading_pair=trade_message.trading_pair,
+            timestamp=trade_message.timestamp,
+            price=float(trade_message.content["price"]),
+            amount=float(trade_message.content["amount"]),
+            type=TradeType.SELL if
+            trade_message.content["trade_type"] == float(TradeType.SELL.value) else TradeType.SELL
+        ))
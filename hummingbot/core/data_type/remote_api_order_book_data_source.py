@@ -21,6 +21,7 @@ from hummingbot.market.binance.binance_order_book import BinanceOrderBook
 from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
 from hummingbot.logger import HummingbotLogger
 from hummingbot.core.data_type.order_book_tracker_entry import OrderBookTrackerEntry
+from hummingbot.core.utils.http_session_registry import get_http_session
 
 
 class RemoteAPIOrderBookDataSource(OrderBookTrackerDataSource):
@@ -53,7 +54,7 @@ class RemoteAPIOrderBookDataSource(OrderBookTrackerDataSource):
 
     async def get_client_session(self) -> aiohttp.ClientSession:
         if self._client_session is None:
-            self._client_session = aiohttp.ClientSession()
+            self._client_session = get_http_session(self.SNAPSHOT_REST_URL)
         return self._client_session
 
     async def get_tracking_pairs(self) -> Dict[str, OrderBookTrackerEntry]:
@@ -0,0 +1,243 @@
+# distutils: language=c++
+# distutils: sources=['hummingbot/core/cpp/OrderBookEntry.cpp', 'hummingbot/core/cpp/OrderBookLadder.cpp']
+cimport cython
+from cython.operator cimport(
+    dereference as deref,
+    address as ref
+)
+from typing import Iterator
+import numpy as np
+from hummingbot.core.data_type.OrderBookLadder cimport truncateOverlapLadders
+from .order_book_row import OrderBookRow
+
+NaN = float("nan")
+
+
+cdef class TickLadderOrderBook(OrderBook):
+    """
+    Order book backed by flat, tick indexed arrays instead of the node based std::set used by OrderBook.
+
+    It is meant for exchanges with a fixed price increment - prices are keyed by their tick index, so prices that are
+    not multiples of tick_size are rounded onto the nearest tick. Applying diffs does not allocate memory per price
+    level, and the best prices sit at the end of the arrays. It has the same API as OrderBook, so connectors can opt in
+    by setting their data source's order_book_create_function, e.g.
+
+        data_source.order_book_create_function = lambda: TickLadderOrderBook(tick_size=0.01)
+
+    The depth_index option of OrderBook is not supported by this backend.
+    """
+
+    def __init__(self, tick_size: float, dex=False, initial_capacity: int = 1024):
+        if not tick_size > 0:
+            raise ValueError(f"tick_size must be positive, got {tick_size}.")
+        super().__init__(dex=dex)
+        self._tick_size = tick_size
+        self._bid_ladder = OrderBookLadder(tick_size, False)
+        self._ask_ladder = OrderBookLadder(tick_size, True)
+        self._bid_ladder.reserve(initial_capacity)
+        self._ask_ladder.reserve(initial_capacity)
+
+    @property
+    def tick_size(self) -> float:
+        return self._tick_size
+
+    cdef c_apply_diffs(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id):
+        cdef:
+            double previous_best_bid = self._best_bid
+            double previous_best_ask = self._best_ask
+
+        # Apply the diffs. Diffs with 0 amounts mean deletion.
+        for bid in bids:
+            self._bid_ladder.set(bid)
+        for ask in asks:
+            self._ask_ladder.set(ask)
+
+        # If any overlapping entries between the bid and ask books, centralised: newer entries win, dex: see OrderBookLadder.cpp
+        truncateOverlapLadders(self._bid_ladder, self._ask_ladder, self._dex)
+        self.c_update_best_prices()
+
+        # Remember the last diff update ID.
+        self._last_diff_uid = update_id
+        self.c_trigger_change_event(bids, asks, previous_best_bid, previous_best_ask, False)
+
+    cdef c_apply_snapshot(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id):
+        cdef:
+            double previous_best_bid = self._best_bid
+            double previous_best_ask = self._best_ask
+
+        # Start with an empty order book, and then insert all entries.
+        self._bid_ladder.clear()
+        self._ask_ladder.clear()
+        for bid in bids:
+            self._bid_ladder.set(bid)
+        for ask in asks:
+            self._ask_ladder.set(ask)
+
+        if self._dex:
+            truncateOverlapLadders(self._bid_ladder, self._ask_ladder, self._dex)
+        self._best_bid = self._best_ask = NaN
+        self.c_update_best_prices()
+
+        # Remember the last snapshot update ID.
+        self._snapshot_uid = update_id
+        self.c_trigger_change_event(bids, asks, previous_best_bid, previous_best_ask, True)
+
+    cdef c_update_best_prices(self):
+        # Record the current best prices, for faster c_get_price() calls.
+        if not self._bid_ladder.empty():
+            self._best_bid = self._bid_ladder.getBest().getPrice()
+        if not self._ask_ladder.empty():
+            self._best_ask = self._ask_ladder.getBest().getPrice()
+
+    def bid_entries(self) -> Iterator[OrderBookRow]:
+        cdef:
+            size_t depth = 0
+            OrderBookEntry entry
+        while depth < self._bid_ladder.size():
+            entry = self._bid_ladder.getLevel(depth)
+            yield OrderBookRow(entry.getPrice(), entry.getAmount(), entry.getUpdateId())
+            depth += 1
+
+    def ask_entries(self) -> Iterator[OrderBookRow]:
+        cdef:
+            size_t depth = 0
+            OrderBookEntry entry
+        while depth < self._ask_ladder.size():
+            entry = self._ask_ladder.getLevel(depth)
+            yield OrderBookRow(entry.getPrice(), entry.getAmount(), entry.getUpdateId())
+            depth += 1
+
+    @cython.boundscheck(False)
+    @cython.wraparound(False)
+    cdef object c_get_numpy_entries(self, bint is_bid):
+        cdef:
+            OrderBookLadder *ladder = ref(self._bid_ladder) if is_bid else ref(self._ask_ladder)
+            object array = np.empty((deref(ladder).size(), 3), dtype=np.float64)
+            double[:, :] rows = array
+            size_t depth
+            OrderBookEntry entry
+
+        for depth in range(deref(ladder).size()):
+            entry = deref(ladder).getLevel(depth)
+            rows[depth, 0] = entry.getPrice()
+            rows[depth, 1] = entry.getAmount()
+            rows[depth, 2] = entry.getUpdateId()
+        return array
+
+    cdef OrderBookLadder *c_get_ladder(self, bint is_buy):
+        return ref(self._ask_ladder) if is_buy else ref(self._bid_ladder)
+
+    cdef double c_get_price(self, bint is_buy) except? -1:
+        if deref(self.c_get_ladder(is_buy)).empty():
+            raise EnvironmentError("Order book is empty - no price quote is possible.")
+        return self._best_ask if is_buy else self._best_bid
+
+    cdef OrderBookQueryResult c_get_price_for_volume(self, bint is_buy, double volume):
+        cdef:
+            OrderBookLadder *ladder = self.c_get_ladder(is_buy)
+            size_t depth
+            double cumulative_volume = 0
+            double result_price = NaN
+
+        for depth in range(deref(ladder).size()):
+            cumulative_volume += deref(ladder).getLevel(depth).getAmount()
+            if cumulative_volume >= volume:
+                result_price = deref(ladder).getLevel(depth).getPrice()
+                break
+
+        return OrderBookQueryResult(NaN, volume, result_price, min(cumulative_volume, volume))
+
+    cdef OrderBookQueryResult c_get_vwap_for_volume(self, bint is_buy, double volume):
+        cdef:
+            OrderBookLadder *ladder = self.c_get_ladder(is_buy)
+            size_t depth
+            double price
+            double amount
+            double total_cost = 0
+            double total_volume = 0
+            double incremental_amount
+            double result_vwap = NaN
+
+        for depth in range(deref(ladder).size()):
+            price = deref(ladder).getLevel(depth).getPrice()
+            amount = deref(ladder).getLevel(depth).getAmount()
+            total_cost += amount * price
+            total_volume += amount
+            if total_volume >= volume:
+                total_cost -= amount * price
+                total_volume -= amount
+                incremental_amount = volume - total_volume
+                total_cost += incremental_amount * price
+                total_volume += incremental_amount
+                result_vwap = total_cost / total_volume
+                break
+
+        return OrderBookQueryResult(NaN, volume, result_vwap, min(total_volume, volume))
+
+    cdef OrderBookQueryResult c_get_price_for_quote_volume(self, bint is_buy, double quote_volume):
+        cdef:
+            OrderBookLadder *ladder = self.c_get_ladder(is_buy)
+            size_t depth
+            double cumulative_volume = 0
+            double result_price = NaN
+
+        for depth in range(deref(ladder).size()):
+            cumulative_volume += deref(ladder).getLevel(depth).getAmount() * deref(ladder).getLevel(depth).getPrice()
+            if cumulative_volume >= quote_volume:
+                result_price = deref(ladder).getLevel(depth).getPrice()
+                break
+
+        return OrderBookQueryResult(NaN, quote_volume, result_price, min(cumulative_volume, quote_volume))
+
+    cdef OrderBookQueryResult c_get_quote_volume_for_base_amount(self, bint is_buy, double base_amount):
+        cdef:
+            OrderBookLadder *ladder = self.c_get_ladder(is_buy)
+            size_t depth
+            double cumulative_volume = 0
+            double cumulative_base_amount = 0
+            double row_amount = 0
+
+        for depth in range(deref(ladder).size()):
+            row_amount = deref(ladder).getLevel(depth).getAmount()
+            if row_amount + cumulative_base_amount >= base_amount:
+                row_amount = base_amount - cumulative_base_amount
+            cumulative_base_amount += row_amount
+            cumulative_volume += row_amount * deref(ladder).getLevel(depth).getPrice()
+            if cumulative_base_amount >= base_amount:
+                break
+
+        return OrderBookQueryResult(NaN, base_amount, NaN, cumulative_volume)
+
+    cdef OrderBookQueryResult c_get_volume_for_price(self, bint is_buy, double price):
+        cdef:
+            OrderBookLadder *ladder = self.c_get_ladder(is_buy)
+            size_t depth
+            double level_price
+            double cumulative_volume = 0
+            double result_price = NaN
+
+        for depth in range(deref(ladder).size()):
+            level_price = deref(ladder).getLevel(depth).getPrice()
+            if (is_buy and level_price > price) or (not is_buy and level_price < price):
+                break
+            cumulative_volume += deref(ladder).getLevel(depth).getAmount()
+            result_price = level_price
+
+        return OrderBookQueryResult(price, NaN, result_price, cumulative_volume)
+
+    cdef OrderBookQueryResult c_get_quote_volume_for_price(self, bint is_buy, double price):
+        cdef:
+            OrderBookLadder *ladder = self.c_get_ladder(is_buy)
+            size_t depth
+            double level_price
+            double cumulative_volume = 0
+            double result_price = NaN
+
+        for depth in range(deref(ladder).size()):
+            level_price = deref(ladder).getLevel(depth).getPrice()
+            if (is_buy and level_price > price) or (not is_buy and level_price < price):
+                break
+            cumulative_volume += deref(ladder).getLevel(depth).getAmount() * level_price
+            result_price = level_price
+
+        return OrderBookQueryResult(price, NaN, result_price, cumulative_volume)
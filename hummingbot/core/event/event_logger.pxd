@@ -4,8 +4,13 @@ from .event_listener cimport EventListener
 cdef class EventLogger(EventListener):
     cdef:
         str _event_source
+        long _max_events
+        frozenset _unbounded_event_types
         object _logged_events
+        dict _events_by_type
+        dict _order_filled_totals
         dict _waiting
         dict _wait_returns
     cdef c_call(self, object event_object)
-
+    cdef c_log_event(self, object event_object, object event_object_type)
+    cdef c_add_order_filled_totals(self, object order_filled_event)
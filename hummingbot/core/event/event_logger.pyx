@@ -2,32 +2,77 @@
 
 import asyncio
 from async_timeout import timeout
+from collections import deque
+from decimal import Decimal
 from typing import (
+    Dict,
+    Iterable,
     List,
     Optional,
+    Tuple,
 )
 
 from hummingbot.core.event.event_listener cimport EventListener
+from hummingbot.core.event.events import (
+    OrderFilledEvent,
+    TradeType
+)
+
+s_decimal_0 = Decimal(0)
 
 
 cdef class EventLogger(EventListener):
-    def __init__(self, event_source: Optional[str] = None):
+    """
+    Logs the events it receives.
+
+    If max_events is given, only the latest max_events events are kept. The logged events are also indexed by event
+    type, and the base and quote asset changes of the logged OrderFilledEvents are totalled by trading pair as they come
+    in - the totals include the fills that have dropped out of the log.
+
+    Events of the unbounded_event_types stay in events_of_type() after they drop out of the log.
+    """
+    def __init__(self,
+                 event_source: Optional[str] = None,
+                 max_events: Optional[int] = None,
+                 unbounded_event_types: Optional[Iterable[type]] = None):
         super().__init__()
         self._event_source = event_source
-        self._logged_events = []
+        self._max_events = max_events if max_events is not None else -1
+        self._unbounded_event_types = frozenset(unbounded_event_types or [])
+        self._logged_events = deque()
+        self._events_by_type = {}
+        self._order_filled_totals = {}
         self._waiting = {}
         self._wait_returns = {}
 
     @property
     def event_log(self) -> List[any]:
-        return self._logged_events.copy()
+        return list(self._logged_events)
 
     @property
     def event_source(self) -> str:
         return self._event_source
 
+    @property
+    def max_events(self) -> Optional[int]:
+        return self._max_events if self._max_events >= 0 else None
+
+    @property
+    def order_filled_totals(self) -> Dict[str, Tuple[Decimal, Decimal]]:
+        """
+        The total (base asset change, quote asset change) of the order filled events by trading pair. Buys add to the
+        base asset and take from the quote asset, sells do the opposite. Fees are not included.
+        """
+        return {trading_pair: tuple(totals) for trading_pair, totals in self._order_filled_totals.items()}
+
+    def events_of_type(self, event_type) -> List[any]:
+        events = self._events_by_type.get(event_type)
+        return list(events) if events is not None else []
+
     def clear(self):
         self._logged_events.clear()
+        self._events_by_type.clear()
+        self._order_filled_totals.clear()
 
     async def wait_for(self, event_type, timeout_seconds: float = 180):
         notifier = asyncio.Event()
@@ -45,8 +90,10 @@ cdef class EventLogger(EventListener):
         self.c_call(event_object)
 
     cdef c_call(self, object event_object):
-        self._logged_events.append(event_object)
         event_object_type = type(event_object)
+        self.c_log_event(event_object, event_object_type)
+        if event_object_type is OrderFilledEvent:
+            self.c_add_order_filled_totals(event_object)
 
         should_notify = []
         for notifier, waiting_event_type in self._waiting.items():
@@ -55,3 +102,33 @@ cdef class EventLogger(EventListener):
                 self._wait_returns[notifier] = event_object
         for notifier in should_notify:
             notifier.set()
+
+    cdef c_log_event(self, object event_object, object event_object_type):
+        cdef:
+            object evicted_event
+            object events = self._events_by_type.get(event_object_type)
+
+        if events is None:
+            events = self._events_by_type[event_object_type] = deque()
+        self._logged_events.append(event_object)
+        events.append(event_object)
+
+        if 0 <= self._max_events < len(self._logged_events):
+            # The evicted event is the oldest one logged, and so the oldest one of its type too.
+            evicted_event = self._logged_events.popleft()
+            if type(evicted_event) not in self._unbounded_event_types:
+                self._events_by_type[type(evicted_event)].popleft()
+
+    cdef c_add_order_filled_totals(self, object order_filled_event):
+        cdef:
+            list totals = self._order_filled_totals.get(order_filled_event.trading_pair)
+            object quote_value = order_filled_event.price * order_filled_event.amount
+
+        if totals is None:
+            totals = self._order_filled_totals[order_filled_event.trading_pair] = [s_decimal_0, s_decimal_0]
+        if order_filled_event.trade_type is TradeType.BUY:
+            totals[0] += order_filled_event.amount
+            totals[1] -= quote_value
+        else:
+            totals[0] -= order_filled_event.amount
+            totals[1] += quote_value
@@ -51,6 +51,7 @@ class ERC20WatcherEvent(Enum):
 
 class OrderBookEvent(Enum):
     TradeEvent = 901
+    OrderBookChangedEvent = 902
 
 
 class ZeroExEvent(Enum):
@@ -235,6 +236,12 @@ class OrderBookTradeEvent(NamedTuple):
     amount: Decimal
 
 
+class OrderBookChangedEvent(NamedTuple):
+    best_bid: float
+    best_ask: float
+    top_of_book_changed: bool
+
+
 class OrderFilledEvent(NamedTuple):
     timestamp: float
     order_id: str
@@ -5,6 +5,12 @@ cdef class PyTimeIterator(TimeIterator):
     def tick(self, double timestamp):
         raise NotImplementedError
 
+    def get_next_wakeup_time(self) -> float:
+        return self._current_timestamp
+
     cdef c_tick(self, double timestamp):
         TimeIterator.c_tick(self, timestamp)
         self.tick(timestamp)
+
+    cdef double c_get_next_wakeup_time(self):
+        return self.get_next_wakeup_time()
@@ -24,6 +24,14 @@ cdef class TimeIterator(PubSub):
     cdef c_tick(self, double timestamp):
         self._current_timestamp = timestamp
 
+    cdef double c_get_next_wakeup_time(self):
+        """
+        The earliest time the iterator has work to do at, for back tests that fast forward over the ticks no iterator
+        needs. Times up to the current timestamp mean the next tick, which is the default, and infinity means the
+        iterator only reacts to the other iterators.
+        """
+        return self._current_timestamp
+
     @property
     def current_timestamp(self) -> float:
         return self._current_timestamp
@@ -32,6 +40,9 @@ cdef class TimeIterator(PubSub):
     def clock(self) -> Optional[Clock]:
         return self._clock
 
+    def get_next_wakeup_time(self) -> float:
+        return self.c_get_next_wakeup_time()
+
     def start(self, clock: Clock):
         self.c_start(clock, clock.current_timestamp)
 
@@ -3,16 +3,22 @@
 import asyncio
 from async_timeout import timeout
 import logging
+import time
 from typing import (
+    Any,
+    Dict,
+    List,
     Optional,
     Coroutine,
     NamedTuple,
-    Callable
+    Callable,
+    Tuple
 )
 
 import hummingbot
 from hummingbot.logger import HummingbotLogger
 from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.core.utils.asyncio_throttle import Throttler
 
 
 class AsyncCallSchedulerItem(NamedTuple):
@@ -20,64 +26,125 @@ class AsyncCallSchedulerItem(NamedTuple):
     coroutine: Coroutine
     timeout_seconds: float
     app_warning_msg: str = "API call error."
+    queued_timestamp: float = 0.0
 
 
-class AsyncCallScheduler:
-    _acs_shared_instance: Optional["AsyncCallScheduler"] = None
-    _acs_logger: Optional[HummingbotLogger] = None
+class AsyncCallSchedulerLaneStats(NamedTuple):
+    queue_depth: int
+    active_calls: int
+    completed_calls: int
+    failed_calls: int
+    average_wait_time: float
+    average_call_time: float
+    max_latency: float
 
-    @classmethod
-    def shared_instance(cls):
-        if cls._acs_shared_instance is None:
-            cls._acs_shared_instance = AsyncCallScheduler()
-        return cls._acs_shared_instance
+
+class AsyncCallSchedulerLane:
+    """
+    A queue of async calls, run by up to max_concurrency workers. Each worker waits call_interval seconds after every
+    call it makes, and if a rate limit of (weight, seconds) is given, every call takes a weight of 1 from it.
+
+    A lane with a max_concurrency of 1 runs its calls strictly one after another.
+    """
+    _acsl_logger: Optional[HummingbotLogger] = None
 
     @classmethod
     def logger(cls) -> HummingbotLogger:
-        if cls._acs_logger is None:
-            cls._acs_logger = logging.getLogger(__name__)
-        return cls._acs_logger
+        if cls._acsl_logger is None:
+            cls._acsl_logger = logging.getLogger(__name__)
+        return cls._acsl_logger
 
-    def __init__(self, call_interval: float = 0.01):
-        self._coro_queue: asyncio.Queue = asyncio.Queue()
-        self._coro_scheduler_task: Optional[asyncio.Task] = None
+    def __init__(self,
+                 name: str,
+                 max_concurrency: int = 1,
+                 call_interval: float = 0.01,
+                 rate_limit: Optional[Tuple[int, float]] = None):
+        self._name: str = name
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self._max_concurrency: int = max(1, max_concurrency)
         self._call_interval: float = call_interval
-        self._ev_loop: asyncio.AbstractEventLoop = asyncio.get_event_loop()
+        self._throttler: Optional[Throttler] = Throttler(rate_limit) if rate_limit is not None else None
+        self._worker_tasks: List[asyncio.Task] = []
+
+        self._active_calls: int = 0
+        self._completed_calls: int = 0
+        self._failed_calls: int = 0
+        self._total_wait_time: float = 0.0
+        self._total_call_time: float = 0.0
+        self._max_latency: float = 0.0
 
     @property
-    def coro_queue(self) -> asyncio.Queue:
-        return self._coro_queue
+    def name(self) -> str:
+        return self._name
 
     @property
-    def coro_scheduler_task(self) -> Optional[asyncio.Task]:
-        return self._coro_scheduler_task
+    def queue(self) -> asyncio.Queue:
+        return self._queue
+
+    @property
+    def max_concurrency(self) -> int:
+        return self._max_concurrency
+
+    @property
+    def call_interval(self) -> float:
+        return self._call_interval
+
+    @property
+    def worker_tasks(self) -> List[asyncio.Task]:
+        return self._worker_tasks
 
     @property
     def started(self) -> bool:
-        return self._coro_scheduler_task is not None
+        return len(self._worker_tasks) > 0
+
+    @property
+    def stats(self) -> AsyncCallSchedulerLaneStats:
+        """
+        Wait time is from the call being scheduled until it starts, including the time waiting on the rate limit. Call
+        time is the time the call takes to finish, and latency is the two together.
+        """
+        finished_calls: int = self._completed_calls + self._failed_calls
+        return AsyncCallSchedulerLaneStats(
+            queue_depth=self._queue.qsize(),
+            active_calls=self._active_calls,
+            completed_calls=self._completed_calls,
+            failed_calls=self._failed_calls,
+            average_wait_time=self._total_wait_time / finished_calls if finished_calls > 0 else 0.0,
+            average_call_time=self._total_call_time / finished_calls if finished_calls > 0 else 0.0,
+            max_latency=self._max_latency
+        )
 
     def start(self):
-        if self._coro_scheduler_task is not None:
+        if self.started:
             self.stop()
-        self._coro_scheduler_task = safe_ensure_future(
-            self._coro_scheduler(
-                self._coro_queue,
-                self._call_interval
-            )
-        )
+        self._worker_tasks = [safe_ensure_future(self._worker()) for _ in range(self._max_concurrency)]
 
     def stop(self):
-        if self._coro_scheduler_task is not None:
-            self._coro_scheduler_task.cancel()
-            self._coro_scheduler_task = None
+        for worker_task in self._worker_tasks:
+            worker_task.cancel()
+        self._worker_tasks = []
 
-    async def _coro_scheduler(self, coro_queue: asyncio.Queue, interval: float = 0.01):
+    def put_nowait(self, item: AsyncCallSchedulerItem):
+        self._queue.put_nowait(item)
+        if not self.started:
+            self.start()
+
+    async def _worker(self):
         while True:
             app_warning_msg = "API call error."
+            fut = None
+            call_start_timestamp = None
             try:
-                fut, coro, timeout_seconds, app_warning_msg = await coro_queue.get()
+                fut, coro, timeout_seconds, app_warning_msg, queued_timestamp = await self._queue.get()
+                if self._throttler is not None:
+                    async with self._throttler.weighted_task(request_weight=1):
+                        pass
+                call_start_timestamp = time.time()
+                self._total_wait_time += call_start_timestamp - queued_timestamp
+                self._active_calls += 1
                 async with timeout(timeout_seconds):
                     fut.set_result(await coro)
+                self._completed_calls += 1
             except asyncio.CancelledError:
                 try:
                     fut.cancel()
@@ -86,8 +153,9 @@ class AsyncCallScheduler:
                 raise
             except asyncio.InvalidStateError:
                 # The future is already cancelled from outside. Ignore.
-                pass
+                self._failed_calls += 1
             except Exception as e:
+                self._failed_calls += 1
                 # Add exception information.
                 app_warning_msg += f" [[Got exception: {str(e)}]]"
                 self.logger().debug(app_warning_msg,
@@ -97,32 +165,130 @@ class AsyncCallScheduler:
                     fut.set_exception(e)
                 except Exception:
                     pass
+            finally:
+                if call_start_timestamp is not None:
+                    now: float = time.time()
+                    self._active_calls -= 1
+                    self._total_call_time += now - call_start_timestamp
+                    self._max_latency = max(self._max_latency, now - queued_timestamp)
 
             try:
-                await asyncio.sleep(interval)
+                await asyncio.sleep(self._call_interval)
             except asyncio.CancelledError:
                 raise
             except Exception:
                 self.logger().error("Scheduler sleep interrupted.", exc_info=True)
 
+
+class AsyncCallScheduler:
+    """
+    Runs async calls through lanes - e.g. one per target host - each with its own queue, concurrency, call interval,
+    rate limit and metrics. Calls scheduled without a lane go to the default lane.
+
+    Lanes are created on first use with the scheduler's settings, unless created beforehand with get_lane(). The
+    default settings (a max_concurrency of 1) run the calls of each lane strictly one after another.
+    """
+    DEFAULT_LANE = "default"
+
+    _acs_shared_instance: Optional["AsyncCallScheduler"] = None
+    _acs_logger: Optional[HummingbotLogger] = None
+
+    @classmethod
+    def shared_instance(cls):
+        if cls._acs_shared_instance is None:
+            cls._acs_shared_instance = AsyncCallScheduler()
+        return cls._acs_shared_instance
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._acs_logger is None:
+            cls._acs_logger = logging.getLogger(__name__)
+        return cls._acs_logger
+
+    def __init__(self,
+                 call_interval: float = 0.01,
+                 max_concurrency: int = 1,
+                 rate_limit: Optional[Tuple[int, float]] = None):
+        """
+        :param call_interval: seconds each worker of a lane waits after every call
+        :param max_concurrency: number of calls each lane runs at the same time
+        :param rate_limit: (weight, seconds) rate limit of each lane, every call having a weight of 1
+        """
+        self._call_interval: float = call_interval
+        self._max_concurrency: int = max_concurrency
+        self._rate_limit: Optional[Tuple[int, float]] = rate_limit
+        self._lanes: Dict[str, AsyncCallSchedulerLane] = {}
+        self._ev_loop: asyncio.AbstractEventLoop = asyncio.get_event_loop()
+        self.get_lane(self.DEFAULT_LANE)
+
+    @property
+    def lanes(self) -> Dict[str, AsyncCallSchedulerLane]:
+        return self._lanes.copy()
+
+    @property
+    def coro_queue(self) -> asyncio.Queue:
+        return self._lanes[self.DEFAULT_LANE].queue
+
+    @property
+    def coro_scheduler_task(self) -> Optional[asyncio.Task]:
+        worker_tasks: List[asyncio.Task] = self._lanes[self.DEFAULT_LANE].worker_tasks
+        return worker_tasks[0] if len(worker_tasks) > 0 else None
+
+    @property
+    def started(self) -> bool:
+        return any(lane.started for lane in self._lanes.values())
+
+    def get_lane(self,
+                 name: str,
+                 max_concurrency: Optional[int] = None,
+                 call_interval: Optional[float] = None,
+                 rate_limit: Optional[Tuple[int, float]] = None) -> AsyncCallSchedulerLane:
+        """
+        Returns the lane of the given name. If there's no such lane yet, it's created with the given settings, and the
+        scheduler's settings for the ones not given.
+        """
+        lane: Optional[AsyncCallSchedulerLane] = self._lanes.get(name)
+        if lane is None:
+            lane = AsyncCallSchedulerLane(
+                name,
+                max_concurrency=max_concurrency if max_concurrency is not None else self._max_concurrency,
+                call_interval=call_interval if call_interval is not None else self._call_interval,
+                rate_limit=rate_limit if rate_limit is not None else self._rate_limit
+            )
+            self._lanes[name] = lane
+        return lane
+
+    def lane_stats(self) -> Dict[str, AsyncCallSchedulerLaneStats]:
+        return {name: lane.stats for name, lane in self._lanes.items()}
+
+    def start(self):
+        for lane in self._lanes.values():
+            lane.start()
+
+    def stop(self):
+        for lane in self._lanes.values():
+            lane.stop()
+
     async def schedule_async_call(self,
                                   coro: Coroutine,
                                   timeout_seconds: float,
-                                  app_warning_msg: str = "API call error.") -> any:
+                                  app_warning_msg: str = "API call error.",
+                                  lane: Optional[str] = None) -> any:
         fut: asyncio.Future = self._ev_loop.create_future()
-        self._coro_queue.put_nowait(AsyncCallSchedulerItem(fut, coro, timeout_seconds,
-                                                           app_warning_msg=app_warning_msg))
-        if self._coro_scheduler_task is None:
-            self.start()
+        self.get_lane(lane if lane is not None else self.DEFAULT_LANE).put_nowait(
+            AsyncCallSchedulerItem(fut, coro, timeout_seconds, app_warning_msg=app_warning_msg,
+                                   queued_timestamp=time.time())
+        )
         return await fut
 
     async def call_async(self,
                          func: Callable, *args,
                          timeout_seconds: float = 5.0,
-                         app_warning_msg: str = "API call error.") -> any:
-        coro: Coroutine = self._ev_loop.run_in_executor(
-            hummingbot.get_executor(),
-            func,
-            *args,
-        )
-        return await self.schedule_async_call(coro, timeout_seconds, app_warning_msg=app_warning_msg)
+                         app_warning_msg: str = "API call error.",
+                         lane: Optional[str] = None) -> any:
+        async def run_in_executor() -> Any:
+            # The function is only handed to the executor when the lane gets to the call.
+            return await self._ev_loop.run_in_executor(hummingbot.get_executor(), func, *args)
+
+        return await self.schedule_async_call(run_in_executor(), timeout_seconds, app_warning_msg=app_warning_msg,
+                                              lane=lane)
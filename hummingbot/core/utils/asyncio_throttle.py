@@ -29,6 +29,23 @@ class Throttler:
         self._period_safety_margin = period_safety_margin
         self._task_logs: Deque[TaskLog] = deque()
 
+    def sync_used_weight(self, used_weight: RequestWeight):
+        """
+        Takes the weight the server reports as used in the current period - e.g. from a response header - into account,
+        if it's more than the weight of the tasks logged here. That is the weight of requests made by other clients
+        sharing the same limit.
+        """
+        now: float = time.time()
+        while self._task_logs and now - self._task_logs[0][0] > self._period - self._period_safety_margin:
+            self._task_logs.popleft()
+        logged_weight: RequestWeight = sum(weight for (ts, weight) in self._task_logs)
+        if used_weight > logged_weight:
+            self._task_logs.append((now, used_weight - logged_weight))
+
+    @property
+    def rate_limit(self) -> Tuple[RequestWeight, Seconds]:
+        return self._rate_limit_weight, self._period
+
     def weighted_task(self,
                       request_weight):
         return ThrottlerContextManager(
@@ -0,0 +1,46 @@
+#!/usr/bin/env python
+
+import bisect
+from typing import (
+    List,
+    Tuple
+)
+
+
+class DurationHistogram:
+    """
+    Histogram of durations in seconds. counts[i] is the number of durations that were at most bucket_bounds[i] seconds
+    and more than the previous bound, and the last count is of the ones over the last bound.
+    """
+    def __init__(self, bucket_bounds: Tuple[float, ...]):
+        self._bucket_bounds: Tuple[float, ...] = bucket_bounds
+        self._counts: List[int] = [0] * (len(bucket_bounds) + 1)
+        self._total_time: float = 0.0
+        self._max: float = 0.0
+
+    @property
+    def bucket_bounds(self) -> Tuple[float, ...]:
+        return self._bucket_bounds
+
+    @property
+    def counts(self) -> List[int]:
+        return self._counts.copy()
+
+    @property
+    def count(self) -> int:
+        return sum(self._counts)
+
+    @property
+    def average(self) -> float:
+        count: int = self.count
+        return self._total_time / count if count > 0 else 0.0
+
+    @property
+    def max(self) -> float:
+        return self._max
+
+    def add(self, duration: float):
+        self._counts[bisect.bisect_left(self._bucket_bounds, duration)] += 1
+        self._total_time += duration
+        if duration > self._max:
+            self._max = duration
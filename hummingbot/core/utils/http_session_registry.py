@@ -0,0 +1,205 @@
+#!/usr/bin/env python
+
+import aiohttp
+import asyncio
+import logging
+import pandas as pd
+from types import SimpleNamespace
+from typing import (
+    Dict,
+    List,
+    Optional,
+    Tuple
+)
+from yarl import URL
+
+from hummingbot.core.utils.duration_histogram import DurationHistogram
+from hummingbot.core.utils.ssl_client_request import SSLClientRequest
+from hummingbot.logger import HummingbotLogger
+
+
+class ResponseTimeHistogram(DurationHistogram):
+    """
+    Histogram of HTTP response times in seconds, which also counts the requests that failed without a response.
+    """
+    def __init__(self, bucket_bounds: Tuple[float, ...]):
+        super().__init__(bucket_bounds)
+        self._error_count: int = 0
+
+    @property
+    def error_count(self) -> int:
+        return self._error_count
+
+    def add_error(self):
+        self._error_count += 1
+
+
+class HTTPSessionRegistry:
+    """
+    Process-wide registry of keep-alive aiohttp sessions, one per host and event loop, so the connections to each host
+    - and their DNS lookups and TLS handshakes - are reused across requests, instead of every polling loop opening its
+    own session.
+
+    The sessions are owned by the registry: users must not close them. Use http_session() in place of
+    `async with aiohttp.ClientSession() as client:`.
+    """
+    CONNECTION_LIMIT_PER_HOST = 20
+    KEEPALIVE_TIMEOUT = 30.0
+    DNS_CACHE_TTL = 300
+    RESPONSE_TIME_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+    _hsr_logger: Optional[HummingbotLogger] = None
+    _hsr_shared_instance: Optional["HTTPSessionRegistry"] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._hsr_logger is None:
+            cls._hsr_logger = logging.getLogger(__name__)
+        return cls._hsr_logger
+
+    @classmethod
+    def shared_instance(cls) -> "HTTPSessionRegistry":
+        if cls._hsr_shared_instance is None:
+            cls._hsr_shared_instance = HTTPSessionRegistry()
+        return cls._hsr_shared_instance
+
+    def __init__(self,
+                 limit_per_host: int = CONNECTION_LIMIT_PER_HOST,
+                 keepalive_timeout: float = KEEPALIVE_TIMEOUT,
+                 dns_cache_ttl: int = DNS_CACHE_TTL):
+        """
+        :param limit_per_host: maximum number of simultaneous connections to each host, 0 for no limit
+        :param keepalive_timeout: seconds an idle connection is kept open for reuse
+        :param dns_cache_ttl: seconds resolved host addresses are cached
+        """
+        self._limit_per_host: int = limit_per_host
+        self._keepalive_timeout: float = keepalive_timeout
+        self._dns_cache_ttl: int = dns_cache_ttl
+        self._host_limits: Dict[str, int] = {}
+        self._sessions: Dict[Tuple[str, asyncio.AbstractEventLoop], aiohttp.ClientSession] = {}
+        self._histograms: Dict[str, ResponseTimeHistogram] = {}
+        self._trace_config: aiohttp.TraceConfig = aiohttp.TraceConfig()
+        self._trace_config.on_request_start.append(self._on_request_start)
+        self._trace_config.on_request_end.append(self._on_request_end)
+        self._trace_config.on_request_exception.append(self._on_request_exception)
+
+    @property
+    def response_time_histograms(self) -> Dict[str, ResponseTimeHistogram]:
+        return self._histograms.copy()
+
+    @property
+    def limit_per_host(self) -> int:
+        return self._limit_per_host
+
+    @limit_per_host.setter
+    def limit_per_host(self, limit: int):
+        """
+        Sets the default connection limit of the hosts, for the sessions created after.
+        """
+        self._limit_per_host = limit
+
+    @property
+    def keepalive_timeout(self) -> float:
+        return self._keepalive_timeout
+
+    @keepalive_timeout.setter
+    def keepalive_timeout(self, keepalive_timeout: float):
+        """
+        Sets the idle connection keep-alive timeout, for the sessions created after.
+        """
+        self._keepalive_timeout = keepalive_timeout
+
+    def set_host_connection_limit(self, host: str, limit: int):
+        """
+        Sets the connection limit of a host, for the sessions created after.
+        """
+        self._host_limits[host] = limit
+
+    def format_status(self) -> str:
+        if len(self._histograms) < 1:
+            return "  HTTP requests: none."
+        response_times_df = pd.DataFrame(
+            data=[[host,
+                   histogram.count,
+                   histogram.error_count,
+                   f"{histogram.average * 1e3:.1f}",
+                   f"{histogram.max * 1e3:.1f}"]
+                  for host, histogram in sorted(self._histograms.items())],
+            columns=["Host", "Responses", "Errors", "Avg (ms)", "Max (ms)"]
+        )
+        lines = ["  HTTP requests:"]
+        lines.extend(["    " + line for line in response_times_df.to_string(index=False).split("\n")])
+        return "\n".join(lines)
+
+    @staticmethod
+    def host_of(url: str) -> str:
+        parsed_url: URL = URL(url)
+        # A bare host name parses as a relative path.
+        return parsed_url.host if parsed_url.host is not None else url
+
+    def get_session(self, url: str) -> aiohttp.ClientSession:
+        """
+        Returns the session for the host of the URL, on the current event loop.
+        """
+        host: str = self.host_of(url)
+        ev_loop: asyncio.AbstractEventLoop = asyncio.get_event_loop()
+        session: Optional[aiohttp.ClientSession] = self._sessions.get((host, ev_loop))
+        if session is None or session.closed:
+            connector: aiohttp.TCPConnector = aiohttp.TCPConnector(
+                limit=0,
+                limit_per_host=self._host_limits.get(host, self._limit_per_host),
+                keepalive_timeout=self._keepalive_timeout,
+                ttl_dns_cache=self._dns_cache_ttl
+            )
+            session = aiohttp.ClientSession(connector=connector,
+                                            request_class=SSLClientRequest,
+                                            trace_configs=[self._trace_config])
+            self._sessions[(host, ev_loop)] = session
+        return session
+
+    async def close(self):
+        sessions: List[aiohttp.ClientSession] = list(self._sessions.values())
+        self._sessions.clear()
+        for session in sessions:
+            if not session.closed:
+                await session.close()
+
+    def _histogram(self, host: str) -> ResponseTimeHistogram:
+        histogram: Optional[ResponseTimeHistogram] = self._histograms.get(host)
+        if histogram is None:
+            histogram = self._histograms[host] = ResponseTimeHistogram(self.RESPONSE_TIME_BUCKETS)
+        return histogram
+
+    async def _on_request_start(self, session: aiohttp.ClientSession, trace_config_ctx: SimpleNamespace, params):
+        trace_config_ctx.start_time = asyncio.get_event_loop().time()
+
+    async def _on_request_end(self, session: aiohttp.ClientSession, trace_config_ctx: SimpleNamespace, params):
+        self._histogram(params.url.host).add(asyncio.get_event_loop().time() - trace_config_ctx.start_time)
+
+    async def _on_request_exception(self, session: aiohttp.ClientSession, trace_config_ctx: SimpleNamespace, params):
+        self._histogram(params.url.host).add_error()
+
+
+class SharedHTTPSession:
+    """
+    Async context manager of a registry session, which leaves the session open on exit.
+    """
+    def __init__(self, url: str):
+        self._url: str = url
+
+    async def __aenter__(self) -> aiohttp.ClientSession:
+        return HTTPSessionRegistry.shared_instance().get_session(self._url)
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        pass
+
+
+def http_session(url: str) -> SharedHTTPSession:
+    """
+    :param url: a URL, or the host name, the session is going to be used for
+    """
+    return SharedHTTPSession(url)
+
+
+def get_http_session(url: str) -> aiohttp.ClientSession:
+    return HTTPSessionRegistry.shared_instance().get_session(url)
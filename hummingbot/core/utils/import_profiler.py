@@ -0,0 +1,138 @@
+#!/usr/bin/env python
+
+import sys
+import time
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    Optional
+)
+
+
+class ImportRecord:
+    __slots__ = ("name", "cumulative_time", "self_time")
+
+    def __init__(self, name: str):
+        self.name: str = name
+        self.cumulative_time: float = 0.0
+        self.self_time: float = 0.0
+
+
+class ProfiledLoader:
+    """
+    Times the module creation and execution of a loader, and puts the original loader back on the module once it is
+    loaded.
+    """
+    def __init__(self, profiler: "ImportProfiler", loader: Any):
+        self._profiler: ImportProfiler = profiler
+        self._loader: Any = loader
+
+    def __getattr__(self, item: str) -> Any:
+        return getattr(self._loader, item)
+
+    def create_module(self, spec) -> Any:
+        return self._profiler.timed_call(spec.name, self._loader.create_module, spec)
+
+    def exec_module(self, module):
+        try:
+            self._profiler.timed_call(module.__name__, self._loader.exec_module, module)
+        finally:
+            module.__loader__ = self._loader
+            if getattr(module, "__spec__", None) is not None:
+                module.__spec__.loader = self._loader
+
+
+class ImportProfiler:
+    """
+    Measures how long the modules imported while it is started take to load, like `python -X importtime` does - but in
+    process, so the report can go to the application logs. The cumulative time of a module includes the modules it
+    imports, its self time doesn't.
+
+    The profiler is a meta path finder in front of the others, which times the loaders they find. Wrapping
+    builtins.__import__() instead would miss the imports of the Cython modules, which go through the C API.
+    """
+    _startup_profiler: Optional["ImportProfiler"] = None
+
+    @classmethod
+    def startup_profiler(cls) -> "ImportProfiler":
+        """
+        Profiler of the imports made while the application starts, started by bin/path_util.py.
+        """
+        if cls._startup_profiler is None:
+            cls._startup_profiler = ImportProfiler()
+        return cls._startup_profiler
+
+    def __init__(self):
+        self._records: Dict[str, ImportRecord] = {}
+        self._stack: List[List[float]] = []
+        self._started: bool = False
+
+    @property
+    def started(self) -> bool:
+        return self._started
+
+    @property
+    def records(self) -> List[ImportRecord]:
+        return list(self._records.values())
+
+    def start(self):
+        if self._started:
+            return
+        self._started = True
+        sys.meta_path.insert(0, self)
+
+    def stop(self):
+        if not self._started:
+            return
+        self._started = False
+        if self in sys.meta_path:
+            sys.meta_path.remove(self)
+
+    def find_spec(self, fullname: str, path: Optional[List[str]] = None, target: Any = None) -> Any:
+        for finder in sys.meta_path:
+            if finder is self or not hasattr(finder, "find_spec"):
+                continue
+            spec = finder.find_spec(fullname, path, target)
+            if spec is not None:
+                break
+        else:
+            return None
+        if spec.loader is not None and hasattr(spec.loader, "exec_module"):
+            spec.loader = ProfiledLoader(self, spec.loader)
+        return spec
+
+    def timed_call(self, name: str, function: Callable, *args) -> Any:
+        # Every frame on the stack is [start time, time spent in the imports nested in it].
+        frame: List[float] = [time.perf_counter(), 0.0]
+        self._stack.append(frame)
+        try:
+            return function(*args)
+        finally:
+            elapsed: float = time.perf_counter() - frame[0]
+            self._stack.pop()
+            if len(self._stack) > 0:
+                self._stack[-1][1] += elapsed
+            record: Optional[ImportRecord] = self._records.get(name)
+            if record is None:
+                record = self._records[name] = ImportRecord(name)
+            record.cumulative_time += elapsed
+            record.self_time += elapsed - frame[1]
+
+    def format_report(self, limit: int = 30) -> str:
+        """
+        Lists the modules with the longest cumulative import time first.
+        """
+        imports_time: float = sum(record.self_time for record in self._records.values())
+        lines: List[str] = [
+            f"Imported {len(self._records)} modules in {imports_time:.3f}s. "
+            f"Slowest {min(limit, len(self._records))} by cumulative time:",
+            f"{'cumulative (ms)':>16} {'self (ms)':>10}  module"
+        ]
+        slowest: List[ImportRecord] = sorted(self._records.values(),
+                                             key=lambda r: r.cumulative_time,
+                                             reverse=True)[:limit]
+        for record in slowest:
+            lines.append(f"{record.cumulative_time * 1e3:>16.1f} {record.self_time * 1e3:>10.1f}  {record.name}")
+        return "\n".join(lines)
@@ -11,7 +11,10 @@ from hummingbot.logger import HummingbotLogger
 import logging
 
 from .async_utils import safe_ensure_future
-from .ssl_client_request import SSLClientRequest
+from .http_session_registry import (
+    get_http_session,
+    http_session
+)
 
 BINANCE_ENDPOINT = "https://api.binance.com/api/v1/exchangeInfo"
 RADAR_RELAY_ENDPOINT = "https://api.radarrelay.com/v3/markets"
@@ -31,7 +34,6 @@ API_CALL_TIMEOUT = 5
 class TradingPairFetcher:
     _sf_shared_instance: "TradingPairFetcher" = None
     _tpf_logger: Optional[HummingbotLogger] = None
-    _tpf_http_client: Optional[aiohttp.ClientSession] = None
 
     @classmethod
     def logger(cls) -> HummingbotLogger:
@@ -46,12 +48,10 @@ class TradingPairFetcher:
         return cls._sf_shared_instance
 
     @classmethod
-    def http_client(cls) -> aiohttp.ClientSession:
-        if cls._tpf_http_client is None:
-            if not asyncio.get_event_loop().is_running():
-                raise EnvironmentError("Event loop must be running to start HTTP client session.")
-            cls._tpf_http_client = aiohttp.ClientSession(request_class=SSLClientRequest)
-        return cls._tpf_http_client
+    def http_client(cls, url: str) -> aiohttp.ClientSession:
+        if not asyncio.get_event_loop().is_running():
+            raise EnvironmentError("Event loop must be running to start HTTP client session.")
+        return get_http_session(url)
 
     def __init__(self):
         self.ready = False
@@ -61,7 +61,7 @@ class TradingPairFetcher:
     async def fetch_binance_trading_pairs(self) -> List[str]:
         try:
             from hummingbot.market.binance.binance_market import BinanceMarket
-            client: aiohttp.ClientSession = self.http_client()
+            client: aiohttp.ClientSession = self.http_client(BINANCE_ENDPOINT)
             async with client.get(BINANCE_ENDPOINT, timeout=API_CALL_TIMEOUT) as response:
                 if response.status == 200:
                     data = await response.json()
@@ -87,7 +87,7 @@ class TradingPairFetcher:
             from hummingbot.market.radar_relay.radar_relay_market import RadarRelayMarket
             trading_pairs = set()
             page_count = 1
-            client: aiohttp.ClientSession = self.http_client()
+            client: aiohttp.ClientSession = self.http_client(RADAR_RELAY_ENDPOINT)
             while True:
                 async with client.get(f"{RADAR_RELAY_ENDPOINT}?perPage=100&page={page_count}", timeout=API_CALL_TIMEOUT) \
                         as response:
@@ -122,7 +122,7 @@ class TradingPairFetcher:
 
             trading_pairs = set()
             page_count = 1
-            client: aiohttp.ClientSession = self.http_client()
+            client: aiohttp.ClientSession = self.http_client(BAMBOO_RELAY_ENDPOINT)
             while True:
                 async with client.get(f"{BAMBOO_RELAY_ENDPOINT}?perPage=1000&page={page_count}",
                                       timeout=API_CALL_TIMEOUT) as response:
@@ -157,7 +157,7 @@ class TradingPairFetcher:
         try:
             from hummingbot.market.coinbase_pro.coinbase_pro_market import CoinbaseProMarket
 
-            client: aiohttp.ClientSession = self.http_client()
+            client: aiohttp.ClientSession = self.http_client(COINBASE_PRO_ENDPOINT)
             async with client.get(COINBASE_PRO_ENDPOINT, timeout=API_CALL_TIMEOUT) as response:
                 if response.status == 200:
                     markets = await response.json()
@@ -182,7 +182,7 @@ class TradingPairFetcher:
         try:
             from hummingbot.market.eterbase.eterbase_market import EterbaseMarket
 
-            client: aiohttp.ClientSession() = self.http_client()
+            client: aiohttp.ClientSession = self.http_client(ETERBASE_ENDPOINT)
             async with client.get(ETERBASE_ENDPOINT, timeout=API_CALL_TIMEOUT) as response:
                 if response.status == 200:
                     markets = await response.json()
@@ -205,7 +205,7 @@ class TradingPairFetcher:
         try:
             from hummingbot.market.huobi.huobi_market import HuobiMarket
 
-            client: aiohttp.ClientSession = self.http_client()
+            client: aiohttp.ClientSession = self.http_client(HUOBI_ENDPOINT)
             async with client.get(HUOBI_ENDPOINT, timeout=API_CALL_TIMEOUT) as response:
                 if response.status == 200:
                     all_trading_pairs: Dict[str, Any] = await response.json()
@@ -233,7 +233,7 @@ class TradingPairFetcher:
     async def fetch_liquid_trading_pairs() -> List[str]:
         try:
             # Returns a List of str, representing each active trading pair on the exchange.
-            client: aiohttp.ClientSession = TradingPairFetcher.http_client()
+            client: aiohttp.ClientSession = TradingPairFetcher.http_client(LIQUID_ENDPOINT)
             async with client.get(LIQUID_ENDPOINT, timeout=API_CALL_TIMEOUT) as response:
                 if response.status == 200:
                     products: List[Dict[str, Any]] = await response.json()
@@ -253,7 +253,7 @@ class TradingPairFetcher:
     @staticmethod
     async def fetch_bittrex_trading_pairs() -> List[str]:
         try:
-            client: aiohttp.ClientSession = TradingPairFetcher.http_client()
+            client: aiohttp.ClientSession = TradingPairFetcher.http_client(BITTREX_ENDPOINT)
             async with client.get(BITTREX_ENDPOINT, timeout=API_CALL_TIMEOUT) as response:
                 if response.status == 200:
                     all_trading_pairs: List[Dict[str, Any]] = await response.json()
@@ -267,7 +267,7 @@ class TradingPairFetcher:
 
     @staticmethod
     async def fetch_kucoin_trading_pairs() -> List[str]:
-        async with aiohttp.ClientSession() as client:
+        async with http_session(KUCOIN_ENDPOINT) as client:
             async with client.get(KUCOIN_ENDPOINT, timeout=API_CALL_TIMEOUT) as response:
                 if response.status == 200:
                     try:
@@ -282,7 +282,7 @@ class TradingPairFetcher:
     @staticmethod
     async def fetch_kraken_trading_pairs() -> List[str]:
         try:
-            async with aiohttp.ClientSession() as client:
+            async with http_session(KRAKEN_ENDPOINT) as client:
                 async with client.get(KRAKEN_ENDPOINT, timeout=API_CALL_TIMEOUT) as response:
                     if response.status == 200:
                         from hummingbot.market.kraken.kraken_market import KrakenMarket
@@ -305,7 +305,7 @@ class TradingPairFetcher:
     async def fetch_dolomite_trading_pairs(self) -> List[str]:
         try:
             from hummingbot.market.dolomite.dolomite_market import DolomiteMarket
-            client: aiohttp.ClientSession = TradingPairFetcher.http_client()
+            client: aiohttp.ClientSession = TradingPairFetcher.http_client(DOLOMITE_ENDPOINT)
             async with client.get(DOLOMITE_ENDPOINT, timeout=API_CALL_TIMEOUT) as response:
                 if response.status == 200:
                     all_trading_pairs: Dict[str, Any] = await response.json()
@@ -8,6 +8,7 @@ from typing import (
 from hummingbot.core.network_base import NetworkBase, NetworkStatus
 from hummingbot.logger import HummingbotLogger
 from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.core.utils.http_session_registry import get_http_session
 from decimal import Decimal
 
 
@@ -41,7 +42,7 @@ class CustomAPIDataFeed(NetworkBase):
 
     def _http_client(self) -> aiohttp.ClientSession:
         if self._shared_client is None:
-            self._shared_client = aiohttp.ClientSession()
+            self._shared_client = get_http_session(self._api_url)
         return self._shared_client
 
     async def check_network(self) -> NetworkStatus:
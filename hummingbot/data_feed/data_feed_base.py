@@ -7,6 +7,10 @@ from typing import (
 )
 
 from hummingbot.core.network_base import NetworkBase, NetworkStatus
+from hummingbot.core.utils.http_session_registry import (
+    get_http_session,
+    http_session
+)
 from hummingbot.logger import HummingbotLogger
 
 
@@ -41,7 +45,7 @@ class DataFeedBase(NetworkBase):
 
     async def _http_client(self) -> aiohttp.ClientSession:
         if self._shared_client is None:
-            self._shared_client = aiohttp.ClientSession()
+            self._shared_client = get_http_session(self.health_check_endpoint)
         return self._shared_client
 
     async def get_ready(self):
@@ -62,7 +66,7 @@ class DataFeedBase(NetworkBase):
 
     async def check_network(self) -> NetworkStatus:
         try:
-            async with aiohttp.ClientSession() as session:
+            async with http_session(self.health_check_endpoint) as session:
                 async with session.get(self.health_check_endpoint) as resp:
                     status_text = await resp.text()
                     if resp.status != 200:
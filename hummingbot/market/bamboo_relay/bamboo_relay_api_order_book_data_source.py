@@ -17,8 +17,11 @@ import websockets
 from websockets.exceptions import ConnectionClosed
 
 from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
-from hummingbot.core.utils.ssl_client_request import SSLClientRequest
 from hummingbot.core.data_type.order_book_message import OrderBookMessage
+from hummingbot.core.utils.http_session_registry import (
+    get_http_session,
+    http_session
+)
 from hummingbot.logger import HummingbotLogger
 from hummingbot.market.bamboo_relay.bamboo_relay_order_book import BambooRelayOrderBook
 from hummingbot.market.bamboo_relay.bamboo_relay_order_book_message import BambooRelayOrderBookMessage
@@ -82,7 +85,7 @@ class BambooRelayAPIOrderBookDataSource(OrderBookTrackerDataSource):
         if cls._client is None:
             if not asyncio.get_event_loop().is_running():
                 raise EnvironmentError("Event loop must be running to start HTTP client session.")
-            cls._client = aiohttp.ClientSession(request_class=SSLClientRequest)
+            cls._client = get_http_session(BAMBOO_RELAY_REST_ENDPOINT)
         return cls._client
 
     @classmethod
@@ -114,7 +117,7 @@ class BambooRelayAPIOrderBookDataSource(OrderBookTrackerDataSource):
             return await response.json()
 
     async def get_new_order_book(self, trading_pair: str) -> BambooRelayOrderBook:
-        async with aiohttp.ClientSession() as client:
+        async with http_session(self._api_endpoint) as client:
             snapshot: Dict[str, any] = await self.get_snapshot(client, trading_pair, self._api_endpoint,
                                                                self._api_prefix)
             snapshot_timestamp: float = time.time()
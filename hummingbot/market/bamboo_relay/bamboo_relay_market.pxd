@@ -1,5 +1,6 @@
 from libc.stdint cimport int64_t
 from hummingbot.market.market_base cimport MarketBase
+from hummingbot.core.data_type.expiry_scheduler cimport ExpiryScheduler
 from hummingbot.core.data_type.transaction_tracker cimport TransactionTracker
 
 
@@ -25,11 +26,12 @@ cdef class BambooRelayMarket(MarketBase):
         object _in_flight_cancels
         object _in_flight_pending_cancels
         list _filled_order_hashes
-        object _order_expiry_queue
+        ExpiryScheduler _order_expiry_queue
         TransactionTracker _tx_tracker
         object _w3
         object _exchange
         object _coordinator
+        object _order_signer
         bint _use_coordinator
         bint _pre_emptive_soft_cancels
         dict _trading_rules
@@ -1,10 +1,6 @@
-import aiohttp
 import asyncio
 from async_timeout import timeout
-from collections import (
-    deque,
-    OrderedDict
-)
+from collections import OrderedDict
 import copy
 import logging
 import math
@@ -70,6 +66,7 @@ from hummingbot.wallet.ethereum.zero_ex.zero_ex_custom_utils_v3 import (
 )
 from hummingbot.wallet.ethereum.zero_ex.zero_ex_exchange_v3 import ZeroExExchange
 from hummingbot.wallet.ethereum.zero_ex.zero_ex_coordinator_v3 import ZeroExCoordinator
+from hummingbot.wallet.ethereum.zero_ex.zero_ex_order_signer import ZeroExOrderSigner
 from hummingbot.market.bamboo_relay.bamboo_relay_constants import (
     BAMBOO_RELAY_REST_ENDPOINT,
     BAMBOO_RELAY_TEST_ENDPOINT,
@@ -102,6 +99,7 @@ from hummingbot.market.bamboo_relay.bamboo_relay_constants import (
 )
 from hummingbot.core.utils.tracking_nonce import get_tracking_nonce
 from hummingbot.core.utils.estimate_fee import estimate_fee
+from hummingbot.core.utils.http_session_registry import http_session
 
 brm_logger = None
 s_decimal_0 = Decimal(0)
@@ -155,7 +153,8 @@ cdef class BambooRelayMarket(MarketBase):
                  trading_pairs: Optional[List[str]] = None,
                  use_coordinator: Optional[bool] = True,
                  pre_emptive_soft_cancels: Optional[bool] = True,
-                 trading_required: bool = True):
+                 trading_required: bool = True,
+                 verify_order_signatures: bool = True):
         cdef:
             str coordinator_address
             str coordinator_registry_address
@@ -179,7 +178,7 @@ cdef class BambooRelayMarket(MarketBase):
         self._in_flight_cancels = OrderedDict()
         self._in_flight_pending_cancels = OrderedDict()
         self._filled_order_hashes = []      # To prevent market filling trying to overfill an inflight market order that's pending
-        self._order_expiry_queue = deque()
+        self._order_expiry_queue = ExpiryScheduler()
         self._tx_tracker = BambooRelayTransactionTracker(self)
         self._w3 = Web3(Web3.HTTPProvider(ethereum_rpc_url))
         self._provider = Web3.HTTPProvider(ethereum_rpc_url)
@@ -237,6 +236,8 @@ cdef class BambooRelayMarket(MarketBase):
             coordinator_registry_address = Web3.toChecksumAddress(ZERO_EX_TEST_COORDINATOR_REGISTRY_ADDRESS)
             self._wallet_spender_address = Web3.toChecksumAddress(ZERO_EX_TEST_ERC20_PROXY)
         self._exchange = ZeroExExchange(self._w3, self._exchange_address, wallet)
+        self._order_signer = ZeroExOrderSigner(wallet.private_key, self._exchange_address, self._chain_id,
+                                               verify_provider=self._provider if verify_order_signatures else None)
         self._coordinator = ZeroExCoordinator(self._provider,
                                               self._w3,
                                               self._exchange_address,
@@ -298,13 +299,12 @@ cdef class BambooRelayMarket(MarketBase):
             BambooRelayInFlightOrder typed_in_flight_order
             str base_currency
             str quote_currency
-            set expiring_order_ids = set([order_id for _, order_id in self._order_expiry_queue])
 
         for in_flight_order in self._in_flight_limit_orders.values():
             typed_in_flight_order = in_flight_order
             # Skip orders that are or have been cancelled but are still being tracked
             if (typed_in_flight_order.order_type is not OrderType.LIMIT or
-                    typed_in_flight_order.client_order_id in expiring_order_ids or
+                    self._order_expiry_queue.c_contains(typed_in_flight_order.client_order_id) or
                     typed_in_flight_order.client_order_id in self._in_flight_cancels or
                     typed_in_flight_order.client_order_id in self._in_flight_pending_cancels or
                     typed_in_flight_order.has_been_cancelled):
@@ -335,7 +335,7 @@ cdef class BambooRelayMarket(MarketBase):
         self._in_flight_pending_limit_orders = OrderedDict()
         self._in_flight_cancels = OrderedDict()
         self._in_flight_pending_cancels = OrderedDict()
-        self._order_expiry_queue = deque()
+        self._order_expiry_queue = ExpiryScheduler()
 
     def restore_tracking_states(self, saved_states: Dict[str, any]):
         # ignore saved orders that may not reflect current version schema
@@ -949,7 +949,7 @@ cdef class BambooRelayMarket(MarketBase):
                            url: str,
                            data: Optional[Dict[str, Any]] = None,
                            headers: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
-        async with aiohttp.ClientSession() as client:
+        async with http_session(url) as client:
             async with client.request(http_method,
                                       url=url,
                                       timeout=self.API_CALL_TIMEOUT,
@@ -1241,9 +1241,8 @@ cdef class BambooRelayMarket(MarketBase):
             'takerFeeAssetData': maker_asset_data
         }
 
-        order_hash_hex = self.get_order_hash_hex(unsigned_limit_order)
+        order_hash_hex, signature = await self._order_signer.sign_order(unsigned_limit_order)
         signed_limit_order = copy.deepcopy(unsigned_limit_order)
-        signature = self.get_zero_ex_signature(order_hash_hex)
         signed_limit_order["signature"] = signature
         try:
             await self._api_request(http_method="post",
@@ -1665,6 +1664,7 @@ cdef class BambooRelayMarket(MarketBase):
 
     def _stop_network(self):
         self._order_book_tracker.stop()
+        self._order_signer.stop()
         if self._status_polling_task is not None:
             self._status_polling_task.cancel()
         if self._pending_approval_tx_hashes is not None:
@@ -1754,15 +1754,20 @@ cdef class BambooRelayMarket(MarketBase):
         )
 
     cdef c_expire_order(self, str order_id, int seconds):
-        self._order_expiry_queue.append((self._current_timestamp + seconds, order_id))
+        cdef:
+            double expiry_timestamp = self._current_timestamp + seconds
+
+        # An order that is already expiring is stopped being tracked at the earliest of its expiry times.
+        if (not self._order_expiry_queue.c_contains(order_id) or
+                expiry_timestamp < self._order_expiry_queue.c_get_deadline(order_id)):
+            self._order_expiry_queue.c_schedule(order_id, expiry_timestamp)
 
     cdef c_check_and_remove_expired_orders(self):
         cdef:
             double current_timestamp = self._current_timestamp
             str order_id
 
-        while len(self._order_expiry_queue) > 0 and self._order_expiry_queue[0][0] < current_timestamp:
-            _, order_id = self._order_expiry_queue.popleft()
+        for order_id in self._order_expiry_queue.c_pop_expired(current_timestamp):
             self.c_stop_tracking_order(order_id)
 
     cdef c_stop_tracking_order(self, str order_id):
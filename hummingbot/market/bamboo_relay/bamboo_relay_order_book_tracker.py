@@ -101,7 +101,7 @@ class BambooRelayOrderBookTracker(OrderBookTracker):
                 if trading_pair not in self._tracking_message_queues:
                     messages_queued += 1
                     # Save diff messages received before snapshots are ready
-                    self._saved_message_queues[trading_pair].append(ob_message)
+                    self._save_order_book_diff(ob_message)
                     continue
                 message_queue: asyncio.Queue = self._tracking_message_queues[trading_pair]
                 # Check the order book's initial update ID. If it's larger, don't bother.
@@ -0,0 +1,180 @@
+#!/usr/bin/env python
+
+import aiohttp
+import hashlib
+import hmac
+import logging
+from typing import (
+    Any,
+    Dict,
+    List,
+    Optional
+)
+from urllib.parse import urlencode
+
+from hummingbot.core.utils.asyncio_throttle import Throttler
+from hummingbot.core.utils.http_session_registry import get_http_session
+from hummingbot.logger import HummingbotLogger
+from hummingbot.market.binance.binance_time import BinanceTime
+
+
+class BinanceAPIError(IOError):
+    def __init__(self, status_code: int, code: int, message: str):
+        super().__init__(f"Binance API error (HTTP status {status_code}, code={code}): {message}")
+        self.status_code: int = status_code
+        self.code: int = code
+        self.message: str = message
+
+
+class BinanceAPIClient:
+    """
+    Asyncio client of the Binance REST API, on the keep-alive HTTP session of the session registry.
+
+    Every request takes its weight from a rate limiter shared by all clients - Binance's request weight limit is per IP
+    address - which is also kept in sync with the used weight Binance reports in the response headers.
+
+    The endpoint methods take the same parameters as the python-binance client's methods of the same names.
+    """
+    API_URL = "https://api.binance.com"
+    REQUEST_WEIGHT_LIMIT = (1200, 60.0)
+    REQUEST_TIMEOUT = 10.0
+    USED_WEIGHT_HEADERS = ("X-MBX-USED-WEIGHT-1M", "X-MBX-USED-WEIGHT")
+    OPEN_ORDERS_WEIGHT = 1
+    OPEN_ORDERS_ALL_SYMBOLS_WEIGHT = 40
+
+    SIDE_BUY = "BUY"
+    SIDE_SELL = "SELL"
+    TIME_IN_FORCE_GTC = "GTC"
+
+    _bac_logger: Optional[HummingbotLogger] = None
+    _bac_request_weight_throttler: Optional[Throttler] = None
+    _bac_public_instance: Optional["BinanceAPIClient"] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._bac_logger is None:
+            cls._bac_logger = logging.getLogger(__name__)
+        return cls._bac_logger
+
+    @classmethod
+    def request_weight_throttler(cls) -> Throttler:
+        if cls._bac_request_weight_throttler is None:
+            cls._bac_request_weight_throttler = Throttler(cls.REQUEST_WEIGHT_LIMIT)
+        return cls._bac_request_weight_throttler
+
+    @classmethod
+    def public_instance(cls) -> "BinanceAPIClient":
+        """
+        Shared client without API keys, for the public market data endpoints.
+        """
+        if cls._bac_public_instance is None:
+            cls._bac_public_instance = BinanceAPIClient()
+        return cls._bac_public_instance
+
+    def __init__(self, api_key: Optional[str] = None, api_secret: Optional[str] = None):
+        self._api_key: Optional[str] = api_key
+        self._api_secret: Optional[str] = api_secret
+
+    @property
+    def api_key(self) -> Optional[str]:
+        return self._api_key
+
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        return get_http_session(self.API_URL)
+
+    async def close(self):
+        # The HTTP session is shared through the session registry, which owns it.
+        pass
+
+    def _signed_query_string(self, params: Dict[str, Any]) -> str:
+        params = dict(params, timestamp=int(BinanceTime.get_instance().time() * 1e3))
+        query_string: str = urlencode(params)
+        signature: str = hmac.new(self._api_secret.encode("utf-8"),
+                                  query_string.encode("utf-8"),
+                                  hashlib.sha256).hexdigest()
+        return f"{query_string}&signature={signature}"
+
+    async def request(self,
+                      method: str,
+                      path: str,
+                      params: Optional[Dict[str, Any]] = None,
+                      signed: bool = False,
+                      weight: int = 1) -> Any:
+        params = {k: v for k, v in (params or {}).items() if v is not None}
+        query_string: str = self._signed_query_string(params) if signed else urlencode(params)
+        headers: Dict[str, str] = {}
+        if self._api_key is not None:
+            headers["X-MBX-APIKEY"] = self._api_key
+        url: str = f"{self.API_URL}{path}"
+        data: Optional[str] = None
+        if method == "GET":
+            if query_string:
+                url = f"{url}?{query_string}"
+        else:
+            headers["Content-Type"] = "application/x-www-form-urlencoded"
+            data = query_string
+
+        throttler: Throttler = self.request_weight_throttler()
+        async with throttler.weighted_task(request_weight=weight):
+            async with self.session.request(method, url, data=data, headers=headers,
+                                            timeout=aiohttp.ClientTimeout(total=self.REQUEST_TIMEOUT)) as response:
+                for header in self.USED_WEIGHT_HEADERS:
+                    if header in response.headers:
+                        throttler.sync_used_weight(int(response.headers[header]))
+                        break
+                if response.status in (418, 429):
+                    # Rate limited - hold off all requests for the rest of the period.
+                    throttler.sync_used_weight(throttler.rate_limit[0])
+                try:
+                    result: Any = await response.json(content_type=None)
+                except ValueError:
+                    raise BinanceAPIError(response.status, -1, await response.text())
+
+        if response.status >= 400:
+            raise BinanceAPIError(response.status,
+                                  result.get("code", -1) if isinstance(result, dict) else -1,
+                                  result.get("msg", "") if isinstance(result, dict) else str(result))
+        if isinstance(result, dict) and result.get("success") is False:
+            # The WAPI endpoints report errors in the response body.
+            raise BinanceAPIError(response.status, -1, result.get("msg", ""))
+        return result
+
+    async def ping(self) -> Dict[str, Any]:
+        return await self.request("GET", "/api/v1/ping")
+
+    async def get_server_time(self) -> Dict[str, Any]:
+        return await self.request("GET", "/api/v1/time")
+
+    async def get_exchange_info(self) -> Dict[str, Any]:
+        return await self.request("GET", "/api/v1/exchangeInfo")
+
+    async def get_order_book(self, **params) -> Dict[str, Any]:
+        limit: int = int(params.get("limit", 100))
+        weight: int = 1 if limit <= 100 else 5 if limit <= 500 else 10 if limit <= 1000 else 50
+        return await self.request("GET", "/api/v1/depth", params, weight=weight)
+
+    async def get_ticker(self, **params) -> Dict[str, Any]:
+        return await self.request("GET", "/api/v1/ticker/24hr", params, weight=1 if "symbol" in params else 40)
+
+    async def get_account(self, **params) -> Dict[str, Any]:
+        return await self.request("GET", "/api/v3/account", params, signed=True, weight=5)
+
+    async def get_trade_fee(self, **params) -> Dict[str, Any]:
+        return await self.request("GET", "/wapi/v3/tradeFee.html", params, signed=True)
+
+    async def get_my_trades(self, **params) -> List[Dict[str, Any]]:
+        return await self.request("GET", "/api/v3/myTrades", params, signed=True, weight=5)
+
+    async def get_order(self, **params) -> Dict[str, Any]:
+        return await self.request("GET", "/api/v3/order", params, signed=True)
+
+    async def get_open_orders(self, **params) -> List[Dict[str, Any]]:
+        weight: int = self.OPEN_ORDERS_WEIGHT if "symbol" in params else self.OPEN_ORDERS_ALL_SYMBOLS_WEIGHT
+        return await self.request("GET", "/api/v3/openOrders", params, signed=True, weight=weight)
+
+    async def create_order(self, **params) -> Dict[str, Any]:
+        return await self.request("POST", "/api/v3/order", params, signed=True)
+
+    async def cancel_order(self, **params) -> Dict[str, Any]:
+        return await self.request("DELETE", "/api/v3/order", params, signed=True)
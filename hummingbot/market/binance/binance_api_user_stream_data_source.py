@@ -13,6 +13,7 @@ import ujson
 import websockets
 from hummingbot.core.data_type.user_stream_tracker_data_source import UserStreamTrackerDataSource
 from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.core.utils.http_session_registry import http_session
 from binance.client import Client as BinanceClient
 from hummingbot.logger import HummingbotLogger
 
@@ -45,7 +46,7 @@ class BinanceAPIUserStreamDataSource(UserStreamTrackerDataSource):
         return self._last_recv_time
 
     async def get_listen_key(self):
-        async with aiohttp.ClientSession() as client:
+        async with http_session(BINANCE_API_ENDPOINT) as client:
             async with client.post(f"{BINANCE_API_ENDPOINT}{BINANCE_USER_STREAM_ENDPOINT}",
                                    headers={"X-MBX-APIKEY": self._binance_client.API_KEY}) as response:
                 response: aiohttp.ClientResponse = response
@@ -55,7 +56,7 @@ class BinanceAPIUserStreamDataSource(UserStreamTrackerDataSource):
                 return data["listenKey"]
 
     async def ping_listen_key(self, listen_key: str) -> bool:
-        async with aiohttp.ClientSession() as client:
+        async with http_session(BINANCE_API_ENDPOINT) as client:
             async with client.put(f"{BINANCE_API_ENDPOINT}{BINANCE_USER_STREAM_ENDPOINT}",
                                   headers={"X-MBX-APIKEY": self._binance_client.API_KEY},
                                   params={"listenKey": listen_key}) as response:
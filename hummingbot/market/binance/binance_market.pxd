@@ -6,6 +6,7 @@ cdef class BinanceMarket(MarketBase):
     cdef:
         object _user_stream_tracker
         object _binance_client
+        object _api_client
         object _ev_loop
         object _poll_notifier
         double _last_timestamp
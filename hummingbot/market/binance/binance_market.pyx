@@ -1,6 +1,5 @@
 from collections import defaultdict
 from libc.stdint cimport int64_t
-import aiohttp
 from aiokafka import (
     AIOKafkaConsumer,
     ConsumerRecord
@@ -9,9 +8,7 @@ import asyncio
 from async_timeout import timeout
 from binance.client import Client as BinanceClient
 from binance import client as binance_client_module
-from binance.exceptions import BinanceAPIException
 from decimal import Decimal
-from functools import partial
 import logging
 import pandas as pd
 import re
@@ -35,6 +32,10 @@ from hummingbot.core.utils.async_utils import (
     safe_ensure_future,
     safe_gather,
 )
+from hummingbot.market.binance.binance_api_client import (
+    BinanceAPIClient,
+    BinanceAPIError
+)
 from hummingbot.market.binance.binance_api_order_book_data_source import BinanceAPIOrderBookDataSource
 from hummingbot.logger import HummingbotLogger
 from hummingbot.core.event.events import (
@@ -110,6 +111,7 @@ cdef class BinanceMarket(MarketBase):
     MARKET_SELL_ORDER_CREATED_EVENT_TAG = MarketEvent.SellOrderCreated.value
 
     API_CALL_TIMEOUT = 10.0
+    API_CALL_CONCURRENCY = 10
     SHORT_POLL_INTERVAL = 5.0
     UPDATE_ORDER_STATUS_MIN_INTERVAL = 10.0
     LONG_POLL_INTERVAL = 120.0
@@ -140,6 +142,7 @@ cdef class BinanceMarket(MarketBase):
         self._trading_required = trading_required
         self._order_book_tracker = BinanceOrderBookTracker(trading_pairs=trading_pairs)
         self._binance_client = BinanceClient(binance_api_key, binance_api_secret)
+        self._api_client = BinanceAPIClient(binance_api_key, binance_api_secret)
         self._user_stream_tracker = BinanceUserStreamTracker(
             data_source_type=user_stream_tracker_data_source_type, binance_client=self._binance_client)
         self._ev_loop = asyncio.get_event_loop()
@@ -155,7 +158,7 @@ cdef class BinanceMarket(MarketBase):
         self._status_polling_task = None
         self._user_stream_event_listener_task = None
         self._trading_rules_polling_task = None
-        self._async_scheduler = AsyncCallScheduler(call_interval=0.5)
+        self._async_scheduler = AsyncCallScheduler(call_interval=0.5, max_concurrency=self.API_CALL_CONCURRENCY)
         self._last_poll_timestamp = 0
         self._throttler = Throttler((10.0, 1.0))
 
@@ -193,6 +196,10 @@ cdef class BinanceMarket(MarketBase):
     def binance_client(self) -> BinanceClient:
         return self._binance_client
 
+    @property
+    def api_client(self) -> BinanceAPIClient:
+        return self._api_client
+
     @property
     def trading_rules(self) -> Dict[str, TradingRule]:
         return self._trading_rules
@@ -253,9 +260,9 @@ cdef class BinanceMarket(MarketBase):
             **kwargs) -> Dict[str, any]:
         async with self._throttler.weighted_task(request_weight=request_weight):
             try:
-                return await self._async_scheduler.call_async(partial(func, *args, **kwargs),
-                                                              timeout_seconds=self.API_CALL_TIMEOUT,
-                                                              app_warning_msg=app_warning_msg)
+                return await self._async_scheduler.schedule_async_call(func(*args, **kwargs),
+                                                                       timeout_seconds=self.API_CALL_TIMEOUT,
+                                                                       app_warning_msg=app_warning_msg)
             except Exception as ex:
                 if "Timestamp for this request" in str(ex):
                     self.logger().warning("Got Binance timestamp error. "
@@ -267,12 +274,11 @@ cdef class BinanceMarket(MarketBase):
 
     async def query_url(self, url, request_weight: int = 1) -> any:
         async with self._throttler.weighted_task(request_weight=request_weight):
-            async with aiohttp.ClientSession() as client:
-                async with client.get(url, timeout=self.API_CALL_TIMEOUT) as response:
-                    if response.status != 200:
-                        raise IOError(f"Error fetching data from {url}. HTTP status is {response.status}.")
-                    data = await response.json()
-                    return data
+            async with self._api_client.session.get(url, timeout=self.API_CALL_TIMEOUT) as response:
+                if response.status != 200:
+                    raise IOError(f"Error fetching data from {url}. HTTP status is {response.status}.")
+                data = await response.json()
+                return data
 
     async def _update_balances(self):
         cdef:
@@ -283,7 +289,7 @@ cdef class BinanceMarket(MarketBase):
             set remote_asset_names = set()
             set asset_names_to_remove
 
-        account_info = await self.query_api(self._binance_client.get_account)
+        account_info = await self.query_api(self._api_client.get_account)
         balances = account_info["balances"]
         for balance_entry in balances:
             asset_name = balance_entry["asset"]
@@ -304,7 +310,7 @@ cdef class BinanceMarket(MarketBase):
 
         if current_timestamp - self._last_update_trade_fees_timestamp > 60.0 * 60.0 or len(self._trade_fees) < 1:
             try:
-                res = await self.query_api(self._binance_client.get_trade_fee)
+                res = await self.query_api(self._api_client.get_trade_fee)
                 for fee in res["tradeFee"]:
                     self._trade_fees[fee["symbol"]] = (Decimal(fee["maker"]), Decimal(fee["taker"]))
                 self._last_update_trade_fees_timestamp = current_timestamp
@@ -349,7 +355,7 @@ cdef class BinanceMarket(MarketBase):
             int64_t last_tick = <int64_t>(self._last_timestamp / 60.0)
             int64_t current_tick = <int64_t>(self._current_timestamp / 60.0)
         if current_tick > last_tick or len(self._trading_rules) < 1:
-            exchange_info = await self.query_api(self._binance_client.get_exchange_info)
+            exchange_info = await self.query_api(self._api_client.get_exchange_info)
             trading_rules_list = self._format_trading_rules(exchange_info)
             self._trading_rules.clear()
             for trading_rule in trading_rules_list:
@@ -424,7 +430,7 @@ cdef class BinanceMarket(MarketBase):
                 trading_pairs_to_order_map[o.trading_pair][o.exchange_order_id] = o
 
             trading_pairs = list(trading_pairs_to_order_map.keys())
-            tasks = [self.query_api(self._binance_client.get_my_trades, symbol=trading_pair)
+            tasks = [self.query_api(self._api_client.get_my_trades, symbol=trading_pair)
                      for trading_pair in trading_pairs]
             self.logger().debug("Polling for order fills of %d trading pairs.", len(tasks))
             results = await safe_gather(*tasks, return_exceptions=True)
@@ -471,8 +477,49 @@ cdef class BinanceMarket(MarketBase):
             int64_t current_tick = <int64_t>(self._current_timestamp / self.UPDATE_ORDER_STATUS_MIN_INTERVAL)
 
         if current_tick > last_tick and len(self._in_flight_orders) > 0:
-            tracked_orders = list(self._in_flight_orders.values())
-            tasks = [self.query_api(self._binance_client.get_order,
+            await self._reconcile_order_status()
+
+    async def _fetch_open_orders(self, trading_pairs: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Fetches the open orders of the trading pairs, keyed by client order ID - with one request per trading pair, or
+        a single request for the whole account when that weighs less. The open orders of the trading pairs that failed
+        to be fetched are left out.
+        """
+        if len(trading_pairs) * BinanceAPIClient.OPEN_ORDERS_WEIGHT >= BinanceAPIClient.OPEN_ORDERS_ALL_SYMBOLS_WEIGHT:
+            tasks = [self.query_api(self._api_client.get_open_orders)]
+        else:
+            tasks = [self.query_api(self._api_client.get_open_orders, symbol=trading_pair)
+                     for trading_pair in trading_pairs]
+        results = await safe_gather(*tasks, return_exceptions=True)
+        open_orders = {}
+        for result in results:
+            if isinstance(result, Exception):
+                self.logger().network(f"Error fetching open orders: {result}.",
+                                      app_warning_msg="Failed to fetch open orders.")
+                continue
+            for open_order in result:
+                open_orders[open_order["clientOrderId"]] = open_order
+        return open_orders
+
+    async def _reconcile_order_status(self):
+        """
+        Reconciles the in flight orders with the open orders on Binance, and looks up the status of the orders that
+        are not open - i.e. done, or not visible in the open orders yet - one by one.
+        """
+        tracked_orders = list(self._in_flight_orders.values())
+        open_orders = await self._fetch_open_orders(list({o.trading_pair for o in tracked_orders}))
+        orders_to_look_up = []
+        for tracked_order in tracked_orders:
+            open_order = open_orders.get(tracked_order.client_order_id)
+            if open_order is None:
+                orders_to_look_up.append(tracked_order)
+            elif tracked_order.client_order_id in self._in_flight_orders:
+                tracked_order.last_state = open_order["status"]
+                self._order_not_found_records.pop(tracked_order.client_order_id, None)
+        tracked_orders = orders_to_look_up
+
+        if len(tracked_orders) > 0:
+            tasks = [self.query_api(self._api_client.get_order,
                                     symbol=o.trading_pair, origClientOrderId=o.client_order_id)
                      for o in tracked_orders]
             self.logger().debug("Polling for order status updates of %d orders.", len(tasks))
@@ -485,7 +532,8 @@ cdef class BinanceMarket(MarketBase):
                     continue
 
                 if isinstance(order_update, Exception):
-                    if order_update.code == 2013 or order_update.message == "Order does not exist.":
+                    if isinstance(order_update, BinanceAPIError) and \
+                            (order_update.code == 2013 or order_update.message == "Order does not exist."):
                         self._order_not_found_records[client_order_id] = \
                             self._order_not_found_records.get(client_order_id, 0) + 1
                         if self._order_not_found_records[client_order_id] < self.ORDER_NOT_EXIST_CONFIRMATION_COUNT:
@@ -759,7 +807,7 @@ cdef class BinanceMarket(MarketBase):
         """
         :return: The current server time in milliseconds since UNIX epoch.
         """
-        result = await self.query_api(self._binance_client.get_server_time)
+        result = await self.query_api(self._api_client.get_server_time)
         return result["serverTime"]
 
     cdef c_start(self, Clock clock, double timestamp):
@@ -793,10 +841,11 @@ cdef class BinanceMarket(MarketBase):
 
     async def stop_network(self):
         self._stop_network()
+        await self._api_client.close()
 
     async def check_network(self) -> NetworkStatus:
         try:
-            await self.query_api(self._binance_client.ping)
+            await self.query_api(self._api_client.ping)
         except asyncio.CancelledError:
             raise
         except Exception:
@@ -863,7 +912,7 @@ cdef class BinanceMarket(MarketBase):
         amount_str = f"{amount:f}"
         price_str = f"{price:f}"
         type_str = BinanceMarket.binance_order_type(order_type)
-        side_str = BinanceClient.SIDE_BUY if trade_type is TradeType.BUY else BinanceClient.SIDE_SELL
+        side_str = BinanceAPIClient.SIDE_BUY if trade_type is TradeType.BUY else BinanceAPIClient.SIDE_SELL
         api_params = {"symbol": trading_pair,
                       "side": side_str,
                       "quantity": amount_str,
@@ -871,7 +920,7 @@ cdef class BinanceMarket(MarketBase):
                       "newClientOrderId": order_id,
                       "price": price_str}
         if order_type == OrderType.LIMIT:
-            api_params["timeInForce"] = BinanceClient.TIME_IN_FORCE_GTC
+            api_params["timeInForce"] = BinanceAPIClient.TIME_IN_FORCE_GTC
         self.c_start_tracking_order(order_id,
                                     "",
                                     trading_pair,
@@ -881,7 +930,7 @@ cdef class BinanceMarket(MarketBase):
                                     order_type
                                     )
         try:
-            order_result = await self.query_api(self._binance_client.create_order, **api_params)
+            order_result = await self.query_api(self._api_client.create_order, **api_params)
             exchange_order_id = str(order_result["orderId"])
             tracked_order = self._in_flight_orders.get(order_id)
             if tracked_order is not None:
@@ -933,10 +982,10 @@ cdef class BinanceMarket(MarketBase):
 
     async def execute_cancel(self, trading_pair: str, order_id: str):
         try:
-            cancel_result = await self.query_api(self._binance_client.cancel_order,
+            cancel_result = await self.query_api(self._api_client.cancel_order,
                                                  symbol=trading_pair,
                                                  origClientOrderId=order_id)
-        except BinanceAPIException as e:
+        except BinanceAPIError as e:
             if "Unknown order sent" in e.message or e.code == 2011:
                 # The order was never there to begin with. So cancelling it is a no-op but semantically successful.
                 self.logger().debug(f"The order {order_id} does not exist on Binance. No cancellation needed.")
@@ -971,7 +1020,7 @@ cdef class BinanceMarket(MarketBase):
             async with timeout(timeout_seconds):
                 cancellation_results = await safe_gather(*tasks, return_exceptions=True)
                 for cr in cancellation_results:
-                    if isinstance(cr, BinanceAPIException):
+                    if isinstance(cr, BinanceAPIError):
                         continue
                     if isinstance(cr, dict) and "origClientOrderId" in cr:
                         client_order_id = cr.get("origClientOrderId")
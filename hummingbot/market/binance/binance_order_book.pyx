@@ -51,6 +51,7 @@ cdef class BinanceOrderBook(OrderBook):
             msg.update(metadata)
         return OrderBookMessage(OrderBookMessageType.DIFF, {
             "trading_pair": msg["s"],
+            "first_update_id": msg["U"],
             "update_id": msg["u"],
             "bids": msg["b"],
             "asks": msg["a"]
@@ -75,6 +76,7 @@ cdef class BinanceOrderBook(OrderBook):
             msg.update(metadata)
         return OrderBookMessage(OrderBookMessageType.DIFF, {
             "trading_pair": msg["s"],
+            "first_update_id": msg["U"],
             "update_id": msg["u"],
             "bids": msg["b"],
             "asks": msg["a"]
@@ -99,6 +101,7 @@ cdef class BinanceOrderBook(OrderBook):
             msg.update(metadata)
         return OrderBookMessage(OrderBookMessageType.DIFF, {
             "trading_pair": msg["s"],
+            "first_update_id": msg["U"],
             "update_id": msg["u"],
             "bids": msg["b"],
             "asks": msg["a"],
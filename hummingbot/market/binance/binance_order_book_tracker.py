@@ -1,14 +1,14 @@
 #!/usr/bin/env python
 
 import asyncio
-from collections import deque, defaultdict
+from collections import deque
 import logging
 import time
 from typing import (
     Deque,
-    Dict,
     List,
-    Optional
+    Optional,
+    Tuple
 )
 
 from hummingbot.logger import HummingbotLogger
@@ -19,6 +19,10 @@ from hummingbot.core.data_type.order_book_message import OrderBookMessage, Order
 
 
 class BinanceOrderBookTracker(OrderBookTracker):
+    # The depth snapshots go through BinanceAPIClient, which takes their weight from the request weight budget it
+    # shares with the market's other REST API calls.
+    SNAPSHOT_INIT_CONCURRENCY: int = 10
+    SNAPSHOT_RATE_LIMIT: Optional[Tuple[int, float]] = None
     _bobt_logger: Optional[HummingbotLogger] = None
 
     @classmethod
@@ -36,7 +40,6 @@ class BinanceOrderBookTracker(OrderBookTracker):
         self._order_book_diff_stream: asyncio.Queue = asyncio.Queue()
         self._order_book_snapshot_stream: asyncio.Queue = asyncio.Queue()
         self._ev_loop: asyncio.BaseEventLoop = asyncio.get_event_loop()
-        self._saved_message_queues: Dict[str, Deque[OrderBookMessage]] = defaultdict(lambda: deque(maxlen=1000))
 
     @property
     def exchange_name(self) -> str:
@@ -59,7 +62,7 @@ class BinanceOrderBookTracker(OrderBookTracker):
                 if trading_pair not in self._tracking_message_queues:
                     messages_queued += 1
                     # Save diff messages received before snapshots are ready
-                    self._saved_message_queues[trading_pair].append(ob_message)
+                    self._save_order_book_diff(ob_message)
                     continue
                 message_queue: asyncio.Queue = self._tracking_message_queues[trading_pair]
                 # Check the order book's initial update ID. If it's larger, don't bother.
@@ -114,7 +117,7 @@ class BinanceOrderBookTracker(OrderBookTracker):
                     message = await message_queue.get()
 
                 if message.type is OrderBookMessageType.DIFF:
-                    order_book.apply_diffs(message.bids, message.asks, message.update_id)
+                    order_book.apply_numpy_diffs(message.bids_array, message.asks_array, message.update_id)
                     past_diffs_window.append(message)
                     while len(past_diffs_window) > self.PAST_DIFF_WINDOW_SIZE:
                         past_diffs_window.popleft()
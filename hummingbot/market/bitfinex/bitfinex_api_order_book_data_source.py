@@ -30,6 +30,7 @@ from hummingbot.core.data_type.order_book_message import (
 )
 from hummingbot.core.utils import async_ttl_cache
 from hummingbot.core.utils.async_utils import safe_gather
+from hummingbot.core.utils.http_session_registry import http_session
 from hummingbot.logger import HummingbotLogger
 from hummingbot.market.bitfinex import BITFINEX_REST_URL, BITFINEX_WS_URI
 from hummingbot.market.bitfinex.bitfinex_active_order_tracker import BitfinexActiveOrderTracker
@@ -181,7 +182,7 @@ class BitfinexAPIOrderBookDataSource(OrderBookTrackerDataSource):
     @classmethod
     @async_ttl_cache(ttl=REQUEST_TTL, maxsize=CACHE_SIZE)
     async def get_active_exchange_markets(cls) -> pd.DataFrame:
-        async with aiohttp.ClientSession() as client:
+        async with http_session(BITFINEX_REST_URL) as client:
             tickers_response, exchange_conf_response = await safe_gather(
                 client.get(f"{BITFINEX_REST_URL}/tickers?symbols=ALL"),
                 client.get(f"{BITFINEX_REST_URL}/conf/pub:info:pair"),
@@ -277,7 +278,7 @@ class BitfinexAPIOrderBookDataSource(OrderBookTrackerDataSource):
         trading_pairs: List[str] = await self.get_trading_pairs()
         number_of_pairs: int = len(trading_pairs)
 
-        async with aiohttp.ClientSession() as client:
+        async with http_session(BITFINEX_REST_URL) as client:
             for idx, trading_pair in enumerate(trading_pairs):
                 try:
                     snapshot: Dict[str, Any] = await self.get_snapshot(client, trading_pair)
@@ -509,7 +510,7 @@ class BitfinexAPIOrderBookDataSource(OrderBookTrackerDataSource):
             trading_pairs: List[str] = await self.get_trading_pairs()
 
             try:
-                async with aiohttp.ClientSession() as client:
+                async with http_session(BITFINEX_REST_URL) as client:
                     for pair in trading_pairs:
                         try:
                             snapshot: Dict[str, Any] = await self.get_snapshot(client, pair)
@@ -120,7 +120,7 @@ class BitfinexOrderBookTracker(OrderBookTracker):
                 if trading_pair not in self._tracking_message_queues:
                     messages_queued += 1
                     # Save diff messages received before snapshots are ready
-                    self._saved_message_queues[trading_pair].append(order_book_message)
+                    self._save_order_book_diff(order_book_message)
                     continue
 
                 message_queue: asyncio.Queue = self._tracking_message_queues[trading_pair]
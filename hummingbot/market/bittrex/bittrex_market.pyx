@@ -37,6 +37,7 @@ from hummingbot.market.trading_rule cimport TradingRule
 from hummingbot.core.utils.tracking_nonce import get_tracking_nonce
 from hummingbot.client.config.fee_overrides_config_map import fee_overrides_config_map
 from hummingbot.core.utils.estimate_fee import estimate_fee
+from hummingbot.core.utils.http_session_registry import get_http_session
 
 bm_logger = None
 s_decimal_0 = Decimal(0)
@@ -969,7 +970,7 @@ cdef class BittrexMarket(MarketBase):
 
     async def _http_client(self) -> aiohttp.ClientSession:
         if self._shared_client is None:
-            self._shared_client = aiohttp.ClientSession()
+            self._shared_client = get_http_session(self.BITTREX_API_ENDPOINT)
         return self._shared_client
 
     async def _api_request(self,
@@ -98,7 +98,7 @@ class BittrexOrderBookTracker(OrderBookTracker):
                 if trading_pair not in self._tracking_message_queues:
                     message_queued += 1
                     # Save diff messages received before snaphsots are ready
-                    self._saved_message_queues[trading_pair].append(ob_message)
+                    self._save_order_book_diff(ob_message)
                     continue
                 message_queue: asyncio.Queue = self._tracking_message_queues[trading_pair]
                 # Check the order book's initial update ID. If it's larger, don't bother.
@@ -232,3 +232,7 @@ class BittrexOrderBookTracker(OrderBookTracker):
         self._order_book_snapshot_router_task = safe_ensure_future(
             self._order_book_snapshot_router()
         )
+        if self._snapshot_cache is not None:
+            self._snapshot_cache_save_task = safe_ensure_future(
+                self._snapshot_cache_save_loop()
+            )
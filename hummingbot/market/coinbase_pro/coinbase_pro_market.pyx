@@ -54,6 +54,7 @@ from hummingbot.market.coinbase_pro.coinbase_pro_in_flight_order cimport Coinbas
 from hummingbot.core.utils.tracking_nonce import get_tracking_nonce
 from hummingbot.client.config.fee_overrides_config_map import fee_overrides_config_map
 from hummingbot.core.utils.estimate_fee import estimate_fee
+from hummingbot.core.utils.http_session_registry import get_http_session
 
 s_logger = None
 s_decimal_0 = Decimal("0.0")
@@ -298,7 +299,7 @@ cdef class CoinbaseProMarket(MarketBase):
         :returns: Shared client session instance
         """
         if self._shared_client is None:
-            self._shared_client = aiohttp.ClientSession()
+            self._shared_client = get_http_session(self.COINBASE_API_ENDPOINT)
         return self._shared_client
 
     async def _api_request(self,
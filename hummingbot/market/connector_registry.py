@@ -0,0 +1,78 @@
+#!/usr/bin/env python
+
+import importlib
+from typing import (
+    Dict,
+    NamedTuple,
+    Type
+)
+
+from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
+from hummingbot.market.market_base import MarketBase
+
+
+class ConnectorSetting(NamedTuple):
+    """
+    Where the market and order book tracker classes of an exchange connector are. The connector modules - and their
+    dependencies, like web3 for the DEX connectors - are only imported when the classes are first asked for.
+    """
+    name: str
+    market_module: str
+    market_class_name: str
+    order_book_tracker_module: str
+    order_book_tracker_class_name: str
+    paper_trade_supported: bool = True
+
+
+CONNECTOR_SETTINGS: Dict[str, ConnectorSetting] = {setting.name: setting for setting in [
+    ConnectorSetting("bamboo_relay",
+                     "hummingbot.market.bamboo_relay.bamboo_relay_market", "BambooRelayMarket",
+                     "hummingbot.market.bamboo_relay.bamboo_relay_order_book_tracker", "BambooRelayOrderBookTracker"),
+    ConnectorSetting("binance",
+                     "hummingbot.market.binance.binance_market", "BinanceMarket",
+                     "hummingbot.market.binance.binance_order_book_tracker", "BinanceOrderBookTracker"),
+    ConnectorSetting("bittrex",
+                     "hummingbot.market.bittrex.bittrex_market", "BittrexMarket",
+                     "hummingbot.market.bittrex.bittrex_order_book_tracker", "BittrexOrderBookTracker"),
+    ConnectorSetting("coinbase_pro",
+                     "hummingbot.market.coinbase_pro.coinbase_pro_market", "CoinbaseProMarket",
+                     "hummingbot.market.coinbase_pro.coinbase_pro_order_book_tracker", "CoinbaseProOrderBookTracker"),
+    ConnectorSetting("dolomite",
+                     "hummingbot.market.dolomite.dolomite_market", "DolomiteMarket",
+                     "hummingbot.market.dolomite.dolomite_order_book_tracker", "DolomiteOrderBookTracker"),
+    ConnectorSetting("eterbase",
+                     "hummingbot.market.eterbase.eterbase_market", "EterbaseMarket",
+                     "hummingbot.market.eterbase.eterbase_order_book_tracker", "EterbaseOrderBookTracker",
+                     paper_trade_supported=False),
+    ConnectorSetting("huobi",
+                     "hummingbot.market.huobi.huobi_market", "HuobiMarket",
+                     "hummingbot.market.huobi.huobi_order_book_tracker", "HuobiOrderBookTracker"),
+    ConnectorSetting("kraken",
+                     "hummingbot.market.kraken.kraken_market", "KrakenMarket",
+                     "hummingbot.market.kraken.kraken_order_book_tracker", "KrakenOrderBookTracker"),
+    ConnectorSetting("kucoin",
+                     "hummingbot.market.kucoin.kucoin_market", "KucoinMarket",
+                     "hummingbot.market.kucoin.kucoin_order_book_tracker", "KucoinOrderBookTracker"),
+    ConnectorSetting("liquid",
+                     "hummingbot.market.liquid.liquid_market", "LiquidMarket",
+                     "hummingbot.market.liquid.liquid_order_book_tracker", "LiquidOrderBookTracker"),
+    ConnectorSetting("radar_relay",
+                     "hummingbot.market.radar_relay.radar_relay_market", "RadarRelayMarket",
+                     "hummingbot.market.radar_relay.radar_relay_order_book_tracker", "RadarRelayOrderBookTracker"),
+]}
+
+
+def get_connector_setting(exchange: str) -> ConnectorSetting:
+    if exchange not in CONNECTOR_SETTINGS:
+        raise ValueError(f"Market name {exchange} is invalid.")
+    return CONNECTOR_SETTINGS[exchange]
+
+
+def get_market_class(exchange: str) -> Type[MarketBase]:
+    setting: ConnectorSetting = get_connector_setting(exchange)
+    return getattr(importlib.import_module(setting.market_module), setting.market_class_name)
+
+
+def get_order_book_tracker_class(exchange: str) -> Type[OrderBookTracker]:
+    setting: ConnectorSetting = get_connector_setting(exchange)
+    return getattr(importlib.import_module(setting.order_book_tracker_module), setting.order_book_tracker_class_name)
@@ -16,6 +16,7 @@ import websockets
 from websockets.exceptions import ConnectionClosed
 
 from hummingbot.core.utils import async_ttl_cache
+from hummingbot.core.utils.http_session_registry import http_session
 from hummingbot.market.dolomite.dolomite_active_order_tracker import DolomiteActiveOrderTracker
 from hummingbot.market.dolomite.dolomite_order_book import DolomiteOrderBook
 from hummingbot.market.dolomite.dolomite_order_book_tracker_entry import DolomiteOrderBookTrackerEntry
@@ -59,7 +60,7 @@ class DolomiteAPIOrderBookDataSource(OrderBookTrackerDataSource):
         """
         Returned data frame should have trading pair as index and include usd volume, baseAsset and quoteAsset
         """
-        async with aiohttp.ClientSession() as client:
+        async with http_session("https://exchange-api.dolomite.io") as client:
             # Hard coded to use the live exchange api for auto completing markets (opposed to using testnet)
             markets_response: aiohttp.ClientResponse = await client.get(
                 f"https://exchange-api.dolomite.io{MARKETS_URL}"
@@ -119,7 +120,7 @@ class DolomiteAPIOrderBookDataSource(OrderBookTrackerDataSource):
 
     async def get_tracking_pairs(self) -> Dict[str, OrderBookTrackerEntry]:
         # Get the currently active markets
-        async with aiohttp.ClientSession() as client:
+        async with http_session(self.REST_URL) as client:
             trading_pairs: List[str] = await self.get_trading_pairs()
             retval: Dict[str, DolomiteOrderBookTrackerEntry] = {}
             number_of_pairs: int = len(trading_pairs)
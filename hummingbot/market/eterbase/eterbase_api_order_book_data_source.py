@@ -20,6 +20,7 @@ from hummingbot.core.data_type.order_book import OrderBook
 from hummingbot.market.eterbase.eterbase_order_book import EterbaseOrderBook
 from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
 from hummingbot.core.utils import async_ttl_cache
+from hummingbot.core.utils.http_session_registry import http_session
 from hummingbot.logger import HummingbotLogger
 from hummingbot.core.data_type.order_book_message import OrderBookMessage
 from hummingbot.market.eterbase.eterbase_active_order_tracker import EterbaseActiveOrderTracker
@@ -50,7 +51,7 @@ class EterbaseAPIOrderBookDataSource(OrderBookTrackerDataSource):
     @classmethod
     async def get_last_traded_prices(cls, trading_pairs: List[str]) -> Dict[str, float]:
         results = dict()
-        async with aiohttp.ClientSession() as client:
+        async with http_session(constants.REST_URL) as client:
             resp = await client.get(f"{constants.REST_URL}/tickers")
             resp_json = await resp.json()
             for trading_pair in trading_pairs:
@@ -65,7 +66,7 @@ class EterbaseAPIOrderBookDataSource(OrderBookTrackerDataSource):
         *required
         Returns all currently active BTC trading pairs from Eterbase, sorted by volume in descending order.
         """
-        async with aiohttp.ClientSession() as client:
+        async with http_session(constants.REST_URL) as client:
             async with client.get(f"{constants.REST_URL}/markets") as products_response:
                 products_response: aiohttp.ClientResponse = products_response
                 if products_response.status != 200:
@@ -151,7 +152,7 @@ class EterbaseAPIOrderBookDataSource(OrderBookTrackerDataSource):
         """
         """
         tp_map_mid: Dict[str, str] = {}
-        async with aiohttp.ClientSession() as client:
+        async with http_session(constants.REST_URL) as client:
             async with client.get(f"{constants.REST_URL}/markets") as products_response:
                 products_response: aiohttp.ClientResponse = products_response
                 if products_response.status != 200:
@@ -180,7 +181,7 @@ class EterbaseAPIOrderBookDataSource(OrderBookTrackerDataSource):
             return data
 
     async def get_new_order_book(self, trading_pair: str) -> OrderBook:
-        async with aiohttp.ClientSession() as client:
+        async with http_session(constants.REST_URL) as client:
             td_map_id: Dict[str, str] = await self.get_map_marketid()
             snapshot: Dict[str, any] = await self.get_snapshot(client, trading_pair)
             snapshot_timestamp: float = time.time()
@@ -288,7 +289,7 @@ class EterbaseAPIOrderBookDataSource(OrderBookTrackerDataSource):
         while True:
             try:
                 trading_pairs: List[str] = self._trading_pairs
-                async with aiohttp.ClientSession() as client:
+                async with http_session(constants.REST_URL) as client:
                     for trading_pair in trading_pairs:
                         try:
                             snapshot: Dict[str, any] = await self.get_snapshot(client, trading_pair)
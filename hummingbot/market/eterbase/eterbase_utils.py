@@ -2,6 +2,7 @@ import logging
 from typing import Dict, Any, Optional
 import hummingbot.market.eterbase.eterbase_constants as constants
 from hummingbot.market.eterbase.eterbase_auth import EterbaseAuth
+from hummingbot.core.utils.http_session_registry import get_http_session
 
 import aiohttp
 import asyncio
@@ -10,8 +11,6 @@ from threading import Thread
 
 _eu_logger = logging.getLogger(__name__)
 
-shared_client = None
-
 marketid_map = None
 
 API_CALL_TIMEOUT = 10.0
@@ -19,18 +18,9 @@ API_CALL_TIMEOUT = 10.0
 
 async def _http_client(loop: Optional = None) -> aiohttp.ClientSession:
     """
-    :returns: Shared client session instance
+    :returns: Shared client session instance of the event loop the API is called from
     """
-
-    # calling API from different thread
-    if loop is not None:
-        return aiohttp.ClientSession(loop = loop)
-
-    # calling API fro main thread
-    global shared_client
-    if shared_client is None:
-        shared_client = aiohttp.ClientSession()
-    return shared_client
+    return get_http_session(constants.REST_URL)
 
 
 async def api_request(http_method: str,
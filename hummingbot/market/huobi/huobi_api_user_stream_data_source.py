@@ -12,6 +12,7 @@ from typing import (
 )
 
 from hummingbot.core.data_type.user_stream_tracker_data_source import UserStreamTrackerDataSource
+from hummingbot.core.utils.http_session_registry import get_http_session
 from hummingbot.logger import HummingbotLogger
 from hummingbot.market.huobi.huobi_auth import HuobiAuth
 
@@ -92,7 +93,7 @@ class HuobiAPIUserStreamDataSource(UserStreamTrackerDataSource):
 
     async def get_ws_connection(self) -> aiohttp.client._WSRequestContextManager:
         if self._client_session is None:
-            self._client_session = aiohttp.ClientSession()
+            self._client_session = get_http_session(HUOBI_WS_ENDPOINT)
 
         stream_url: str = f"{HUOBI_WS_ENDPOINT}"
         return self._client_session.ws_connect(stream_url)
@@ -150,6 +151,3 @@ class HuobiAPIUserStreamDataSource(UserStreamTrackerDataSource):
                 if self._websocket_connection is not None:
                     await self._websocket_connection.close()
                     self._websocket_connection = None
-                if self._client_session is not None:
-                    await self._client_session.close()
-                    self._client_session = None
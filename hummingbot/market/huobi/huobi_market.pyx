@@ -67,6 +67,7 @@ from hummingbot.market.huobi.huobi_user_stream_tracker import HuobiUserStreamTra
 from hummingbot.core.utils.tracking_nonce import get_tracking_nonce
 from hummingbot.client.config.fee_overrides_config_map import fee_overrides_config_map
 from hummingbot.core.utils.estimate_fee import estimate_fee
+from hummingbot.core.utils.http_session_registry import get_http_session
 
 hm_logger = None
 s_decimal_0 = Decimal(0)
@@ -104,6 +105,7 @@ cdef class HuobiMarket(MarketBase):
     MARKET_SELL_ORDER_CREATED_EVENT_TAG = MarketEvent.SellOrderCreated.value
     API_CALL_TIMEOUT = 10.0
     UPDATE_ORDERS_INTERVAL = 10.0
+    OPEN_ORDERS_PAGE_SIZE = 500
 
     @classmethod
     def logger(cls) -> HummingbotLogger:
@@ -273,7 +275,7 @@ cdef class HuobiMarket(MarketBase):
 
     async def _http_client(self) -> aiohttp.ClientSession:
         if self._shared_client is None:
-            self._shared_client = aiohttp.ClientSession()
+            self._shared_client = get_http_session(HUOBI_ROOT_API)
         return self._shared_client
 
     async def _api_request(self,
@@ -440,6 +442,31 @@ cdef class HuobiMarket(MarketBase):
         path_url = f"/order/orders/{exchange_order_id}"
         return await self._api_request("get", path_url=path_url, is_auth_required=True)
 
+    async def list_open_orders(self, trading_pairs: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Fetches the open orders of the trading pairs, with one request per trading pair. The open orders of the trading
+        pairs that failed to be fetched are left out.
+
+        :returns: the open orders, keyed by exchange order ID
+        """
+        tasks = [self._api_request("get",
+                                   path_url="/order/openOrders",
+                                   params={"account-id": self._account_id,
+                                           "symbol": trading_pair,
+                                           "size": self.OPEN_ORDERS_PAGE_SIZE},
+                                   is_auth_required=True)
+                 for trading_pair in trading_pairs]
+        results = await safe_gather(*tasks, return_exceptions=True)
+        open_orders = {}
+        for trading_pair, result in zip(trading_pairs, results):
+            if isinstance(result, Exception):
+                self.logger().network(f"Error fetching open orders of {trading_pair}: {result}.",
+                                      app_warning_msg=f"Could not fetch open orders of {trading_pair} from Huobi.")
+                continue
+            for open_order in result:
+                open_orders[str(open_order["id"])] = open_order
+        return open_orders
+
     async def _update_order_status(self):
         cdef:
             # The poll interval for order status is 10 seconds.
@@ -448,8 +475,15 @@ cdef class HuobiMarket(MarketBase):
 
         if current_tick > last_tick and len(self._in_flight_orders) > 0:
             tracked_orders = list(self._in_flight_orders.values())
+            open_orders = await self.list_open_orders(list({o.trading_pair for o in tracked_orders}))
             for tracked_order in tracked_orders:
                 exchange_order_id = await tracked_order.get_exchange_order_id()
+                open_order = open_orders.get(str(exchange_order_id))
+                if open_order is not None and \
+                        Decimal(open_order["filled-amount"]) == tracked_order.executed_amount_base:
+                    # The order is still open and has not been filled since the last update. Only the orders that are
+                    # missing from the open orders, or have new fills, are looked up.
+                    continue
                 try:
                     order_update = await self.get_order_status(exchange_order_id)
                 except HuobiAPIError as e:
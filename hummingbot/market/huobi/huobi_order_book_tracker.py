@@ -53,6 +53,9 @@ class HuobiOrderBookTracker(OrderBookTracker):
                 trading_pair: str = ob_message.trading_pair
 
                 if trading_pair not in self._tracking_message_queues:
+                    messages_queued += 1
+                    # Save diff messages received before snapshots are ready
+                    self._save_order_book_diff(ob_message)
                     continue
                 message_queue: asyncio.Queue = self._tracking_message_queues[trading_pair]
                 # Check the order book's initial update ID. If it's larger, don't bother.
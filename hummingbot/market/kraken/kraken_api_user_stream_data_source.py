@@ -13,6 +13,7 @@ import time
 import ujson
 import websockets
 from hummingbot.core.data_type.user_stream_tracker_data_source import UserStreamTrackerDataSource
+from hummingbot.core.utils.http_session_registry import get_http_session
 from hummingbot.logger import HummingbotLogger
 from hummingbot.market.kraken.kraken_auth import KrakenAuth
 from hummingbot.market.kraken.kraken_order_book import KrakenOrderBook
@@ -123,7 +124,7 @@ class KrakenAPIUserStreamDataSource(UserStreamTrackerDataSource):
 
     async def _http_client(self) -> aiohttp.ClientSession:
         if self._shared_client is None or self._shared_client.closed:
-            self._shared_client = aiohttp.ClientSession()
+            self._shared_client = get_http_session(KRAKEN_ROOT_API)
         return self._shared_client
 
     async def _inner_messages(self,
@@ -155,5 +156,5 @@ class KrakenAPIUserStreamDataSource(UserStreamTrackerDataSource):
             await ws.close()
 
     async def stop(self):
-        if self._shared_client is not None and not self._shared_client.closed:
-            await self._shared_client.close()
+        # The HTTP session is shared through the session registry, which owns it.
+        self._shared_client = None
@@ -56,6 +56,7 @@ from hummingbot.market.trading_rule cimport TradingRule
 from hummingbot.core.utils.tracking_nonce import get_tracking_nonce
 from hummingbot.client.config.fee_overrides_config_map import fee_overrides_config_map
 from hummingbot.core.utils.estimate_fee import estimate_fee
+from hummingbot.core.utils.http_session_registry import get_http_session
 
 s_logger = None
 s_decimal_0 = Decimal(0)
@@ -98,6 +99,7 @@ cdef class KrakenMarket(MarketBase):
     KRAKEN_USER_STREAM_TOPIC_NAME = "kraken-user-stream.serialized"
 
     ORDER_NOT_EXIST_CONFIRMATION_COUNT = 3
+    QUERY_ORDERS_BATCH_SIZE = 50
 
     @classmethod
     def logger(cls) -> HummingbotLogger:
@@ -409,6 +411,36 @@ cdef class KrakenMarket(MarketBase):
                 self.logger().error(f"Error parsing the trading pair rule {rule}. Skipping.", exc_info=True)
         return retval
 
+    async def _query_orders(self, tracked_orders: List[KrakenInFlightOrder]) -> List[Any]:
+        """
+        Queries the status of the orders in batches of up to QUERY_ORDERS_BATCH_SIZE orders per request, and looks up
+        the orders of a batch that Kraken rejected - which it does for a single unknown order ID - one by one.
+
+        :returns: the QueryOrders result, or the exception raised, for each order
+        """
+        batches = [[o] for o in tracked_orders if o.exchange_order_id is None]
+        identified_orders = [o for o in tracked_orders if o.exchange_order_id is not None]
+        batches.extend(identified_orders[i:i + self.QUERY_ORDERS_BATCH_SIZE]
+                       for i in range(0, len(identified_orders), self.QUERY_ORDERS_BATCH_SIZE))
+        tasks = [self._query_orders_batch(batch) for batch in batches]
+        batch_results = await safe_gather(*tasks, return_exceptions=True)
+
+        results_by_order_id = {}
+        for batch, batch_result in zip(batches, batch_results):
+            if len(batch) > 1 and isinstance(batch_result, dict) and batch_result.get("error") is not None:
+                order_results = await safe_gather(*[self._query_orders_batch([o]) for o in batch],
+                                                  return_exceptions=True)
+            else:
+                order_results = [batch_result] * len(batch)
+            for tracked_order, order_result in zip(batch, order_results):
+                results_by_order_id[tracked_order.client_order_id] = order_result
+        return [results_by_order_id[o.client_order_id] for o in tracked_orders]
+
+    async def _query_orders_batch(self, tracked_orders: List[KrakenInFlightOrder]) -> Dict[str, Any]:
+        txid = (tracked_orders[0].exchange_order_id if len(tracked_orders) == 1
+                else ",".join(o.exchange_order_id for o in tracked_orders))
+        return await self._api_request("POST", QUERY_ORDERS_URI, data={"txid": txid}, is_auth_required=True)
+
     async def _update_order_status(self):
         cdef:
             # This is intended to be a backup measure to close straggler orders, in case Kraken's user stream events
@@ -419,12 +451,7 @@ cdef class KrakenMarket(MarketBase):
 
         if len(self._in_flight_orders) > 0:
             tracked_orders = list(self._in_flight_orders.values())
-            tasks = [self._api_request("POST",
-                                       QUERY_ORDERS_URI,
-                                       data={"txid": o.exchange_order_id},
-                                       is_auth_required=True)
-                     for o in tracked_orders]
-            results = await safe_gather(*tasks, return_exceptions=True)
+            results = await self._query_orders(tracked_orders)
 
             for order_update, tracked_order in zip(results, tracked_orders):
                 client_order_id = tracked_order.client_order_id
@@ -740,7 +767,7 @@ cdef class KrakenMarket(MarketBase):
 
     async def _http_client(self) -> aiohttp.ClientSession:
         if self._shared_client is None:
-            self._shared_client = aiohttp.ClientSession()
+            self._shared_client = get_http_session(KRAKEN_ROOT_API)
         return self._shared_client
 
     async def _api_request(self,
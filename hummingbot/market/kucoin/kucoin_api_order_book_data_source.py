@@ -18,6 +18,7 @@ from websockets.exceptions import ConnectionClosed
 from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
 from hummingbot.core.data_type.order_book_message import OrderBookMessage
 from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.utils.http_session_registry import http_session
 from hummingbot.logger import HummingbotLogger
 from hummingbot.market.kucoin.kucoin_order_book import KucoinOrderBook
 from hummingbot.market.kucoin.kucoin_active_order_tracker import KucoinActiveOrderTracker
@@ -49,7 +50,7 @@ class KucoinAPIOrderBookDataSource(OrderBookTrackerDataSource):
     @classmethod
     async def get_last_traded_prices(cls, trading_pairs: List[str]) -> Dict[str, float]:
         results = dict()
-        async with aiohttp.ClientSession() as client:
+        async with http_session(TICKER_PRICE_CHANGE_URL) as client:
             resp = await client.get(TICKER_PRICE_CHANGE_URL)
             resp_json = await resp.json()
             for trading_pair in trading_pairs:
@@ -69,7 +70,7 @@ class KucoinAPIOrderBookDataSource(OrderBookTrackerDataSource):
             return data
 
     async def get_new_order_book(self, trading_pair: str) -> OrderBook:
-        async with aiohttp.ClientSession() as client:
+        async with http_session(SNAPSHOT_REST_URL) as client:
             snapshot: Dict[str, Any] = await self.get_snapshot(client, trading_pair)
             snapshot_timestamp: float = time.time()
             snapshot_msg: OrderBookMessage = KucoinOrderBook.snapshot_message_from_exchange(
@@ -107,7 +108,7 @@ class KucoinAPIOrderBookDataSource(OrderBookTrackerDataSource):
 
     # get required data to create a websocket request
     async def ws_connect_data(self):
-        async with aiohttp.ClientSession() as session:
+        async with http_session("https://api.kucoin.com") as session:
             async with session.post('https://api.kucoin.com/api/v1/bullet-public', data=b'') as resp:
                 response: aiohttp.ClientResponse = resp
                 if response.status != 200:
@@ -188,7 +189,7 @@ class KucoinAPIOrderBookDataSource(OrderBookTrackerDataSource):
     async def listen_for_order_book_snapshots(self, ev_loop: asyncio.BaseEventLoop, output: asyncio.Queue):
         while True:
             try:
-                async with aiohttp.ClientSession() as client:
+                async with http_session(SNAPSHOT_REST_URL) as client:
                     for trading_pair in self._trading_pairs:
                         try:
                             snapshot: Dict[str, Any] = await self.get_snapshot(client, trading_pair)
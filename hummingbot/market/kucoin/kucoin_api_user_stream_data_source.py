@@ -13,6 +13,7 @@ import ujson
 import websockets
 
 from hummingbot.core.data_type.user_stream_tracker_data_source import UserStreamTrackerDataSource
+from hummingbot.core.utils.http_session_registry import http_session
 from hummingbot.market.kucoin.kucoin_auth import KucoinAuth
 from hummingbot.logger import HummingbotLogger
 
@@ -49,7 +50,7 @@ class KucoinAPIUserStreamDataSource(UserStreamTrackerDataSource):
         return self._last_recv_time
 
     async def get_listen_key(self):
-        async with aiohttp.ClientSession() as client:
+        async with http_session(KUCOIN_API_ENDPOINT) as client:
             header = self._kucoin_auth.add_auth_to_params("POST", KUCOIN_USER_STREAM_ENDPOINT)
             async with client.post(f"{KUCOIN_API_ENDPOINT}{KUCOIN_USER_STREAM_ENDPOINT}", headers=header) as response:
                 response: aiohttp.ClientResponse = response
@@ -52,6 +52,7 @@ from hummingbot.market.market_base import MarketBase
 from hummingbot.core.utils.tracking_nonce import get_tracking_nonce
 from hummingbot.client.config.fee_overrides_config_map import fee_overrides_config_map
 from hummingbot.core.utils.estimate_fee import estimate_fee
+from hummingbot.core.utils.http_session_registry import get_http_session
 
 km_logger = None
 s_decimal_0 = Decimal(0)
@@ -87,6 +88,7 @@ cdef class KucoinMarket(MarketBase):
     MARKET_SELL_ORDER_CREATED_EVENT_TAG = MarketEvent.SellOrderCreated.value
     API_CALL_TIMEOUT = 10.0
     UPDATE_ORDERS_INTERVAL = 10.0
+    ACTIVE_ORDERS_PAGE_SIZE = 500
     SHORT_POLL_INTERVAL = 5.0
     LONG_POLL_INTERVAL = 120.0
 
@@ -376,7 +378,7 @@ cdef class KucoinMarket(MarketBase):
 
     async def _http_client(self) -> aiohttp.ClientSession:
         if self._shared_client is None:
-            self._shared_client = aiohttp.ClientSession()
+            self._shared_client = get_http_session(KUCOIN_ROOT_API)
         return self._shared_client
 
     async def _api_request(self,
@@ -508,6 +510,24 @@ cdef class KucoinMarket(MarketBase):
         path_url = f"/api/v1/orders/{exchange_order_id}"
         return await self._api_request("get", path_url=path_url, is_auth_required=True)
 
+    async def list_active_orders(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Fetches the active orders of the account, one page of up to ACTIVE_ORDERS_PAGE_SIZE orders at a time.
+
+        :returns: the active orders of the account, keyed by exchange order ID
+        """
+        active_orders = {}
+        current_page = 1
+        while True:
+            path_url = (f"/api/v1/orders?status=active&pageSize={self.ACTIVE_ORDERS_PAGE_SIZE}"
+                        f"&currentPage={current_page}")
+            result = await self._api_request("get", path_url=path_url, is_auth_required=True)
+            for order in result["data"]["items"]:
+                active_orders[order["id"]] = order
+            if current_page >= result["data"]["totalPage"]:
+                return active_orders
+            current_page += 1
+
     async def _update_order_status(self):
         cdef:
             # The poll interval for order status is 10 seconds.
@@ -516,8 +536,20 @@ cdef class KucoinMarket(MarketBase):
 
         if current_tick > last_tick and len(self._in_flight_orders) > 0:
             tracked_orders = list(self._in_flight_orders.values())
+            try:
+                active_orders = await self.list_active_orders()
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                self.logger().network("Error fetching active orders.", exc_info=True,
+                                      app_warning_msg="Could not fetch active orders from Kucoin.")
+                active_orders = {}
             for tracked_order in tracked_orders:
                 exchange_order_id = await tracked_order.get_exchange_order_id()
+                if exchange_order_id in active_orders:
+                    # The order is still active, so there is nothing to update yet. Only the orders missing from the
+                    # active orders are looked up.
+                    continue
                 order_update = await self.get_order_status(exchange_order_id)
                 if order_update is None:
                     self.logger().network(
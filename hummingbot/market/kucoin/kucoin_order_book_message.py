@@ -2,11 +2,9 @@
 import time
 from typing import (
     Dict,
-    List,
     Optional,
 )
 
-from hummingbot.core.data_type.order_book_row import OrderBookRow
 from hummingbot.core.data_type.order_book_message import (
     OrderBookMessage,
     OrderBookMessageType,
@@ -42,22 +40,6 @@ class KucoinOrderBookMessage(OrderBookMessage):
     def trading_pair(self) -> str:
         return self.content["trading_pair"]
 
-    @property
-    def asks(self) -> List[OrderBookRow]:
-        # raise NotImplementedError("Kucoin order book messages have different semantics.")
-        return [
-            OrderBookRow(float(price), float(amount), self.update_id)
-            for price, amount, *trash in self.content.get("asks", [])
-        ]
-
-    @property
-    def bids(self) -> List[OrderBookRow]:
-        # raise NotImplementedError("Kucoin order book messages have different semantics.")
-        return [
-            OrderBookRow(float(price), float(amount), self.update_id)
-            for price, amount, *trash in self.content.get("bids", [])
-        ]
-
     @property
     def has_update_id(self) -> bool:
         return True
@@ -2,11 +2,9 @@
 
 from typing import (
     Dict,
-    List,
     Optional,
 )
 
-from hummingbot.core.data_type.order_book_row import OrderBookRow
 from hummingbot.core.data_type.order_book_message import (
     OrderBookMessage,
     OrderBookMessageType,
@@ -41,17 +39,3 @@ class LiquidOrderBookMessage(OrderBookMessage):
     @property
     def trading_pair(self) -> (str):
         return self.content.get('trading_pair', None)
-
-    @property
-    def asks(self) -> (List[OrderBookRow]):
-        return [
-            OrderBookRow(float(price), float(amount), self.update_id)
-            for price, amount, *trash in self.content.get("asks", [])
-        ]
-
-    @property
-    def bids(self) -> (List[OrderBookRow]):
-        return [
-            OrderBookRow(float(price), float(amount), self.update_id)
-            for price, amount, *trash in self.content.get("bids", [])
-        ]
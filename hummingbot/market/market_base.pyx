@@ -20,6 +20,7 @@ from hummingbot.core.data_type.order_book_row import (
 )
 from hummingbot.core.event.events import (
     MarketEvent,
+    OrderFilledEvent,
     OrderType,
     TradeType,
     TradeFee
@@ -28,9 +29,9 @@ from hummingbot.core.event.event_logger import EventLogger
 from hummingbot.core.data_type.limit_order import LimitOrder
 from hummingbot.core.network_iterator import NetworkIterator
 from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
 from hummingbot.market.in_flight_order_base import InFlightOrderBase
 from .deposit_info import DepositInfo
-from hummingbot.core.event.events import OrderFilledEvent
 
 NaN = float("nan")
 s_decimal_NaN = Decimal("nan")
@@ -49,11 +50,16 @@ cdef class MarketBase(NetworkIterator):
         MarketEvent.SellOrderCreated,
         MarketEvent.OrderExpired
     ]
+    # Number of the latest market events kept in event_logs. The order filled events, which the strategies' trades
+    # are made from, are all kept in event_logs_of_type().
+    EVENT_LOG_MAX_EVENTS = 10000
 
     def __init__(self):
         super().__init__()
         self._event_reporter = EventReporter(event_source=self.name)
-        self._event_logger = EventLogger(event_source=self.name)
+        self._event_logger = EventLogger(event_source=self.name,
+                                         max_events=self.EVENT_LOG_MAX_EVENTS,
+                                         unbounded_event_types=[OrderFilledEvent])
         for event_tag in self.MARKET_EVENTS:
             self.c_add_listener(event_tag.value, self._event_reporter)
             self.c_add_listener(event_tag.value, self._event_logger)
@@ -99,23 +105,12 @@ cdef class MarketBase(NetworkIterator):
         For BUY filled order, the quote balance goes down while the base balance goes up, and for SELL order, it's the
         opposite. This does not account for fee.
         """
-        order_filled_events = list(filter(lambda e: isinstance(e, OrderFilledEvent), self.event_logs))
         balances = {}
-        for event in order_filled_events:
-            hb_trading_pair = self.convert_from_exchange_trading_pair(event.trading_pair)
+        for trading_pair, (base_value, quote_value) in self._event_logger.order_filled_totals.items():
+            hb_trading_pair = self.convert_from_exchange_trading_pair(trading_pair)
             base, quote = hb_trading_pair.split("-")[0], hb_trading_pair.split("-")[1]
-            if event.trade_type is TradeType.BUY:
-                quote_value = Decimal("-1") * event.price * event.amount
-                base_value = event.amount
-            else:
-                quote_value = event.price * event.amount
-                base_value = Decimal("-1") * event.amount
-            if base not in balances:
-                balances[base] = s_decimal_0
-            if quote not in balances:
-                balances[quote] = s_decimal_0
-            balances[base] += base_value
-            balances[quote] += quote_value
+            balances[base] = balances.get(base, s_decimal_0) + base_value
+            balances[quote] = balances.get(quote, s_decimal_0) + quote_value
         return balances
 
     @staticmethod
@@ -142,10 +137,17 @@ cdef class MarketBase(NetworkIterator):
     def event_logs(self) -> List[any]:
         return self._event_logger.event_log
 
+    def event_logs_of_type(self, event_type) -> List[any]:
+        return self._event_logger.events_of_type(event_type)
+
     @property
     def order_books(self) -> Dict[str, OrderBook]:
         raise NotImplementedError
 
+    @property
+    def order_book_tracker(self) -> Optional[OrderBookTracker]:
+        return self._order_book_tracker
+
     @property
     def ready(self) -> bool:
         raise NotImplementedError
@@ -3,6 +3,9 @@
 import os.path
 import pandas as pd
 import asyncio
+from concurrent.futures import ThreadPoolExecutor
+import logging
+from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import (
     Session,
     Query
@@ -10,6 +13,8 @@ from sqlalchemy.orm import (
 import time
 import threading
 from typing import (
+    Any,
+    Callable,
     Dict,
     List,
     Optional,
@@ -18,6 +23,8 @@ from typing import (
 )
 
 from hummingbot import data_path
+from hummingbot.logger import HummingbotLogger
+from hummingbot.client.performance_analysis import TradePerformanceAccumulator
 from hummingbot.core.event.events import (
     BuyOrderCreatedEvent,
     SellOrderCreatedEvent,
@@ -37,19 +44,51 @@ from hummingbot.model.order import Order
 from hummingbot.model.order_status import OrderStatus
 from hummingbot.model.sql_connection_manager import SQLConnectionManager
 from hummingbot.model.trade_fill import TradeFill
+from hummingbot.core.utils.async_utils import safe_ensure_future
+
+# A pending database write, run with the session of the batch it's written in.
+PendingWrite = Callable[[Session], None]
+# (pending writes, market states to save as (market name, timestamp, saved state), CSV rows by file path)
+WriteBatch = Tuple[List[PendingWrite], List[Tuple[str, int, Dict[str, Any]]], Dict[str, List[List[Any]]]]
+
+CSV_HEADER: List[str] = ["Config File", "Strategy", "Exchange", "Timestamp", "Market", "Base", "Quote", "Trade", "Type",
+                         "Price", "Amount", "Fee", "Age", "Order ID", "Exchange Trade ID"]
 
 
 class MarketsRecorder:
+    """
+    Records the orders, order status changes, trade fills and market states of the markets to the database, and the
+    trade fills to the trades CSV file.
+
+    Records are written behind the event loop: the event handlers only queue them, and they're written every
+    WRITE_INTERVAL seconds in a single transaction on a writer thread. The market states of a market are saved once
+    per batch, however many of its events are in it. The queries below, and stop(), flush the pending records first.
+    """
+    WRITE_INTERVAL = 0.5
+    WRITE_QUEUE_DEPTH_WARNING = 1000
+
     market_event_tag_map: Dict[int, MarketEvent] = {
         event_obj.value: event_obj
         for event_obj in MarketEvent.__members__.values()
     }
 
+    _mr_logger: Optional[HummingbotLogger] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._mr_logger is None:
+            cls._mr_logger = logging.getLogger(__name__)
+        return cls._mr_logger
+
     def __init__(self,
                  sql: SQLConnectionManager,
                  markets: List[MarketBase],
                  config_file_path: str,
-                 strategy_name: str):
+                 strategy_name: str,
+                 trade_performance_accumulator: Optional[TradePerformanceAccumulator] = None):
+        """
+        :param trade_performance_accumulator: if given, every recorded trade fill is added to it
+        """
         if threading.current_thread() != threading.main_thread():
             raise EnvironmentError("MarketsRecorded can only be initialized from the main thread.")
 
@@ -58,6 +97,16 @@ class MarketsRecorder:
         self._markets: List[MarketBase] = markets
         self._config_file_path: str = config_file_path
         self._strategy_name: str = strategy_name
+        self._trade_performance_accumulator: Optional[TradePerformanceAccumulator] = trade_performance_accumulator
+
+        self._pending_writes: List[PendingWrite] = []
+        self._pending_market_states: Dict[str, MarketBase] = {}
+        self._pending_csv_rows: Dict[str, List[List[Any]]] = {}
+        self._in_flight_writes: int = 0
+        self._max_write_queue_depth: int = 0
+        self._in_flight_lock: threading.Lock = threading.Lock()
+        self._write_executor: Optional[ThreadPoolExecutor] = None
+        self._write_task: Optional[asyncio.Task] = None
 
         self._create_order_forwarder: SourceInfoEventForwarder = SourceInfoEventForwarder(self._did_create_order)
         self._fill_order_forwarder: SourceInfoEventForwarder = SourceInfoEventForwarder(self._did_fill_order)
@@ -93,21 +142,174 @@ class MarketsRecorder:
     def strategy_name(self) -> str:
         return self._strategy_name
 
+    @property
+    def trade_performance_accumulator(self) -> Optional[TradePerformanceAccumulator]:
+        return self._trade_performance_accumulator
+
     @property
     def db_timestamp(self) -> int:
         return int(time.time() * 1e3)
 
+    @property
+    def write_queue_depth(self) -> int:
+        """
+        Number of database writes queued or being written.
+        """
+        with self._in_flight_lock:
+            return len(self._pending_writes) + self._in_flight_writes
+
+    @property
+    def max_write_queue_depth(self) -> int:
+        """
+        Largest write queue depth seen by the writer, sampled before each batch.
+        """
+        return self._max_write_queue_depth
+
+    @property
+    def writes_in_background(self) -> bool:
+        # Every connection to an in-memory SQLite database opens a different database, so those are written inline.
+        return self._sql.engine.url.database not in (None, "", ":memory:")
+
+    def format_status(self) -> str:
+        return f"  Database writes: {self.write_queue_depth} pending (peak {self._max_write_queue_depth})."
+
     def start(self):
         for market in self._markets:
             for event_pair in self._event_pairs:
                 market.add_listener(event_pair[0], event_pair[1])
+        if self._write_task is None:
+            if self.writes_in_background:
+                self._write_executor = ThreadPoolExecutor(max_workers=1)
+            self._write_task = safe_ensure_future(self._write_loop(), loop=self._ev_loop)
 
     def stop(self):
         for market in self._markets:
             for event_pair in self._event_pairs:
                 market.remove_listener(event_pair[0], event_pair[1])
+        if self._write_task is not None:
+            self._write_task.cancel()
+            self._write_task = None
+        self.flush()
+        if self._write_executor is not None:
+            self._write_executor.shutdown(wait=True)
+            self._write_executor = None
+
+    def flush(self):
+        """
+        Writes the pending records and waits for the ones being written, so they're visible to the shared session.
+        """
+        batch: WriteBatch = self._take_pending_writes()
+        if self._write_executor is not None:
+            self._write_executor.submit(self._write_batch, batch).result()
+            # Ends the shared session's transaction, so its next query sees the rows written by the writer thread.
+            self.session.commit()
+        else:
+            self._write_batch(batch)
+
+    async def _write_loop(self):
+        while True:
+            try:
+                await asyncio.sleep(self.WRITE_INTERVAL)
+                if len(self._pending_writes) == 0 and len(self._pending_market_states) == 0:
+                    continue
+                queue_depth: int = self.write_queue_depth
+                self._max_write_queue_depth = max(self._max_write_queue_depth, queue_depth)
+                if queue_depth > self.WRITE_QUEUE_DEPTH_WARNING:
+                    self.logger().warning(f"{queue_depth} database writes are pending. "
+                                          f"The database is falling behind the market events.")
+                batch: WriteBatch = self._take_pending_writes()
+                if self._write_executor is not None:
+                    await self._ev_loop.run_in_executor(self._write_executor, self._write_batch, batch)
+                else:
+                    self._write_batch(batch)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                self.logger().error("Unexpected error writing market records.", exc_info=True)
+
+    def _enqueue_write(self, write: PendingWrite, market: MarketBase):
+        self._pending_writes.append(write)
+        self._pending_market_states[market.display_name] = market
+
+    def _take_pending_writes(self) -> WriteBatch:
+        timestamp: int = self.db_timestamp
+        with self._in_flight_lock:
+            writes: List[PendingWrite] = self._pending_writes
+            self._pending_writes = []
+            self._in_flight_writes += len(writes)
+        # Market tracking states are read here, on the event loop's thread, while the markets aren't changing.
+        market_states: List[Tuple[str, int, Dict[str, Any]]] = [
+            (display_name, timestamp, market.tracking_states)
+            for display_name, market in self._pending_market_states.items()
+        ]
+        csv_rows: Dict[str, List[List[Any]]] = self._pending_csv_rows
+        self._pending_market_states = {}
+        self._pending_csv_rows = {}
+        return writes, market_states, csv_rows
+
+    def _write_batch(self, batch: WriteBatch):
+        writes, market_states, csv_rows = batch
+        try:
+            try:
+                self._commit_writes(writes, market_states)
+            except SQLAlchemyError:
+                # Don't let one bad record take the rest of the batch down with it.
+                self.logger().error("Error writing batched market records. Writing them one at a time.",
+                                    exc_info=True)
+                for write in writes:
+                    try:
+                        self._commit_writes([write], [])
+                    except SQLAlchemyError:
+                        self.logger().error("Error writing market record.", exc_info=True)
+                try:
+                    self._commit_writes([], market_states)
+                except SQLAlchemyError:
+                    self.logger().error("Error saving market states.", exc_info=True)
+            for csv_path, rows in csv_rows.items():
+                self._append_csv_rows(csv_path, rows)
+        finally:
+            with self._in_flight_lock:
+                self._in_flight_writes -= len(writes)
+
+    def _commit_writes(self, writes: List[PendingWrite], market_states: List[Tuple[str, int, Dict[str, Any]]]):
+        if len(writes) == 0 and len(market_states) == 0:
+            return
+        if self._write_executor is None:
+            session: Session = self.session
+            try:
+                self._apply_writes(session, writes, market_states)
+                session.commit()
+            except Exception:
+                session.rollback()
+                raise
+        else:
+            with self._sql.begin() as session:
+                self._apply_writes(session, writes, market_states)
+
+    def _apply_writes(self,
+                      session: Session,
+                      writes: List[PendingWrite],
+                      market_states: List[Tuple[str, int, Dict[str, Any]]]):
+        for write in writes:
+            write(session)
+        for market_name, timestamp, saved_state in market_states:
+            market_state_record: Optional[MarketState] = (session
+                                                          .query(MarketState)
+                                                          .filter(MarketState.config_file_path ==
+                                                                  self._config_file_path,
+                                                                  MarketState.market == market_name)
+                                                          .one_or_none())
+            if market_state_record is not None:
+                market_state_record.saved_state = saved_state
+                market_state_record.timestamp = timestamp
+            else:
+                session.add(MarketState(config_file_path=self._config_file_path,
+                                        market=market_name,
+                                        timestamp=timestamp,
+                                        saved_state=saved_state))
 
     def get_orders_for_config_and_market(self, config_file_path: str, market: MarketBase) -> List[Order]:
+        self.flush()
         session: Session = self.session
         query: Query = (session
                         .query(Order)
@@ -117,6 +319,7 @@ class MarketsRecorder:
         return query.all()
 
     def get_trades_for_config(self, config_file_path: str, number_of_rows: Optional[int] = None) -> List[TradeFill]:
+        self.flush()
         session: Session = self.session
         query: Query = (session
                         .query(TradeFill)
@@ -128,6 +331,7 @@ class MarketsRecorder:
             return query.limit(number_of_rows).all()
 
     def save_market_states(self, config_file_path: str, market: MarketBase, no_commit: bool = False):
+        self._pending_market_states.pop(market.display_name, None)
         session: Session = self.session
         market_states: Optional[MarketState] = self.get_market_states(config_file_path, market)
         timestamp: int = self.db_timestamp
@@ -152,6 +356,7 @@ class MarketsRecorder:
             market.restore_tracking_states(market_states.saved_state)
 
     def get_market_states(self, config_file_path: str, market: MarketBase) -> Optional[MarketState]:
+        self.flush()
         session: Session = self.session
         query: Query = (session
                         .query(MarketState)
@@ -168,7 +373,6 @@ class MarketsRecorder:
             self._ev_loop.call_soon_threadsafe(self._did_create_order, event_tag, market, evt)
             return
 
-        session: Session = self.session
         base_asset, quote_asset = market.split_trading_pair(evt.trading_pair)
         timestamp: int = self.db_timestamp
         event_type: MarketEvent = self.market_event_tag_map[event_tag]
@@ -188,10 +392,12 @@ class MarketsRecorder:
         order_status: OrderStatus = OrderStatus(order=order_record,
                                                 timestamp=timestamp,
                                                 status=event_type.name)
-        session.add(order_record)
-        session.add(order_status)
-        self.save_market_states(self._config_file_path, market, no_commit=True)
-        session.commit()
+
+        def write(session: Session):
+            session.add(order_record)
+            session.add(order_status)
+
+        self._enqueue_write(write, market)
 
     def _did_fill_order(self,
                         event_tag: int,
@@ -201,18 +407,11 @@ class MarketsRecorder:
             self._ev_loop.call_soon_threadsafe(self._did_fill_order, event_tag, market, evt)
             return
 
-        session: Session = self.session
         base_asset, quote_asset = market.split_trading_pair(evt.trading_pair)
         timestamp: int = self.db_timestamp
         event_type: MarketEvent = self.market_event_tag_map[event_tag]
         order_id: str = evt.order_id
 
-        # Try to find the order record, and update it if necessary.
-        order_record: Optional[Order] = session.query(Order).filter(Order.id == order_id).one_or_none()
-        if order_record is not None:
-            order_record.last_status = event_type.name
-            order_record.last_update_timestamp = timestamp
-
         # Order status and trade fill record should be added even if the order record is not found, because it's
         # possible for fill event to come in before the order created event for market orders.
         order_status: OrderStatus = OrderStatus(order_id=order_id,
@@ -232,27 +431,49 @@ class MarketsRecorder:
                                                  amount=float(evt.amount),
                                                  trade_fee=TradeFee.to_json(evt.trade_fee),
                                                  exchange_trade_id=evt.exchange_trade_id)
-        session.add(order_status)
-        session.add(trade_fill_record)
-        self.save_market_states(self._config_file_path, market, no_commit=True)
-        session.commit()
-        self.append_to_csv(trade_fill_record)
+        if self._trade_performance_accumulator is not None:
+            self._trade_performance_accumulator.add_trade(trade_fill_record)
+        self._pending_csv_rows.setdefault(self._csv_path(trade_fill_record), []).append(
+            self._csv_row(trade_fill_record)
+        )
+
+        def write(session: Session):
+            # Try to find the order record, and update it if necessary.
+            order_record: Optional[Order] = session.query(Order).filter(Order.id == order_id).one_or_none()
+            if order_record is not None:
+                order_record.last_status = event_type.name
+                order_record.last_update_timestamp = timestamp
+            session.add(order_status)
+            session.add(trade_fill_record)
 
-    def append_to_csv(self, trade: TradeFill):
+        self._enqueue_write(write, market)
+
+    @staticmethod
+    def _csv_path(trade: TradeFill) -> str:
         csv_file = "trades_" + trade.config_file_path[:-4] + ".csv"
-        csv_path = os.path.join(data_path(), csv_file)
+        return os.path.join(data_path(), csv_file)
+
+    @staticmethod
+    def _csv_row(trade: TradeFill) -> List[Any]:
         # // indicates order is a paper order so 'n/a'. For real orders, calculate age.
         age = "n/a"
         if "//" not in trade.order_id:
             age = pd.Timestamp(int(trade.timestamp / 1e3 - int(trade.order_id[-16:]) / 1e6), unit='s').strftime('%H:%M:%S')
+        return [trade.config_file_path, trade.strategy, trade.market, trade.timestamp, trade.symbol, trade.base_asset,
+                trade.quote_asset, trade.trade_type, trade.order_type, trade.price, trade.amount, trade.trade_fee, age,
+                trade.order_id, trade.exchange_trade_id]
+
+    @staticmethod
+    def _append_csv_rows(csv_path: str, rows: List[List[Any]]):
         if not os.path.exists(csv_path):
-            df_header = pd.DataFrame([["Config File", "Strategy", "Exchange", "Timestamp", "Market", "Base", "Quote",
-                                       "Trade", "Type", "Price", "Amount", "Fee", "Age", "Order ID", "Exchange Trade ID"]])
+            df_header = pd.DataFrame([CSV_HEADER])
             df_header.to_csv(csv_path, mode='a', header=False, index=False)
-        df = pd.DataFrame([[trade.config_file_path, trade.strategy, trade.market, trade.timestamp, trade.symbol, trade.base_asset, trade.quote_asset,
-                            trade.trade_type, trade.order_type, trade.price, trade.amount, trade.trade_fee, age, trade.order_id, trade.exchange_trade_id]])
+        df = pd.DataFrame(rows)
         df.to_csv(csv_path, mode='a', header=False, index=False)
 
+    def append_to_csv(self, trade: TradeFill):
+        self._append_csv_rows(self._csv_path(trade), [self._csv_row(trade)])
+
     def _update_order_status(self,
                              event_tag: int,
                              market: MarketBase,
@@ -265,23 +486,21 @@ class MarketsRecorder:
             self._ev_loop.call_soon_threadsafe(self._update_order_status, event_tag, market, evt)
             return
 
-        session: Session = self.session
         timestamp: int = self.db_timestamp
         event_type: MarketEvent = self.market_event_tag_map[event_tag]
         order_id: str = evt.order_id
-        order_record: Optional[Order] = session.query(Order).filter(Order.id == order_id).one_or_none()
-
-        if order_record is not None:
-            order_record.last_status = event_type.name
-            order_record.last_update_timestamp = timestamp
-            order_status: OrderStatus = OrderStatus(order_id=order_id,
-                                                    timestamp=timestamp,
-                                                    status=event_type.name)
-            session.add(order_status)
-            self.save_market_states(self._config_file_path, market, no_commit=True)
-            session.commit()
-        else:
-            session.rollback()
+
+        def write(session: Session):
+            order_record: Optional[Order] = session.query(Order).filter(Order.id == order_id).one_or_none()
+            if order_record is not None:
+                order_record.last_status = event_type.name
+                order_record.last_update_timestamp = timestamp
+                order_status: OrderStatus = OrderStatus(order_id=order_id,
+                                                        timestamp=timestamp,
+                                                        status=event_type.name)
+                session.add(order_status)
+
+        self._enqueue_write(write, market)
 
     def _did_cancel_order(self,
                           event_tag: int,
@@ -32,6 +32,11 @@ cdef class PaperTradeMarket(MarketBase):
         dict _trading_pairs
         object _config
         object _queued_orders
+        bint _has_new_limit_orders
+        object _maker_fee
+        dict _queue_positions
+        dict _bid_queue_levels
+        dict _ask_queue_levels
         dict _quantization_params
         object _order_book_trade_listener
         object _market_order_filled_listener
@@ -53,19 +58,27 @@ cdef class PaperTradeMarket(MarketBase):
                               LimitOrders *limit_orders_map_ptr,
                               LimitOrdersIterator *map_it_ptr,
                               const SingleTradingPairLimitOrdersIterator orders_it)
+    cdef object c_get_maker_fee(self)
+    cdef c_add_queue_position(self, str order_id, str trading_pair, bint is_buy, object price, object quantity)
+    cdef c_remove_queue_position(self, str order_id)
+    cdef c_update_queue_positions(self, str trading_pair)
+    cdef dict c_match_trade_to_queue_level(self, str trading_pair, bint is_buy, double price, double amount)
     cdef c_process_limit_order(self,
                                bint is_buy,
                                LimitOrders *limit_orders_map_ptr,
                                LimitOrdersIterator *map_it_ptr,
-                               SingleTradingPairLimitOrdersIterator orders_it)
+                               SingleTradingPairLimitOrdersIterator orders_it,
+                               object fill_amount=*)
     cdef c_process_limit_bid_order(self,
                                    LimitOrders *limit_orders_map_ptr,
                                    LimitOrdersIterator *map_it_ptr,
-                                   SingleTradingPairLimitOrdersIterator orders_it)
+                                   SingleTradingPairLimitOrdersIterator orders_it,
+                                   object fill_amount=*)
     cdef c_process_limit_ask_order(self,
                                    LimitOrders *limit_orders_map_ptr,
                                    LimitOrdersIterator *map_it_ptr,
-                                   SingleTradingPairLimitOrdersIterator orders_it)
+                                   SingleTradingPairLimitOrdersIterator orders_it,
+                                   object fill_amount=*)
     cdef c_process_crossed_limit_orders_for_trading_pair(self,
                                                          bint is_buy,
                                                          LimitOrders *limit_orders_map_ptr,
@@ -9,6 +9,7 @@ from cpython cimport PyObject
 from decimal import Decimal
 from functools import partial
 import hummingbot
+from libc.math cimport INFINITY
 from libcpp cimport bool as cppbool
 from libcpp.vector cimport vector
 import logging
@@ -138,6 +139,85 @@ cdef class QueuedOrder:
                 f"{self.amount})")
 
 
+cdef class LimitOrderQueuePosition:
+    """
+    Queue position of a simulated limit order at its price level - the order book volume ahead of it, and how much of
+    it has been filled.
+
+    The volume ahead starts as the whole price level when the order is placed. It goes down to the smallest amount the
+    level goes down to with the order book diffs - orders at the level are assumed to be cancelled from ahead of the
+    order, and orders added to it are behind - and with the trades at the price of the order, whose volume fills the
+    order once all of the volume ahead is consumed.
+
+    A trade usually shows up as a level decrease in the diffs as well, and the diff may arrive before the trade. The
+    part of a level decrease taken off the volume ahead is kept as unmatched decrease for QUEUE_MATCH_WINDOW seconds,
+    and trades at the level within that time are matched against it first, so the same volume is not counted twice.
+    """
+    cdef:
+        str _order_id
+        str _trading_pair
+        bint _is_buy
+        double _price
+        object _quantity
+        object _filled_amount
+        double queue_ahead
+        double unmatched_decrease
+        double unmatched_decrease_timestamp
+
+    def __init__(self, order_id: str, trading_pair: str, is_buy: bool, price: float, quantity: Decimal,
+                 queue_ahead: float):
+        self._order_id = order_id
+        self._trading_pair = trading_pair
+        self._is_buy = is_buy
+        self._price = price
+        self._quantity = quantity
+        self._filled_amount = s_decimal_0
+        self.queue_ahead = queue_ahead
+        self.unmatched_decrease = 0
+        self.unmatched_decrease_timestamp = 0
+
+    @property
+    def order_id(self) -> str:
+        return self._order_id
+
+    @property
+    def trading_pair(self) -> str:
+        return self._trading_pair
+
+    @property
+    def is_buy(self) -> bint:
+        return self._is_buy
+
+    @property
+    def price(self) -> double:
+        return self._price
+
+    @property
+    def quantity(self) -> Decimal:
+        return self._quantity
+
+    @property
+    def filled_amount(self) -> Decimal:
+        return self._filled_amount
+
+    @property
+    def remaining_amount(self) -> Decimal:
+        return self._quantity - self._filled_amount
+
+    @property
+    def volume_ahead(self) -> double:
+        return self.queue_ahead
+
+    cdef double c_get_unmatched_decrease(self, double timestamp, double window):
+        if timestamp - self.unmatched_decrease_timestamp > window:
+            return 0
+        return self.unmatched_decrease
+
+    def __repr__(self) -> str:
+        return (f"LimitOrderQueuePosition('{self.order_id}', '{self.trading_pair}', {self.is_buy}, {self.price}, "
+                f"{self.quantity}, filled={self.filled_amount}, ahead={self.volume_ahead})")
+
+
 cdef class OrderBookTradeListener(EventListener):
     cdef:
         MarketBase _market
@@ -162,7 +242,7 @@ cdef class OrderBookMarketOrderFillListener(EventListener):
 
     cdef c_call(self, object event_object):
 
-        if event_object.trading_pair not in self._market.order_books or event_object.order_type != OrderType.MARKET:
+        if event_object.order_type is not OrderType.MARKET or event_object.trading_pair not in self._market.order_books:
             return
         order_book = self._market.order_books[event_object.trading_pair]
         order_book.record_filled_order(event_object)
@@ -170,6 +250,7 @@ cdef class OrderBookMarketOrderFillListener(EventListener):
 
 cdef class PaperTradeMarket(MarketBase):
     TRADE_EXECUTION_DELAY = 5.0
+    QUEUE_MATCH_WINDOW = 1.0
     ORDER_FILLED_EVENT_TAG = MarketEvent.OrderFilled.value
     SELL_ORDER_COMPLETED_EVENT_TAG = MarketEvent.SellOrderCompleted.value
     BUY_ORDER_COMPLETED_EVENT_TAG = MarketEvent.BuyOrderCompleted.value
@@ -188,6 +269,11 @@ cdef class PaperTradeMarket(MarketBase):
         self._trading_pairs = {}
         self._config = config
         self._queued_orders = deque()
+        self._has_new_limit_orders = False
+        self._maker_fee = None
+        self._queue_positions = {}
+        self._bid_queue_levels = {}
+        self._ask_queue_levels = {}
         self._quantization_params = {}
         self._order_book_tracker = order_book_tracker
         self._order_book_trade_listener = OrderBookTradeListener(self)
@@ -281,14 +367,21 @@ cdef class PaperTradeMarket(MarketBase):
 
         return retval
 
+    @property
+    def queue_positions(self) -> Dict[str, LimitOrderQueuePosition]:
+        return self._queue_positions
+
     @property
     def on_hold_balances(self) -> Dict[str, Decimal]:
+        cdef:
+            LimitOrderQueuePosition position
         _on_hold_balances = defaultdict(Decimal)
         for limit_order in self.limit_orders:
+            position = self._queue_positions[limit_order.client_order_id]
             if limit_order.is_buy:
-                _on_hold_balances[limit_order.quote_currency] += limit_order.quantity * limit_order.price
+                _on_hold_balances[limit_order.quote_currency] += position.remaining_amount * limit_order.price
             else:
-                _on_hold_balances[limit_order.base_currency] += limit_order.quantity
+                _on_hold_balances[limit_order.base_currency] += position.remaining_amount
         return _on_hold_balances
 
     @property
@@ -324,8 +417,25 @@ cdef class PaperTradeMarket(MarketBase):
 
     cdef c_tick(self, double timestamp):
         MarketBase.c_tick(self, timestamp)
+        # The maker fee estimate is looked up again on the first fill of each tick.
+        self._maker_fee = None
         self.c_process_market_orders()
+        for trading_pair in self._bid_queue_levels.keys() | self._ask_queue_levels.keys():
+            self.c_update_queue_positions(trading_pair)
         self.c_process_crossed_limit_orders()
+        self._has_new_limit_orders = False
+
+    cdef double c_get_next_wakeup_time(self):
+        cdef:
+            QueuedOrder front_order
+        # New limit orders may cross the order book right away. Otherwise, limit orders are only filled by order book
+        # changes, which happen in the ticks of the data iterators.
+        if self._has_new_limit_orders:
+            return self._current_timestamp
+        if len(self._queued_orders) > 0:
+            front_order = self._queued_orders[0]
+            return front_order.create_timestamp + self.TRADE_EXECUTION_DELAY
+        return INFINITY
 
     cdef str c_buy(self,
                    str trading_pair_str,
@@ -356,6 +466,7 @@ cdef class PaperTradeMarket(MarketBase):
                                                    quantized_amount))
         elif order_type is OrderType.LIMIT:
 
+            self._has_new_limit_orders = True
             map_it = self._bid_limit_orders.find(cpp_trading_pair_str)
 
             if map_it == self._bid_limit_orders.end():
@@ -372,6 +483,7 @@ cdef class PaperTradeMarket(MarketBase):
                 <PyObject *> quantized_price,
                 <PyObject *> quantized_amount
             ))
+            self.c_add_queue_position(order_id, trading_pair_str, True, quantized_price, quantized_amount)
         self.c_trigger_event(self.MARKET_BUY_ORDER_CREATED_EVENT_TAG,
                              BuyOrderCreatedEvent(
                                  self._current_timestamp,
@@ -411,6 +523,7 @@ cdef class PaperTradeMarket(MarketBase):
             self._queued_orders.append(QueuedOrder(self._current_timestamp, order_id, False, trading_pair_str,
                                                    quantized_amount))
         elif order_type is OrderType.LIMIT:
+            self._has_new_limit_orders = True
             map_it = self._ask_limit_orders.find(cpp_trading_pair_str)
 
             if map_it == self._ask_limit_orders.end():
@@ -427,6 +540,7 @@ cdef class PaperTradeMarket(MarketBase):
                 <PyObject *> quantized_price,
                 <PyObject *> quantized_amount
             ))
+            self.c_add_queue_position(order_id, trading_pair_str, False, quantized_price, quantized_amount)
         self.c_trigger_event(self.MARKET_SELL_ORDER_CREATED_EVENT_TAG,
                              SellOrderCreatedEvent(
                                  self._current_timestamp,
@@ -574,6 +688,7 @@ cdef class PaperTradeMarket(MarketBase):
         cdef:
             SingleTradingPairLimitOrders *orders_collection_ptr = address(deref(deref(map_it_ptr)).second)
         try:
+            self.c_remove_queue_position(deref(orders_it).getClientOrderID().decode("utf8"))
             orders_collection_ptr.erase(orders_it)
             if orders_collection_ptr.empty():
                 map_it_ptr[0] = limit_orders_map_ptr.erase(deref(map_it_ptr))
@@ -582,22 +697,124 @@ cdef class PaperTradeMarket(MarketBase):
             self.logger().error("Error deleting limit order.", exc_info=True)
             return False
 
+    cdef object c_get_maker_fee(self):
+        if self._maker_fee is None:
+            self._maker_fee = estimate_fee(self.name, True)
+        return self._maker_fee
+
+    cdef c_add_queue_position(self, str order_id, str trading_pair, bint is_buy, object price, object quantity):
+        cdef:
+            CompositeOrderBook order_book = <CompositeOrderBook>self.c_get_order_book(trading_pair)
+            dict queue_levels = self._bid_queue_levels if is_buy else self._ask_queue_levels
+            double level_price = float(price)
+            LimitOrderQueuePosition position
+
+        # Earlier level updates must not count against the new order.
+        self.c_update_queue_positions(trading_pair)
+        position = LimitOrderQueuePosition(order_id, trading_pair, is_buy, level_price, quantity,
+                                           order_book.c_get_level_amount(is_buy, level_price))
+        self._queue_positions[order_id] = position
+        queue_levels.setdefault(trading_pair, {}).setdefault(level_price, []).append(position)
+        order_book.c_watch_level(is_buy, level_price)
+
+    cdef c_remove_queue_position(self, str order_id):
+        cdef:
+            LimitOrderQueuePosition position = self._queue_positions.pop(order_id, None)
+            dict queue_levels
+            dict trading_pair_levels
+            list level_positions
+
+        if position is None:
+            return
+        queue_levels = self._bid_queue_levels if position._is_buy else self._ask_queue_levels
+        trading_pair_levels = queue_levels[position._trading_pair]
+        level_positions = trading_pair_levels[position._price]
+        level_positions.remove(position)
+        if len(level_positions) == 0:
+            del trading_pair_levels[position._price]
+            (<CompositeOrderBook>self.c_get_order_book(position._trading_pair)).c_unwatch_level(position._is_buy,
+                                                                                                position._price)
+            if len(trading_pair_levels) == 0:
+                del queue_levels[position._trading_pair]
+
+    cdef c_update_queue_positions(self, str trading_pair):
+        """
+        Brings the volume ahead of the limit orders on a trading pair down to the smallest amount their price levels went
+        down to, with the order book updates since the last call. The decreases are kept as unmatched decrease, for the
+        trades that caused them to be matched against.
+        """
+        cdef:
+            CompositeOrderBook order_book = <CompositeOrderBook>self.c_get_order_book(trading_pair)
+            LimitOrderQueuePosition position
+            double decrease
+
+        for is_buy, queue_levels in ((True, self._bid_queue_levels), (False, self._ask_queue_levels)):
+            trading_pair_levels = queue_levels.get(trading_pair)
+            if trading_pair_levels is None:
+                continue
+            for level_price, level_minimum in order_book.c_pop_level_minimums(is_buy).items():
+                for position in trading_pair_levels.get(level_price, ()):
+                    if level_minimum < position.queue_ahead:
+                        decrease = position.queue_ahead - level_minimum
+                        position.queue_ahead = level_minimum
+                        position.unmatched_decrease = (position.c_get_unmatched_decrease(self._current_timestamp,
+                                                                                         self.QUEUE_MATCH_WINDOW)
+                                                       + decrease)
+                        position.unmatched_decrease_timestamp = self._current_timestamp
+
+    cdef dict c_match_trade_to_queue_level(self, str trading_pair, bint is_buy, double price, double amount):
+        """
+        Consumes the volume ahead of the limit orders at the price of a trade with the trade amount, in the order the
+        limit orders were placed, and returns the amounts filled by what is left of it - by client order ID. The part of
+        the trade amount already taken off the volume ahead by the diffs - the unmatched decrease - is not consumed
+        again.
+        """
+        cdef:
+            dict queue_levels = self._bid_queue_levels if is_buy else self._ask_queue_levels
+            list level_positions = queue_levels.get(trading_pair, {}).get(price, [])
+            dict fill_amounts = {}
+            double filled_volume = 0
+            double volume_past
+            double matched_decrease
+            double trade_amount
+            LimitOrderQueuePosition position
+
+        for position in level_positions:
+            matched_decrease = min(amount, position.c_get_unmatched_decrease(self._current_timestamp,
+                                                                             self.QUEUE_MATCH_WINDOW))
+            position.unmatched_decrease -= matched_decrease
+            trade_amount = amount - matched_decrease
+            # Volume past the order, after the volume ahead of it and the fills of the orders placed before it.
+            volume_past = trade_amount - position.queue_ahead - filled_volume
+            position.queue_ahead = max(0.0, position.queue_ahead - trade_amount)
+            if volume_past <= 0:
+                continue
+            fill_amount = min(self.c_quantize_order_amount(trading_pair, volume_past), position.remaining_amount)
+            if fill_amount > s_decimal_0:
+                fill_amounts[position._order_id] = fill_amount
+                filled_volume += float(fill_amount)
+        return fill_amounts
+
     cdef c_process_limit_bid_order(self,
                                    LimitOrders *limit_orders_map_ptr,
                                    LimitOrdersIterator *map_it_ptr,
-                                   SingleTradingPairLimitOrdersIterator orders_it):
+                                   SingleTradingPairLimitOrdersIterator orders_it,
+                                   object fill_amount=None):
         cdef:
             const CPPLimitOrder *cpp_limit_order_ptr = address(deref(orders_it))
             str trading_pair = cpp_limit_order_ptr.getTradingPair().decode("utf8")
             str quote_asset = cpp_limit_order_ptr.getQuoteCurrency().decode("utf8")
             str base_asset = cpp_limit_order_ptr.getBaseCurrency().decode("utf8")
             str order_id = cpp_limit_order_ptr.getClientOrderID().decode("utf8")
+            LimitOrderQueuePosition position = self._queue_positions[order_id]
             object quote_asset_balance = self.c_get_balance(quote_asset)
-            object quote_asset_traded = <object> cpp_limit_order_ptr.getPrice() * \
-                                        <object> cpp_limit_order_ptr.getQuantity()
-            object base_asset_traded = <object> cpp_limit_order_ptr.getQuantity()
+            object remaining_amount = position.remaining_amount
+            object base_asset_traded = (remaining_amount
+                                        if fill_amount is None or fill_amount > remaining_amount
+                                        else fill_amount)
+            object quote_asset_traded = <object> cpp_limit_order_ptr.getPrice() * base_asset_traded
 
-        # Check if there's enough balance to satisfy the order. If not, remove the limit order without doing anything.
+        # Check if there's enough balance to satisfy the fill. If not, remove the limit order without doing anything.
         if quote_asset_balance < quote_asset_traded:
             self.logger().warning(f"Not enough {quote_asset} balance to fill limit buy order on {trading_pair}. "
                                   f"{quote_asset_traded:.8g} {quote_asset} needed vs. "
@@ -611,7 +828,7 @@ cdef class PaperTradeMarket(MarketBase):
         self.c_set_balance(base_asset, self.c_get_balance(base_asset) + base_asset_traded)
 
         # add fee
-        fees = estimate_fee(self.name, True)
+        fees = self.c_get_maker_fee()
 
         # Emit the trade and order completed events.
         config = self._config
@@ -624,10 +841,15 @@ cdef class PaperTradeMarket(MarketBase):
                 TradeType.BUY,
                 OrderType.LIMIT,
                 <object> cpp_limit_order_ptr.getPrice(),
-                <object> cpp_limit_order_ptr.getQuantity(),
+                base_asset_traded,
                 fees
             ))
 
+        # The order stays on the book until it is completely filled.
+        position._filled_amount += base_asset_traded
+        if base_asset_traded < remaining_amount:
+            return
+
         self.c_trigger_event(
             self.BUY_ORDER_COMPLETED_EVENT_TAG,
             BuyOrderCompletedEvent(
@@ -636,8 +858,8 @@ cdef class PaperTradeMarket(MarketBase):
                 base_asset,
                 quote_asset,
                 base_asset if config.buy_fees_asset is AssetType.BASE_CURRENCY else quote_asset,
-                base_asset_traded,
-                quote_asset_traded,
+                <object> cpp_limit_order_ptr.getQuantity(),
+                <object> cpp_limit_order_ptr.getPrice() * <object> cpp_limit_order_ptr.getQuantity(),
                 s_decimal_0,
                 OrderType.LIMIT
             ))
@@ -646,19 +868,23 @@ cdef class PaperTradeMarket(MarketBase):
     cdef c_process_limit_ask_order(self,
                                    LimitOrders *limit_orders_map_ptr,
                                    LimitOrdersIterator *map_it_ptr,
-                                   SingleTradingPairLimitOrdersIterator orders_it):
+                                   SingleTradingPairLimitOrdersIterator orders_it,
+                                   object fill_amount=None):
         cdef:
             const CPPLimitOrder *cpp_limit_order_ptr = address(deref(orders_it))
             str trading_pair_str = cpp_limit_order_ptr.getTradingPair().decode("utf8")
             str quote_asset = cpp_limit_order_ptr.getQuoteCurrency().decode("utf8")
             str base_asset = cpp_limit_order_ptr.getBaseCurrency().decode("utf8")
             str order_id = cpp_limit_order_ptr.getClientOrderID().decode("utf8")
+            LimitOrderQueuePosition position = self._queue_positions[order_id]
             object base_asset_balance = self.c_get_balance(base_asset)
-            object quote_asset_traded = <object> cpp_limit_order_ptr.getPrice() * \
-                                        <object> cpp_limit_order_ptr.getQuantity()
-            object base_asset_traded = <object> cpp_limit_order_ptr.getQuantity()
+            object remaining_amount = position.remaining_amount
+            object base_asset_traded = (remaining_amount
+                                        if fill_amount is None or fill_amount > remaining_amount
+                                        else fill_amount)
+            object quote_asset_traded = <object> cpp_limit_order_ptr.getPrice() * base_asset_traded
 
-        # Check if there's enough balance to satisfy the order. If not, remove the limit order without doing anything.
+        # Check if there's enough balance to satisfy the fill. If not, remove the limit order without doing anything.
         if base_asset_balance < base_asset_traded:
             self.logger().warning(f"Not enough {base_asset} balance to fill limit sell order on {trading_pair_str}. "
                                   f"{base_asset_traded:.8g} {base_asset} needed vs. "
@@ -671,7 +897,7 @@ cdef class PaperTradeMarket(MarketBase):
         self.c_set_balance(base_asset, self.c_get_balance(base_asset) - base_asset_traded)
 
         # add fee
-        fees = estimate_fee(self.name, True)
+        fees = self.c_get_maker_fee()
 
         # Emit the trade and order completed events.
         config = self._config
@@ -684,10 +910,15 @@ cdef class PaperTradeMarket(MarketBase):
                 TradeType.SELL,
                 OrderType.LIMIT,
                 <object> cpp_limit_order_ptr.getPrice(),
-                <object> cpp_limit_order_ptr.getQuantity(),
+                base_asset_traded,
                 fees
             ))
 
+        # The order stays on the book until it is completely filled.
+        position._filled_amount += base_asset_traded
+        if base_asset_traded < remaining_amount:
+            return
+
         self.c_trigger_event(
             self.SELL_ORDER_COMPLETED_EVENT_TAG,
             SellOrderCompletedEvent(
@@ -696,8 +927,8 @@ cdef class PaperTradeMarket(MarketBase):
                 base_asset,
                 quote_asset,
                 base_asset if config.sell_fees_asset is AssetType.BASE_CURRENCY else quote_asset,
-                base_asset_traded,
-                quote_asset_traded,
+                <object> cpp_limit_order_ptr.getQuantity(),
+                <object> cpp_limit_order_ptr.getPrice() * <object> cpp_limit_order_ptr.getQuantity(),
                 s_decimal_0,
                 OrderType.LIMIT
             ))
@@ -707,12 +938,16 @@ cdef class PaperTradeMarket(MarketBase):
                                bint is_buy,
                                LimitOrders *limit_orders_map_ptr,
                                LimitOrdersIterator *map_it_ptr,
-                               SingleTradingPairLimitOrdersIterator orders_it):
+                               SingleTradingPairLimitOrdersIterator orders_it,
+                               object fill_amount=None):
+        """
+        Fills a limit order by fill_amount, or by all of its remaining amount if fill_amount is None.
+        """
         try:
             if is_buy:
-                self.c_process_limit_bid_order(limit_orders_map_ptr, map_it_ptr, orders_it)
+                self.c_process_limit_bid_order(limit_orders_map_ptr, map_it_ptr, orders_it, fill_amount)
             else:
-                self.c_process_limit_ask_order(limit_orders_map_ptr, map_it_ptr, orders_it)
+                self.c_process_limit_ask_order(limit_orders_map_ptr, map_it_ptr, orders_it, fill_amount)
         except Exception as e:
             self.logger().error(f"Error processing limit order.", exc_info=True)
 
@@ -730,17 +965,24 @@ cdef class PaperTradeMarket(MarketBase):
         """
         cdef:
             str trading_pair = deref(deref(map_it_ptr)).first.decode("utf8")
-            object opposite_order_book_price = self.c_get_price(trading_pair, is_buy)
+            CompositeOrderBook order_book = <CompositeOrderBook>self.c_get_order_book(trading_pair)
+            double opposite_order_book_price
             SingleTradingPairLimitOrders *orders_collection_ptr = address(deref(deref(map_it_ptr)).second)
             SingleTradingPairLimitOrdersIterator orders_it = orders_collection_ptr.begin()
             SingleTradingPairLimitOrdersRIterator orders_rit = orders_collection_ptr.rbegin()
             vector[SingleTradingPairLimitOrdersIterator] process_order_its
             const CPPLimitOrder *cpp_limit_order_ptr = NULL
 
+        try:
+            opposite_order_book_price = order_book.c_get_price(is_buy)
+        except EnvironmentError:
+            return
+
+        # The scan only compares the double prices of the orders, and stops at the first order that isn't crossed.
         if is_buy:
             while orders_rit != orders_collection_ptr.rend():
                 cpp_limit_order_ptr = address(deref(orders_rit))
-                if opposite_order_book_price > <object>cpp_limit_order_ptr.getPrice():
+                if opposite_order_book_price > cpp_limit_order_ptr.getDoublePrice():
                     break
                 process_order_its.push_back(getIteratorFromReverseIterator(
                     <reverse_iterator[SingleTradingPairLimitOrdersIterator]>orders_rit))
@@ -748,7 +990,7 @@ cdef class PaperTradeMarket(MarketBase):
         else:
             while orders_it != orders_collection_ptr.end():
                 cpp_limit_order_ptr = address(deref(orders_it))
-                if opposite_order_book_price < <object>cpp_limit_order_ptr.getPrice():
+                if opposite_order_book_price < cpp_limit_order_ptr.getDoublePrice():
                     break
                 process_order_its.push_back(orders_it)
                 inc(orders_it)
@@ -777,15 +1019,18 @@ cdef class PaperTradeMarket(MarketBase):
     # <editor-fold desc="Event listener functions">
     cdef c_match_trade_to_limit_orders(self, object order_book_trade_event):
         """
-        Trigger limit orders when incoming market orders have crossed the limit order's price.
+        Trigger limit orders when incoming market orders have crossed the limit order's price. Limit orders priced past
+        the trade are filled entirely, and limit orders at the trade price are filled by the trade volume left past their
+        queue positions - see LimitOrderQueuePosition.
 
         :param order_book_trade_event: trade event from order book
         """
         cdef:
-            string cpp_trading_pair = order_book_trade_event.trading_pair.encode("utf8")
+            str trading_pair = order_book_trade_event.trading_pair
+            string cpp_trading_pair = trading_pair.encode("utf8")
             bint is_maker_buy = order_book_trade_event.type is TradeType.SELL
-            object trade_price = order_book_trade_event.price
-            object trade_quantity = order_book_trade_event.amount
+            double trade_price = order_book_trade_event.price
+            double order_price
             LimitOrders *limit_orders_map_ptr = (address(self._bid_limit_orders)
                                                  if is_maker_buy
                                                  else address(self._ask_limit_orders))
@@ -794,32 +1039,57 @@ cdef class PaperTradeMarket(MarketBase):
             SingleTradingPairLimitOrdersIterator orders_it
             SingleTradingPairLimitOrdersRIterator orders_rit
             vector[SingleTradingPairLimitOrdersIterator] process_order_its
+            list process_fill_amounts = []
+            dict level_fill_amounts
             const CPPLimitOrder *cpp_limit_order_ptr = NULL
+            str order_id
+            size_t i
 
         if map_it == limit_orders_map_ptr.end():
             return
 
+        self.c_update_queue_positions(trading_pair)
+        level_fill_amounts = self.c_match_trade_to_queue_level(trading_pair, is_maker_buy, trade_price,
+                                                               order_book_trade_event.amount)
         orders_collection_ptr = address(deref(map_it).second)
         if is_maker_buy:
             orders_rit = orders_collection_ptr.rbegin()
             while orders_rit != orders_collection_ptr.rend():
                 cpp_limit_order_ptr = address(deref(orders_rit))
-                if <object>cpp_limit_order_ptr.getPrice() <= trade_price:
+                order_price = cpp_limit_order_ptr.getDoublePrice()
+                if order_price < trade_price:
                     break
-                process_order_its.push_back(getIteratorFromReverseIterator(
-                    <reverse_iterator[SingleTradingPairLimitOrdersIterator]>orders_rit))
+                if order_price > trade_price:
+                    process_order_its.push_back(getIteratorFromReverseIterator(
+                        <reverse_iterator[SingleTradingPairLimitOrdersIterator]>orders_rit))
+                    process_fill_amounts.append(None)
+                else:
+                    order_id = cpp_limit_order_ptr.getClientOrderID().decode("utf8")
+                    if order_id in level_fill_amounts:
+                        process_order_its.push_back(getIteratorFromReverseIterator(
+                            <reverse_iterator[SingleTradingPairLimitOrdersIterator]>orders_rit))
+                        process_fill_amounts.append(level_fill_amounts[order_id])
                 inc(orders_rit)
         else:
             orders_it = orders_collection_ptr.begin()
             while orders_it != orders_collection_ptr.end():
                 cpp_limit_order_ptr = address(deref(orders_it))
-                if <object>cpp_limit_order_ptr.getPrice() >= trade_price:
+                order_price = cpp_limit_order_ptr.getDoublePrice()
+                if order_price > trade_price:
                     break
-                process_order_its.push_back(orders_it)
+                if order_price < trade_price:
+                    process_order_its.push_back(orders_it)
+                    process_fill_amounts.append(None)
+                else:
+                    order_id = cpp_limit_order_ptr.getClientOrderID().decode("utf8")
+                    if order_id in level_fill_amounts:
+                        process_order_its.push_back(orders_it)
+                        process_fill_amounts.append(level_fill_amounts[order_id])
                 inc(orders_it)
 
-        for orders_it in process_order_its:
-            self.c_process_limit_order(is_maker_buy, limit_orders_map_ptr, address(map_it), orders_it)
+        for i in range(process_order_its.size()):
+            self.c_process_limit_order(is_maker_buy, limit_orders_map_ptr, address(map_it), process_order_its[i],
+                                       process_fill_amounts[i])
 
     # </editor-fold>
 
@@ -1,5 +1,6 @@
 from libc.stdint cimport int64_t
 from hummingbot.market.market_base cimport MarketBase
+from hummingbot.core.data_type.expiry_scheduler cimport ExpiryScheduler
 from hummingbot.core.data_type.transaction_tracker cimport TransactionTracker
 
 
@@ -19,10 +20,11 @@ cdef class RadarRelayMarket(MarketBase):
         double _poll_interval
         dict _in_flight_limit_orders
         dict _in_flight_market_orders
-        object _order_expiry_queue
+        ExpiryScheduler _order_expiry_queue
         TransactionTracker _tx_tracker
         object _w3
         object _exchange
+        object _order_signer
         dict _withdraw_rules
         dict _trading_rules
         object _pending_approval_tx_hashes
@@ -1,7 +1,5 @@
-import aiohttp
 import asyncio
 from async_timeout import timeout
-from collections import deque
 import copy
 import logging
 import math
@@ -59,8 +57,10 @@ from hummingbot.market.trading_rule cimport TradingRule
 from hummingbot.wallet.ethereum.web3_wallet import Web3Wallet
 from hummingbot.wallet.ethereum.zero_ex.zero_ex_custom_utils_v3 import fix_signature
 from hummingbot.wallet.ethereum.zero_ex.zero_ex_exchange_v3 import ZeroExExchange
+from hummingbot.wallet.ethereum.zero_ex.zero_ex_order_signer import ZeroExOrderSigner
 from hummingbot.core.utils.tracking_nonce import get_tracking_nonce
 from hummingbot.core.utils.estimate_fee import estimate_fee
+from hummingbot.core.utils.http_session_registry import http_session
 
 rrm_logger = None
 s_decimal_0 = Decimal(0)
@@ -114,7 +114,8 @@ cdef class RadarRelayMarket(MarketBase):
                  OrderBookTrackerDataSourceType.EXCHANGE_API,
                  wallet_spender_address: str = ZERO_EX_MAINNET_ERC20_PROXY,
                  trading_pairs: Optional[List[str]] = None,
-                 trading_required: bool = True):
+                 trading_required: bool = True,
+                 verify_order_signatures: bool = True):
         super().__init__()
         self._trading_required = trading_required
         self._order_book_tracker = RadarRelayOrderBookTracker(trading_pairs=trading_pairs)
@@ -128,7 +129,7 @@ cdef class RadarRelayMarket(MarketBase):
         self._poll_interval = poll_interval
         self._in_flight_limit_orders = {}  # limit orders are off chain
         self._in_flight_market_orders = {}  # market orders are on chain
-        self._order_expiry_queue = deque()
+        self._order_expiry_queue = ExpiryScheduler()
         self._tx_tracker = RadarRelayTransactionTracker(self)
         self._w3 = Web3(Web3.HTTPProvider(ethereum_rpc_url))
         self._provider = Web3.HTTPProvider(ethereum_rpc_url)
@@ -139,6 +140,8 @@ cdef class RadarRelayMarket(MarketBase):
         self._wallet = wallet
         self._wallet_spender_address = wallet_spender_address
         self._exchange = ZeroExExchange(self._w3, ZERO_EX_MAINNET_EXCHANGE_ADDRESS, wallet)
+        self._order_signer = ZeroExOrderSigner(wallet.private_key, ZERO_EX_MAINNET_EXCHANGE_ADDRESS, 1,
+                                               verify_provider=self._provider if verify_order_signatures else None)
         self._latest_salt = -1
 
     @property
@@ -190,13 +193,12 @@ cdef class RadarRelayMarket(MarketBase):
             RadarRelayInFlightOrder typed_in_flight_order
             str base_currency
             str quote_currency
-            set expiring_order_ids = set([order_id for _, order_id in self._order_expiry_queue])
 
         for in_flight_order in self._in_flight_limit_orders.values():
             typed_in_flight_order = in_flight_order
             if typed_in_flight_order.order_type is not OrderType.LIMIT:
                 continue
-            if typed_in_flight_order.client_order_id in expiring_order_ids:
+            if self._order_expiry_queue.c_contains(typed_in_flight_order.client_order_id):
                 continue
             retval.append(typed_in_flight_order.to_limit_order())
         return retval
@@ -599,7 +601,7 @@ cdef class RadarRelayMarket(MarketBase):
                            data: Optional[Dict[str, Any]] = None,
                            headers: Optional[Dict[str, str]] = None,
                            json: int = 0) -> Dict[str, Any]:
-        async with aiohttp.ClientSession() as client:
+        async with http_session(url) as client:
             async with (
                     client.request(http_method,
                                    url=url,
@@ -717,9 +719,8 @@ cdef class RadarRelayMarket(MarketBase):
                                                                        price=f"{price:f}",
                                                                        expires=expires)
         unsigned_limit_order["makerAddress"] = self._wallet.address
-        order_hash_hex = self.get_order_hash_hex(unsigned_limit_order)
+        order_hash_hex, signature = await self._order_signer.sign_order(unsigned_limit_order)
         signed_limit_order = copy.deepcopy(unsigned_limit_order)
-        signature = self.get_zero_ex_signature(order_hash_hex)
         signed_limit_order["signature"] = signature
         await self._api_request(http_method="post", url=url, data=signed_limit_order, headers={"Content-Type": "application/json"}, json=1)
         self._latest_salt = int(unsigned_limit_order["salt"])
@@ -941,6 +942,7 @@ cdef class RadarRelayMarket(MarketBase):
 
     def _stop_network(self):
         self._order_book_tracker.stop()
+        self._order_signer.stop()
         if self._status_polling_task is not None:
             self._status_polling_task.cancel()
         if self._pending_approval_tx_hashes is not None:
@@ -1018,15 +1020,16 @@ cdef class RadarRelayMarket(MarketBase):
         )
 
     cdef c_expire_order(self, str order_id):
-        self._order_expiry_queue.append((self._current_timestamp + self.ORDER_EXPIRY_TIME, order_id))
+        # Orders are checked on every status update, keep the expiry time of the first check that expires them.
+        if not self._order_expiry_queue.c_contains(order_id):
+            self._order_expiry_queue.c_schedule(order_id, self._current_timestamp + self.ORDER_EXPIRY_TIME)
 
     cdef c_check_and_remove_expired_orders(self):
         cdef:
             double current_timestamp = self._current_timestamp
             str order_id
 
-        while len(self._order_expiry_queue) > 0 and self._order_expiry_queue[0][0] < current_timestamp:
-            _, order_id = self._order_expiry_queue.popleft()
+        for order_id in self._order_expiry_queue.c_pop_expired(current_timestamp):
             self.c_stop_tracking_order(order_id)
 
     cdef c_stop_tracking_order(self, str order_id):
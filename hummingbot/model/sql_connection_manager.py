@@ -32,10 +32,13 @@ class SQLSessionWrapper:
         return self._session
 
     def __exit__(self, exc_type, exc_val, exc_tb):
-        if exc_type is None:
-            self._session.commit()
-        else:
-            self._session.rollback()
+        try:
+            if exc_type is None:
+                self._session.commit()
+            else:
+                self._session.rollback()
+        finally:
+            self._session.close()
 
 
 class SQLConnectionType(Enum):
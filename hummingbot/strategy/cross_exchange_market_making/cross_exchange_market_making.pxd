@@ -34,6 +34,7 @@ cdef class CrossExchangeMarketMakingStrategy(StrategyBase):
         object _taker_to_maker_base_conversion_rate
         object _taker_to_maker_quote_conversion_rate
         bint _hb_app_notification
+        bint _order_book_triggered_ticks
 
     cdef c_process_market_pair(self,
                                object market_pair,
@@ -76,7 +76,8 @@ cdef class CrossExchangeMarketMakingStrategy(StrategyBase):
                  status_report_interval: float = 900,
                  taker_to_maker_base_conversion_rate: Decimal = Decimal("1"),
                  taker_to_maker_quote_conversion_rate: Decimal = Decimal("1"),
-                 hb_app_notification: bool = False
+                 hb_app_notification: bool = False,
+                 order_book_triggered_ticks: bool = False
                  ):
         """
         Initializes a cross exchange market making strategy object.
@@ -98,6 +99,8 @@ cdef class CrossExchangeMarketMakingStrategy(StrategyBase):
         :param anti_hysteresis_duration: the minimum amount of time interval between adjusting limit order prices
         :param logging_options: bit field for what types of logging to enable in this strategy object
         :param status_report_interval: what is the time interval between outputting new network warnings
+        :param order_book_triggered_ticks: whether changes to the maker and taker order books tick the strategy as they
+                                           happen, on top of the clock's ticks
         """
         if len(market_pairs) < 0:
             raise ValueError(f"market_pairs must not be empty.")
@@ -136,6 +139,7 @@ cdef class CrossExchangeMarketMakingStrategy(StrategyBase):
         self._taker_to_maker_base_conversion_rate = taker_to_maker_base_conversion_rate
         self._taker_to_maker_quote_conversion_rate = taker_to_maker_quote_conversion_rate
         self._hb_app_notification = hb_app_notification
+        self._order_book_triggered_ticks = order_book_triggered_ticks
 
         cdef:
             list all_markets = list(self._maker_markets | self._taker_markets)
@@ -279,6 +283,15 @@ cdef class CrossExchangeMarketMakingStrategy(StrategyBase):
                     # Markets are ready, ok to proceed.
                     if self.OPTION_LOG_STATUS_REPORT:
                         self.logger().info(f"Markets are ready. Trading started.")
+                    if self._order_book_triggered_ticks:
+                        # React to the maker and taker order books as they change, rather than on the next clock tick.
+                        self.c_add_tick_trigger_order_books(
+                            [market_info.order_book
+                             for market_pair in self._market_pairs.values()
+                             for market_info in (market_pair.maker, market_pair.taker)],
+                            self.TRIGGERED_TICK_DEBOUNCE,
+                            self.TRIGGERED_TICK_MIN_INTERVAL
+                        )
 
             if should_report_warnings:
                 # Check if all markets are still connected or not. If not, log a warning.
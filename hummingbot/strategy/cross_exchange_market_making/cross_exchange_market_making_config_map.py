@@ -211,4 +211,13 @@ cross_exchange_market_making_config_map = {
         validator=lambda v: validate_decimal(v, Decimal(0), Decimal("100"), inclusive=False),
         type_str="decimal"
     ),
+    "order_book_triggered_ticks": ConfigVar(
+        key="order_book_triggered_ticks",
+        prompt="Do you want the strategy to react to order book changes as they happen, rather than once per "
+               "second? (Yes/No) >>> ",
+        default=False,
+        type_str="bool",
+        validator=validate_bool,
+        required_if=lambda: False,
+    ),
 }
@@ -30,6 +30,7 @@ def start(self):
     anti_hysteresis_duration = xemm_map.get("anti_hysteresis_duration").value
     taker_to_maker_base_conversion_rate = xemm_map.get("taker_to_maker_base_conversion_rate").value
     taker_to_maker_quote_conversion_rate = xemm_map.get("taker_to_maker_quote_conversion_rate").value
+    order_book_triggered_ticks = xemm_map.get("order_book_triggered_ticks").value
 
     # check if top depth tolerance is a list or if trade size override exists
     if isinstance(top_depth_tolerance, list) or "trade_size_override" in xemm_map:
@@ -86,4 +87,5 @@ def start(self):
         taker_to_maker_base_conversion_rate=taker_to_maker_base_conversion_rate,
         taker_to_maker_quote_conversion_rate=taker_to_maker_quote_conversion_rate,
         hb_app_notification=True,
+        order_book_triggered_ticks=order_book_triggered_ticks,
     )
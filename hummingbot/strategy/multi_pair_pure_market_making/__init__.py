@@ -0,0 +1,8 @@
+#!/usr/bin/env python
+
+from .multi_pair_pure_market_making import MultiPairPureMarketMakingStrategy
+from .data_types import PairConfig
+__all__ = [
+    MultiPairPureMarketMakingStrategy,
+    PairConfig
+]
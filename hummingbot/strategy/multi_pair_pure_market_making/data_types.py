@@ -0,0 +1,45 @@
+#!/usr/bin/env python
+from decimal import Decimal
+from typing import (
+    Any,
+    Dict,
+    NamedTuple
+)
+
+
+class PairConfig(NamedTuple):
+    """
+    Market making parameters of a trading pair. The spreads and percentages are fractions, e.g. 0.01 for 1%.
+    """
+    bid_spread: Decimal
+    ask_spread: Decimal
+    order_amount: Decimal
+    order_levels: int = 1
+    order_level_spread: Decimal = Decimal(0)
+    order_level_amount: Decimal = Decimal(0)
+    order_refresh_time: float = 30.0
+    order_refresh_tolerance_pct: Decimal = Decimal(-1)
+    filled_order_delay: float = 60.0
+    minimum_spread: Decimal = Decimal(-1)
+    inventory_skew_enabled: bool = False
+    inventory_target_base_pct: Decimal = Decimal(0)
+    inventory_range_multiplier: Decimal = Decimal(0)
+    price_ceiling: Decimal = Decimal(-1)
+    price_floor: Decimal = Decimal(-1)
+
+    def with_overrides(self, overrides: Dict[str, Any]) -> "PairConfig":
+        """
+        Replaces the parameters in the overrides, converted to the types of the defaults.
+        """
+        values: Dict[str, Any] = {}
+        for key, value in overrides.items():
+            if key not in self._fields:
+                raise ValueError(f"{key} is not a market making parameter.")
+            default_value: Any = getattr(self, key)
+            if isinstance(default_value, Decimal):
+                values[key] = Decimal(str(value))
+            elif isinstance(default_value, bool):
+                values[key] = value if isinstance(value, bool) else str(value).lower() in ("true", "yes", "y")
+            else:
+                values[key] = type(default_value)(value)
+        return self._replace(**values)
@@ -0,0 +1,41 @@
+# distutils: language=c++
+
+from libc.stdint cimport int64_t
+from hummingbot.market.market_base cimport MarketBase
+from hummingbot.strategy.strategy_base cimport StrategyBase
+
+
+cdef class MultiPairPureMarketMakingStrategy(StrategyBase):
+    cdef:
+        list _market_infos
+        dict _market_info_indices
+        list _pair_configs
+        dict _pair_config_arrays
+        int _max_order_levels
+        list _limit_order_types
+        object _create_timestamps
+        object _cancel_timestamps
+        bint _hb_app_notification
+        bint _order_book_triggered_ticks
+
+        bint _all_markets_ready
+        double _last_timestamp
+        double _status_report_interval
+        int64_t _logging_options
+
+    cdef double c_get_next_wakeup_time(self)
+    cdef dict c_create_proposals(self, object pair_indices, dict market_info_to_active_orders)
+    cdef tuple c_get_inventory_skew_ratios(self, object pair_indices, object mid_prices,
+                                           dict market_info_to_active_orders)
+    cdef tuple c_get_adjusted_available_balance(self, object market_info, list orders)
+    cdef c_apply_budget_constraint(self, dict proposals, dict market_info_to_active_orders, set cancel_pair_indices)
+    cdef c_filter_out_takers(self, dict proposals)
+    cdef bint c_is_within_tolerance(self, list current_prices, list proposal_prices, object tolerance_pct)
+    cdef bint c_expires_orders(self, MarketBase market)
+    cdef tuple c_get_refresh_pair_indices(self, dict proposals, dict market_info_to_active_orders)
+    cdef c_cancel_active_orders(self, list cancel_pair_indices, list kept_pair_indices,
+                                dict market_info_to_active_orders)
+    cdef c_cancel_orders_below_min_spread(self, dict market_info_to_active_orders)
+    cdef c_execute_orders_proposals(self, dict proposals, dict market_info_to_active_orders)
+    cdef c_did_complete_limit_order(self, object order_completed_event, bint is_buy)
+    cdef c_set_timers(self, int pair_index)
@@ -0,0 +1,676 @@
+from decimal import Decimal
+import logging
+import numpy as np
+import pandas as pd
+from typing import (
+    Dict,
+    List
+)
+
+from hummingbot.core.clock cimport Clock
+from hummingbot.core.event.events import TradeType
+from hummingbot.core.data_type.limit_order cimport LimitOrder
+from hummingbot.core.data_type.limit_order import LimitOrder
+from hummingbot.core.network_iterator import NetworkStatus
+from hummingbot.market.market_base cimport MarketBase
+from hummingbot.market.market_base import (
+    MarketBase,
+    OrderType,
+)
+from hummingbot.strategy.market_trading_pair_tuple import MarketTradingPairTuple
+from hummingbot.strategy.strategy_base import StrategyBase
+from hummingbot.strategy.pure_market_making.data_types import (
+    Proposal,
+    PriceSize
+)
+from hummingbot.strategy.pure_market_making.inventory_skew_calculator import (
+    calculate_bid_ask_ratios_from_base_asset_ratios
+)
+from hummingbot.strategy.pure_market_making.pure_market_making_order_tracker import PureMarketMakingOrderTracker
+from hummingbot.client.config.global_config_map import global_config_map
+
+from .data_types import PairConfig
+
+
+NaN = float("nan")
+s_decimal_zero = Decimal(0)
+s_logger = None
+
+
+cdef object float_to_decimal(double value):
+    # Drops the binary floating point noise of the array calculations, before the prices and sizes are quantized.
+    return Decimal(f"{value:.12g}")
+
+
+cdef class MultiPairPureMarketMakingStrategy(StrategyBase):
+    """
+    Pure market making on many trading pairs, with one strategy instance and the market connectors it shares between
+    them.
+
+    The proposals of all the trading pairs due for new orders are calculated together once per tick, with the price and
+    size levels of every pair as the rows of numpy arrays. Only the calculation is batched: cancels and new orders are
+    still sent one request per order, through c_cancel_order() and c_buy_with_specific_market() /
+    c_sell_with_specific_market(), since MarketBase and the market connectors have no batch order endpoint to use.
+    Each trading pair has its own PairConfig, and trading pairs listed first get their orders first when the pairs
+    compete for the balance of an asset.
+
+    Hanging orders, ping pong, order optimization, transaction costs and external price sources are only available in
+    the single pair PureMarketMakingStrategy.
+    """
+    OPTION_LOG_CREATE_ORDER = 1 << 3
+    OPTION_LOG_MAKER_ORDER_FILLED = 1 << 4
+    OPTION_LOG_STATUS_REPORT = 1 << 5
+    OPTION_LOG_ALL = 0x7fffffffffffffff
+
+    # These are exchanges where you're expected to expire orders instead of actively cancelling them.
+    RADAR_RELAY_TYPE_EXCHANGES = {"radar_relay", "bamboo_relay"}
+
+    @classmethod
+    def logger(cls):
+        global s_logger
+        if s_logger is None:
+            s_logger = logging.getLogger(__name__)
+        return s_logger
+
+    def __init__(self,
+                 market_infos: List[MarketTradingPairTuple],
+                 pair_configs: List[PairConfig],
+                 logging_options: int = OPTION_LOG_ALL,
+                 status_report_interval: float = 900,
+                 hb_app_notification: bool = False,
+                 order_book_triggered_ticks: bool = False,
+                 ):
+        if len(market_infos) != len(pair_configs):
+            raise ValueError("Every trading pair needs a pair config.")
+        if len(set(market_infos)) != len(market_infos):
+            raise ValueError("Trading pairs must not be repeated.")
+        for market_info, pair_config in zip(market_infos, pair_configs):
+            if pair_config.price_ceiling > 0 and pair_config.price_ceiling < pair_config.price_floor:
+                raise ValueError(f"Parameter price_ceiling of {market_info.trading_pair} cannot be lower than "
+                                 f"price_floor.")
+
+        super().__init__()
+        self._sb_order_tracker = PureMarketMakingOrderTracker()
+        self._market_infos = list(market_infos)
+        self._market_info_indices = {market_info: index for index, market_info in enumerate(self._market_infos)}
+        self._pair_configs = list(pair_configs)
+        self._pair_config_arrays = {
+            field: np.array([float(getattr(pair_config, field)) for pair_config in self._pair_configs],
+                            dtype=np.float64)
+            for field in PairConfig._fields
+        }
+        self._max_order_levels = max([pair_config.order_levels for pair_config in self._pair_configs] + [0])
+        self._limit_order_types = [market_info.market.get_maker_order_type() for market_info in self._market_infos]
+        self._create_timestamps = np.zeros(len(self._market_infos), dtype=np.float64)
+        self._cancel_timestamps = np.zeros(len(self._market_infos), dtype=np.float64)
+        self._hb_app_notification = hb_app_notification
+        self._order_book_triggered_ticks = order_book_triggered_ticks
+
+        self._all_markets_ready = False
+        self._logging_options = logging_options
+        self._last_timestamp = 0
+        self._status_report_interval = status_report_interval
+
+        self.c_add_markets(list(set(market_info.market for market_info in self._market_infos)))
+
+    @property
+    def market_infos(self) -> List[MarketTradingPairTuple]:
+        return self._market_infos
+
+    @property
+    def pair_configs(self) -> Dict[str, PairConfig]:
+        return {market_info.trading_pair: pair_config
+                for market_info, pair_config in zip(self._market_infos, self._pair_configs)}
+
+    @property
+    def market_info_to_active_orders(self) -> Dict[MarketTradingPairTuple, List[LimitOrder]]:
+        return self._sb_order_tracker.market_pair_to_active_orders
+
+    @property
+    def active_orders(self) -> List[LimitOrder]:
+        return [order for market_info, orders in self.market_info_to_active_orders.items()
+                if market_info in self._market_info_indices
+                for order in orders]
+
+    @property
+    def active_buys(self) -> List[LimitOrder]:
+        return [o for o in self.active_orders if o.is_buy]
+
+    @property
+    def active_sells(self) -> List[LimitOrder]:
+        return [o for o in self.active_orders if not o.is_buy]
+
+    @property
+    def logging_options(self) -> int:
+        return self._logging_options
+
+    @logging_options.setter
+    def logging_options(self, int64_t logging_options):
+        self._logging_options = logging_options
+
+    @property
+    def order_tracker(self):
+        return self._sb_order_tracker
+
+    def active_orders_summary_df(self) -> pd.DataFrame:
+        cdef:
+            dict market_info_to_active_orders = self.market_info_to_active_orders
+            list data = []
+        for index, market_info in enumerate(self._market_infos):
+            active_orders = market_info_to_active_orders.get(market_info, [])
+            mid_price = market_info.get_mid_price()
+            buy_prices = [order.price for order in active_orders if order.is_buy]
+            sell_prices = [order.price for order in active_orders if not order.is_buy]
+            data.append([
+                market_info.trading_pair,
+                float(mid_price),
+                len(buy_prices),
+                len(sell_prices),
+                f"{(mid_price - max(buy_prices)) / mid_price:.2%}" if buy_prices and mid_price > 0 else "",
+                f"{(min(sell_prices) - mid_price) / mid_price:.2%}" if sell_prices and mid_price > 0 else "",
+                max(0, int(self._cancel_timestamps[index] - self._current_timestamp)) if active_orders else "",
+            ])
+        return pd.DataFrame(data=data, columns=["Market", "Mid Price", "Buys", "Sells", "Best Bid Spread",
+                                                "Best Ask Spread", "Refresh (s)"])
+
+    def format_status(self) -> str:
+        cdef:
+            list lines = []
+            list warning_lines = []
+        warning_lines.extend(self.network_warning(self._market_infos))
+
+        markets_df = self.market_status_data_frame(self._market_infos)
+        lines.extend(["", "  Markets:"] + ["    " + line for line in markets_df.to_string(index=False).split("\n")])
+
+        assets_df = self.wallet_balance_data_frame(self._market_infos)
+        lines.extend(["", "  Assets:"] + ["    " + line for line in assets_df.to_string(index=False).split("\n")])
+
+        orders_df = self.active_orders_summary_df()
+        lines.extend(["", "  Orders:"] + ["    " + line for line in orders_df.to_string(index=False).split("\n")])
+
+        warning_lines.extend(self.balance_warning(self._market_infos))
+
+        if len(warning_lines) > 0:
+            lines.extend(["", "*** WARNINGS ***"] + warning_lines)
+
+        return "\n".join(lines)
+
+    # The following exposed Python functions are meant for unit tests
+    # ---------------------------------------------------------------
+    def create_proposals(self) -> Dict[str, Proposal]:
+        cdef:
+            dict market_info_to_active_orders = self.market_info_to_active_orders
+            dict proposals = self.c_create_proposals(np.arange(len(self._market_infos)), market_info_to_active_orders)
+            list cancel_pair_indices
+        cancel_pair_indices, _ = self.c_get_refresh_pair_indices(proposals, market_info_to_active_orders)
+        self.c_apply_budget_constraint(proposals, market_info_to_active_orders, set(cancel_pair_indices))
+        self.c_filter_out_takers(proposals)
+        return {self._market_infos[pair_index].trading_pair: proposal for pair_index, proposal in proposals.items()}
+
+    # ---------------------------------------------------------------
+
+    cdef c_start(self, Clock clock, double timestamp):
+        StrategyBase.c_start(self, clock, timestamp)
+        self._last_timestamp = timestamp
+
+    cdef c_tick(self, double timestamp):
+        StrategyBase.c_tick(self, timestamp)
+        cdef:
+            int64_t current_tick = <int64_t>(timestamp // self._status_report_interval)
+            int64_t last_tick = <int64_t>(self._last_timestamp // self._status_report_interval)
+            bint should_report_warnings = ((current_tick > last_tick) and
+                                           (self._logging_options & self.OPTION_LOG_STATUS_REPORT))
+            dict market_info_to_active_orders
+            dict proposals
+            list cancel_pair_indices
+            list kept_pair_indices
+        try:
+            if not self._all_markets_ready:
+                self._all_markets_ready = all([market.ready for market in self._sb_markets])
+                if not self._all_markets_ready:
+                    # Markets not ready yet. Don't do anything.
+                    if should_report_warnings:
+                        self.logger().warning(f"Markets are not ready. No market making trades are permitted.")
+                    return
+                if self._order_book_triggered_ticks:
+                    # React to the order books as they change, rather than on the next clock tick.
+                    self.c_add_tick_trigger_order_books([market_info.order_book for market_info in self._market_infos],
+                                                        self.TRIGGERED_TICK_DEBOUNCE,
+                                                        self.TRIGGERED_TICK_MIN_INTERVAL)
+
+            if should_report_warnings:
+                if not all([market.network_status is NetworkStatus.CONNECTED for market in self._sb_markets]):
+                    self.logger().warning(f"WARNING: Some markets are not connected or are down at the moment. Market "
+                                          f"making may be dangerous when markets or networks are unstable.")
+
+            market_info_to_active_orders = self._sb_order_tracker.market_pair_to_active_orders
+            proposals = self.c_create_proposals(np.flatnonzero(self._create_timestamps <= self._current_timestamp),
+                                                market_info_to_active_orders)
+            # Which active orders stay is decided before the budget constraint, which only counts the balances of the
+            # orders that are cancelled as available again.
+            cancel_pair_indices, kept_pair_indices = self.c_get_refresh_pair_indices(proposals,
+                                                                                     market_info_to_active_orders)
+            self.c_apply_budget_constraint(proposals, market_info_to_active_orders, set(cancel_pair_indices))
+            self.c_filter_out_takers(proposals)
+            self.c_cancel_active_orders(cancel_pair_indices, kept_pair_indices, market_info_to_active_orders)
+            self.c_cancel_orders_below_min_spread(market_info_to_active_orders)
+            self.c_execute_orders_proposals(proposals, market_info_to_active_orders)
+        finally:
+            self._last_timestamp = timestamp
+
+    cdef double c_get_next_wakeup_time(self):
+        cdef:
+            dict market_info_to_active_orders
+            list pair_indices_with_orders
+            double next_wakeup_time
+        if not self._all_markets_ready or len(self._market_infos) == 0:
+            return self._current_timestamp
+        next_wakeup_time = self._create_timestamps.min()
+        # Price driven cancellations happen on the order book changes, which come with the ticks of the data iterators.
+        market_info_to_active_orders = self._sb_order_tracker.market_pair_to_active_orders
+        pair_indices_with_orders = [self._market_info_indices[market_info]
+                                    for market_info, orders in market_info_to_active_orders.items()
+                                    if len(orders) > 0 and market_info in self._market_info_indices]
+        if len(pair_indices_with_orders) > 0:
+            next_wakeup_time = min(next_wakeup_time, self._cancel_timestamps[pair_indices_with_orders].min())
+        return next_wakeup_time
+
+    cdef dict c_create_proposals(self, object pair_indices, dict market_info_to_active_orders):
+        """
+        Calculates the order prices and sizes of the trading pairs in one pass, with a row per pair in the arrays and a
+        column per order level. Only the quantization to the trading rules is done order by order. The proposals are
+        not limited by the available balances yet - see c_apply_budget_constraint().
+
+        :param pair_indices: indices of the trading pairs to create the proposals of
+        :return: the proposals, by trading pair index
+        """
+        cdef:
+            dict proposals = {}
+            dict config
+            object mid_prices
+            object levels
+            object level_spreads
+            object buy_prices
+            object sell_prices
+            object sizes
+            object bid_ratios
+            object ask_ratios
+            object buy_sizes
+            object sell_sizes
+            object is_valid
+            object level_mask
+            object buy_mask
+            object sell_mask
+            object market_info
+            MarketBase market
+            str trading_pair
+            list buys
+            list sells
+            object price
+            object size
+
+        if len(pair_indices) == 0:
+            return proposals
+
+        config = {field: values[pair_indices] for field, values in self._pair_config_arrays.items()}
+        mid_prices = np.array([float(self._market_infos[pair_index].get_mid_price()) for pair_index in pair_indices],
+                              dtype=np.float64)
+        # NaN mid prices, of empty order books, don't get any orders.
+        is_valid = mid_prices > 0
+
+        levels = np.arange(self._max_order_levels, dtype=np.float64)
+        level_spreads = np.outer(config["order_level_spread"], levels)
+        buy_prices = mid_prices[:, None] * (1.0 - config["bid_spread"][:, None] - level_spreads)
+        sell_prices = mid_prices[:, None] * (1.0 + config["ask_spread"][:, None] + level_spreads)
+        sizes = config["order_amount"][:, None] + np.outer(config["order_level_amount"], levels)
+
+        bid_ratios, ask_ratios = self.c_get_inventory_skew_ratios(pair_indices, mid_prices,
+                                                                  market_info_to_active_orders)
+        buy_sizes = sizes * bid_ratios[:, None]
+        sell_sizes = sizes * ask_ratios[:, None]
+
+        # Price band: no buys above the ceiling, no sells below the floor.
+        level_mask = (levels[None, :] < config["order_levels"][:, None]) & is_valid[:, None]
+        buy_mask = (level_mask & (buy_prices > 0) & (buy_sizes > 0) &
+                    ~((config["price_ceiling"] > 0) & (mid_prices >= config["price_ceiling"]))[:, None])
+        sell_mask = (level_mask & (sell_sizes > 0) &
+                     ~((config["price_floor"] > 0) & (mid_prices <= config["price_floor"]))[:, None])
+
+        for row, pair_index in enumerate(pair_indices):
+            market_info = self._market_infos[pair_index]
+            market = market_info.market
+            trading_pair = market_info.trading_pair
+            buys = []
+            sells = []
+            for level in np.flatnonzero(buy_mask[row]):
+                price = market.c_quantize_order_price(trading_pair, float_to_decimal(buy_prices[row, level]))
+                size = market.c_quantize_order_amount(trading_pair, float_to_decimal(buy_sizes[row, level]))
+                if size > 0:
+                    buys.append(PriceSize(price, size))
+            for level in np.flatnonzero(sell_mask[row]):
+                price = market.c_quantize_order_price(trading_pair, float_to_decimal(sell_prices[row, level]))
+                size = market.c_quantize_order_amount(trading_pair, float_to_decimal(sell_sizes[row, level]), price)
+                if size > 0:
+                    sells.append(PriceSize(price, size))
+            proposals[pair_index] = Proposal(buys, sells)
+        return proposals
+
+    cdef tuple c_get_inventory_skew_ratios(self, object pair_indices, object mid_prices,
+                                           dict market_info_to_active_orders):
+        """
+        :return: the bid and ask size ratios of the trading pairs, which are 1 for the pairs without inventory skew
+        """
+        cdef:
+            object bid_ratios = np.ones(len(pair_indices), dtype=np.float64)
+            object ask_ratios = np.ones(len(pair_indices), dtype=np.float64)
+            object skewed_rows = np.flatnonzero(self._pair_config_arrays["inventory_skew_enabled"][pair_indices])
+            object skewed_pair_indices
+            object order_levels
+            object total_order_sizes
+            list base_balances = []
+            list quote_balances = []
+
+        if len(skewed_rows) == 0:
+            return bid_ratios, ask_ratios
+
+        skewed_pair_indices = pair_indices[skewed_rows]
+        for pair_index in skewed_pair_indices:
+            market_info = self._market_infos[pair_index]
+            base_balance, quote_balance = self.c_get_adjusted_available_balance(
+                market_info, market_info_to_active_orders.get(market_info, [])
+            )
+            base_balances.append(float(base_balance))
+            quote_balances.append(float(quote_balance))
+
+        # Same as calculate_total_order_size(), for all the skewed trading pairs.
+        order_levels = self._pair_config_arrays["order_levels"][skewed_pair_indices]
+        total_order_sizes = 2.0 * (order_levels * self._pair_config_arrays["order_amount"][skewed_pair_indices] +
+                                   order_levels * (order_levels - 1.0) / 2.0 *
+                                   self._pair_config_arrays["order_level_amount"][skewed_pair_indices])
+        bid_ratios[skewed_rows], ask_ratios[skewed_rows] = calculate_bid_ask_ratios_from_base_asset_ratios(
+            np.array(base_balances, dtype=np.float64),
+            np.array(quote_balances, dtype=np.float64),
+            mid_prices[skewed_rows],
+            self._pair_config_arrays["inventory_target_base_pct"][skewed_pair_indices],
+            total_order_sizes * self._pair_config_arrays["inventory_range_multiplier"][skewed_pair_indices]
+        )
+        return bid_ratios, ask_ratios
+
+    cdef tuple c_get_adjusted_available_balance(self, object market_info, list orders):
+        """
+        Calculates the available balance, plus the amount attributed to orders.
+        :return: (base amount, quote amount) in Decimal
+        """
+        cdef:
+            MarketBase market = market_info.market
+            object base_balance = market.c_get_available_balance(market_info.base_asset)
+            object quote_balance = market.c_get_available_balance(market_info.quote_asset)
+
+        for order in orders:
+            if order.is_buy:
+                quote_balance += order.quantity * order.price
+            else:
+                base_balance += order.quantity
+
+        return base_balance, quote_balance
+
+    cdef c_apply_budget_constraint(self, dict proposals, dict market_info_to_active_orders, set cancel_pair_indices):
+        """
+        Drops the orders that the available balances can't cover. The trading pairs share the balances of their
+        common assets, which go to the trading pairs in the order they are listed.
+
+        The balances of the active orders of the trading pairs in cancel_pair_indices count as available. The other
+        trading pairs with active orders keep them, and place no new orders - so their proposals are left out.
+        """
+        cdef:
+            dict budgets = {}
+            object market_info
+            MarketBase market
+            object quote_size
+            object base_size
+
+        for pair_index in proposals:
+            market_info = self._market_infos[pair_index]
+            market = market_info.market
+            for asset in (market_info.base_asset, market_info.quote_asset):
+                if (market, asset) not in budgets:
+                    budgets[(market, asset)] = market.c_get_available_balance(asset)
+            if pair_index not in cancel_pair_indices:
+                continue
+            # The orders of the proposal replace the active ones, so their balances can be used again.
+            for order in market_info_to_active_orders.get(market_info, []):
+                if order.is_buy:
+                    budgets[(market, market_info.quote_asset)] += order.quantity * order.price
+                else:
+                    budgets[(market, market_info.base_asset)] += order.quantity
+
+        for pair_index, proposal in proposals.items():
+            market_info = self._market_infos[pair_index]
+            market = market_info.market
+            if pair_index not in cancel_pair_indices and len(market_info_to_active_orders.get(market_info, [])) > 0:
+                continue
+            for buy in proposal.buys:
+                buy_fees = market.c_get_fee(market_info.base_asset, market_info.quote_asset, OrderType.LIMIT,
+                                            TradeType.BUY, buy.size, buy.price)
+                quote_size = buy.size * buy.price * (Decimal(1) + buy_fees.percent)
+                if budgets[(market, market_info.quote_asset)] < quote_size:
+                    self.logger().info(f"Insufficient balance: {market_info.trading_pair} buy order (price: "
+                                       f"{buy.price}, size: {buy.size}) is omitted, {market_info.quote_asset} "
+                                       f"available balance: {budgets[(market, market_info.quote_asset)]}.")
+                    buy.size = s_decimal_zero
+                else:
+                    budgets[(market, market_info.quote_asset)] -= quote_size
+            proposal.buys = [o for o in proposal.buys if o.size > 0]
+            for sell in proposal.sells:
+                base_size = sell.size
+                if budgets[(market, market_info.base_asset)] < base_size:
+                    self.logger().info(f"Insufficient balance: {market_info.trading_pair} sell order (price: "
+                                       f"{sell.price}, size: {sell.size}) is omitted, {market_info.base_asset} "
+                                       f"available balance: {budgets[(market, market_info.base_asset)]}.")
+                    sell.size = s_decimal_zero
+                else:
+                    budgets[(market, market_info.base_asset)] -= base_size
+            proposal.sells = [o for o in proposal.sells if o.size > 0]
+
+    cdef c_filter_out_takers(self, dict proposals):
+        cdef:
+            object market_info
+            MarketBase market
+        for pair_index, proposal in proposals.items():
+            market_info = self._market_infos[pair_index]
+            market = market_info.market
+            top_ask = market.c_get_price(market_info.trading_pair, True)
+            if not top_ask.is_nan():
+                proposal.buys = [buy for buy in proposal.buys if buy.price < top_ask]
+            top_bid = market.c_get_price(market_info.trading_pair, False)
+            if not top_bid.is_nan():
+                proposal.sells = [sell for sell in proposal.sells if sell.price > top_bid]
+
+    cdef c_did_fill_order(self, object order_filled_event):
+        cdef:
+            str order_id = order_filled_event.order_id
+            object market_info = self._sb_order_tracker.c_get_shadow_market_pair_from_order_id(order_id)
+
+        if market_info is not None and self._logging_options & self.OPTION_LOG_MAKER_ORDER_FILLED:
+            self.log_with_clock(
+                logging.INFO,
+                f"({market_info.trading_pair}) Maker {'buy' if order_filled_event.trade_type is TradeType.BUY else 'sell'} "
+                f"order of {order_filled_event.amount} {market_info.base_asset} filled."
+            )
+
+    cdef c_did_complete_buy_order(self, object order_completed_event):
+        self.c_did_complete_limit_order(order_completed_event, True)
+
+    cdef c_did_complete_sell_order(self, object order_completed_event):
+        self.c_did_complete_limit_order(order_completed_event, False)
+
+    cdef c_did_complete_limit_order(self, object order_completed_event, bint is_buy):
+        cdef:
+            str order_id = order_completed_event.order_id
+            object market_info = self._sb_order_tracker.c_get_market_pair_from_order_id(order_id)
+            LimitOrder limit_order_record
+            int pair_index
+            str side = "buy" if is_buy else "sell"
+
+        if market_info is None or market_info not in self._market_info_indices:
+            return
+        limit_order_record = self._sb_order_tracker.c_get_limit_order(market_info, order_id)
+        if limit_order_record is None:
+            return
+
+        # delay order creation of the trading pair by its filled_order_delay (in seconds)
+        pair_index = self._market_info_indices[market_info]
+        self._create_timestamps[pair_index] = (self._current_timestamp +
+                                               self._pair_config_arrays["filled_order_delay"][pair_index])
+        self._cancel_timestamps[pair_index] = min(self._cancel_timestamps[pair_index],
+                                                  self._create_timestamps[pair_index])
+
+        self.log_with_clock(
+            logging.INFO,
+            f"({market_info.trading_pair}) Maker {side} order {order_id} "
+            f"({limit_order_record.quantity} {limit_order_record.base_currency} @ "
+            f"{limit_order_record.price} {limit_order_record.quote_currency}) has been completely filled."
+        )
+        self.notify_hb_app(
+            f"Maker {side.upper()} order {limit_order_record.quantity} {limit_order_record.base_currency} @ "
+            f"{limit_order_record.price} {limit_order_record.quote_currency} is filled."
+        )
+
+    cdef bint c_is_within_tolerance(self, list current_prices, list proposal_prices, object tolerance_pct):
+        if len(current_prices) != len(proposal_prices):
+            return False
+        current_prices = sorted(current_prices)
+        proposal_prices = sorted(proposal_prices)
+        for current, proposal in zip(current_prices, proposal_prices):
+            # if spread diff is more than the tolerance or order quantities are different, return false.
+            if abs(proposal - current)/current > tolerance_pct:
+                return False
+        return True
+
+    cdef bint c_expires_orders(self, MarketBase market):
+        return market.name in self.RADAR_RELAY_TYPE_EXCHANGES
+
+    cdef tuple c_get_refresh_pair_indices(self, dict proposals, dict market_info_to_active_orders):
+        """
+        Splits the trading pairs with active orders due for a refresh into the ones whose active orders are to be
+        cancelled, and the ones whose proposals are within their order refresh tolerance - which keep their orders.
+
+        :return: (indices of the trading pairs to cancel the orders of, indices of the trading pairs within tolerance)
+        """
+        cdef:
+            bint active_cancels = global_config_map.get("0x_active_cancels").value
+            list cancel_pair_indices = []
+            list kept_pair_indices = []
+            object market_info
+            object pair_config
+            list active_orders
+            object proposal
+
+        for pair_index in np.flatnonzero(self._cancel_timestamps <= self._current_timestamp):
+            market_info = self._market_infos[pair_index]
+            if not active_cancels and self.c_expires_orders(market_info.market):
+                continue
+            active_orders = market_info_to_active_orders.get(market_info, [])
+            if len(active_orders) == 0:
+                continue
+            pair_config = self._pair_configs[pair_index]
+            proposal = proposals.get(pair_index)
+            if (proposal is not None and pair_config.order_refresh_tolerance_pct >= 0 and
+                    self.c_is_within_tolerance([Decimal(str(o.price)) for o in active_orders if o.is_buy],
+                                               [buy.price for buy in proposal.buys],
+                                               pair_config.order_refresh_tolerance_pct) and
+                    self.c_is_within_tolerance([Decimal(str(o.price)) for o in active_orders if not o.is_buy],
+                                               [sell.price for sell in proposal.sells],
+                                               pair_config.order_refresh_tolerance_pct)):
+                kept_pair_indices.append(pair_index)
+            else:
+                cancel_pair_indices.append(pair_index)
+        return cancel_pair_indices, kept_pair_indices
+
+    cdef c_cancel_active_orders(self, list cancel_pair_indices, list kept_pair_indices,
+                                dict market_info_to_active_orders):
+        """
+        Cancels the active orders of the trading pairs in cancel_pair_indices, and restarts the refresh timers of the
+        trading pairs in kept_pair_indices - see c_get_refresh_pair_indices().
+        """
+        cdef:
+            object market_info
+
+        for pair_index in kept_pair_indices:
+            market_info = self._market_infos[pair_index]
+            self.logger().info(f"({market_info.trading_pair}) Not cancelling active orders since difference "
+                               f"between new order prices and current order prices is within "
+                               f"{self._pair_configs[pair_index].order_refresh_tolerance_pct:.2%} "
+                               f"order_refresh_tolerance_pct")
+            self.c_set_timers(pair_index)
+
+        for pair_index in cancel_pair_indices:
+            market_info = self._market_infos[pair_index]
+            for order in market_info_to_active_orders.get(market_info, []):
+                self.c_cancel_order(market_info, order.client_order_id)
+
+    # Cancel active orders if spreads are below their trading pair's minimum_spread
+    cdef c_cancel_orders_below_min_spread(self, dict market_info_to_active_orders):
+        cdef:
+            list cancels = []
+            object minimum_spread
+            object mid_price
+
+        for market_info, active_orders in market_info_to_active_orders.items():
+            if market_info not in self._market_info_indices or len(active_orders) == 0:
+                continue
+            minimum_spread = self._pair_configs[self._market_info_indices[market_info]].minimum_spread
+            mid_price = market_info.get_mid_price()
+            for order in active_orders:
+                negation = -1 if order.is_buy else 1
+                if (negation * (order.price - mid_price) / mid_price) < minimum_spread:
+                    self.logger().info(f"({market_info.trading_pair}) Order is below minimum spread "
+                                       f"({minimum_spread}). Cancelling Order: "
+                                       f"({'Buy' if order.is_buy else 'Sell'}) ID - {order.client_order_id}")
+                    cancels.append((market_info, order.client_order_id))
+
+        for market_info, order_id in cancels:
+            self.c_cancel_order(market_info, order_id)
+
+    cdef c_execute_orders_proposals(self, dict proposals, dict market_info_to_active_orders):
+        cdef:
+            object market_info
+            double expiration_seconds
+            object order_type
+
+        for pair_index, proposal in proposals.items():
+            market_info = self._market_infos[pair_index]
+            if (self._create_timestamps[pair_index] >= self._current_timestamp or
+                    len(market_info_to_active_orders.get(market_info, [])) > 0 or
+                    len(proposal.buys) + len(proposal.sells) == 0):
+                continue
+            expiration_seconds = (self._pair_config_arrays["order_refresh_time"][pair_index]
+                                  if self.c_expires_orders(market_info.market)
+                                  else NaN)
+            order_type = self._limit_order_types[pair_index]
+
+            if self._logging_options & self.OPTION_LOG_CREATE_ORDER:
+                self.logger().info(
+                    f"({market_info.trading_pair}) Creating {len(proposal.buys)} bid orders and "
+                    f"{len(proposal.sells)} ask orders at (Size, Price): "
+                    f"{[f'{o.size.normalize()} {market_info.base_asset}, {o.price.normalize()} {market_info.quote_asset}' for o in proposal.buys + proposal.sells]}"
+                )
+            for buy in proposal.buys:
+                self.c_buy_with_specific_market(market_info, buy.size, order_type=order_type, price=buy.price,
+                                                expiration_seconds=expiration_seconds)
+            for sell in proposal.sells:
+                self.c_sell_with_specific_market(market_info, sell.size, order_type=order_type, price=sell.price,
+                                                 expiration_seconds=expiration_seconds)
+            self.c_set_timers(pair_index)
+
+    cdef c_set_timers(self, int pair_index):
+        cdef double next_cycle = self._current_timestamp + self._pair_config_arrays["order_refresh_time"][pair_index]
+        if self._create_timestamps[pair_index] <= self._current_timestamp:
+            self._create_timestamps[pair_index] = next_cycle
+        if self._cancel_timestamps[pair_index] <= self._current_timestamp:
+            self._cancel_timestamps[pair_index] = min(self._create_timestamps[pair_index], next_cycle)
+
+    def notify_hb_app(self, msg: str):
+        if self._hb_app_notification:
+            from hummingbot.client.hummingbot_application import HummingbotApplication
+            HummingbotApplication.main_application()._notify(msg)
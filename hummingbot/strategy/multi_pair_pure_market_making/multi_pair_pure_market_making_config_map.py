@@ -0,0 +1,193 @@
+from decimal import Decimal
+import json
+from typing import (
+    Any,
+    Dict,
+    List,
+    Optional
+)
+
+from hummingbot.client.config.config_var import ConfigVar
+from hummingbot.client.config.config_validators import (
+    validate_exchange,
+    validate_market_trading_pair,
+    validate_bool,
+    validate_decimal,
+    validate_int
+)
+from hummingbot.client.settings import (
+    required_exchanges,
+    EXAMPLE_PAIRS,
+)
+from hummingbot.client.config.config_helpers import parse_cvar_value
+from hummingbot.strategy.multi_pair_pure_market_making.data_types import PairConfig
+
+
+def maker_trading_pairs_prompt():
+    exchange = multi_pair_pure_market_making_config_map.get("exchange").value
+    example = EXAMPLE_PAIRS.get(exchange)
+    return "Enter the token trading pairs you would like to trade on %s, separated by commas%s >>> " \
+           % (exchange, f" (e.g. {example})" if example else "")
+
+
+# strategy specific validators
+def validate_exchange_trading_pairs(value: str) -> Optional[str]:
+    exchange = multi_pair_pure_market_making_config_map.get("exchange").value
+    trading_pairs: List[str] = parse_cvar_value(multi_pair_pure_market_making_config_map["markets"], value)
+    if len(trading_pairs) == 0:
+        return "Enter at least one trading pair."
+    if len(set(trading_pairs)) != len(trading_pairs):
+        return "Trading pairs must not be repeated."
+    for trading_pair in trading_pairs:
+        err_msg = validate_market_trading_pair(exchange, trading_pair)
+        if err_msg is not None:
+            return err_msg
+
+
+def validate_pair_overrides(value: str) -> Optional[str]:
+    try:
+        pair_overrides: Dict[str, Dict[str, Any]] = json.loads(value.replace("'", '"')) if value else {}
+    except Exception:
+        return "Invalid JSON format."
+    if not isinstance(pair_overrides, dict):
+        return "Overrides must be a JSON object, keyed by trading pair."
+    trading_pairs: List[str] = multi_pair_pure_market_making_config_map["markets"].value or []
+    for trading_pair, overrides in pair_overrides.items():
+        if trading_pair not in trading_pairs:
+            return f"{trading_pair} is not one of the markets."
+        if not isinstance(overrides, dict):
+            return f"The overrides of {trading_pair} must be a JSON object."
+        unknown_keys: List[str] = [key for key in overrides if key not in PairConfig._fields]
+        if len(unknown_keys) > 0:
+            return f"{', '.join(unknown_keys)} can't be set per trading pair."
+
+
+def exchange_on_validated(value: str):
+    required_exchanges.append(value)
+
+
+multi_pair_pure_market_making_config_map = {
+    "strategy":
+        ConfigVar(key="strategy",
+                  prompt=None,
+                  default="multi_pair_pure_market_making"),
+    "exchange":
+        ConfigVar(key="exchange",
+                  prompt="Enter your maker exchange name >>> ",
+                  validator=validate_exchange,
+                  on_validated=exchange_on_validated,
+                  prompt_on_new=True),
+    "markets":
+        ConfigVar(key="markets",
+                  prompt=maker_trading_pairs_prompt,
+                  type_str="list",
+                  validator=validate_exchange_trading_pairs,
+                  prompt_on_new=True),
+    "bid_spread":
+        ConfigVar(key="bid_spread",
+                  prompt="How far away from the mid price do you want to place the "
+                         "first bid order? (Enter 1 to indicate 1%) >>> ",
+                  type_str="decimal",
+                  validator=lambda v: validate_decimal(v, 0, 100, inclusive=False),
+                  prompt_on_new=True),
+    "ask_spread":
+        ConfigVar(key="ask_spread",
+                  prompt="How far away from the mid price do you want to place the "
+                         "first ask order? (Enter 1 to indicate 1%) >>> ",
+                  type_str="decimal",
+                  validator=lambda v: validate_decimal(v, 0, 100, inclusive=False),
+                  prompt_on_new=True),
+    "minimum_spread":
+        ConfigVar(key="minimum_spread",
+                  prompt="At what minimum spread should the bot automatically cancel orders? (Enter 1 for 1%) >>> ",
+                  required_if=lambda: False,
+                  type_str="decimal",
+                  default=Decimal(-100),
+                  validator=lambda v: validate_decimal(v, -100, 100, True)),
+    "order_refresh_time":
+        ConfigVar(key="order_refresh_time",
+                  prompt="How often do you want to cancel and replace bids and asks "
+                         "(in seconds)? >>> ",
+                  type_str="float",
+                  validator=lambda v: validate_decimal(v, 0, inclusive=False),
+                  prompt_on_new=True),
+    "order_refresh_tolerance_pct":
+        ConfigVar(key="order_refresh_tolerance_pct",
+                  prompt="Enter the percent change in price needed to refresh orders at each cycle "
+                         "(Enter 1 to indicate 1%) >>> ",
+                  type_str="decimal",
+                  default=Decimal("0"),
+                  validator=lambda v: validate_decimal(v, -10, 10, inclusive=True)),
+    "order_amount":
+        ConfigVar(key="order_amount",
+                  prompt="What is the amount of base asset per order, for the trading pairs without an "
+                         "order_amount override? >>> ",
+                  type_str="decimal",
+                  validator=lambda v: validate_decimal(v, min_value=0, inclusive=False),
+                  prompt_on_new=True),
+    "order_levels":
+        ConfigVar(key="order_levels",
+                  prompt="How many orders do you want to place on both sides? >>> ",
+                  type_str="int",
+                  validator=lambda v: validate_int(v, min_value=0, inclusive=False),
+                  default=1),
+    "order_level_amount":
+        ConfigVar(key="order_level_amount",
+                  prompt="How much do you want to increase or decrease the order size for each "
+                         "additional order? (decrease < 0 > increase) >>> ",
+                  required_if=lambda: multi_pair_pure_market_making_config_map.get("order_levels").value > 1,
+                  type_str="decimal",
+                  validator=lambda v: validate_decimal(v),
+                  default=0),
+    "order_level_spread":
+        ConfigVar(key="order_level_spread",
+                  prompt="Enter the price increments (as percentage) for subsequent "
+                         "orders? (Enter 1 to indicate 1%) >>> ",
+                  required_if=lambda: multi_pair_pure_market_making_config_map.get("order_levels").value > 1,
+                  type_str="decimal",
+                  validator=lambda v: validate_decimal(v, 0, 100, inclusive=False),
+                  default=Decimal("1")),
+    "inventory_skew_enabled":
+        ConfigVar(key="inventory_skew_enabled",
+                  prompt="Would you like to enable inventory skew? (Yes/No) >>> ",
+                  type_str="bool",
+                  default=False,
+                  validator=validate_bool),
+    "inventory_target_base_pct":
+        ConfigVar(key="inventory_target_base_pct",
+                  prompt="What is your target base asset percentage? Enter 50 for 50% >>> ",
+                  required_if=lambda: multi_pair_pure_market_making_config_map.get("inventory_skew_enabled").value,
+                  type_str="decimal",
+                  validator=lambda v: validate_decimal(v, 0, 100),
+                  default=Decimal("50")),
+    "inventory_range_multiplier":
+        ConfigVar(key="inventory_range_multiplier",
+                  prompt="What is your tolerable range of inventory around the target, "
+                         "expressed in multiples of your total order size? ",
+                  required_if=lambda: multi_pair_pure_market_making_config_map.get("inventory_skew_enabled").value,
+                  type_str="decimal",
+                  validator=lambda v: validate_decimal(v, min_value=0, inclusive=False),
+                  default=Decimal("1")),
+    "filled_order_delay":
+        ConfigVar(key="filled_order_delay",
+                  prompt="How long do you want to wait before placing the next order "
+                         "if your order gets filled (in seconds)? >>> ",
+                  type_str="float",
+                  validator=lambda v: validate_decimal(v, min_value=0, inclusive=False),
+                  default=60),
+    "pair_overrides":
+        ConfigVar(key="pair_overrides",
+                  prompt="Enter the parameters to override per trading pair, as JSON "
+                         "(e.g. {\"ETH-USDT\": {\"bid_spread\": 0.5, \"order_amount\": 0.1}}) >>> ",
+                  required_if=lambda: False,
+                  type_str="json",
+                  default={},
+                  validator=validate_pair_overrides),
+    "order_book_triggered_ticks":
+        ConfigVar(key="order_book_triggered_ticks",
+                  prompt="Do you want the strategy to react to order book changes as they happen, rather than once "
+                         "per second? (Yes/No) >>> ",
+                  type_str="bool",
+                  default=False,
+                  validator=validate_bool),
+}
@@ -0,0 +1,73 @@
+from typing import (
+    Any,
+    Dict,
+    List,
+    Tuple,
+)
+
+from hummingbot.strategy.market_trading_pair_tuple import MarketTradingPairTuple
+from hummingbot.strategy.multi_pair_pure_market_making import (
+    MultiPairPureMarketMakingStrategy,
+    PairConfig
+)
+from hummingbot.strategy.multi_pair_pure_market_making.multi_pair_pure_market_making_config_map import \
+    multi_pair_pure_market_making_config_map as c_map
+from decimal import Decimal
+
+# Parameters entered as percentages, e.g. 1 for 1%, which the strategy takes as fractions.
+PERCENT_PARAMETERS = ("bid_spread", "ask_spread", "minimum_spread", "order_level_spread",
+                      "order_refresh_tolerance_pct", "inventory_target_base_pct")
+
+
+def start(self):
+    try:
+        exchange = c_map.get("exchange").value.lower()
+        raw_trading_pairs = c_map.get("markets").value
+        pair_overrides: Dict[str, Dict[str, Any]] = c_map.get("pair_overrides").value or {}
+        order_book_triggered_ticks = c_map.get("order_book_triggered_ticks").value
+        base_config = PairConfig(
+            bid_spread=c_map.get("bid_spread").value,
+            ask_spread=c_map.get("ask_spread").value,
+            order_amount=c_map.get("order_amount").value,
+            order_levels=c_map.get("order_levels").value,
+            order_level_spread=c_map.get("order_level_spread").value,
+            order_level_amount=c_map.get("order_level_amount").value,
+            order_refresh_time=c_map.get("order_refresh_time").value,
+            order_refresh_tolerance_pct=c_map.get("order_refresh_tolerance_pct").value,
+            filled_order_delay=c_map.get("filled_order_delay").value,
+            minimum_spread=c_map.get("minimum_spread").value,
+            inventory_skew_enabled=c_map.get("inventory_skew_enabled").value,
+            inventory_target_base_pct=c_map.get("inventory_target_base_pct").value or Decimal("0"),
+            inventory_range_multiplier=c_map.get("inventory_range_multiplier").value or Decimal("0"),
+        )
+
+        pair_configs: List[PairConfig] = []
+        for raw_trading_pair in raw_trading_pairs:
+            pair_config: PairConfig = base_config.with_overrides(pair_overrides.get(raw_trading_pair, {}))
+            pair_configs.append(pair_config._replace(**{
+                key: getattr(pair_config, key) / Decimal('100') for key in PERCENT_PARAMETERS
+            }))
+
+        trading_pairs: List[str] = self._convert_to_exchange_trading_pair(exchange, raw_trading_pairs)
+        maker_assets: List[Tuple[str, str]] = self._initialize_market_assets(exchange, trading_pairs)
+        market_names: List[Tuple[str, List[str]]] = [(exchange, trading_pairs)]
+        self._initialize_wallet(token_trading_pairs=list(set(asset for assets in maker_assets for asset in assets)))
+        self._initialize_markets(market_names)
+        self.assets = set(asset for assets in maker_assets for asset in assets)
+        self.market_trading_pair_tuples = [
+            MarketTradingPairTuple(self.markets[exchange], trading_pair, base_asset, quote_asset)
+            for trading_pair, (base_asset, quote_asset) in zip(trading_pairs, maker_assets)
+        ]
+
+        strategy_logging_options = MultiPairPureMarketMakingStrategy.OPTION_LOG_ALL
+
+        self.strategy = MultiPairPureMarketMakingStrategy(
+            market_infos=self.market_trading_pair_tuples,
+            pair_configs=pair_configs,
+            logging_options=strategy_logging_options,
+            hb_app_notification=True,
+            order_book_triggered_ticks=order_book_triggered_ticks,
+        )
+    except Exception as e:
+        self._notify(str(e))
+        self.logger().error("Unknown error during initialization.", exc_info=True)
@@ -1,5 +1,6 @@
 # distutils: language=c++
 
+from hummingbot.core.data_type.expiry_scheduler cimport ExpiryScheduler
 from hummingbot.core.data_type.limit_order cimport LimitOrder
 from hummingbot.core.time_iterator cimport TimeIterator
 
@@ -11,8 +12,9 @@ cdef class OrderTracker(TimeIterator):
         dict _order_id_to_market_pair
         dict _shadow_tracked_limit_orders
         dict _shadow_order_id_to_market_pair
-        object _shadow_gc_requests
+        ExpiryScheduler _shadow_gc_requests
         object _in_flight_cancels
+        ExpiryScheduler _in_flight_cancel_expiries
         object _in_flight_pending_created
 
     cdef dict c_get_limit_orders(self)
@@ -31,5 +33,6 @@ cdef class OrderTracker(TimeIterator):
     cdef c_start_tracking_market_order(self, object market_pair, str order_id, bint is_buy, object quantity)
     cdef c_stop_tracking_market_order(self, object market_pair, str order_id)
     cdef c_check_and_cleanup_shadow_records(self)
+    cdef c_check_and_cleanup_in_flight_cancels(self)
     cdef c_add_create_order_pending(self, str order_id)
     cdef c_remove_create_order_pending(self, str order_id)
@@ -1,5 +1,6 @@
 from decimal import Decimal
 import numpy as np
+from typing import Tuple
 
 from .data_types import InventorySkewBidAskRatios
 
@@ -55,3 +56,44 @@ cdef object c_calculate_bid_ask_ratios_from_base_asset_ratio(
         double ask_adjustment = 2.0 - bid_adjustment
 
     return InventorySkewBidAskRatios(bid_adjustment, ask_adjustment)
+
+
+def calculate_bid_ask_ratios_from_base_asset_ratios(
+        base_asset_amounts: np.ndarray, quote_asset_amounts: np.ndarray, prices: np.ndarray,
+        target_base_asset_ratios: np.ndarray, base_asset_ranges: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Array version of calculate_bid_ask_ratios_from_base_asset_ratio(), for the inventories of many trading pairs at once.
+
+    :return: the bid ratios and the ask ratios
+    """
+    cdef:
+        object total_portfolio_values = base_asset_amounts * prices + quote_asset_amounts
+        object is_valid = (total_portfolio_values > 0.0) & (base_asset_ranges > 0.0)
+        object base_asset_values = base_asset_amounts * prices
+        object base_asset_range_values = np.minimum(base_asset_ranges * prices, total_portfolio_values * 0.5)
+        object target_base_asset_values = total_portfolio_values * target_base_asset_ratios
+        object left_base_asset_value_limits = np.maximum(target_base_asset_values - base_asset_range_values, 0.0)
+        object right_base_asset_value_limits = target_base_asset_values + base_asset_range_values
+        object left_widths = target_base_asset_values - left_base_asset_value_limits
+        object right_widths = right_base_asset_value_limits - target_base_asset_values
+        object left_inventory_ratios
+        object right_inventory_ratios
+        object bid_adjustments
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        # Interpolates like np.interp() does, also over the empty intervals of the zero ranges.
+        left_inventory_ratios = np.where(
+            left_widths > 0.0,
+            np.clip((base_asset_values - left_base_asset_value_limits) / left_widths, 0.0, 1.0) * 0.5,
+            np.where(base_asset_values < left_base_asset_value_limits, 0.0, 0.5)
+        )
+        right_inventory_ratios = np.where(
+            right_widths > 0.0,
+            0.5 + np.clip((base_asset_values - target_base_asset_values) / right_widths, 0.0, 1.0) * 0.5,
+            np.where(base_asset_values < target_base_asset_values, 0.5, 1.0)
+        )
+    bid_adjustments = np.where(base_asset_values < target_base_asset_values,
+                               2.0 - left_inventory_ratios * 2.0,
+                               (1.0 - right_inventory_ratios) * 2.0)
+    bid_adjustments = np.where(is_valid, bid_adjustments, 0.0)
+    return bid_adjustments, np.where(is_valid, 2.0 - bid_adjustments, 0.0)
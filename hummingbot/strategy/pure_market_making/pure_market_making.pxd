@@ -36,6 +36,7 @@ cdef class PureMarketMakingStrategy(StrategyBase):
         bint _ping_pong_enabled
         list _ping_pong_warning_lines
         bint _hb_app_notification
+        bint _order_book_triggered_ticks
 
         double _cancel_timestamp
         double _create_timestamp
@@ -48,6 +49,7 @@ cdef class PureMarketMakingStrategy(StrategyBase):
         double _status_report_interval
         int64_t _logging_options
     cdef object c_get_mid_price(self)
+    cdef double c_get_next_wakeup_time(self)
     cdef object c_create_base_proposal(self)
     cdef tuple c_get_adjusted_available_balance(self, list orders)
     cdef c_apply_order_levels_modifiers(self, object proposal)
@@ -90,6 +90,7 @@ cdef class PureMarketMakingStrategy(StrategyBase):
                  status_report_interval: float = 900,
                  minimum_spread: Decimal = Decimal(0),
                  hb_app_notification: bool = False,
+                 order_book_triggered_ticks: bool = False,
                  ):
 
         if price_ceiling != s_decimal_neg_one and price_ceiling < price_floor:
@@ -126,6 +127,7 @@ cdef class PureMarketMakingStrategy(StrategyBase):
         self._ping_pong_enabled = ping_pong_enabled
         self._ping_pong_warning_lines = []
         self._hb_app_notification = hb_app_notification
+        self._order_book_triggered_ticks = order_book_triggered_ticks
 
         self._cancel_timestamp = 0
         self._create_timestamp = 0
@@ -568,6 +570,11 @@ cdef class PureMarketMakingStrategy(StrategyBase):
                     if should_report_warnings:
                         self.logger().warning(f"Markets are not ready. No market making trades are permitted.")
                     return
+                if self._order_book_triggered_ticks:
+                    # React to the order book as it changes, rather than on the next clock tick.
+                    self.c_add_tick_trigger_order_books([self._market_info.order_book],
+                                                        self.TRIGGERED_TICK_DEBOUNCE,
+                                                        self.TRIGGERED_TICK_MIN_INTERVAL)
 
             if should_report_warnings:
                 if not all([market.network_status is NetworkStatus.CONNECTED for market in self._sb_markets]):
@@ -599,6 +606,16 @@ cdef class PureMarketMakingStrategy(StrategyBase):
         finally:
             self._last_timestamp = timestamp
 
+    cdef double c_get_next_wakeup_time(self):
+        cdef:
+            double next_wakeup_time = self._create_timestamp
+        if not self._all_markets_ready:
+            return self._current_timestamp
+        # Price driven cancellations happen on the order book changes, which come with the ticks of the data iterators.
+        if len(self.active_non_hanging_orders) > 0:
+            next_wakeup_time = min(next_wakeup_time, self._cancel_timestamp)
+        return next_wakeup_time
+
     cdef object c_create_base_proposal(self):
         cdef:
             MarketBase market = self._market_info.market
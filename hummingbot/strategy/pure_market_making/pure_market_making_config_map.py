@@ -304,5 +304,12 @@ pure_market_making_config_map = {
                                         "order book? (Yes/No) >>> ",
                                  required_if=lambda: pure_market_making_config_map.get("price_source_enabled").value,
                                  type_str="bool",
-                                 validator=validate_take_if_crossed)
+                                 validator=validate_take_if_crossed),
+    "order_book_triggered_ticks":
+        ConfigVar(key="order_book_triggered_ticks",
+                  prompt="Do you want the strategy to react to order book changes as they happen, rather than once "
+                         "per second? (Yes/No) >>> ",
+                  type_str="bool",
+                  default=False,
+                  validator=validate_bool),
 }
@@ -16,11 +16,19 @@ cdef class StrategyBase(TimeIterator):
         EventListener _sb_expire_order_listener
         EventListener _sb_complete_buy_order_listener
         EventListener _sb_complete_sell_order_listener
+        EventListener _sb_order_book_changed_listener
+        list _sb_tick_trigger_order_books
+        double _sb_tick_trigger_debounce
+        double _sb_tick_trigger_min_interval
+        object _sb_triggered_tick_handle
         bint _sb_delegate_lock
         OrderTracker _sb_order_tracker
 
     cdef c_add_markets(self, list markets)
     cdef c_remove_markets(self, list markets)
+    cdef c_add_tick_trigger_order_books(self, list order_books, double debounce, double min_interval)
+    cdef c_remove_tick_trigger_order_books(self)
+    cdef c_did_change_order_book(self, object order_book_changed_event)
     cdef c_did_create_buy_order(self, object order_created_event)
     cdef c_did_create_sell_order(self, object order_created_event)
     cdef c_did_fill_order(self, object order_filled_event)
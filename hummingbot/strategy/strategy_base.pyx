@@ -1,11 +1,18 @@
+import asyncio
 from decimal import Decimal
 import logging
 import pandas as pd
+import time
 from typing import (
     List)
 
 from hummingbot.core.clock cimport Clock
-from hummingbot.core.event.events import MarketEvent
+from hummingbot.core.clock_mode import ClockMode
+from hummingbot.core.data_type.order_book cimport OrderBook
+from hummingbot.core.event.events import (
+    MarketEvent,
+    OrderBookEvent
+)
 from hummingbot.core.event.event_listener cimport EventListener
 from hummingbot.core.network_iterator import NetworkStatus
 from hummingbot.strategy.market_trading_pair_tuple import MarketTradingPairTuple
@@ -76,6 +83,11 @@ cdef class BuyOrderCreatedListener(BaseStrategyEventListener):
 cdef class SellOrderCreatedListener(BaseStrategyEventListener):
     cdef c_call(self, object arg):
         self._owner.c_did_create_sell_order(arg)
+
+
+cdef class OrderBookChangedListener(BaseStrategyEventListener):
+    cdef c_call(self, object arg):
+        self._owner.c_did_change_order_book(arg)
 # </editor-fold>
 
 
@@ -88,6 +100,10 @@ cdef class StrategyBase(TimeIterator):
     ORDER_FAILURE_EVENT_TAG = MarketEvent.OrderFailure.value
     BUY_ORDER_CREATED_EVENT_TAG = MarketEvent.BuyOrderCreated.value
     SELL_ORDER_CREATED_EVENT_TAG = MarketEvent.SellOrderCreated.value
+    ORDER_BOOK_CHANGED_EVENT_TAG = OrderBookEvent.OrderBookChangedEvent.value
+
+    TRIGGERED_TICK_DEBOUNCE = 0.05
+    TRIGGERED_TICK_MIN_INTERVAL = 0.2
 
     @classmethod
     def logger(cls) -> logging.Logger:
@@ -104,6 +120,11 @@ cdef class StrategyBase(TimeIterator):
         self._sb_expire_order_listener = OrderExpiredListener(self)
         self._sb_complete_buy_order_listener = BuyOrderCompletedListener(self)
         self._sb_complete_sell_order_listener = SellOrderCompletedListener(self)
+        self._sb_order_book_changed_listener = OrderBookChangedListener(self)
+        self._sb_tick_trigger_order_books = []
+        self._sb_tick_trigger_debounce = self.TRIGGERED_TICK_DEBOUNCE
+        self._sb_tick_trigger_min_interval = self.TRIGGERED_TICK_MIN_INTERVAL
+        self._sb_triggered_tick_handle = None
 
         self._sb_delegate_lock = False
 
@@ -133,8 +154,7 @@ cdef class StrategyBase(TimeIterator):
                          order_filled_event.trade_fee)
         past_trades = []
         for market in self.active_markets:
-            event_logs = market.event_logs
-            order_filled_events = list(filter(lambda e: isinstance(e, OrderFilledEvent), event_logs))
+            order_filled_events = market.event_logs_of_type(OrderFilledEvent)
             past_trades += list(map(lambda ofe: event_to_trade(ofe, market.display_name), order_filled_events))
 
         return sorted(past_trades, key=lambda x: x.timestamp)
@@ -239,6 +259,7 @@ cdef class StrategyBase(TimeIterator):
         TimeIterator.c_stop(self, clock)
         self._sb_order_tracker.c_stop(clock)
         self.c_remove_markets(list(self._sb_markets))
+        self.c_remove_tick_trigger_order_books()
 
     cdef c_add_markets(self, list markets):
         cdef:
@@ -274,6 +295,74 @@ cdef class StrategyBase(TimeIterator):
             typed_market.c_remove_listener(self.SELL_ORDER_COMPLETED_EVENT_TAG, self._sb_complete_sell_order_listener)
             self._sb_markets.remove(typed_market)
 
+    def add_tick_trigger_order_books(self,
+                                     order_books: List[OrderBook],
+                                     debounce: float = TRIGGERED_TICK_DEBOUNCE,
+                                     min_interval: float = TRIGGERED_TICK_MIN_INTERVAL):
+        self.c_add_tick_trigger_order_books(order_books, debounce, min_interval)
+
+    def remove_tick_trigger_order_books(self):
+        self.c_remove_tick_trigger_order_books()
+
+    cdef c_add_tick_trigger_order_books(self, list order_books, double debounce, double min_interval):
+        """
+        Has the order books' changes tick the strategy as they happen, in real time mode, in addition to the clock's
+        fixed interval ticks - which are left as a heartbeat.
+
+        :param order_books: order books whose top of book changes trigger ticks
+        :param debounce: seconds to wait after a change before ticking, so a burst of changes triggers a single tick
+        :param min_interval: minimum seconds between two ticks of the strategy, counting the clock's ticks
+        """
+        cdef:
+            OrderBook typed_order_book
+
+        self._sb_tick_trigger_debounce = debounce
+        self._sb_tick_trigger_min_interval = min_interval
+        for order_book in order_books:
+            typed_order_book = order_book
+            if typed_order_book in self._sb_tick_trigger_order_books:
+                continue
+            typed_order_book.c_add_listener(self.ORDER_BOOK_CHANGED_EVENT_TAG, self._sb_order_book_changed_listener)
+            self._sb_tick_trigger_order_books.append(typed_order_book)
+
+    cdef c_remove_tick_trigger_order_books(self):
+        cdef:
+            OrderBook typed_order_book
+
+        for order_book in self._sb_tick_trigger_order_books:
+            typed_order_book = order_book
+            typed_order_book.c_remove_listener(self.ORDER_BOOK_CHANGED_EVENT_TAG, self._sb_order_book_changed_listener)
+        self._sb_tick_trigger_order_books = []
+        if self._sb_triggered_tick_handle is not None:
+            self._sb_triggered_tick_handle.cancel()
+            self._sb_triggered_tick_handle = None
+
+    cdef c_did_change_order_book(self, object order_book_changed_event):
+        cdef:
+            double delay
+
+        # A tick is already on its way, or there is no clock to tick with.
+        if self._sb_triggered_tick_handle is not None:
+            return
+        if self._clock is None or self._clock.clock_mode is not ClockMode.REALTIME:
+            return
+        delay = max(self._sb_tick_trigger_debounce,
+                    self._current_timestamp + self._sb_tick_trigger_min_interval - time.time())
+        self._sb_triggered_tick_handle = asyncio.get_event_loop().call_later(delay, self._triggered_tick)
+
+    def _triggered_tick(self):
+        cdef:
+            double now = time.time()
+
+        self._sb_triggered_tick_handle = None
+        # Skip the tick if the clock has ticked the strategy since the change, or has stopped.
+        if self._clock is None or now - self._current_timestamp < self._sb_tick_trigger_min_interval:
+            return
+        try:
+            self.c_tick(now)
+        except Exception:
+            self.logger().error("Unexpected error running order book triggered tick.", exc_info=True)
+
     cdef object c_sum_flat_fees(self, str quote_asset, list flat_fees):
 
         """
@@ -5,6 +5,7 @@ from typing import (
     Coroutine,
     Callable
 )
+from urllib.parse import urlparse
 from web3 import Web3
 
 from hummingbot.core.utils.async_call_scheduler import AsyncCallScheduler
@@ -12,18 +13,28 @@ from hummingbot.core.pubsub import PubSub
 
 
 class BaseWatcher(PubSub):
+    # Number of calls the watchers of the same Ethereum node make at the same time.
+    NODE_CALL_CONCURRENCY = 4
+
     def __init__(self, w3: Web3):
         super().__init__()
         self._w3: Web3 = w3
         self._ev_loop: asyncio.AbstractEventLoop = asyncio.get_event_loop()
+        # The watchers of each Ethereum node share a scheduler lane.
+        endpoint_uri: str = getattr(getattr(w3, "provider", None), "endpoint_uri", None) or ""
+        self._scheduler_lane: str = urlparse(str(endpoint_uri)).netloc or AsyncCallScheduler.DEFAULT_LANE
+        AsyncCallScheduler.shared_instance().get_lane(self._scheduler_lane, max_concurrency=self.NODE_CALL_CONCURRENCY)
+
+    @property
+    def scheduler_lane(self) -> str:
+        return self._scheduler_lane
 
-    @staticmethod
-    async def schedule_async_call(coro: Coroutine, timeout_seconds: float, **kwargs) -> any:
-        return await AsyncCallScheduler.shared_instance().schedule_async_call(coro, timeout_seconds, **kwargs)
+    async def schedule_async_call(self, coro: Coroutine, timeout_seconds: float, **kwargs) -> any:
+        return await AsyncCallScheduler.shared_instance().schedule_async_call(coro, timeout_seconds,
+                                                                              lane=self._scheduler_lane, **kwargs)
 
-    @staticmethod
-    async def call_async(func: Callable, *args, **kwargs):
-        return await AsyncCallScheduler.shared_instance().call_async(func, *args, **kwargs)
+    async def call_async(self, func: Callable, *args, **kwargs):
+        return await AsyncCallScheduler.shared_instance().call_async(func, *args, lane=self._scheduler_lane, **kwargs)
 
     async def start_network(self):
         raise NotImplementedError
@@ -12,6 +12,7 @@ import ujson
 from web3 import Web3
 from web3.contract import Contract
 from zero_ex.order_utils import Order
+from hummingbot.core.utils.http_session_registry import http_session
 from hummingbot.wallet.ethereum.zero_ex.zero_ex_transaction_encoder_v3 import (
     ZeroExTransaction,
     SignedZeroExTransaction,
@@ -419,7 +420,7 @@ class ZeroExCoordinator:
         return result
     
     async def _post_request(self, url, data, timeout=10):
-        async with aiohttp.ClientSession() as client:
+        async with http_session(url) as client:
             async with client.request('POST',
                                       url=url,
                                       timeout=timeout,
@@ -126,49 +126,65 @@ def generate_order_hash_hex(
     ... )
     'cb36e4fedb36508fb707e2c05e21bffc7a72766ccae93f8ff096693fff7f1714'
     """  # noqa: E501 (line too long)
+    return generate_order_hash(order, generate_domain_struct_hash(exchange_address, chain_id)).hex()
 
-    def pad_20_bytes_to_32(twenty_bytes: bytes):
-        return bytes(12) + twenty_bytes
 
-    def int_to_32_big_endian_bytes(i: int):
-        return i.to_bytes(32, byteorder="big")
+def _pad_20_bytes_to_32(twenty_bytes: bytes) -> bytes:
+    return bytes(12) + twenty_bytes
 
-    eip712_domain_struct_hash = keccak(
+
+def _int_to_32_big_endian_bytes(i: int) -> bytes:
+    return i.to_bytes(32, byteorder="big")
+
+
+def _ensure_bytes(str_or_bytes: Union[str, bytes]) -> bytes:
+    return (
+        to_bytes(hexstr=cast(bytes, str_or_bytes))
+        if isinstance(str_or_bytes, str)
+        else str_or_bytes
+    )
+
+
+def generate_domain_struct_hash(exchange_address: str, chain_id: int) -> bytes:
+    """Calculate the EIP712 domain separator of a 0x Exchange contract, which is
+    the same for all the orders to it - so it can be calculated once, for all
+    of them.
+    """
+    return keccak(
         _Constants.eip712_domain_struct_header
-        + int_to_32_big_endian_bytes(int(chain_id))
-        + pad_20_bytes_to_32(to_bytes(hexstr=exchange_address))
+        + _int_to_32_big_endian_bytes(int(chain_id))
+        + _pad_20_bytes_to_32(to_bytes(hexstr=exchange_address))
     )
 
-    def ensure_bytes(str_or_bytes: Union[str, bytes]) -> bytes:
-        return (
-            to_bytes(hexstr=cast(bytes, str_or_bytes))
-            if isinstance(str_or_bytes, str)
-            else str_or_bytes
-        )
 
+def generate_order_hash(order: Order, domain_struct_hash: bytes) -> bytes:
+    """Calculate the hash of the given order, with the domain separator of the
+    0x Exchange contract from generate_domain_struct_hash(). The order can be a
+    struct or a JS dict, with hex strings for the asset data.
+    """
     eip712_order_struct_hash = keccak(
         _Constants.eip712_order_schema_hash
-        + pad_20_bytes_to_32(to_bytes(hexstr=order["makerAddress"]))
-        + pad_20_bytes_to_32(to_bytes(hexstr=order["takerAddress"]))
-        + pad_20_bytes_to_32(to_bytes(hexstr=order["feeRecipientAddress"]))
-        + pad_20_bytes_to_32(to_bytes(hexstr=order["senderAddress"]))
-        + int_to_32_big_endian_bytes(int(order["makerAssetAmount"]))
-        + int_to_32_big_endian_bytes(int(order["takerAssetAmount"]))
-        + int_to_32_big_endian_bytes(int(order["makerFee"]))
-        + int_to_32_big_endian_bytes(int(order["takerFee"]))
-        + int_to_32_big_endian_bytes(int(order["expirationTimeSeconds"]))
-        + int_to_32_big_endian_bytes(int(order["salt"]))
-        + keccak(ensure_bytes(order["makerAssetData"]))
-        + keccak(ensure_bytes(order["takerAssetData"]))
-        + keccak(ensure_bytes(order["makerFeeAssetData"]))
-        + keccak(ensure_bytes(order["takerFeeAssetData"]))
+        + _pad_20_bytes_to_32(to_bytes(hexstr=order["makerAddress"]))
+        + _pad_20_bytes_to_32(to_bytes(hexstr=order["takerAddress"]))
+        + _pad_20_bytes_to_32(to_bytes(hexstr=order["feeRecipientAddress"]))
+        + _pad_20_bytes_to_32(to_bytes(hexstr=order["senderAddress"]))
+        + _int_to_32_big_endian_bytes(int(order["makerAssetAmount"]))
+        + _int_to_32_big_endian_bytes(int(order["takerAssetAmount"]))
+        + _int_to_32_big_endian_bytes(int(order["makerFee"]))
+        + _int_to_32_big_endian_bytes(int(order["takerFee"]))
+        + _int_to_32_big_endian_bytes(int(order["expirationTimeSeconds"]))
+        + _int_to_32_big_endian_bytes(int(order["salt"]))
+        + keccak(_ensure_bytes(order["makerAssetData"]))
+        + keccak(_ensure_bytes(order["takerAssetData"]))
+        + keccak(_ensure_bytes(order["makerFeeAssetData"]))
+        + keccak(_ensure_bytes(order["takerFeeAssetData"]))
     )
 
     return keccak(
         _Constants.eip191_header
-        + eip712_domain_struct_hash
+        + domain_struct_hash
         + eip712_order_struct_hash
-    ).hex()
+    )
 
 
 def is_valid_signature(
@@ -301,3 +317,17 @@ def fix_signature(provider, signer_address, hash_hex, signature, chain_id = 1) -
         "Signature returned from web3 provider is in an unknown format."
         + " Attempted to parse as RSV and as VRS."
     )
+
+
+# convert_local_signature formats the signature of a local account - which eth_account always returns as r + s + v -
+# the way fix_signature would, without checking both formats against the 0x exchange contract.
+def convert_local_signature(signature: str) -> str:
+    ec_signature = _parse_signature_hex_as_rsv(signature)
+    if ec_signature["v"] not in [27, 28]:
+        raise RuntimeError("Signature of the local account is not in the R + S + V format.")
+    return (
+        _convert_ec_signature_to_vrs_hex(ec_signature)
+        + _Constants.SignatureType.ETH_SIGN.value.to_bytes(
+            1, byteorder="big"
+        ).hex()
+    )
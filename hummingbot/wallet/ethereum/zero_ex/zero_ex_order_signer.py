@@ -0,0 +1,173 @@
+#!/usr/bin/env python
+
+import asyncio
+from concurrent.futures import ProcessPoolExecutor
+import functools
+import os
+from typing import (
+    Any,
+    Dict,
+    List,
+    Optional,
+    Tuple
+)
+
+from eth_account import Account
+from eth_account.messages import defunct_hash_message
+from eth_account.signers.local import LocalAccount
+from web3.providers.base import BaseProvider
+
+from hummingbot.wallet.ethereum.zero_ex.zero_ex_custom_utils_v3 import (
+    convert_local_signature,
+    generate_domain_struct_hash,
+    generate_order_hash,
+    is_valid_signature
+)
+
+# The account of the signing worker process, set by _init_signing_worker().
+_worker_account: Optional[LocalAccount] = None
+
+
+def _init_signing_worker(private_key: str):
+    global _worker_account
+    _worker_account = Account.privateKeyToAccount(private_key)
+
+
+def _sign_order_batch(domain_struct_hash: bytes, unsigned_orders: List[Dict[str, Any]]) -> List[Tuple[str, str]]:
+    """
+    Hashes and signs a batch of orders in a signing worker process.
+
+    :return: the order hash hex and the 0x signature of each order
+    """
+    results: List[Tuple[str, str]] = []
+    for unsigned_order in unsigned_orders:
+        order_hash_hex: str = "0x" + generate_order_hash(unsigned_order, domain_struct_hash).hex()
+        signature: str = _worker_account.signHash(defunct_hash_message(hexstr=order_hash_hex))["signature"].hex()
+        results.append((order_hash_hex, convert_local_signature(signature)))
+    return results
+
+
+class ZeroExOrderSigner:
+    """
+    Hashes and signs 0x v3 orders in a pool of worker processes, so the keccak and ECDSA work stays off the event loop.
+
+    The EIP712 domain separator of the exchange contract is calculated once, and the order schema hash is a constant of
+    zero_ex_custom_utils_v3. Orders are signed with the local account of the wallet's private key, and the signatures
+    are formatted for the 0x ETH_SIGN type like fix_signature() does - but without its calls to the exchange contract.
+
+    sign_orders() signs a whole order ladder in one call, spread over the workers. The orders passed to sign_order() in
+    the same event loop iteration - like the ones a strategy places in one tick - are batched the same way.
+
+    With a verify_provider, sign_order() also checks each signature with the is_valid_signature call to the exchange
+    contract that fix_signature() makes, and raises ValueError on an invalid one.
+    """
+    def __init__(self,
+                 private_key: str,
+                 exchange_address: str,
+                 chain_id: int,
+                 max_workers: Optional[int] = None,
+                 verify_provider: Optional[BaseProvider] = None):
+        self._private_key: str = private_key
+        self._address: str = Account.privateKeyToAccount(private_key).address
+        self._chain_id: int = chain_id
+        self._verify_provider: Optional[BaseProvider] = verify_provider
+        self._domain_struct_hash: bytes = generate_domain_struct_hash(exchange_address.lower(), chain_id)
+        self._max_workers: int = max_workers if max_workers is not None else max(1, min(4, os.cpu_count() or 1))
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._pending_orders: List[Tuple[Dict[str, Any], asyncio.Future]] = []
+
+    @property
+    def domain_struct_hash(self) -> bytes:
+        return self._domain_struct_hash
+
+    def start(self):
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self._max_workers,
+                                                 initializer=_init_signing_worker,
+                                                 initargs=(self._private_key,))
+
+    def stop(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+    def sign_orders(self, unsigned_orders: List[Dict[str, Any]]) -> List[asyncio.Future]:
+        """
+        Signs a batch of orders in the worker pool.
+
+        :param unsigned_orders: orders as JS dicts, with hex strings for the addresses and asset data
+        :return: a future of the order hash hex and the signature of each order
+        """
+        futures: List[asyncio.Future] = [asyncio.get_event_loop().create_future() for _ in unsigned_orders]
+        self._submit_orders(unsigned_orders, futures)
+        return futures
+
+    async def sign_order(self, unsigned_order: Dict[str, Any]) -> Tuple[str, str]:
+        """
+        Signs an order, in a batch with the other orders to sign from the same event loop iteration.
+
+        :return: the order hash hex and the signature of the order
+        """
+        ev_loop: asyncio.AbstractEventLoop = asyncio.get_event_loop()
+        future: asyncio.Future = ev_loop.create_future()
+        self._pending_orders.append((unsigned_order, future))
+        if len(self._pending_orders) == 1:
+            ev_loop.call_soon(self._sign_pending_orders)
+        order_hash_hex, signature = await future
+        if self._verify_provider is not None:
+            await self.verify_signature(order_hash_hex, signature)
+        return order_hash_hex, signature
+
+    async def verify_signature(self, order_hash_hex: str, signature: str):
+        """
+        Checks a signature with the exchange contract, through the verify_provider.
+
+        :raises ValueError: if the exchange contract doesn't accept the signature
+        """
+        valid: bool = await asyncio.get_event_loop().run_in_executor(
+            None, is_valid_signature, self._verify_provider, order_hash_hex, signature, self._address, self._chain_id
+        )
+        if valid is not True:
+            raise ValueError(f"The exchange contract rejected the signature of order {order_hash_hex}.")
+
+    def _sign_pending_orders(self):
+        pending_orders: List[Tuple[Dict[str, Any], asyncio.Future]] = self._pending_orders
+        self._pending_orders = []
+        try:
+            self._submit_orders([order for order, _ in pending_orders], [future for _, future in pending_orders])
+        except Exception as e:
+            for _, future in pending_orders:
+                if not future.done():
+                    future.set_exception(e)
+
+    def _submit_orders(self, unsigned_orders: List[Dict[str, Any]], futures: List[asyncio.Future]):
+        if len(unsigned_orders) == 0:
+            return
+        self.start()
+        # One chunk of orders per worker, so the whole batch costs a single round trip to each of them.
+        chunk_size: int = -(-len(unsigned_orders) // self._max_workers)
+        for start in range(0, len(unsigned_orders), chunk_size):
+            try:
+                batch_future: asyncio.Future = asyncio.wrap_future(self._executor.submit(
+                    _sign_order_batch,
+                    self._domain_struct_hash,
+                    unsigned_orders[start:start + chunk_size]
+                ))
+            except Exception:
+                # A pool with a dead worker can't take any more work, the next batch starts a new one.
+                self.stop()
+                raise
+            batch_future.add_done_callback(functools.partial(self._set_results,
+                                                             futures=futures[start:start + chunk_size]))
+
+    @staticmethod
+    def _set_results(batch_future: asyncio.Future, futures: List[asyncio.Future]):
+        for index, future in enumerate(futures):
+            if future.done():
+                continue
+            if batch_future.cancelled():
+                future.cancel()
+            elif batch_future.exception() is not None:
+                future.set_exception(batch_future.exception())
+            else:
+                future.set_result(batch_future.result()[index])
@@ -46,6 +46,7 @@ def main():
         "hummingbot.strategy",
         "hummingbot.strategy.arbitrage",
         "hummingbot.strategy.cross_exchange_market_making",
+        "hummingbot.strategy.multi_pair_pure_market_making",
         "hummingbot.strategy.pure_market_making",
         "hummingbot.templates",
         "hummingbot.wallet",
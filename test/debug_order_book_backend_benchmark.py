@@ -0,0 +1,103 @@
+#!/usr/bin/env python
+
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+
+import argparse
+import numpy as np
+import pandas as pd
+import time
+from typing import (
+    List,
+    Optional,
+    Tuple
+)
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.tick_ladder_order_book import TickLadderOrderBook
+
+DiffMessage = Tuple[np.ndarray, np.ndarray]
+
+
+def load_diff_stream(path: str) -> List[DiffMessage]:
+    """
+    Loads a recorded diff stream from a CSV file with the columns [update_id, is_bid, price, amount]. Rows sharing an
+    update ID are applied as one diff message.
+    """
+    df: pd.DataFrame = pd.read_csv(path)
+    messages: List[DiffMessage] = []
+    for update_id, rows in df.groupby("update_id", sort=True):
+        bids = rows[rows.is_bid != 0]
+        asks = rows[rows.is_bid == 0]
+        messages.append((
+            np.column_stack([bids.price.values, bids.amount.values, np.full(len(bids), update_id)]).astype(np.float64),
+            np.column_stack([asks.price.values, asks.amount.values, np.full(len(asks), update_id)]).astype(np.float64)
+        ))
+    return messages
+
+
+def generate_diff_stream(num_messages: int, levels: int, tick_size: float, seed: int = 0) -> List[DiffMessage]:
+    """
+    Generates a diff stream around a random walking mid price, with most updates close to the top of the book.
+    """
+    rng: np.random.RandomState = np.random.RandomState(seed)
+    mid_tick: int = 10000
+    messages: List[DiffMessage] = []
+    for update_id in range(1, num_messages + 1):
+        mid_tick += rng.choice([-1, 0, 0, 0, 1])
+        updates_per_side: int = rng.randint(1, 20)
+        depth: np.ndarray = np.minimum(rng.geometric(0.05, size=(2, updates_per_side)), levels)
+        amounts: np.ndarray = np.where(rng.rand(2, updates_per_side) < 0.3, 0, rng.uniform(0.1, 10, (2, updates_per_side)))
+        ids: np.ndarray = np.full(updates_per_side, update_id, dtype=np.float64)
+        messages.append((
+            np.column_stack([(mid_tick - depth[0]) * tick_size, amounts[0], ids]),
+            np.column_stack([(mid_tick + depth[1]) * tick_size, amounts[1], ids])
+        ))
+    return messages
+
+
+def replay(order_book: OrderBook, messages: List[DiffMessage]) -> float:
+    start: float = time.perf_counter()
+    for bids, asks in messages:
+        order_book.apply_numpy_diffs(bids, asks)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Replays an order book diff stream against the OrderBook backends.")
+    parser.add_argument("--diff-file", type=str, default=None,
+                        help="CSV file of recorded diffs, with the columns [update_id, is_bid, price, amount].")
+    parser.add_argument("--tick-size", type=float, default=0.01)
+    parser.add_argument("--messages", type=int, default=100000)
+    parser.add_argument("--levels", type=int, default=1000)
+    args = parser.parse_args()
+
+    diff_file: Optional[str] = args.diff_file
+    if diff_file is not None:
+        messages: List[DiffMessage] = load_diff_stream(diff_file)
+    else:
+        messages: List[DiffMessage] = generate_diff_stream(args.messages, args.levels, args.tick_size)
+    num_updates: int = sum(len(bids) + len(asks) for bids, asks in messages)
+    print(f"Replaying {len(messages)} diff messages with {num_updates} level updates.")
+
+    set_order_book: OrderBook = OrderBook()
+    ladder_order_book: TickLadderOrderBook = TickLadderOrderBook(args.tick_size)
+    for label, order_book in (("std::set OrderBook", set_order_book), ("TickLadderOrderBook", ladder_order_book)):
+        elapsed: float = replay(order_book, messages)
+        print(f"  {label:<20} {elapsed:8.3f}s, {num_updates / elapsed:>12,.0f} level updates/s")
+
+    batch_order_book: OrderBook = OrderBook()
+    batch_bids: np.ndarray = np.vstack([bids for bids, _ in messages])
+    batch_asks: np.ndarray = np.vstack([asks for _, asks in messages])
+    start: float = time.perf_counter()
+    batch_order_book.apply_numpy_diffs_batch(batch_bids, batch_asks)
+    elapsed: float = time.perf_counter() - start
+    print(f"  {'batched OrderBook':<20} {elapsed:8.3f}s, {num_updates / elapsed:>12,.0f} level updates/s")
+
+    set_bids, set_asks = set_order_book.snapshot
+    ladder_bids, ladder_asks = ladder_order_book.snapshot
+    assert set_bids.equals(ladder_bids) and set_asks.equals(ladder_asks), "The backends diverged."
+    assert batch_order_book.snapshot[0].equals(set_bids), "The batched replay diverged."
+
+
+if __name__ == "__main__":
+    main()
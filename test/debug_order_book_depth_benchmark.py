@@ -0,0 +1,135 @@
+#!/usr/bin/env python
+
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+
+import argparse
+import numpy as np
+import time
+from typing import (
+    Callable,
+    Iterator
+)
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_row import OrderBookRow
+
+NaN = float("nan")
+
+
+def generator_price_for_volume(order_book: OrderBook, is_buy: bool, volume: float) -> float:
+    """
+    Reference implementation of the depth query walking the Python row generators, as OrderBook used to do.
+    """
+    cumulative_volume: float = 0
+    entries: Iterator[OrderBookRow] = order_book.ask_entries() if is_buy else order_book.bid_entries()
+    for row in entries:
+        cumulative_volume += row.amount
+        if cumulative_volume >= volume:
+            return row.price
+    return NaN
+
+
+def generator_volume_for_price(order_book: OrderBook, is_buy: bool, price: float) -> float:
+    cumulative_volume: float = 0
+    entries: Iterator[OrderBookRow] = order_book.ask_entries() if is_buy else order_book.bid_entries()
+    for row in entries:
+        if (is_buy and row.price > price) or (not is_buy and row.price < price):
+            break
+        cumulative_volume += row.amount
+    return cumulative_volume
+
+
+def make_order_book(levels: int, depth_index: bool = False) -> OrderBook:
+    mid_price: float = 100.0
+    tick: float = 0.01
+    offsets: np.ndarray = np.arange(1, levels + 1, dtype=np.float64)
+    amounts: np.ndarray = np.random.uniform(0.1, 10.0, levels)
+    update_ids: np.ndarray = np.ones(levels, dtype=np.float64)
+    bids: np.ndarray = np.column_stack([mid_price - offsets * tick, amounts, update_ids])
+    asks: np.ndarray = np.column_stack([mid_price + offsets * tick, amounts, update_ids])
+    order_book: OrderBook = OrderBook(depth_index=depth_index)
+    order_book.apply_numpy_snapshot(bids, asks)
+    return order_book
+
+
+def time_diffs_and_queries(label: str, order_book: OrderBook, levels: int, diff_size: int, iterations: int,
+                           volume: float) -> float:
+    """
+    Applies a batch of ask diffs, half of them on price levels the book doesn't have yet, and then queries the depth -
+    as a connector does on a live book.
+    """
+    np.random.seed(1)
+    batches = []
+    for update_id in range(2, iterations + 2):
+        # Half tick offsets are new price levels, which are removed again by the next batches.
+        offsets: np.ndarray = np.random.randint(1, levels + 1, diff_size) + np.tile([0, 0.5], diff_size // 2 + 1)[:diff_size]
+        amounts: np.ndarray = np.random.choice([0, 0.5, 2, 7], diff_size)
+        batches.append(np.column_stack([100.0 + offsets * 0.01, amounts, np.full(diff_size, update_id)]))
+    empty: np.ndarray = np.empty((0, 3), dtype=np.float64)
+
+    start: float = time.perf_counter()
+    for asks in batches:
+        order_book.apply_numpy_diffs(empty, asks)
+        order_book.get_price_for_volume(True, volume)
+        order_book.get_vwap_for_volume(True, volume)
+    elapsed: float = time.perf_counter() - start
+    print(f"  {label:<40} {elapsed / iterations * 1e6:>12.2f} us/batch")
+    return elapsed
+
+
+def time_it(label: str, func: Callable[[], object], iterations: int) -> float:
+    start: float = time.perf_counter()
+    for _ in range(iterations):
+        func()
+    elapsed: float = time.perf_counter() - start
+    print(f"  {label:<40} {elapsed / iterations * 1e6:>12.2f} us/query")
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmarks OrderBook depth queries against the generator based walk.")
+    parser.add_argument("--levels", type=int, default=1000)
+    parser.add_argument("--iterations", type=int, default=2000)
+    parser.add_argument("--diff-size", type=int, default=20,
+                        help="number of price levels in each diff batch of the live book workload")
+    args = parser.parse_args()
+
+    order_book: OrderBook = make_order_book(args.levels)
+    # Query deep enough to walk about 90% of each side.
+    total_volume: float = sum(row.amount for row in order_book.ask_entries())
+    volume: float = total_volume * 0.9
+    price: float = 100.0 + args.levels * 0.01 * 0.9
+
+    assert order_book.get_price_for_volume(True, volume).result_price == \
+        generator_price_for_volume(order_book, True, volume)
+    assert order_book.get_volume_for_price(True, price).result_volume == \
+        generator_volume_for_price(order_book, True, price)
+
+    print(f"Order book with {args.levels} levels per side, {args.iterations} iterations:")
+    old = time_it("generator get_price_for_volume",
+                  lambda: generator_price_for_volume(order_book, True, volume), args.iterations)
+    new = time_it("native get_price_for_volume",
+                  lambda: order_book.get_price_for_volume(True, volume), args.iterations)
+    print(f"  speed up: {old / new:.1f}x")
+    old = time_it("generator get_volume_for_price",
+                  lambda: generator_volume_for_price(order_book, True, price), args.iterations)
+    new = time_it("native get_volume_for_price",
+                  lambda: order_book.get_volume_for_price(True, price), args.iterations)
+    print(f"  speed up: {old / new:.1f}x")
+    time_it("native get_vwap_for_volume",
+            lambda: order_book.get_vwap_for_volume(True, volume), args.iterations)
+    time_it("native get_price_for_quote_volume",
+            lambda: order_book.get_price_for_quote_volume(True, volume * 100), args.iterations)
+    time_it("native get_quote_volume_for_base_amount",
+            lambda: order_book.get_quote_volume_for_base_amount(True, volume), args.iterations)
+
+    print(f"Diff batches of {args.diff_size} levels, half of them new, each followed by 2 depth queries:")
+    old = time_diffs_and_queries("native walk", make_order_book(args.levels), args.levels, args.diff_size,
+                                 args.iterations, volume)
+    new = time_diffs_and_queries("depth index", make_order_book(args.levels, depth_index=True), args.levels,
+                                 args.diff_size, args.iterations, volume)
+    print(f"  speed up: {old / new:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
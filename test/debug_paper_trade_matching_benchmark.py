@@ -0,0 +1,117 @@
+#!/usr/bin/env python
+
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+
+import argparse
+import asyncio
+import numpy as np
+import time
+from typing import Tuple
+
+from hummingbot.core.clock import Clock
+from hummingbot.core.clock_mode import ClockMode
+from hummingbot.core.data_type.composite_order_book import CompositeOrderBook
+from hummingbot.core.event.events import (
+    OrderBookTradeEvent,
+    OrderType,
+    TradeType
+)
+from hummingbot.market.paper_trade.market_config import MarketConfig
+from hummingbot.market.paper_trade.paper_trade_market import PaperTradeMarket
+from test.test_order_book_tracker import (
+    FakeOrderBookDataSource,
+    FakeOrderBookTracker
+)
+
+TRADING_PAIR = "COIN-USDT"
+
+
+class BenchmarkOrderBookTracker(FakeOrderBookTracker):
+    @property
+    def exchange_name(self) -> str:
+        return "binance"
+
+
+class BenchmarkMarket:
+    @staticmethod
+    def split_trading_pair(trading_pair: str) -> Tuple[str, str]:
+        return tuple(trading_pair.split("-"))
+
+
+def make_market() -> Tuple[PaperTradeMarket, Clock]:
+    tracker: BenchmarkOrderBookTracker = BenchmarkOrderBookTracker(FakeOrderBookDataSource([TRADING_PAIR]),
+                                                                   [TRADING_PAIR])
+    market: PaperTradeMarket = PaperTradeMarket(tracker, MarketConfig.default_config(), BenchmarkMarket)
+    tracker.start()
+    asyncio.get_event_loop().run_until_complete(tracker._order_books_initialized.wait())
+    tracker.stop()
+    assert market.ready
+    market.set_balance("COIN", 1e12)
+    market.set_balance("USDT", 1e12)
+    clock: Clock = Clock(ClockMode.BACKTEST, tick_size=1.0, start_time=0.0, end_time=1e9)
+    clock.add_iterator(market)
+    clock.backtest_til(0.0)
+    return market, clock
+
+
+def place_bids(market: PaperTradeMarket, num_orders: int, num_levels: int):
+    order_book: CompositeOrderBook = market.order_books[TRADING_PAIR]
+    order_book.apply_numpy_snapshot(np.array([[90.0, 1.0, 1]], dtype=np.float64),
+                                    np.array([[110.0, 1.0, 1]], dtype=np.float64))
+    for i in range(num_orders):
+        market.buy(TRADING_PAIR, 1, OrderType.LIMIT, 100 - (i % num_levels) * 0.01)
+
+
+def bench_trade_matching(market: PaperTradeMarket, num_orders: int, num_levels: int) -> float:
+    place_bids(market, num_orders, num_levels)
+    order_book: CompositeOrderBook = market.order_books[TRADING_PAIR]
+    start: float = time.perf_counter()
+    # A trade through all the price levels fills every order.
+    order_book.apply_trade(OrderBookTradeEvent(TRADING_PAIR, 0.0, TradeType.SELL, 99.0 - num_levels * 0.01, 1.0))
+    elapsed: float = time.perf_counter() - start
+    assert len(market.limit_orders) == 0
+    return elapsed
+
+
+def bench_crossed_orders(market: PaperTradeMarket, clock: Clock, num_orders: int, num_levels: int) -> float:
+    place_bids(market, num_orders, num_levels)
+    order_book: CompositeOrderBook = market.order_books[TRADING_PAIR]
+    order_book.apply_numpy_diffs(np.empty((0, 3)), np.array([[99.0 - num_levels * 0.01, 1e9, 2]],
+                                                            dtype=np.float64))
+    start: float = time.perf_counter()
+    clock.backtest_til(clock.current_timestamp + 1.0)
+    elapsed: float = time.perf_counter() - start
+    assert len(market.limit_orders) == 0
+    return elapsed
+
+
+def bench_idle_ticks(market: PaperTradeMarket, clock: Clock, num_orders: int, num_levels: int, num_ticks: int) -> float:
+    place_bids(market, num_orders, num_levels)
+    start: float = time.perf_counter()
+    clock.backtest_til(clock.current_timestamp + num_ticks)
+    elapsed: float = time.perf_counter() - start
+    asyncio.get_event_loop().run_until_complete(market.cancel_all(0))
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmarks the limit order matching of PaperTradeMarket.")
+    parser.add_argument("--orders", type=int, default=5000)
+    parser.add_argument("--levels", type=int, default=50)
+    parser.add_argument("--ticks", type=int, default=2000)
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+
+    market, clock = make_market()
+    print(f"{args.orders} limit bids over {args.levels} price levels, best of {args.rounds} rounds:")
+    elapsed: float = min(bench_trade_matching(market, args.orders, args.levels) for _ in range(args.rounds))
+    print(f"  {'trade matching':<30} {args.orders / elapsed:>12.0f} orders matched/s")
+    elapsed = min(bench_crossed_orders(market, clock, args.orders, args.levels) for _ in range(args.rounds))
+    print(f"  {'crossed order book':<30} {args.orders / elapsed:>12.0f} orders matched/s")
+    elapsed = min(bench_idle_ticks(market, clock, args.orders, args.levels, args.ticks) for _ in range(args.rounds))
+    print(f"  {'ticks without fills':<30} {elapsed / args.ticks * 1e6:>12.2f} us/tick")
+
+
+if __name__ == "__main__":
+    main()
@@ -76,3 +76,31 @@ class FixtureHuobi:
                                                    "canceled-at": 1581563762755}}
 
     ORDERS_BATCH_CANCELLED = {"status": "ok", "data": {"success": ["69098120228", "69098120253"], "failed": []}}
+
+    GET_OPEN_ORDERS = {"status": "ok",
+                       "data": [{"id": 69100000001, "symbol": "ethusdt", "account-id": 11899168,
+                                 "client-order-id": "buy-ethusdt-1581564000000001",
+                                 "amount": "0.060000000000000000", "price": "244.640000000000000000",
+                                 "created-at": 1581564000082, "type": "buy-limit", "filled-amount": "0.0",
+                                 "filled-cash-amount": "0.0", "filled-fees": "0.0", "source": "spot-api",
+                                 "state": "submitted"},
+                                {"id": 69100000002, "symbol": "ethusdt", "account-id": 11899168,
+                                 "client-order-id": "buy-ethusdt-1581564000000002",
+                                 "amount": "0.060000000000000000", "price": "244.640000000000000000",
+                                 "created-at": 1581564000083, "type": "buy-limit",
+                                 "filled-amount": "0.020000000000000000",
+                                 "filled-cash-amount": "4.892800000000000000",
+                                 "filled-fees": "0.000040000000000000", "source": "spot-api",
+                                 "state": "partial-filled"}]}
+
+    ORDER_GET_LIMIT_BUY_PARTIALLY_FILLED = {"status": "ok",
+                                            "data": {"id": 69100000002, "symbol": "ethusdt", "account-id": 11899168,
+                                                     "client-order-id": "buy-ethusdt-1581564000000002",
+                                                     "amount": "0.060000000000000000",
+                                                     "price": "244.640000000000000000",
+                                                     "created-at": 1581564000083, "type": "buy-limit",
+                                                     "field-amount": "0.020000000000000000",
+                                                     "field-cash-amount": "4.892800000000000000",
+                                                     "field-fees": "0.000040000000000000", "finished-at": 0,
+                                                     "source": "spot-api", "state": "partial-filled",
+                                                     "canceled-at": 0}}
@@ -0,0 +1,17 @@
+class FixtureKraken:
+    INVALID_ORDER = {"error": ["EOrder:Invalid order"]}
+
+    ORDER_OPEN = {"refid": None, "userref": 1, "status": "open", "opentm": 1588888888.1234, "starttm": 0,
+                  "expiretm": 0,
+                  "descr": {"pair": "ETHUSDC", "type": "buy", "ordertype": "limit", "price": "180.00", "price2": "0",
+                            "leverage": "none", "order": "buy 0.10000000 ETHUSDC @ limit 180.00", "close": ""},
+                  "vol": "0.10000000", "vol_exec": "0.00000000", "cost": "0.00000", "fee": "0.00000",
+                  "price": "0.00000", "stopprice": "0.00000", "limitprice": "0.00000", "misc": "", "oflags": "fciq"}
+
+    ORDER_CLOSED = {"refid": None, "userref": 2, "status": "closed", "opentm": 1588888889.1234, "starttm": 0,
+                    "expiretm": 0,
+                    "descr": {"pair": "ETHUSDC", "type": "buy", "ordertype": "limit", "price": "180.00", "price2": "0",
+                              "leverage": "none", "order": "buy 0.10000000 ETHUSDC @ limit 180.00", "close": ""},
+                    "vol": "0.10000000", "vol_exec": "0.10000000", "cost": "18.00000", "fee": "0.02880",
+                    "price": "180.00000", "stopprice": "0.00000", "limitprice": "0.00000", "misc": "",
+                    "oflags": "fciq", "closetm": 1588888890.1234, "reason": None}
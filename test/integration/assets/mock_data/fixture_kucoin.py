@@ -93,3 +93,6 @@ class FixtureKucoin:
 
     ORDER_CANCEL_ALL = {"code": "200000",
                         "data": {"cancelledOrderIds": ["5e3d0851051a350008723a81", "5e3d08516e350a0009bcd272"]}}
+
+    GET_ACTIVE_ORDERS = {"code": "200000",
+                         "data": {"currentPage": 1, "pageSize": 500, "totalNum": 0, "totalPage": 1, "items": []}}
@@ -0,0 +1,108 @@
+#!/usr/bin/env python
+
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../../")))
+
+import asyncio
+import logging
+import time
+import unittest
+from unittest import mock
+
+from hummingbot.core.utils.asyncio_throttle import Throttler
+from hummingbot.market.binance.binance_api_client import (
+    BinanceAPIClient,
+    BinanceAPIError
+)
+from test.integration.assets.mock_data.fixture_binance import FixtureBinance
+from test.integration.humming_web_app import HummingWebApp
+
+
+class BinanceAPIClientUnitTest(unittest.TestCase):
+    base_api_url = "api.binance.com"
+
+    @classmethod
+    def setUpClass(cls):
+        cls.ev_loop: asyncio.BaseEventLoop = asyncio.get_event_loop()
+        cls.web_app = HummingWebApp.get_instance()
+        cls.web_app.add_host_to_mock(cls.base_api_url)
+        cls.web_app.start()
+        cls.ev_loop.run_until_complete(cls.web_app.wait_til_started())
+        cls._patcher = mock.patch("aiohttp.client.URL")
+        cls._url_mock = cls._patcher.start()
+        cls._url_mock.side_effect = cls.web_app.reroute_local
+        cls.web_app.update_response("get", cls.base_api_url, "/api/v1/depth", FixtureBinance.LINKETH_SNAP,
+                                    params={"symbol": "LINKETH"})
+        cls.web_app.update_response("get", cls.base_api_url, "/api/v3/account", FixtureBinance.GET_ACCOUNT)
+        cls.web_app.update_response("post", cls.base_api_url, "/api/v3/order", FixtureBinance.ORDER_BUY_NOT_FILLED)
+        cls.web_app.update_response("get", cls.base_api_url, "/api/v3/openOrders",
+                                    [FixtureBinance.ORDER_BUY_PRECISION_GET])
+        cls.client: BinanceAPIClient = BinanceAPIClient("XXX", "YYY")
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.ev_loop.run_until_complete(cls.client.close())
+        cls.web_app.stop()
+        cls._patcher.stop()
+
+    def test_signature(self):
+        # The example of the Binance API documentation.
+        client: BinanceAPIClient = BinanceAPIClient(
+            "vmPUZE6mv9SD5VNHk4HlWFsOr6aKE2zvsw0MuIgwCIPy6utIco14y7Ju91duEh8A",
+            "NhqPtmdSJYdKjVHjA7PZj4Mge3R5YNiP1e3UZjInClVN65XAbvqqM6A7H5fATj0j"
+        )
+        with mock.patch("hummingbot.market.binance.binance_api_client.BinanceTime") as binance_time:
+            binance_time.get_instance.return_value.time.return_value = 1499827319.559
+            query_string: str = client._signed_query_string({
+                "symbol": "LTCBTC", "side": "BUY", "type": "LIMIT", "timeInForce": "GTC", "quantity": 1,
+                "price": 0.1, "recvWindow": 5000
+            })
+        self.assertEqual("symbol=LTCBTC&side=BUY&type=LIMIT&timeInForce=GTC&quantity=1&price=0.1&recvWindow=5000"
+                         "&timestamp=1499827319559"
+                         "&signature=c8db56825ae71d6d79447849e617115f4a920fa2acdcab2b053c4b2838bd6b71",
+                         query_string)
+
+    def test_requests(self):
+        snapshot = self.ev_loop.run_until_complete(self.client.get_order_book(symbol="LINKETH", limit=1000))
+        self.assertEqual(FixtureBinance.LINKETH_SNAP, snapshot)
+        account = self.ev_loop.run_until_complete(self.client.get_account())
+        self.assertEqual(FixtureBinance.GET_ACCOUNT, account)
+        order = self.ev_loop.run_until_complete(self.client.create_order(
+            symbol="LINKETH", side=BinanceAPIClient.SIDE_BUY, type="LIMIT", quantity="1", price="0.01059657",
+            timeInForce=BinanceAPIClient.TIME_IN_FORCE_GTC, newClientOrderId="buy-LINKETH-1580268987255692"
+        ))
+        self.assertEqual(154316832, order["orderId"])
+        open_orders = self.ev_loop.run_until_complete(self.client.get_open_orders(symbol="LINKETH"))
+        self.assertEqual([FixtureBinance.ORDER_BUY_PRECISION_GET], open_orders)
+
+        # All the requests are made on the same session.
+        session = self.client.session
+        self.ev_loop.run_until_complete(self.client.get_account())
+        self.assertIs(session, self.client.session)
+
+    def test_request_error(self):
+        with self.assertRaises(BinanceAPIError) as context:
+            self.ev_loop.run_until_complete(self.client.cancel_order(symbol="LINKETH", origClientOrderId="none"))
+        self.assertEqual(404, context.exception.status_code)
+
+    def test_sync_used_weight(self):
+        throttler: Throttler = Throttler((10, 1.0))
+        throttler.sync_used_weight(9)
+
+        async def weighted_task():
+            async with throttler.weighted_task(request_weight=1):
+                pass
+
+        start: float = time.time()
+        self.ev_loop.run_until_complete(weighted_task())
+        # The weight used elsewhere leaves no capacity until the period is over.
+        self.assertGreater(time.time() - start, 0.8)
+
+
+def main():
+    logging.basicConfig(level=logging.ERROR)
+    unittest.main()
+
+
+if __name__ == "__main__":
+    main()
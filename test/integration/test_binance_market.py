@@ -115,6 +115,7 @@ class BinanceMarketUnitTest(unittest.TestCase):
                                         FixtureBinance.GET_LISTEN_KEY)
             cls.web_app.update_response("put", cls.base_api_url, "/api/v1/userDataStream",
                                         FixtureBinance.GET_LISTEN_KEY)
+            cls.web_app.update_response("get", cls.base_api_url, "/api/v3/openOrders", [])
             cls.web_app.update_response("get", cls.base_api_url, "/api/v1/depth",
                                         FixtureBinance.LINKETH_SNAP, params={'symbol': 'LINKETH'})
             cls.web_app.update_response("get", cls.base_api_url, "/api/v1/depth",
@@ -597,6 +598,56 @@ class BinanceMarketUnitTest(unittest.TestCase):
             recorder.stop()
             os.unlink(self.db_path)
 
+    @unittest.skipUnless(API_MOCK_ENABLED, "Needs the open orders and order status mocked.")
+    def test_order_status_reconciliation(self):
+        open_order_id: str = "buy-LINKETH-1580289856010707"
+        done_order_id: str = "sell-LINKETH-1580289858445415"
+        self.market.restore_tracking_states({
+            order_id: {
+                "client_order_id": order_id,
+                "exchange_order_id": str(fixture["orderId"]),
+                "trading_pair": "LINKETH",
+                "order_type": "LIMIT",
+                "trade_type": fixture["side"],
+                "price": fixture["price"],
+                "amount": fixture["origQty"],
+                "last_state": "NEW",
+                "executed_amount_base": "0",
+                "executed_amount_quote": "0",
+                "fee_asset": None,
+                "fee_paid": "0"
+            }
+            for order_id, fixture in [(open_order_id, FixtureBinance.ORDER_BUY_PRECISION_GET),
+                                      (done_order_id, FixtureBinance.ORDER_SELL_PRECISION_GET)]
+        })
+        try:
+            self.web_app.update_response("get", self.base_api_url, "/api/v3/openOrders",
+                                         [self.fixture(FixtureBinance.ORDER_BUY_PRECISION_GET,
+                                                       status="PARTIALLY_FILLED")],
+                                         params={"symbol": "LINKETH"})
+            # The open order would be completed, if it were looked up.
+            self.web_app.update_response("get", self.base_api_url, "/api/v3/order",
+                                         self.fixture(FixtureBinance.ORDER_BUY_PRECISION_GET, status="FILLED"),
+                                         params={"origClientOrderId": open_order_id})
+            self.web_app.update_response("get", self.base_api_url, "/api/v3/order",
+                                         self.fixture(FixtureBinance.ORDER_SELL_PRECISION_GET, status="CANCELED"),
+                                         params={"origClientOrderId": done_order_id})
+
+            self.run_parallel(self.market._reconcile_order_status())
+
+            self.assertEqual("PARTIALLY_FILLED", self.market.in_flight_orders[open_order_id].last_state)
+            self.assertNotIn(done_order_id, self.market.in_flight_orders)
+            cancelled_events: List[OrderCancelledEvent] = [t for t in self.market_logger.event_log
+                                                           if isinstance(t, OrderCancelledEvent)]
+            self.assertEqual([done_order_id], [e.order_id for e in cancelled_events])
+            self.assertEqual(0, len([t for t in self.market_logger.event_log
+                                     if isinstance(t, BuyOrderCompletedEvent)]))
+        finally:
+            self.market.in_flight_orders.pop(open_order_id, None)
+            self.market.in_flight_orders.pop(done_order_id, None)
+            self.web_app.update_response("get", self.base_api_url, "/api/v3/openOrders", [],
+                                         params={"symbol": "LINKETH"})
+
     def test_update_last_prices(self):
         # This is basic test to see if order_book last_trade_price is initiated and updated.
         for order_book in self.market.order_books.values():
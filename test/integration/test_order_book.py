@@ -6,6 +6,9 @@ import sys; sys.path.insert(0, realpath(join(__file__, "../../../")))
 import logging
 import unittest
 from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.event.events import OrderBookEvent
+from hummingbot.core.event.event_logger import EventLogger
+from hummingbot.core.data_type.tick_ladder_order_book import TickLadderOrderBook
 import numpy as np
 
 
@@ -53,6 +56,194 @@ class OrderBookUnitTest(unittest.TestCase):
         self.assertEqual(best_bid, [50., 0.01, 6.])
         self.assertEqual(best_ask, 0)
 
+    def test_depth_queries(self):
+        order_book = OrderBook()
+        bids_array = np.array([[1, 1, 1], [2, 1, 1], [3, 2, 1]], dtype=np.float64)
+        asks_array = np.array([[4, 1, 1], [5, 1, 1], [6, 2, 1]], dtype=np.float64)
+        order_book.apply_numpy_snapshot(bids_array, asks_array)
+
+        self.assertEqual(5, order_book.get_price_for_volume(True, 2).result_price)
+        self.assertEqual(2, order_book.get_price_for_volume(False, 3).result_price)
+        self.assertTrue(np.isnan(order_book.get_price_for_volume(True, 5).result_price))
+        self.assertEqual(4.5, order_book.get_vwap_for_volume(True, 2).result_price)
+        self.assertEqual(2.25, order_book.get_vwap_for_volume(False, 4).result_price)
+        self.assertEqual(5, order_book.get_price_for_quote_volume(True, 9).result_price)
+        self.assertEqual(15, order_book.get_quote_volume_for_base_amount(True, 3).result_volume)
+        self.assertEqual(7, order_book.get_quote_volume_for_base_amount(False, 2.5).result_volume)
+        self.assertEqual(2, order_book.get_volume_for_price(True, 5).result_volume)
+        self.assertEqual(3, order_book.get_volume_for_price(False, 2).result_volume)
+        self.assertEqual(9, order_book.get_quote_volume_for_price(True, 5).result_volume)
+        self.assertEqual(8, order_book.get_quote_volume_for_price(False, 2).result_volume)
+
+    def test_apply_numpy_diffs_batch(self):
+        np.random.seed(3)
+        sequential_order_book = OrderBook()
+        batch_order_book = OrderBook()
+        bids_array = np.array([[99, 1, 1], [98, 1, 1]], dtype=np.float64)
+        asks_array = np.array([[101, 1, 1], [102, 1, 1]], dtype=np.float64)
+        for order_book in (sequential_order_book, batch_order_book):
+            order_book.apply_numpy_snapshot(bids_array, asks_array)
+
+        bid_messages = []
+        ask_messages = []
+        for update_id in range(2, 200):
+            bid_messages.append(np.column_stack([np.random.randint(95, 102, 3).astype(np.float64),
+                                                 np.random.choice([0, 1, 2], 3),
+                                                 np.full(3, update_id)]))
+            ask_messages.append(np.column_stack([np.random.randint(98, 105, 2).astype(np.float64),
+                                                 np.random.choice([0, 1, 2], 2),
+                                                 np.full(2, update_id)]))
+            sequential_order_book.apply_numpy_diffs(bid_messages[-1], ask_messages[-1])
+        # Some messages only update one side.
+        ask_messages[10] = ask_messages[10][:0]
+        bid_messages[20] = bid_messages[20][:0]
+        sequential_order_book.apply_numpy_snapshot(bids_array, asks_array)
+        for bids, asks in zip(bid_messages, ask_messages):
+            sequential_order_book.apply_numpy_diffs(bids, asks)
+        batch_order_book.apply_numpy_diffs_batch(np.vstack(bid_messages), np.vstack(ask_messages))
+
+        sequential_bids, sequential_asks = sequential_order_book.snapshot
+        batch_bids, batch_asks = batch_order_book.snapshot
+        self.assertTrue(sequential_bids.equals(batch_bids))
+        self.assertTrue(sequential_asks.equals(batch_asks))
+        self.assertEqual(199, batch_order_book.last_diff_uid)
+
+    def test_apply_numpy_diffs_update_id(self):
+        order_book = OrderBook()
+        empty_array = np.zeros((0, 3), dtype=np.float64)
+        order_book.apply_numpy_snapshot(np.array([[1, 1, 3]], dtype=np.float64), empty_array)
+        self.assertEqual(3, order_book.snapshot_uid)
+        order_book.apply_numpy_diffs(empty_array, empty_array, 5)
+        self.assertEqual(5, order_book.last_diff_uid)
+        with self.assertRaises(ValueError):
+            order_book.apply_numpy_diffs(np.array([[1, 1]], dtype=np.float64), empty_array)
+
+    def test_depth_index(self):
+        np.random.seed(42)
+        plain_order_book = OrderBook()
+        indexed_order_book = OrderBook(depth_index=True)
+        self.assertTrue(indexed_order_book.depth_index_enabled)
+        levels = np.arange(1, 201, dtype=np.float64)
+        bids_array = np.column_stack([100 - levels * 0.1, np.random.uniform(1, 10, 200), np.ones(200)])
+        asks_array = np.column_stack([100 + levels * 0.1, np.random.uniform(1, 10, 200), np.ones(200)])
+        for order_book in (plain_order_book, indexed_order_book):
+            order_book.apply_numpy_snapshot(bids_array, asks_array)
+
+        for update_id in range(2, 50):
+            # Mix of amount changes on existing levels, removals, new levels and levels crossing the other side.
+            bid_prices = np.round(100 - np.random.randint(-3, 250, 10) * 0.1, 1)
+            ask_prices = np.round(100 + np.random.randint(-3, 250, 10) * 0.1, 1)
+            amounts = np.random.choice([0, 0.5, 2, 7], 10)
+            bid_diffs = np.column_stack([bid_prices, amounts, np.full(10, update_id)])
+            ask_diffs = np.column_stack([ask_prices, amounts[::-1], np.full(10, update_id)])
+            for order_book in (plain_order_book, indexed_order_book):
+                order_book.apply_numpy_diffs(bid_diffs, ask_diffs)
+
+            for is_buy in (True, False):
+                for volume in (0.1, 10, 300):
+                    for query in ("get_price_for_volume", "get_vwap_for_volume", "get_quote_volume_for_base_amount"):
+                        expected = getattr(plain_order_book, query)(is_buy, volume)
+                        actual = getattr(indexed_order_book, query)(is_buy, volume)
+                        np.testing.assert_allclose([expected.result_price, expected.result_volume],
+                                                   [actual.result_price, actual.result_volume])
+                for quote_volume in (10, 1000, 100000):
+                    expected = plain_order_book.get_price_for_quote_volume(is_buy, quote_volume)
+                    actual = indexed_order_book.get_price_for_quote_volume(is_buy, quote_volume)
+                    np.testing.assert_allclose([expected.result_price, expected.result_volume],
+                                               [actual.result_price, actual.result_volume])
+                for price in (90, 99.5, 100, 100.5, 110):
+                    for query in ("get_volume_for_price", "get_quote_volume_for_price"):
+                        expected = getattr(plain_order_book, query)(is_buy, price)
+                        actual = getattr(indexed_order_book, query)(is_buy, price)
+                        np.testing.assert_allclose([expected.result_price, expected.result_volume],
+                                                   [actual.result_price, actual.result_volume])
+
+    def test_tick_ladder_order_book(self):
+        np.random.seed(7)
+        set_order_book = OrderBook()
+        ladder_order_book = TickLadderOrderBook(tick_size=0.1)
+        levels = np.arange(1, 101, dtype=np.float64)
+        bids_array = np.column_stack([np.round(100 - levels * 0.1, 1), np.random.uniform(1, 10, 100), np.ones(100)])
+        asks_array = np.column_stack([np.round(100 + levels * 0.1, 1), np.random.uniform(1, 10, 100), np.ones(100)])
+        for order_book in (set_order_book, ladder_order_book):
+            order_book.apply_numpy_snapshot(bids_array, asks_array)
+
+        for update_id in range(2, 50):
+            bid_diffs = np.column_stack([np.round(100 + np.random.randint(-120, 3, 5) * 0.1, 1),
+                                         np.random.choice([0, 1, 3], 5),
+                                         np.full(5, update_id)])
+            ask_diffs = np.column_stack([np.round(100 + np.random.randint(-2, 120, 5) * 0.1, 1),
+                                         np.random.choice([0, 2, 5], 5),
+                                         np.full(5, update_id)])
+            for order_book in (set_order_book, ladder_order_book):
+                order_book.apply_numpy_diffs(bid_diffs, ask_diffs)
+
+            set_bids, set_asks = set_order_book.snapshot
+            ladder_bids, ladder_asks = ladder_order_book.snapshot
+            self.assertTrue(set_bids.equals(ladder_bids))
+            self.assertTrue(set_asks.equals(ladder_asks))
+            for is_buy in (True, False):
+                self.assertEqual(set_order_book.get_price(is_buy), ladder_order_book.get_price(is_buy))
+                expected = set_order_book.get_vwap_for_volume(is_buy, 20)
+                actual = ladder_order_book.get_vwap_for_volume(is_buy, 20)
+                np.testing.assert_allclose([expected.result_price, expected.result_volume],
+                                           [actual.result_price, actual.result_volume])
+                expected = set_order_book.get_volume_for_price(is_buy, 100)
+                actual = ladder_order_book.get_volume_for_price(is_buy, 100)
+                np.testing.assert_allclose([expected.result_price, expected.result_volume],
+                                           [actual.result_price, actual.result_volume])
+
+    def test_numpy_snapshot(self):
+        bids_array = np.array([[1, 1, 1], [3, 2, 2], [2, 5, 3]], dtype=np.float64)
+        asks_array = np.array([[5, 1, 1], [4, 3, 2]], dtype=np.float64)
+        for create_order_book in (lambda: OrderBook(), lambda: TickLadderOrderBook(tick_size=1)):
+            self.assertEqual((0, 3), create_order_book().numpy_snapshot[0].shape)
+            order_book = create_order_book()
+            order_book.apply_numpy_snapshot(bids_array, asks_array)
+            bids, asks = order_book.numpy_snapshot
+            bids_df, asks_df = order_book.snapshot
+            np.testing.assert_array_equal(bids_df.values, bids)
+            np.testing.assert_array_equal(asks_df.values, asks)
+            self.assertEqual([3, 2, 1], bids[:, 0].tolist())
+            self.assertEqual([4, 5], asks[:, 0].tolist())
+
+            restored_order_book = OrderBook()
+            restored_order_book.apply_numpy_snapshot(bids, asks)
+            self.assertTrue(restored_order_book.snapshot[0].equals(bids_df))
+            self.assertTrue(restored_order_book.snapshot[1].equals(asks_df))
+
+    def test_change_events(self):
+        bids_array = np.array([[1, 1, 1], [2, 1, 1], [3, 2, 1]], dtype=np.float64)
+        asks_array = np.array([[4, 1, 1], [5, 1, 1], [6, 2, 1]], dtype=np.float64)
+        for order_book in (OrderBook(), TickLadderOrderBook(tick_size=0.5)):
+            event_logger = EventLogger()
+            order_book.add_listener(OrderBookEvent.OrderBookChangedEvent, event_logger)
+            order_book.apply_numpy_snapshot(bids_array, asks_array)
+            self.assertEqual(1, len(event_logger.event_log))
+            self.assertEqual((3, 4, True), tuple(event_logger.event_log[-1]))
+
+            # Changes away from the top of book are not published by default.
+            order_book.apply_numpy_diffs(np.array([[1., 3., 2.]]), np.array([[6., 0., 2.]]))
+            self.assertEqual(1, len(event_logger.event_log))
+            # A new amount at the top of book is.
+            order_book.apply_numpy_diffs(np.array([[3., 5., 3.]]), np.empty((0, 3)))
+            self.assertEqual(2, len(event_logger.event_log))
+            self.assertEqual((3, 4, False), tuple(event_logger.event_log[-1]))
+            # So is a move of the best prices.
+            order_book.apply_numpy_diffs(np.empty((0, 3)), np.array([[4., 0., 4.]]))
+            self.assertEqual(3, len(event_logger.event_log))
+            self.assertEqual((3, 5, True), tuple(event_logger.event_log[-1]))
+
+            # Changes within the depth range are published.
+            order_book.change_event_depth_range = 0.4
+            order_book.apply_numpy_diffs(np.array([[1., 2., 5.]]), np.empty((0, 3)))
+            self.assertEqual(3, len(event_logger.event_log))
+            order_book.apply_numpy_diffs(np.array([[2., 2., 6.]]), np.empty((0, 3)))
+            self.assertEqual(4, len(event_logger.event_log))
+            self.assertEqual((3, 5, False), tuple(event_logger.event_log[-1]))
+            with self.assertRaises(ValueError):
+                order_book.change_event_depth_range = -1
+
 
 def main():
     logging.basicConfig(level=logging.INFO)
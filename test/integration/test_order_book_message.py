@@ -0,0 +1,70 @@
+#!/usr/bin/env python
+
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../../")))
+
+import logging
+import unittest
+import numpy as np
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_message import (
+    OrderBookMessage,
+    OrderBookMessageType
+)
+from hummingbot.core.data_type.order_book_row import OrderBookRow
+
+
+class OrderBookMessageUnitTest(unittest.TestCase):
+    def test_lazy_parsing(self):
+        message = OrderBookMessage(OrderBookMessageType.DIFF, {
+            "trading_pair": "ETH-USDT",
+            "update_id": 7,
+            "bids": [["100.5", "1.25"], ["100.0", "0"]],
+            "asks": [["101", "2", "extra field"]]
+        }, timestamp=1.0)
+
+        np.testing.assert_array_equal(np.array([[100.5, 1.25, 7], [100.0, 0, 7]]), message.bids_array)
+        np.testing.assert_array_equal(np.array([[101, 2, 7]]), message.asks_array)
+        self.assertEqual([OrderBookRow(100.5, 1.25, 7), OrderBookRow(100.0, 0, 7)], message.bids)
+        self.assertEqual([OrderBookRow(101, 2, 7)], message.asks)
+        # Each side is parsed once.
+        self.assertIs(message.bids, message.bids)
+        self.assertIs(message.asks_array, message.asks_array)
+        self.assertFalse(hasattr(message, "__dict__"))
+
+    def test_ordering(self):
+        messages = [OrderBookMessage(OrderBookMessageType.DIFF, {"update_id": update_id, "bids": [], "asks": []})
+                    for update_id in (3, 1, 2)]
+        self.assertEqual([1, 2, 3], [message.update_id for message in sorted(messages)])
+        trade = OrderBookMessage(OrderBookMessageType.TRADE, {"trade_id": 1}, timestamp=1.0)
+        self.assertEqual(-1, trade.update_id)
+        self.assertNotEqual(trade, messages[1])
+
+    def test_restore_from_snapshot_and_diffs(self):
+        snapshot = OrderBookMessage(OrderBookMessageType.SNAPSHOT, {
+            "update_id": 2,
+            "bids": [["99", "1"], ["98", "1"]],
+            "asks": [["101", "1"], ["102", "1"]]
+        }, timestamp=1.0)
+        diffs = [
+            OrderBookMessage(OrderBookMessageType.DIFF, {"update_id": 1, "bids": [["99", "5"]], "asks": []}),
+            OrderBookMessage(OrderBookMessageType.DIFF, {"update_id": 3, "bids": [["98", "0"]], "asks": [["100", "3"]]}),
+            OrderBookMessage(OrderBookMessageType.DIFF, {"update_id": 4, "bids": [["97", "2"]], "asks": []}),
+            OrderBookMessage(OrderBookMessageType.DIFF, {"update_id": 5, "bids": [], "asks": [["100", "1"]]}),
+            OrderBookMessage(OrderBookMessageType.DIFF, {"update_id": 6, "bids": [], "asks": []})
+        ]
+        order_book = OrderBook()
+        order_book.restore_from_snapshot_and_diffs(snapshot, diffs)
+        self.assertEqual([OrderBookRow(99, 1, 2), OrderBookRow(97, 2, 4)], list(order_book.bid_entries()))
+        self.assertEqual([OrderBookRow(100, 1, 5)], list(order_book.ask_entries())[:1])
+        self.assertEqual([100, 101, 102], [row.price for row in order_book.ask_entries()])
+        self.assertEqual(6, order_book.last_diff_uid)
+
+
+def main():
+    logging.basicConfig(level=logging.INFO)
+    unittest.main()
+
+
+if __name__ == "__main__":
+    main()
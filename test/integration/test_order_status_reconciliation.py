@@ -0,0 +1,264 @@
+#!/usr/bin/env python
+
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../../")))
+
+import asyncio
+import copy
+from decimal import Decimal
+import logging
+import requests
+from typing import (
+    Any,
+    Dict,
+    List
+)
+import unittest
+from unittest import mock
+
+from hummingbot.core.clock import (
+    Clock,
+    ClockMode
+)
+from hummingbot.core.event.event_logger import EventLogger
+from hummingbot.core.event.events import (
+    BuyOrderCompletedEvent,
+    MarketEvent,
+    OrderCancelledEvent,
+    OrderFilledEvent
+)
+from hummingbot.market.binance.binance_market import BinanceMarket
+from hummingbot.market.huobi.huobi_market import HuobiMarket
+from hummingbot.market.kraken.kraken_market import KrakenMarket
+from hummingbot.market.kucoin.kucoin_market import KucoinMarket
+from hummingbot.market.market_base import MarketBase
+from test.integration.humming_web_app import HummingWebApp
+from test.integration.assets.mock_data.fixture_binance import FixtureBinance
+from test.integration.assets.mock_data.fixture_huobi import FixtureHuobi
+from test.integration.assets.mock_data.fixture_kraken import FixtureKraken
+from test.integration.assets.mock_data.fixture_kucoin import FixtureKucoin
+
+BINANCE_HOST = "api.binance.com"
+HUOBI_HOST = "api.huobi.pro"
+KUCOIN_HOST = "api.kucoin.com"
+KRAKEN_HOST = "api.kraken.com"
+
+
+def tracking_state(client_order_id: str, exchange_order_id: str, trading_pair: str, trade_type: str,
+                   **kwargs) -> Dict[str, Any]:
+    state: Dict[str, Any] = {
+        "client_order_id": client_order_id,
+        "exchange_order_id": exchange_order_id,
+        "trading_pair": trading_pair,
+        "order_type": "LIMIT",
+        "trade_type": trade_type,
+        "price": "100",
+        "amount": "0.06",
+        "last_state": "NEW",
+        "executed_amount_base": "0",
+        "executed_amount_quote": "0",
+        "fee_asset": None,
+        "fee_paid": "0"
+    }
+    state.update(kwargs)
+    return state
+
+
+class OrderStatusReconciliationUnitTest(unittest.TestCase):
+    """
+    Reconciles the in flight orders of each market against its bulk open order listing, with the REST API served by
+    the mock web app. Every order looked up one by one in the mocks is done, so an open order that was looked up
+    anyway shows up as completed.
+    """
+    events: List[MarketEvent] = [
+        MarketEvent.BuyOrderCompleted,
+        MarketEvent.OrderFilled,
+        MarketEvent.OrderCancelled,
+        MarketEvent.OrderFailure
+    ]
+
+    @classmethod
+    def setUpClass(cls):
+        cls.ev_loop: asyncio.BaseEventLoop = asyncio.get_event_loop()
+        cls.web_app: HummingWebApp = HummingWebApp.get_instance()
+        for host in (BINANCE_HOST, HUOBI_HOST, KUCOIN_HOST, KRAKEN_HOST):
+            cls.web_app.add_host_to_mock(host)
+        cls.web_app.start()
+        cls.ev_loop.run_until_complete(cls.web_app.wait_til_started())
+        cls._patcher = mock.patch("aiohttp.client.URL")
+        cls._url_mock = cls._patcher.start()
+        cls._url_mock.side_effect = cls.web_app.reroute_local
+        cls._req_patcher = mock.patch.object(requests.Session, "request", autospec=True)
+        cls._req_url_mock = cls._req_patcher.start()
+        cls._req_url_mock.side_effect = HummingWebApp.reroute_request
+        cls.web_app.update_response("get", BINANCE_HOST, "/api/v1/ping", {})
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.web_app.stop()
+        cls._patcher.stop()
+        cls._req_patcher.stop()
+
+    def reconcile(self, market: MarketBase, update_order_status) -> EventLogger:
+        event_logger: EventLogger = EventLogger()
+        for event_tag in self.events:
+            market.add_listener(event_tag, event_logger)
+        # Some markets only poll the order status once their poll interval has passed since the start of the clock.
+        clock: Clock = Clock(ClockMode.BACKTEST, 1.0, 1000.0, 2000.0)
+        with clock:
+            clock.add_iterator(market)
+            clock.backtest_til(1001.0)
+            self.ev_loop.run_until_complete(update_order_status())
+        return event_logger
+
+    def test_binance_open_orders(self):
+        market: BinanceMarket = BinanceMarket("XXX", "YYY", trading_pairs=["LINKETH"])
+        open_order_id: str = FixtureBinance.ORDER_BUY_PRECISION_GET["clientOrderId"]
+        done_order_id: str = FixtureBinance.ORDER_SELL_PRECISION_GET["clientOrderId"]
+        market.restore_tracking_states({
+            fixture["clientOrderId"]: tracking_state(fixture["clientOrderId"], str(fixture["orderId"]), "LINKETH",
+                                                     fixture["side"])
+            for fixture in (FixtureBinance.ORDER_BUY_PRECISION_GET, FixtureBinance.ORDER_SELL_PRECISION_GET)
+        })
+        open_order: Dict[str, Any] = dict(FixtureBinance.ORDER_BUY_PRECISION_GET, status="PARTIALLY_FILLED")
+        self.web_app.update_response("get", BINANCE_HOST, "/api/v3/openOrders", [open_order],
+                                     params={"symbol": "LINKETH"})
+        self.web_app.update_response("get", BINANCE_HOST, "/api/v3/order",
+                                     dict(FixtureBinance.ORDER_BUY_PRECISION_GET, status="FILLED"),
+                                     params={"origClientOrderId": open_order_id})
+        self.web_app.update_response("get", BINANCE_HOST, "/api/v3/order",
+                                     dict(FixtureBinance.ORDER_SELL_PRECISION_GET, status="CANCELED"),
+                                     params={"origClientOrderId": done_order_id})
+
+        event_logger: EventLogger = self.reconcile(market, market._reconcile_order_status)
+
+        self.assertEqual("PARTIALLY_FILLED", market.in_flight_orders[open_order_id].last_state)
+        self.assertNotIn(done_order_id, market.in_flight_orders)
+        self.assertEqual([done_order_id], [e.order_id for e in event_logger.event_log
+                                           if isinstance(e, OrderCancelledEvent)])
+        self.assertEqual(0, len([e for e in event_logger.event_log if isinstance(e, BuyOrderCompletedEvent)]))
+
+    def test_huobi_open_orders(self):
+        market: HuobiMarket = HuobiMarket("XXX", "YYY", trading_pairs=["ethusdt"])
+        unchanged_order_id, filled_order_id, done_order_id = "buy-ethusdt-1", "buy-ethusdt-2", "buy-ethusdt-3"
+        market.restore_tracking_states({
+            client_order_id: tracking_state(client_order_id, exchange_order_id, "ethusdt", "BUY",
+                                            last_state="submitted")
+            for client_order_id, exchange_order_id in ((unchanged_order_id, "69100000001"),
+                                                       (filled_order_id, "69100000002"),
+                                                       (done_order_id, "69092298194"))
+        })
+        self.web_app.update_response("get", HUOBI_HOST, "/v1/order/openOrders", FixtureHuobi.GET_OPEN_ORDERS)
+        self.web_app.update_response("get", HUOBI_HOST, "/v1/order/orders/69100000001",
+                                     FixtureHuobi.ORDER_GET_LIMIT_BUY_FILLED)
+        self.web_app.update_response("get", HUOBI_HOST, "/v1/order/orders/69100000002",
+                                     FixtureHuobi.ORDER_GET_LIMIT_BUY_PARTIALLY_FILLED)
+        self.web_app.update_response("get", HUOBI_HOST, "/v1/order/orders/69092298194",
+                                     FixtureHuobi.ORDER_GET_LIMIT_BUY_FILLED)
+
+        event_logger: EventLogger = self.reconcile(market, market._update_order_status)
+
+        # The open order without new fills is not looked up, the one with new fills is.
+        self.assertEqual("submitted", market.in_flight_orders[unchanged_order_id].last_state)
+        self.assertEqual("partial-filled", market.in_flight_orders[filled_order_id].last_state)
+        self.assertEqual(Decimal("0.02"), market.in_flight_orders[filled_order_id].executed_amount_base)
+        self.assertNotIn(done_order_id, market.in_flight_orders)
+        fills: List[OrderFilledEvent] = [e for e in event_logger.event_log if isinstance(e, OrderFilledEvent)]
+        self.assertEqual([filled_order_id, done_order_id], [e.order_id for e in fills])
+        self.assertEqual([done_order_id], [e.order_id for e in event_logger.event_log
+                                           if isinstance(e, BuyOrderCompletedEvent)])
+
+    def active_orders_page(self, exchange_order_ids: List[str], current_page: int, total_page: int) -> Dict[str, Any]:
+        page: Dict[str, Any] = copy.deepcopy(FixtureKucoin.GET_ACTIVE_ORDERS)
+        page["data"].update(currentPage=current_page, totalPage=total_page, totalNum=len(exchange_order_ids))
+        page["data"]["items"] = [dict(FixtureKucoin.ORDER_GET_BUY_UNMATCHED["data"], id=exchange_order_id)
+                                 for exchange_order_id in exchange_order_ids]
+        return page
+
+    def test_kucoin_active_order_pages(self):
+        market: KucoinMarket = KucoinMarket("XXX", "ZZZ", "YYY", trading_pairs=["ETH-USDT"])
+        first_page_order_id, second_page_order_id, done_order_id = "buy-ETH-USDT-1", "buy-ETH-USDT-2", "buy-ETH-USDT-3"
+        exchange_order_ids: Dict[str, str] = {first_page_order_id: "5e3d00000000000000000001",
+                                              second_page_order_id: "5e3d00000000000000000002",
+                                              done_order_id: FixtureKucoin.ORDER_GET_AFTER_BUY["data"]["id"]}
+        market.restore_tracking_states({
+            client_order_id: tracking_state(client_order_id, exchange_order_id, "ETH-USDT", "BUY",
+                                            last_state="DEAL")
+            for client_order_id, exchange_order_id in exchange_order_ids.items()
+        })
+        # More active orders than fit on the first page - the second tracked order is on the second page.
+        first_page_ids: List[str] = [f"5e3d1{i:019d}" for i in range(KucoinMarket.ACTIVE_ORDERS_PAGE_SIZE - 1)]
+        first_page_ids.append(exchange_order_ids[first_page_order_id])
+        for current_page, page_ids in ((1, first_page_ids), (2, [exchange_order_ids[second_page_order_id]])):
+            self.web_app.update_response("get", KUCOIN_HOST, "/api/v1/orders",
+                                         self.active_orders_page(page_ids, current_page, 2),
+                                         params={"status": "active", "currentPage": current_page})
+        for exchange_order_id in exchange_order_ids.values():
+            self.web_app.update_response("get", KUCOIN_HOST, f"/api/v1/orders/{exchange_order_id}",
+                                         FixtureKucoin.ORDER_GET_AFTER_BUY)
+
+        event_logger: EventLogger = self.reconcile(market, market._update_order_status)
+
+        self.assertEqual({first_page_order_id, second_page_order_id}, set(market.in_flight_orders.keys()))
+        self.assertEqual([done_order_id], [e.order_id for e in event_logger.event_log
+                                           if isinstance(e, BuyOrderCompletedEvent)])
+
+    def kraken_market(self, exchange_order_ids: List[str]) -> KrakenMarket:
+        market: KrakenMarket = KrakenMarket("XXX", "YYYY", trading_pairs=["ETHUSDC"])
+        market.restore_tracking_states({
+            f"buy-ETHUSDC-{exchange_order_id}": tracking_state(f"buy-ETHUSDC-{exchange_order_id}", exchange_order_id,
+                                                               "ETHUSDC", "BUY", last_state="open", userref=i)
+            for i, exchange_order_id in enumerate(exchange_order_ids)
+        })
+        return market
+
+    def test_kraken_query_order_batches(self):
+        exchange_order_ids: List[str] = [f"OABCDE-FGHIJ-{i:06d}" for i in range(KrakenMarket.QUERY_ORDERS_BATCH_SIZE + 1)]
+        market: KrakenMarket = self.kraken_market(exchange_order_ids)
+        # The first batch of 50 orders are all open, the last order - in a batch of its own - is closed.
+        first_batch: List[str] = exchange_order_ids[:KrakenMarket.QUERY_ORDERS_BATCH_SIZE]
+        self.web_app.update_response("post", KRAKEN_HOST, "/0/private/QueryOrders",
+                                     {"error": [], "result": {txid: FixtureKraken.ORDER_OPEN for txid in first_batch}},
+                                     params={"txid": ",".join(first_batch)})
+        self.web_app.update_response("post", KRAKEN_HOST, "/0/private/QueryOrders",
+                                     {"error": [], "result": {exchange_order_ids[-1]: FixtureKraken.ORDER_CLOSED}},
+                                     params={"txid": exchange_order_ids[-1]})
+
+        event_logger: EventLogger = self.reconcile(market, market._update_order_status)
+
+        self.assertEqual({f"buy-ETHUSDC-{txid}" for txid in first_batch}, set(market.in_flight_orders.keys()))
+        self.assertEqual([f"buy-ETHUSDC-{exchange_order_ids[-1]}"],
+                         [e.order_id for e in event_logger.event_log if isinstance(e, BuyOrderCompletedEvent)])
+
+    def test_kraken_query_orders_fallback(self):
+        open_txid, closed_txid, unknown_txid = "OABCDE-FGHIJ-000001", "OABCDE-FGHIJ-000002", "OABCDE-FGHIJ-000003"
+        market: KrakenMarket = self.kraken_market([open_txid, closed_txid, unknown_txid])
+        # Kraken rejects the whole batch for the unknown order, so every order is looked up on its own.
+        self.web_app.update_response("post", KRAKEN_HOST, "/0/private/QueryOrders", FixtureKraken.INVALID_ORDER,
+                                     params={"txid": ",".join([open_txid, closed_txid, unknown_txid])})
+        self.web_app.update_response("post", KRAKEN_HOST, "/0/private/QueryOrders",
+                                     {"error": [], "result": {open_txid: FixtureKraken.ORDER_OPEN}},
+                                     params={"txid": open_txid})
+        self.web_app.update_response("post", KRAKEN_HOST, "/0/private/QueryOrders",
+                                     {"error": [], "result": {closed_txid: FixtureKraken.ORDER_CLOSED}},
+                                     params={"txid": closed_txid})
+        self.web_app.update_response("post", KRAKEN_HOST, "/0/private/QueryOrders", FixtureKraken.INVALID_ORDER,
+                                     params={"txid": unknown_txid})
+
+        event_logger: EventLogger = self.reconcile(market, market._update_order_status)
+
+        # The unknown order is only given up on after it has been missing a few times in a row.
+        self.assertEqual({f"buy-ETHUSDC-{open_txid}", f"buy-ETHUSDC-{unknown_txid}"},
+                         set(market.in_flight_orders.keys()))
+        self.assertEqual("open", market.in_flight_orders[f"buy-ETHUSDC-{open_txid}"].last_state)
+        self.assertEqual([f"buy-ETHUSDC-{closed_txid}"],
+                         [e.order_id for e in event_logger.event_log if isinstance(e, BuyOrderCompletedEvent)])
+
+
+def main():
+    logging.basicConfig(level=logging.ERROR)
+    unittest.main()
+
+
+if __name__ == "__main__":
+    main()
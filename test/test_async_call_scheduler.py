@@ -0,0 +1,100 @@
+#!/usr/bin/env python
+
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+
+import asyncio
+import logging
+import time
+import unittest
+from typing import List
+
+from hummingbot.core.utils.async_call_scheduler import (
+    AsyncCallScheduler,
+    AsyncCallSchedulerLaneStats
+)
+
+
+class AsyncCallSchedulerUnitTest(unittest.TestCase):
+    CALL_DURATION = 0.1
+
+    def setUp(self):
+        self.ev_loop: asyncio.BaseEventLoop = asyncio.get_event_loop()
+        self.active_calls: int = 0
+        self.max_active_calls: int = 0
+
+    def blocking_call(self, value: int) -> int:
+        self.active_calls += 1
+        self.max_active_calls = max(self.max_active_calls, self.active_calls)
+        time.sleep(self.CALL_DURATION)
+        self.active_calls -= 1
+        return value
+
+    async def run_calls(self, scheduler: AsyncCallScheduler, lanes: List[str]) -> List[int]:
+        return await asyncio.gather(*[scheduler.call_async(self.blocking_call, i, lane=lane)
+                                      for i, lane in enumerate(lanes)])
+
+    def test_serial_lane(self):
+        scheduler: AsyncCallScheduler = AsyncCallScheduler()
+        try:
+            start: float = time.time()
+            results: List[int] = self.ev_loop.run_until_complete(self.run_calls(scheduler, [None] * 5))
+            self.assertEqual(list(range(5)), results)
+            self.assertEqual(1, self.max_active_calls)
+            self.assertGreaterEqual(time.time() - start, 5 * self.CALL_DURATION)
+        finally:
+            scheduler.stop()
+
+    def test_concurrent_lanes(self):
+        scheduler: AsyncCallScheduler = AsyncCallScheduler(max_concurrency=4)
+        scheduler.get_lane("slow.example.com", max_concurrency=1)
+        try:
+            start: float = time.time()
+            results: List[int] = self.ev_loop.run_until_complete(
+                self.run_calls(scheduler, ["fast.example.com"] * 8 + ["slow.example.com"] * 2)
+            )
+            self.assertEqual(list(range(10)), results)
+            self.assertEqual(5, self.max_active_calls)
+            self.assertLess(time.time() - start, 4 * self.CALL_DURATION)
+
+            stats: AsyncCallSchedulerLaneStats = scheduler.lane_stats()["fast.example.com"]
+            self.assertEqual(0, stats.queue_depth)
+            self.assertEqual(0, stats.active_calls)
+            self.assertEqual(8, stats.completed_calls)
+            self.assertGreater(stats.average_wait_time, 0)
+            self.assertGreaterEqual(stats.average_call_time, self.CALL_DURATION)
+            self.assertGreaterEqual(stats.max_latency, 2 * self.CALL_DURATION)
+            self.assertEqual(2, scheduler.lane_stats()["slow.example.com"].completed_calls)
+        finally:
+            scheduler.stop()
+
+    def test_lane_rate_limit(self):
+        # At most 2 calls (weight 1 each) fit in every 0.5 second period.
+        scheduler: AsyncCallScheduler = AsyncCallScheduler(max_concurrency=4, rate_limit=(3, 0.5))
+        try:
+            start: float = time.time()
+            self.ev_loop.run_until_complete(self.run_calls(scheduler, ["example.com"] * 5))
+            self.assertGreater(time.time() - start, 0.8)
+        finally:
+            scheduler.stop()
+
+    def test_failed_call(self):
+        def fail():
+            raise ValueError("Failed call.")
+
+        scheduler: AsyncCallScheduler = AsyncCallScheduler()
+        try:
+            with self.assertRaises(ValueError):
+                self.ev_loop.run_until_complete(scheduler.call_async(fail))
+            self.assertEqual(1, scheduler.lane_stats()[AsyncCallScheduler.DEFAULT_LANE].failed_calls)
+        finally:
+            scheduler.stop()
+
+
+def main():
+    logging.basicConfig(level=logging.ERROR)
+    unittest.main()
+
+
+if __name__ == "__main__":
+    main()
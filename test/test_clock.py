@@ -0,0 +1,121 @@
+#!/usr/bin/env python
+
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+
+import asyncio
+import logging
+import time
+from typing import (
+    List,
+    Optional
+)
+import unittest
+
+from hummingbot.core.clock import Clock
+from hummingbot.core.clock_mode import ClockMode
+from hummingbot.core.py_time_iterator import PyTimeIterator
+from hummingbot.core.utils.duration_histogram import DurationHistogram
+
+
+class RecordingIterator(PyTimeIterator):
+    def __init__(self, tick_duration: float = 0.0, wakeup_times: Optional[List[float]] = None):
+        super().__init__()
+        self.tick_duration: float = tick_duration
+        self.wakeup_times: Optional[List[float]] = wakeup_times
+        self.timestamps: List[float] = []
+
+    def get_next_wakeup_time(self) -> float:
+        if self.wakeup_times is None:
+            return super().get_next_wakeup_time()
+        return next((t for t in self.wakeup_times if t > self.current_timestamp), float("inf"))
+
+    def tick(self, timestamp: float):
+        self.timestamps.append(timestamp)
+        if self.tick_duration > 0:
+            time.sleep(self.tick_duration)
+
+
+class ClockUnitTest(unittest.TestCase):
+    TICK_SIZE = 0.1
+
+    @classmethod
+    def setUpClass(cls):
+        cls.ev_loop: asyncio.BaseEventLoop = asyncio.get_event_loop()
+
+    def run_clock(self, clock: Clock, duration: float):
+        with clock:
+            self.ev_loop.run_until_complete(clock.run_til(time.time() + duration))
+
+    def test_sub_second_ticks(self):
+        clock: Clock = Clock(ClockMode.REALTIME, tick_size=self.TICK_SIZE)
+        iterator: RecordingIterator = RecordingIterator()
+        clock.add_iterator(iterator)
+        self.run_clock(clock, 1.0)
+
+        self.assertGreaterEqual(len(iterator.timestamps), 8)
+        for timestamp, next_timestamp in zip(iterator.timestamps, iterator.timestamps[1:]):
+            # Consecutive ticks, each at an exact multiple of the tick size.
+            self.assertAlmostEqual(self.TICK_SIZE, next_timestamp - timestamp, places=6)
+            self.assertAlmostEqual(round(timestamp / self.TICK_SIZE), timestamp / self.TICK_SIZE, places=6)
+        self.assertEqual(0, clock.overrun_count)
+        self.assertEqual(0, clock.skipped_tick_count)
+
+        histogram: DurationHistogram = clock.tick_duration_histograms[iterator]
+        self.assertEqual(len(iterator.timestamps), histogram.count)
+        self.assertEqual(len(iterator.timestamps), clock.tick_count)
+        self.assertLess(histogram.max, self.TICK_SIZE)
+
+    def test_tick_overruns(self):
+        clock: Clock = Clock(ClockMode.REALTIME, tick_size=self.TICK_SIZE)
+        fast_iterator: RecordingIterator = RecordingIterator()
+        slow_iterator: RecordingIterator = RecordingIterator(tick_duration=self.TICK_SIZE * 2.5)
+        clock.add_iterator(fast_iterator)
+        clock.add_iterator(slow_iterator)
+        self.run_clock(clock, 1.5)
+
+        # Every tick overran, and made the clock skip the next two.
+        tick_count: int = len(slow_iterator.timestamps)
+        self.assertGreaterEqual(tick_count, 3)
+        self.assertEqual(tick_count, clock.overrun_count)
+        self.assertGreaterEqual(clock.skipped_tick_count, (tick_count - 1) * 2)
+        for timestamp, next_timestamp in zip(slow_iterator.timestamps, slow_iterator.timestamps[1:]):
+            self.assertAlmostEqual(self.TICK_SIZE * 3, next_timestamp - timestamp, places=6)
+
+        histograms = clock.tick_duration_histograms
+        self.assertGreaterEqual(histograms[slow_iterator].average, self.TICK_SIZE * 2.5)
+        self.assertLess(histograms[fast_iterator].average, self.TICK_SIZE)
+        status: str = clock.format_status()
+        self.assertIn(f"{tick_count} overran", status)
+        self.assertIn("RecordingIterator", status)
+
+    def test_fast_forward_backtest(self):
+        clock: Clock = Clock(ClockMode.BACKTEST, tick_size=0.5, start_time=1000.0, end_time=1100.0, fast_forward=True)
+        iterator: RecordingIterator = RecordingIterator(wakeup_times=[1000.25, 1010.0, 1050.3])
+        clock.add_iterator(iterator)
+        clock.backtest()
+
+        # The iterator is ticked at the first tick at or after each wake up time, and at the end time.
+        self.assertEqual([1000.5, 1010.0, 1050.5, 1100.0], iterator.timestamps)
+        self.assertEqual(200 - 4, clock.skipped_tick_count)
+
+        # Iterators without a wake up time are ticked at every tick.
+        clock = Clock(ClockMode.BACKTEST, tick_size=0.5, start_time=1000.0, end_time=1005.0, fast_forward=True)
+        iterator = RecordingIterator()
+        clock.add_iterator(iterator)
+        clock.backtest()
+        self.assertEqual(10, len(iterator.timestamps))
+        self.assertEqual(0, clock.skipped_tick_count)
+
+    def test_invalid_tick_size(self):
+        with self.assertRaises(ValueError):
+            Clock(ClockMode.REALTIME, tick_size=0)
+
+
+def main():
+    logging.basicConfig(level=logging.ERROR)
+    unittest.main()
+
+
+if __name__ == "__main__":
+    main()
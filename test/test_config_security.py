@@ -9,7 +9,12 @@ import unittest
 from hummingbot.client.config.security import Security
 from hummingbot.client import settings
 from hummingbot.client.config.global_config_map import global_config_map
-from hummingbot.client.config.config_crypt import encrypt_n_save_config_value
+from hummingbot.client.config.config_crypt import (
+    decrypt_keyfile,
+    decrypt_keyfiles,
+    encrypt_n_save_config_value,
+    list_encrypted_file_paths
+)
 import os
 import shutil
 import asyncio
@@ -65,6 +70,7 @@ class ConfigSecurityExistingPasswordUnitTest(unittest.TestCase):
         self.assertFalse(Security.is_decryption_done())
         await Security.wait_til_decryption_done()
         self.assertEqual(len(Security.all_decrypted_values()), 2)
+        self.assertEqual(len(Security.decryption_times()), 2)
         config_value = Security.decrypted_value("test_key_1")
         self.assertEqual("test_value_1", config_value)
         Security.update_secure_config("test_key_1", "new_value")
@@ -73,3 +79,16 @@ class ConfigSecurityExistingPasswordUnitTest(unittest.TestCase):
     def test_existing_password(self):
         loop = asyncio.get_event_loop()
         loop.run_until_complete(self._test_existing_password())
+
+    def test_decrypt_keyfiles(self):
+        loop = asyncio.get_event_loop()
+        file_paths = list_encrypted_file_paths()
+        results = loop.run_until_complete(decrypt_keyfiles(file_paths, "a"))
+        self.assertEqual(["test_value_1", "test_value_2"], [results[file_path][0].decode() for file_path in file_paths])
+        # A key file decrypted already is not decrypted again.
+        results = loop.run_until_complete(decrypt_keyfiles(file_paths, "a", {file_paths[0]: (b"cached", 0.0)}))
+        self.assertEqual([b"cached", b"test_value_2"], [results[file_path][0] for file_path in file_paths])
+        with self.assertRaises(ValueError):
+            loop.run_until_complete(decrypt_keyfiles(file_paths, "b"))
+        with self.assertRaises(ValueError):
+            decrypt_keyfile({"version": 4, "crypto": {}}, "a")
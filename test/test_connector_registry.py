@@ -0,0 +1,50 @@
+#!/usr/bin/env python
+
+from os.path import join, realpath, exists
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+
+import logging
+import re
+import unittest
+
+from hummingbot.market.connector_registry import (
+    CONNECTOR_SETTINGS,
+    get_market_class,
+    get_order_book_tracker_class
+)
+
+
+class ConnectorRegistryUnitTest(unittest.TestCase):
+    root_dir: str = realpath(join(__file__, "../../"))
+
+    def module_source(self, module: str) -> str:
+        base_path: str = join(self.root_dir, *module.split("."))
+        for extension in (".py", ".pyx"):
+            if exists(base_path + extension):
+                with open(base_path + extension) as fd:
+                    return fd.read()
+        self.fail(f"Module {module} does not exist.")
+
+    def test_connector_settings(self):
+        # The connector modules aren't imported here, as they need the dependencies of every exchange.
+        for name, setting in CONNECTOR_SETTINGS.items():
+            self.assertEqual(name, setting.name)
+            self.assertRegex(self.module_source(setting.market_module),
+                             rf"(cdef )?class {re.escape(setting.market_class_name)}\(")
+            self.assertRegex(self.module_source(setting.order_book_tracker_module),
+                             rf"class {re.escape(setting.order_book_tracker_class_name)}\(")
+
+    def test_unknown_connector(self):
+        with self.assertRaises(ValueError):
+            get_market_class("unknown_exchange")
+        with self.assertRaises(ValueError):
+            get_order_book_tracker_class("unknown_exchange")
+
+
+def main():
+    logging.basicConfig(level=logging.ERROR)
+    unittest.main()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+#!/usr/bin/env python
+
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+
+from decimal import Decimal
+import logging
+import unittest
+
+from hummingbot.core.event.event_logger import EventLogger
+from hummingbot.core.event.events import (
+    OrderCancelledEvent,
+    OrderFilledEvent,
+    OrderType,
+    TradeFee,
+    TradeType
+)
+
+
+class EventLoggerUnitTest(unittest.TestCase):
+    @staticmethod
+    def fill_event(order_id: str, trade_type: TradeType, price: str, amount: str) -> OrderFilledEvent:
+        return OrderFilledEvent(0, order_id, "COINALPHA-HBOT", trade_type, OrderType.LIMIT, Decimal(price),
+                                Decimal(amount), TradeFee(Decimal(0)))
+
+    def test_unbounded_log(self):
+        event_logger: EventLogger = EventLogger()
+        events = [OrderCancelledEvent(i, str(i)) for i in range(100)]
+        for event in events:
+            event_logger(event)
+        self.assertIsNone(event_logger.max_events)
+        self.assertEqual(events, event_logger.event_log)
+        self.assertEqual(events, event_logger.events_of_type(OrderCancelledEvent))
+        self.assertEqual([], event_logger.events_of_type(OrderFilledEvent))
+
+    def test_ring_buffer(self):
+        event_logger: EventLogger = EventLogger(max_events=3)
+        fills = [self.fill_event(str(i), TradeType.BUY, "10", "1") for i in range(3)]
+        cancels = [OrderCancelledEvent(i, str(i)) for i in range(3)]
+        for fill, cancel in zip(fills, cancels):
+            event_logger(fill)
+            event_logger(cancel)
+
+        self.assertEqual([cancels[1], fills[2], cancels[2]], event_logger.event_log)
+        self.assertEqual([fills[2]], event_logger.events_of_type(OrderFilledEvent))
+        self.assertEqual(cancels[1:], event_logger.events_of_type(OrderCancelledEvent))
+        # The totals still count the fills that have dropped out of the log.
+        self.assertEqual({"COINALPHA-HBOT": (Decimal(3), Decimal(-30))}, event_logger.order_filled_totals)
+
+        event_logger.clear()
+        self.assertEqual([], event_logger.event_log)
+        self.assertEqual([], event_logger.events_of_type(OrderCancelledEvent))
+        self.assertEqual({}, event_logger.order_filled_totals)
+
+    def test_unbounded_event_types(self):
+        event_logger: EventLogger = EventLogger(max_events=3, unbounded_event_types=[OrderFilledEvent])
+        fills = [self.fill_event(str(i), TradeType.BUY, "10", "1") for i in range(3)]
+        cancels = [OrderCancelledEvent(i, str(i)) for i in range(3)]
+        for fill, cancel in zip(fills, cancels):
+            event_logger(fill)
+            event_logger(cancel)
+
+        self.assertEqual([cancels[1], fills[2], cancels[2]], event_logger.event_log)
+        self.assertEqual(fills, event_logger.events_of_type(OrderFilledEvent))
+        self.assertEqual(cancels[1:], event_logger.events_of_type(OrderCancelledEvent))
+
+    def test_order_filled_totals(self):
+        event_logger: EventLogger = EventLogger()
+        event_logger(self.fill_event("1", TradeType.BUY, "10", "2"))
+        event_logger(self.fill_event("2", TradeType.SELL, "11", "0.5"))
+        event_logger(OrderFilledEvent(0, "3", "WETH-DAI", TradeType.SELL, OrderType.MARKET, Decimal("200"),
+                                      Decimal("1"), TradeFee(Decimal(0))))
+        self.assertEqual({
+            "COINALPHA-HBOT": (Decimal("1.5"), Decimal("-14.5")),
+            "WETH-DAI": (Decimal("-1"), Decimal("200"))
+        }, event_logger.order_filled_totals)
+
+
+def main():
+    logging.basicConfig(level=logging.ERROR)
+    unittest.main()
+
+
+if __name__ == "__main__":
+    main()
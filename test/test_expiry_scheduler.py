@@ -0,0 +1,64 @@
+#!/usr/bin/env python
+
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+
+import logging
+import math
+import unittest
+
+from hummingbot.core.data_type.expiry_scheduler import ExpiryScheduler
+
+
+class ExpirySchedulerUnitTest(unittest.TestCase):
+    def test_pop_expired(self):
+        scheduler: ExpiryScheduler = ExpiryScheduler()
+        scheduler.schedule("c", 30.0)
+        scheduler.schedule("a", 10.0)
+        scheduler.schedule("b", 20.0)
+        scheduler.schedule("b2", 20.0)
+        self.assertEqual(4, len(scheduler))
+
+        self.assertEqual([], scheduler.pop_expired(10.0))
+        self.assertEqual(["a", "b", "b2"], scheduler.pop_expired(25.0))
+        self.assertEqual(["c"], scheduler.keys)
+        self.assertNotIn("a", scheduler)
+        self.assertIn("c", scheduler)
+        self.assertEqual(["c"], scheduler.pop_expired(100.0))
+        self.assertEqual(0, len(scheduler))
+
+    def test_cancel_and_reschedule(self):
+        scheduler: ExpiryScheduler = ExpiryScheduler()
+        scheduler.schedule("a", 10.0)
+        scheduler.schedule("b", 10.0)
+        scheduler.schedule("c", 10.0)
+        scheduler.cancel("a")
+        scheduler.cancel("unknown")
+        scheduler.schedule("b", 50.0)
+        scheduler.schedule("c", 10.0)
+        self.assertTrue(math.isnan(scheduler.get_deadline("a")))
+        self.assertEqual(50.0, scheduler.get_deadline("b"))
+
+        self.assertEqual(["c"], scheduler.pop_expired(20.0))
+        self.assertEqual(["b"], scheduler.pop_expired(60.0))
+        self.assertEqual(0, len(scheduler))
+
+    def test_stale_entries_compaction(self):
+        scheduler: ExpiryScheduler = ExpiryScheduler()
+        scheduler.schedule("live", 1000.0)
+        for i in range(10000):
+            scheduler.schedule("moving", float(i))
+        self.assertEqual(2, len(scheduler))
+        self.assertEqual(9999.0, scheduler.get_deadline("moving"))
+
+        self.assertEqual(["live"], scheduler.pop_expired(5000.0))
+        self.assertEqual(["moving"], scheduler.pop_expired(10000.0))
+
+
+def main():
+    logging.basicConfig(level=logging.ERROR)
+    unittest.main()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+#!/usr/bin/env python
+
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+
+import aiohttp
+from aiohttp import web
+import asyncio
+import logging
+from typing import (
+    List,
+    Set
+)
+import unittest
+
+from hummingbot.core.utils.http_session_registry import (
+    HTTPSessionRegistry,
+    ResponseTimeHistogram
+)
+
+
+class HTTPSessionRegistryUnitTest(unittest.TestCase):
+    REQUEST_DURATION = 0.1
+
+    @classmethod
+    def setUpClass(cls):
+        cls.ev_loop: asyncio.BaseEventLoop = asyncio.get_event_loop()
+        cls.peer_ports: Set[int] = set()
+        cls.active_requests: int = 0
+        cls.max_active_requests: int = 0
+
+        async def handler(request: web.Request) -> web.Response:
+            cls.peer_ports.add(request.transport.get_extra_info("peername")[1])
+            cls.active_requests += 1
+            cls.max_active_requests = max(cls.max_active_requests, cls.active_requests)
+            await asyncio.sleep(cls.REQUEST_DURATION)
+            cls.active_requests -= 1
+            return web.json_response({"path": request.path})
+
+        app: web.Application = web.Application()
+        app.router.add_get("/{path}", handler)
+        cls.runner: web.AppRunner = web.AppRunner(app)
+        cls.ev_loop.run_until_complete(cls.runner.setup())
+        site: web.TCPSite = web.TCPSite(cls.runner, "127.0.0.1", 0)
+        cls.ev_loop.run_until_complete(site.start())
+        cls.base_url: str = f"http://127.0.0.1:{site._server.sockets[0].getsockname()[1]}"
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.ev_loop.run_until_complete(cls.runner.cleanup())
+
+    def setUp(self):
+        self.peer_ports.clear()
+        type(self).max_active_requests = 0
+        self.registry: HTTPSessionRegistry = HTTPSessionRegistry()
+
+    def tearDown(self):
+        self.ev_loop.run_until_complete(self.registry.close())
+
+    async def get(self, path: str):
+        session: aiohttp.ClientSession = self.registry.get_session(self.base_url)
+        async with session.get(f"{self.base_url}/{path}") as response:
+            return await response.json()
+
+    def test_session_per_host(self):
+        async def check_sessions():
+            session: aiohttp.ClientSession = self.registry.get_session(f"{self.base_url}/a")
+            self.assertIs(session, self.registry.get_session(f"{self.base_url}/b"))
+            self.assertIs(session, self.registry.get_session("127.0.0.1"))
+            self.assertIsNot(session, self.registry.get_session("https://api.example.com/c"))
+
+            # A closed session is replaced.
+            await session.close()
+            self.assertIsNot(session, self.registry.get_session(self.base_url))
+
+        self.ev_loop.run_until_complete(check_sessions())
+
+    def test_keep_alive(self):
+        for i in range(5):
+            self.assertEqual({"path": f"/{i}"}, self.ev_loop.run_until_complete(self.get(str(i))))
+        # The requests were all made on the same connection.
+        self.assertEqual(1, len(self.peer_ports))
+
+        histogram: ResponseTimeHistogram = self.registry.response_time_histograms["127.0.0.1"]
+        self.assertEqual(5, histogram.count)
+        self.assertEqual(0, histogram.error_count)
+        self.assertGreaterEqual(histogram.average, self.REQUEST_DURATION)
+        self.assertEqual(5, sum(histogram.counts[2:4]))
+
+        status_lines: List[str] = self.registry.format_status().split("\n")
+        self.assertEqual("  HTTP requests:", status_lines[0])
+        self.assertEqual(["127.0.0.1", "5", "0"], status_lines[2].split()[:3])
+
+    def test_connection_limit(self):
+        self.registry.set_host_connection_limit("127.0.0.1", 2)
+        results: List = self.ev_loop.run_until_complete(asyncio.gather(*[self.get(str(i)) for i in range(6)]))
+        self.assertEqual(6, len(results))
+        self.assertEqual(2, self.max_active_requests)
+        self.assertEqual(2, len(self.peer_ports))
+
+    def test_default_connection_limit(self):
+        self.registry.limit_per_host = 3
+        results: List = self.ev_loop.run_until_complete(asyncio.gather(*[self.get(str(i)) for i in range(6)]))
+        self.assertEqual(6, len(results))
+        self.assertEqual(3, self.max_active_requests)
+
+
+def main():
+    logging.basicConfig(level=logging.ERROR)
+    unittest.main()
+
+
+if __name__ == "__main__":
+    main()
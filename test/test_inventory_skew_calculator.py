@@ -5,11 +5,14 @@ from os.path import (
 )
 import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
 
+import numpy as np
 import unittest
 
 from hummingbot.strategy.pure_market_making.data_types import InventorySkewBidAskRatios
-from hummingbot.strategy.pure_market_making.inventory_skew_calculator import \
-    calculate_bid_ask_ratios_from_base_asset_ratio
+from hummingbot.strategy.pure_market_making.inventory_skew_calculator import (
+    calculate_bid_ask_ratios_from_base_asset_ratio,
+    calculate_bid_ask_ratios_from_base_asset_ratios
+)
 
 
 class InventorySkewCalculatorUnitTest(unittest.TestCase):
@@ -109,6 +112,26 @@ class InventorySkewCalculatorUnitTest(unittest.TestCase):
         self.assertAlmostEqual(0.0, bid_ask_ratios.bid_ratio)
         self.assertAlmostEqual(0.0, bid_ask_ratios.ask_ratio)
 
+    def test_portfolio_arrays(self):
+        portfolios = [
+            (85000.0, 10000.0, 0.0036, 0.03, 20000.0),
+            (8500.0, 10000.0, 0.0036, 0.03, 20000.0),
+            (95000.0, 10000.0, 0.0036, 0.03, 20000.0),
+            (100.0, 10.0, 1.0, 0.35, 200.0),
+            (10.0, 100.0, 1.0, 0.75, 200.0),
+            (0.0, 0.0, 0.0036, 0.03, 20000.0),
+            (0.0, 10000.0, 0.0036, 0.03, 20000.0),
+            (85000.0, 10000.0, 0.0036, 0.03, 0.0),
+            (10.0, 100.0, 0.0, 0.5, 20.0),
+        ]
+        bid_ratios, ask_ratios = calculate_bid_ask_ratios_from_base_asset_ratios(
+            *[np.array(values) for values in zip(*portfolios)]
+        )
+        for portfolio, bid_ratio, ask_ratio in zip(portfolios, bid_ratios, ask_ratios):
+            bid_ask_ratios: InventorySkewBidAskRatios = calculate_bid_ask_ratios_from_base_asset_ratio(*portfolio)
+            self.assertAlmostEqual(bid_ask_ratios.bid_ratio, bid_ratio)
+            self.assertAlmostEqual(bid_ask_ratios.ask_ratio, ask_ratio)
+
 
 if __name__ == "__main__":
     unittest.main()
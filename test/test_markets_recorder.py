@@ -0,0 +1,134 @@
+#!/usr/bin/env python
+
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+
+import asyncio
+from decimal import Decimal
+import logging
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+from typing import (
+    Any,
+    Dict,
+    List
+)
+
+from hummingbot.core.event.events import (
+    BuyOrderCreatedEvent,
+    MarketEvent,
+    OrderCancelledEvent,
+    OrderFilledEvent,
+    OrderType,
+    TradeFee,
+    TradeType
+)
+from hummingbot.market.markets_recorder import MarketsRecorder
+from hummingbot.model.order import Order
+from hummingbot.model.sql_connection_manager import (
+    SQLConnectionManager,
+    SQLConnectionType
+)
+from hummingbot.model.trade_fill import TradeFill
+
+
+class FakeMarket:
+    def __init__(self, display_name: str):
+        self.display_name: str = display_name
+        self.tracking_states: Dict[str, Any] = {}
+
+    @staticmethod
+    def split_trading_pair(trading_pair: str):
+        return trading_pair.split("-")
+
+    def add_listener(self, event_tag, listener):
+        pass
+
+    def remove_listener(self, event_tag, listener):
+        pass
+
+
+class MarketsRecorderUnitTest(unittest.TestCase):
+    config_file_path: str = "test_config.yml"
+
+    def setUp(self):
+        self.ev_loop: asyncio.BaseEventLoop = asyncio.get_event_loop()
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.data_path_patch = patch("hummingbot.market.markets_recorder.data_path", return_value=self.temp_dir.name)
+        self.data_path_patch.start()
+        self.sql: SQLConnectionManager = SQLConnectionManager(SQLConnectionType.TRADE_FILLS,
+                                                              db_path=join(self.temp_dir.name, "trades.sqlite"))
+        self.market: FakeMarket = FakeMarket("fake_exchange")
+        self.recorder: MarketsRecorder = MarketsRecorder(self.sql, [self.market], self.config_file_path, "pmm")
+
+    def tearDown(self):
+        self.recorder.stop()
+        self.data_path_patch.stop()
+        self.temp_dir.cleanup()
+
+    def simulate_order(self, order_id: str, filled: bool):
+        self.recorder._did_create_order(MarketEvent.BuyOrderCreated.value, self.market, BuyOrderCreatedEvent(
+            0, OrderType.LIMIT, "COINALPHA-HBOT", Decimal("1"), Decimal("100"), order_id
+        ))
+        self.market.tracking_states[order_id] = {"status": "open"}
+        if filled:
+            self.recorder._did_fill_order(MarketEvent.OrderFilled.value, self.market, OrderFilledEvent(
+                0, order_id, "COINALPHA-HBOT", TradeType.BUY, OrderType.LIMIT, Decimal("100"), Decimal("1"),
+                TradeFee(Decimal("0.01")), f"trade-{order_id}"
+            ))
+        else:
+            self.recorder._did_cancel_order(MarketEvent.OrderCancelled.value, self.market, OrderCancelledEvent(
+                0, order_id
+            ))
+
+    def test_batched_writes(self):
+        self.recorder.start()
+        order_ids: List[str] = [f"buy-COINALPHA-HBOT-{i:016d}" for i in range(50)]
+        for i, order_id in enumerate(order_ids):
+            self.simulate_order(order_id, i % 2 == 0)
+
+        # Nothing is written until the next write interval.
+        self.assertEqual(100, self.recorder.write_queue_depth)
+        with self.sql.begin() as session:
+            self.assertEqual(0, session.query(Order).count())
+
+        self.ev_loop.run_until_complete(asyncio.sleep(MarketsRecorder.WRITE_INTERVAL * 3))
+        self.assertEqual(0, self.recorder.write_queue_depth)
+        self.assertEqual(100, self.recorder.max_write_queue_depth)
+        self.assertEqual("  Database writes: 0 pending (peak 100).", self.recorder.format_status())
+        with self.sql.begin() as session:
+            orders: List[Order] = session.query(Order).order_by(Order.id).all()
+            self.assertEqual(order_ids, [order.id for order in orders])
+            self.assertEqual(["OrderFilled", "OrderCancelled"] * 25, [order.last_status for order in orders])
+            self.assertEqual(25, session.query(TradeFill).count())
+
+        saved_state: Dict[str, Any] = self.recorder.get_market_states(self.config_file_path, self.market).saved_state
+        self.assertEqual(50, len(saved_state))
+        with open(join(self.temp_dir.name, "trades_test_config.csv")) as fd:
+            # The header, and one row per trade.
+            self.assertEqual(26, len(fd.readlines()))
+
+    def test_flush_on_stop(self):
+        self.recorder.start()
+        self.simulate_order("buy-COINALPHA-HBOT-0000000000000001", True)
+        self.recorder.stop()
+        self.assertEqual(0, self.recorder.write_queue_depth)
+        self.assertEqual(1, len(self.recorder.get_trades_for_config(self.config_file_path)))
+        self.assertTrue(os.path.exists(join(self.temp_dir.name, "trades_test_config.csv")))
+
+    def test_queries_see_pending_writes(self):
+        self.recorder.start()
+        self.simulate_order("buy-COINALPHA-HBOT-0000000000000001", False)
+        orders: List[Order] = self.recorder.get_orders_for_config_and_market(self.config_file_path, self.market)
+        self.assertEqual(["OrderCancelled"], [order.last_status for order in orders])
+
+
+def main():
+    logging.basicConfig(level=logging.ERROR)
+    unittest.main()
+
+
+if __name__ == "__main__":
+    main()
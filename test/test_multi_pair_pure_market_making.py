@@ -0,0 +1,226 @@
+#!/usr/bin/env python
+
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+
+import asyncio
+from decimal import Decimal
+import logging
+import numpy as np
+from typing import (
+    List,
+    Tuple
+)
+import unittest
+
+from hummingbot.core.clock import Clock
+from hummingbot.core.clock_mode import ClockMode
+from hummingbot.core.data_type.limit_order import LimitOrder
+from hummingbot.market.paper_trade.market_config import MarketConfig
+from hummingbot.market.paper_trade.paper_trade_market import PaperTradeMarket
+from hummingbot.strategy.market_trading_pair_tuple import MarketTradingPairTuple
+from hummingbot.strategy.multi_pair_pure_market_making import (
+    MultiPairPureMarketMakingStrategy,
+    PairConfig
+)
+from hummingbot.strategy.pure_market_making.inventory_skew_calculator import (
+    calculate_bid_ask_ratios_from_base_asset_ratio,
+    calculate_total_order_size
+)
+from test.test_order_book_tracker import (
+    FakeOrderBookDataSource,
+    FakeOrderBookTracker
+)
+
+
+class FakeExchangeOrderBookTracker(FakeOrderBookTracker):
+    @property
+    def exchange_name(self) -> str:
+        return "binance"
+
+
+class FakeExchangeMarket:
+    @staticmethod
+    def split_trading_pair(trading_pair: str) -> Tuple[str, str]:
+        return tuple(trading_pair.split("-"))
+
+
+class MultiPairPureMarketMakingUnitTest(unittest.TestCase):
+    trading_pairs: List[str] = ["COIN-USDT", "TOKEN-USDT"]
+    start_timestamp: float = 1000.0
+
+    @classmethod
+    def setUpClass(cls):
+        cls.ev_loop: asyncio.BaseEventLoop = asyncio.get_event_loop()
+
+    def setUp(self):
+        tracker: FakeExchangeOrderBookTracker = FakeExchangeOrderBookTracker(
+            FakeOrderBookDataSource(self.trading_pairs), self.trading_pairs)
+        self.market: PaperTradeMarket = PaperTradeMarket(tracker, MarketConfig.default_config(), FakeExchangeMarket)
+        tracker.start()
+        self.ev_loop.run_until_complete(asyncio.wait_for(tracker._order_books_initialized.wait(), timeout=5))
+        self.assertTrue(self.market.ready)
+        self.tracker: FakeExchangeOrderBookTracker = tracker
+
+        # Mid prices of 100 for COIN-USDT and 10 for TOKEN-USDT.
+        self.market.order_books["COIN-USDT"].apply_numpy_snapshot(
+            np.array([[99, 10, 100]], dtype=np.float64), np.array([[101, 10, 100]], dtype=np.float64))
+        self.market.order_books["TOKEN-USDT"].apply_numpy_snapshot(
+            np.array([[9.9, 100, 100]], dtype=np.float64), np.array([[10.1, 100, 100]], dtype=np.float64))
+        self.market.set_balance("COIN", 50)
+        self.market.set_balance("TOKEN", 500)
+        self.market.set_balance("USDT", 10000)
+
+        self.market_infos: List[MarketTradingPairTuple] = [
+            MarketTradingPairTuple(self.market, trading_pair, *trading_pair.split("-"))
+            for trading_pair in self.trading_pairs
+        ]
+        self.clock: Clock = Clock(ClockMode.BACKTEST, tick_size=1.0, start_time=self.start_timestamp,
+                                  end_time=self.start_timestamp + 1000)
+        self.clock.add_iterator(self.market)
+
+    def tearDown(self):
+        self.tracker.stop()
+
+    def start_strategy(self, pair_configs: List[PairConfig]) -> MultiPairPureMarketMakingStrategy:
+        strategy: MultiPairPureMarketMakingStrategy = MultiPairPureMarketMakingStrategy(
+            self.market_infos, pair_configs, logging_options=0)
+        self.clock.add_iterator(strategy)
+        self.clock.backtest_til(self.start_timestamp)
+        return strategy
+
+    @staticmethod
+    def order_prices(orders: List[LimitOrder], trading_pair: str, is_buy: bool) -> List[Decimal]:
+        return sorted(order.price for order in orders if order.trading_pair == trading_pair and order.is_buy == is_buy)
+
+    def test_proposals(self):
+        base_config: PairConfig = PairConfig(bid_spread=Decimal("0.01"), ask_spread=Decimal("0.02"),
+                                             order_amount=Decimal(1))
+        strategy: MultiPairPureMarketMakingStrategy = self.start_strategy([
+            base_config,
+            base_config.with_overrides({"order_levels": 3, "order_level_spread": "0.01", "order_level_amount": 2})
+        ])
+
+        proposals = strategy.create_proposals()
+        self.assertEqual([Decimal("99")], [buy.price for buy in proposals["COIN-USDT"].buys])
+        self.assertEqual([Decimal("102")], [sell.price for sell in proposals["COIN-USDT"].sells])
+        self.assertEqual([Decimal("9.9"), Decimal("9.8"), Decimal("9.7")],
+                         [buy.price for buy in proposals["TOKEN-USDT"].buys])
+        self.assertEqual([Decimal("10.2"), Decimal("10.3"), Decimal("10.4")],
+                         [sell.price for sell in proposals["TOKEN-USDT"].sells])
+        self.assertEqual([Decimal(1), Decimal(3), Decimal(5)], [buy.size for buy in proposals["TOKEN-USDT"].buys])
+
+    def test_refresh_orders(self):
+        base_config: PairConfig = PairConfig(bid_spread=Decimal("0.01"), ask_spread=Decimal("0.01"),
+                                             order_amount=Decimal(1), order_refresh_time=10.0)
+        strategy: MultiPairPureMarketMakingStrategy = self.start_strategy([
+            base_config,
+            base_config.with_overrides({"order_refresh_time": 30})
+        ])
+        self.clock.backtest_til(self.start_timestamp + 1)
+        self.assertEqual(4, len(strategy.active_orders))
+        coin_order_ids: List[str] = [o.client_order_id for o in strategy.active_orders if o.trading_pair == "COIN-USDT"]
+        token_order_ids: List[str] = [o.client_order_id for o in strategy.active_orders
+                                      if o.trading_pair == "TOKEN-USDT"]
+
+        # Only the orders of COIN-USDT are due for a refresh.
+        self.clock.backtest_til(self.start_timestamp + 12)
+        self.assertEqual(4, len(strategy.active_orders))
+        self.assertTrue(all(o.client_order_id not in coin_order_ids
+                            for o in strategy.active_orders if o.trading_pair == "COIN-USDT"))
+        self.assertEqual(token_order_ids, [o.client_order_id for o in strategy.active_orders
+                                           if o.trading_pair == "TOKEN-USDT"])
+
+    def test_shared_budget(self):
+        # Both trading pairs want 200 USDT for their bids, only the first listed one gets it.
+        self.market.set_balance("USDT", 300)
+        base_config: PairConfig = PairConfig(bid_spread=Decimal("0.01"), ask_spread=Decimal("0.01"),
+                                             order_amount=Decimal(1), order_levels=2)
+        strategy: MultiPairPureMarketMakingStrategy = self.start_strategy([
+            base_config,
+            base_config.with_overrides({"order_amount": 10})
+        ])
+        proposals = strategy.create_proposals()
+        self.assertEqual(2, len(proposals["COIN-USDT"].buys))
+        self.assertEqual(1, len(proposals["TOKEN-USDT"].buys))
+        self.assertEqual(2, len(proposals["TOKEN-USDT"].sells))
+
+    def test_shared_budget_with_kept_orders(self):
+        self.market.set_balance("USDT", 250)
+        base_config: PairConfig = PairConfig(bid_spread=Decimal("0.01"), ask_spread=Decimal("0.01"),
+                                             order_amount=Decimal(1), order_refresh_time=10.0)
+        strategy: MultiPairPureMarketMakingStrategy = self.start_strategy([
+            base_config,
+            base_config.with_overrides({"order_amount": 10, "order_refresh_tolerance_pct": "0.05",
+                                        "order_refresh_time": 11})
+        ])
+        self.clock.backtest_til(self.start_timestamp + 1)
+        self.assertEqual([Decimal("99")], self.order_prices(strategy.active_orders, "COIN-USDT", True))
+        self.assertEqual([Decimal("9.9")], self.order_prices(strategy.active_orders, "TOKEN-USDT", True))
+        token_order_ids: List[str] = [o.client_order_id for o in strategy.active_orders
+                                      if o.trading_pair == "TOKEN-USDT"]
+        for order in strategy.active_orders:
+            if order.trading_pair == "COIN-USDT":
+                self.market.cancel(order.trading_pair, order.client_order_id)
+
+        # The COIN-USDT orders are placed again in the tick that refreshes the TOKEN-USDT ones. The COIN-USDT bid
+        # needs 198 USDT, of the 151 USDT available. The TOKEN-USDT orders are within tolerance and stay, so the 99 USDT
+        # on their bid isn't available to COIN-USDT.
+        self.market.order_books["COIN-USDT"].apply_numpy_snapshot(
+            np.array([[198, 10, 101]], dtype=np.float64), np.array([[202, 10, 101]], dtype=np.float64))
+        self.clock.backtest_til(self.start_timestamp + 12)
+        self.assertEqual(token_order_ids, [o.client_order_id for o in strategy.active_orders
+                                           if o.trading_pair == "TOKEN-USDT"])
+        self.assertEqual([], self.order_prices(strategy.active_orders, "COIN-USDT", True))
+        self.assertEqual([Decimal("202")], self.order_prices(strategy.active_orders, "COIN-USDT", False))
+
+    def test_price_band(self):
+        base_config: PairConfig = PairConfig(bid_spread=Decimal("0.01"), ask_spread=Decimal("0.01"),
+                                             order_amount=Decimal(1))
+        strategy: MultiPairPureMarketMakingStrategy = self.start_strategy([
+            base_config.with_overrides({"price_ceiling": 100}),
+            base_config.with_overrides({"price_floor": 11})
+        ])
+        self.clock.backtest_til(self.start_timestamp + 1)
+        self.assertEqual([], self.order_prices(strategy.active_orders, "COIN-USDT", True))
+        self.assertEqual([Decimal("101")], self.order_prices(strategy.active_orders, "COIN-USDT", False))
+        self.assertEqual([Decimal("9.9")], self.order_prices(strategy.active_orders, "TOKEN-USDT", True))
+        self.assertEqual([], self.order_prices(strategy.active_orders, "TOKEN-USDT", False))
+
+    def test_inventory_skew(self):
+        base_config: PairConfig = PairConfig(bid_spread=Decimal("0.01"), ask_spread=Decimal("0.01"),
+                                             order_amount=Decimal(1), order_levels=2, inventory_skew_enabled=True,
+                                             inventory_target_base_pct=Decimal("0.5"),
+                                             inventory_range_multiplier=Decimal(100))
+        strategy: MultiPairPureMarketMakingStrategy = self.start_strategy([base_config, base_config])
+        proposals = strategy.create_proposals()
+
+        for trading_pair, base_balance, mid_price in (("COIN-USDT", 50, 100), ("TOKEN-USDT", 500, 10)):
+            bid_ratio, ask_ratio = calculate_bid_ask_ratios_from_base_asset_ratio(
+                base_balance, 10000, mid_price, 0.5,
+                float(calculate_total_order_size(Decimal(1), Decimal(0), 2) * 100)
+            )
+            self.assertAlmostEqual(bid_ratio, float(proposals[trading_pair].buys[0].size), places=4)
+            self.assertAlmostEqual(ask_ratio, float(proposals[trading_pair].sells[0].size), places=4)
+
+    def test_pair_config_validation(self):
+        base_config: PairConfig = PairConfig(bid_spread=Decimal("0.01"), ask_spread=Decimal("0.01"),
+                                             order_amount=Decimal(1))
+        with self.assertRaises(ValueError):
+            base_config.with_overrides({"hanging_orders_enabled": True})
+        with self.assertRaises(ValueError):
+            MultiPairPureMarketMakingStrategy(self.market_infos, [base_config])
+        with self.assertRaises(ValueError):
+            MultiPairPureMarketMakingStrategy(
+                self.market_infos,
+                [base_config, base_config.with_overrides({"price_ceiling": 5, "price_floor": 10})]
+            )
+
+
+def main():
+    logging.basicConfig(level=logging.ERROR)
+    unittest.main()
+
+
+if __name__ == "__main__":
+    main()
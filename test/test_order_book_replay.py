@@ -0,0 +1,164 @@
+#!/usr/bin/env python
+
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+
+import asyncio
+import logging
+import math
+import numpy as np
+import tempfile
+import unittest
+
+from hummingbot.core.clock import Clock
+from hummingbot.core.clock_mode import ClockMode
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_message import (
+    OrderBookMessage,
+    OrderBookMessageType
+)
+from hummingbot.core.data_type.order_book_recorder import (
+    OrderBookRecordChunk,
+    OrderBookRecorder
+)
+from hummingbot.core.data_type.order_book_replay_data_source import OrderBookReplayDataSource
+from hummingbot.core.data_type.order_book_replay_tracker import OrderBookReplayTracker
+from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
+from hummingbot.core.event.events import TradeType
+from test.test_order_book_tracker import FakeOrderBookDataSource
+
+
+def diff_message(trading_pair: str, update_id: int, bids, asks) -> OrderBookMessage:
+    return OrderBookMessage(OrderBookMessageType.DIFF, {
+        "trading_pair": trading_pair, "update_id": update_id, "bids": bids, "asks": asks
+    })
+
+
+def trade_message(trading_pair: str, trade_id: int, price: float, amount: float) -> OrderBookMessage:
+    return OrderBookMessage(OrderBookMessageType.TRADE, {
+        "trading_pair": trading_pair, "trade_id": trade_id, "trade_type": float(TradeType.BUY.value),
+        "price": price, "amount": amount
+    })
+
+
+class OrderBookReplayUnitTest(unittest.TestCase):
+    trading_pair: str = "COIN-USDT"
+
+    @classmethod
+    def setUpClass(cls):
+        cls.ev_loop: asyncio.BaseEventLoop = asyncio.get_event_loop()
+
+    def setUp(self):
+        self._record_dir = tempfile.TemporaryDirectory()
+        self.record_dir: str = self._record_dir.name
+
+    def tearDown(self):
+        self._record_dir.cleanup()
+
+    def record(self) -> OrderBook:
+        """
+        Records two 100 second chunks of a single order book, and returns the recorded order book.
+        """
+        order_book: OrderBook = OrderBook()
+        order_book.apply_numpy_snapshot(np.array([[99, 1, 10]], dtype=np.float64),
+                                        np.array([[101, 1, 10]], dtype=np.float64))
+        recorder: OrderBookRecorder = OrderBookRecorder(self.record_dir, chunk_duration=100.0)
+
+        async def record_messages():
+            recorder.start({self.trading_pair: order_book})
+            await asyncio.sleep(0)
+            recorder.check_chunks(1000.0)
+            for i in range(1, 150):
+                message: OrderBookMessage = diff_message(self.trading_pair, 10 + i, [[f"{99 - i * 0.01:.2f}", "1"]],
+                                                         [])
+                order_book.apply_numpy_diffs(message.bids_array, message.asks_array, message.update_id)
+                recorder.record_message(message, 1000.0 + i)
+                recorder.check_chunks(1000.0 + i)
+            recorder.record_message(trade_message(self.trading_pair, 1, 100.5, 2.0), 1150.0)
+            recorder.stop()
+
+        self.ev_loop.run_until_complete(record_messages())
+        return order_book
+
+    def test_record_chunks(self):
+        self.record()
+        chunk_paths = OrderBookRecorder.chunk_paths(self.record_dir, self.trading_pair)
+        self.assertEqual([1000.0, 1100.0], [timestamp for timestamp, _ in chunk_paths])
+
+        chunk: OrderBookRecordChunk = OrderBookRecordChunk.load(chunk_paths[1][1])
+        # The second chunk starts with a snapshot of the order book, and ends with the trade.
+        self.assertEqual(OrderBookMessageType.SNAPSHOT.value, chunk.message_types[0])
+        self.assertEqual(110, chunk.update_ids[0])
+        self.assertEqual(1 + 100, chunk.num_bids[0])
+        self.assertEqual([OrderBookMessageType.DIFF.value] * 49, chunk.message_types[1:-1].tolist())
+        self.assertEqual(OrderBookMessageType.TRADE.value, chunk.message_types[-1])
+        self.assertEqual(TradeType.BUY.value, chunk.trade_types[-1])
+        self.assertEqual([100.5, 2.0], chunk.rows[-1].tolist())
+
+    def test_replay(self):
+        recorded_order_book: OrderBook = self.record()
+        data_source: OrderBookReplayDataSource = OrderBookReplayDataSource(self.record_dir, [self.trading_pair],
+                                                                           start_time=1050.0)
+        order_book: OrderBook = data_source.create_order_book(self.trading_pair)
+        self.assertEqual(60, order_book.last_diff_uid)
+        self.assertEqual(1051.0, data_source.next_message_timestamp)
+
+        data_source.replay_til(1120.5)
+        self.assertEqual(130, order_book.last_diff_uid)
+        data_source.replay_til(1200.0)
+        self.assertTrue(math.isinf(data_source.next_message_timestamp))
+        self.assertEqual(100.5, order_book.last_trade_price)
+        for recorded_side, replayed_side in zip(recorded_order_book.numpy_snapshot, order_book.numpy_snapshot):
+            self.assertEqual(recorded_side[:, :2].tolist(), replayed_side[:, :2].tolist())
+
+        # A replay starting after the first chunk starts with the snapshot of the second one.
+        data_source = OrderBookReplayDataSource(self.record_dir, [self.trading_pair], start_time=1100.0)
+        self.assertEqual(110, data_source.create_order_book(self.trading_pair).snapshot_uid)
+
+        with self.assertRaises(ValueError):
+            OrderBookReplayDataSource(self.record_dir, ["NONE-USDT"])
+
+    def test_fast_forward_backtest(self):
+        self.record()
+        tracker: OrderBookReplayTracker = OrderBookReplayTracker(self.record_dir, [self.trading_pair],
+                                                                 start_time=1000.0)
+        tracker.start()
+        self.ev_loop.run_until_complete(asyncio.wait_for(tracker._order_books_initialized.wait(), timeout=5))
+        order_book: OrderBook = tracker.order_books[self.trading_pair]
+
+        # The clock stops once all the data is replayed.
+        clock: Clock = Clock(ClockMode.BACKTEST, tick_size=0.5, start_time=1000.0, end_time=float("nan"),
+                             fast_forward=True)
+        clock.add_iterator(tracker.time_iterator)
+        clock.backtest()
+        tracker.stop()
+        self.assertEqual(1150.5, clock.current_timestamp)
+        self.assertEqual(159, order_book.last_diff_uid)
+        self.assertEqual(100.5, order_book.last_trade_price)
+        self.assertGreater(clock.skipped_tick_count, 100)
+
+    def test_record_tracker(self):
+        trading_pairs = ["COIN0-USDT", "COIN1-USDT"]
+        tracker: OrderBookTracker = OrderBookTracker(FakeOrderBookDataSource(trading_pairs), trading_pairs)
+        tracker.order_book_recorder = OrderBookRecorder(self.record_dir)
+        tracker.start()
+        self.ev_loop.run_until_complete(asyncio.sleep(1.5))
+        tracker.stop()
+
+        data_source: OrderBookReplayDataSource = OrderBookReplayDataSource(self.record_dir, trading_pairs)
+        for trading_pair in trading_pairs:
+            order_book: OrderBook = data_source.create_order_book(trading_pair)
+            data_source.replay_til(math.inf)
+            # The diffs were received before the order book snapshot, which they are replayed on top of.
+            self.assertEqual([100, 99], [row.price for row in order_book.bid_entries()])
+            self.assertEqual(tracker.order_books[trading_pair].numpy_snapshot[1][:, :2].tolist(),
+                             order_book.numpy_snapshot[1][:, :2].tolist())
+
+
+def main():
+    logging.basicConfig(level=logging.ERROR)
+    unittest.main()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,237 @@
+#!/usr/bin/env python
+
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+
+import asyncio
+import logging
+import numpy as np
+import tempfile
+import time
+import unittest
+from typing import List
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_message import (
+    OrderBookMessage,
+    OrderBookMessageType
+)
+from hummingbot.core.data_type.order_book_snapshot_cache import OrderBookSnapshotCache
+from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
+from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
+from hummingbot.core.event.events import TradeType
+from hummingbot.market.binance.binance_order_book_tracker import BinanceOrderBookTracker
+
+
+class FakeOrderBookDataSource(OrderBookTrackerDataSource):
+    SNAPSHOT_DELAY = 0.2
+
+    def __init__(self, trading_pairs: List[str]):
+        super().__init__(trading_pairs)
+        self.active_requests: int = 0
+        self.max_active_requests: int = 0
+
+    async def get_new_order_book(self, trading_pair: str) -> OrderBook:
+        self.active_requests += 1
+        self.max_active_requests = max(self.max_active_requests, self.active_requests)
+        try:
+            await asyncio.sleep(self.SNAPSHOT_DELAY)
+            order_book: OrderBook = self.order_book_create_function()
+            snapshot: OrderBookMessage = OrderBookMessage(OrderBookMessageType.SNAPSHOT, {
+                "trading_pair": trading_pair,
+                "update_id": 10,
+                "bids": [["99", "1"]],
+                "asks": [["101", "1"]]
+            }, timestamp=time.time())
+            order_book.apply_numpy_snapshot(snapshot.bids_array, snapshot.asks_array, snapshot.update_id)
+            return order_book
+        finally:
+            self.active_requests -= 1
+
+    async def listen_for_order_book_diffs(self, ev_loop: asyncio.BaseEventLoop, output: asyncio.Queue):
+        for trading_pair in self._trading_pairs:
+            for update_id, price in ((9, "98"), (11, "100")):
+                output.put_nowait(OrderBookMessage(OrderBookMessageType.DIFF, {
+                    "trading_pair": trading_pair,
+                    "update_id": update_id,
+                    "bids": [[price, "2"]],
+                    "asks": []
+                }, timestamp=time.time()))
+        await asyncio.sleep(3600)
+
+    async def listen_for_order_book_snapshots(self, ev_loop: asyncio.BaseEventLoop, output: asyncio.Queue):
+        await asyncio.sleep(3600)
+
+    async def listen_for_trades(self, ev_loop: asyncio.BaseEventLoop, output: asyncio.Queue):
+        await asyncio.sleep(3600)
+
+    @classmethod
+    async def get_last_traded_prices(cls, trading_pairs: List[str]):
+        return {trading_pair: 100.0 for trading_pair in trading_pairs}
+
+
+class FakeStreamingOrderBookDataSource(FakeOrderBookDataSource):
+    """
+    Streams a snapshot newer than the REST snapshot, and a trade, for each trading pair before its REST snapshot.
+    """
+    async def listen_for_order_book_snapshots(self, ev_loop: asyncio.BaseEventLoop, output: asyncio.Queue):
+        for trading_pair in self._trading_pairs:
+            output.put_nowait(OrderBookMessage(OrderBookMessageType.SNAPSHOT, {
+                "trading_pair": trading_pair,
+                "update_id": 12,
+                "bids": [["99.5", "3"]],
+                "asks": [["100.5", "3"]]
+            }, timestamp=time.time()))
+        await asyncio.sleep(3600)
+
+    async def listen_for_trades(self, ev_loop: asyncio.BaseEventLoop, output: asyncio.Queue):
+        for trading_pair in self._trading_pairs:
+            output.put_nowait(OrderBookMessage(OrderBookMessageType.TRADE, {
+                "trading_pair": trading_pair,
+                "trade_type": float(TradeType.BUY.value),
+                "price": "100.25",
+                "amount": "1"
+            }, timestamp=time.time()))
+        await asyncio.sleep(3600)
+
+
+class FakeOrderBookTracker(OrderBookTracker):
+    SNAPSHOT_INIT_CONCURRENCY = 4
+    SNAPSHOT_RATE_LIMIT = (100, 1.0)
+
+
+class ThrottledOrderBookTracker(OrderBookTracker):
+    SNAPSHOT_INIT_CONCURRENCY = 12
+    SNAPSHOT_RATE_LIMIT = (5, 1.0)
+
+
+class OrderBookTrackerUnitTest(unittest.TestCase):
+    trading_pairs: List[str] = [f"COIN{i}-USDT" for i in range(12)]
+
+    def setUp(self):
+        self.ev_loop: asyncio.BaseEventLoop = asyncio.get_event_loop()
+        self.data_source: FakeOrderBookDataSource = FakeOrderBookDataSource(self.trading_pairs)
+        self.tracker: FakeOrderBookTracker = FakeOrderBookTracker(self.data_source, self.trading_pairs)
+
+    def tearDown(self):
+        self.tracker.stop()
+
+    async def wait_til_ready(self):
+        while not self.tracker.ready:
+            await asyncio.sleep(0.05)
+        # Let the tracking tasks process the saved diff messages.
+        await asyncio.sleep(0.1)
+
+    def test_concurrent_initialization(self):
+        self.tracker.start()
+        start: float = time.time()
+        self.ev_loop.run_until_complete(asyncio.wait_for(self.wait_til_ready(), timeout=10))
+        elapsed: float = time.time() - start
+
+        self.assertEqual(4, self.data_source.max_active_requests)
+        # 12 snapshots of 0.2s each, 4 at a time.
+        self.assertLess(elapsed, 12 * FakeOrderBookDataSource.SNAPSHOT_DELAY)
+        self.assertEqual(set(self.trading_pairs), set(self.tracker.order_books.keys()))
+        for order_book in self.tracker.order_books.values():
+            # The diff received before the snapshot and newer than it is replayed, the older one is dropped.
+            self.assertEqual([100, 99], [row.price for row in order_book.bid_entries()])
+            self.assertEqual(11, order_book.last_diff_uid)
+
+    def test_snapshot_throttler(self):
+        self.tracker = ThrottledOrderBookTracker(self.data_source, self.trading_pairs)
+        self.tracker.start()
+        start: float = time.time()
+        self.ev_loop.run_until_complete(asyncio.wait_for(self.wait_til_ready(), timeout=10))
+        # At most 4 requests (weight 1 each) fit in every 1 second period.
+        self.assertGreater(time.time() - start, 2.0)
+
+    def test_early_messages(self):
+        # The snapshots and trades streamed before an order book's REST snapshot arrives are kept until it is tracked.
+        self.data_source = FakeStreamingOrderBookDataSource(self.trading_pairs)
+        self.tracker = FakeOrderBookTracker(self.data_source, self.trading_pairs)
+        self.tracker.start()
+        self.ev_loop.run_until_complete(asyncio.wait_for(self.wait_til_ready(), timeout=10))
+        for order_book in self.tracker.order_books.values():
+            self.assertEqual(12, order_book.snapshot_uid)
+            self.assertEqual([99.5], [row.price for row in order_book.bid_entries()])
+            self.assertEqual(100.5, order_book.get_price(True))
+            self.assertEqual(100.25, order_book.last_trade_price)
+
+    def save_snapshot_cache(self, cache_dir: str, update_id: int) -> OrderBookSnapshotCache:
+        snapshot_cache: OrderBookSnapshotCache = OrderBookSnapshotCache(cache_dir)
+        cached_order_book: OrderBook = OrderBook()
+        cached_order_book.apply_numpy_snapshot(np.array([[97, 3, update_id], [96, 1, update_id]], dtype=np.float64),
+                                               np.array([[102, 4, update_id]], dtype=np.float64))
+        for trading_pair in self.trading_pairs:
+            snapshot_cache.save(trading_pair, cached_order_book)
+        return snapshot_cache
+
+    def test_snapshot_cache(self):
+        with tempfile.TemporaryDirectory() as cache_dir:
+            self.assertIsNone(OrderBookSnapshotCache(cache_dir).load(self.trading_pairs[0]))
+            snapshot_cache: OrderBookSnapshotCache = self.save_snapshot_cache(cache_dir, 8)
+            entry = snapshot_cache.load(self.trading_pairs[0])
+            self.assertEqual(8, entry.update_id)
+            self.assertEqual([[97, 3, 8], [96, 1, 8]], entry.bids.tolist())
+            self.assertEqual([[102, 4, 8]], entry.asks.tolist())
+
+            # The first diff (update ID 9) continues from the cached snapshots, so the order books are ready before
+            # any REST snapshot arrives.
+            self.tracker.snapshot_cache = snapshot_cache
+            self.tracker.start()
+            self.ev_loop.run_until_complete(asyncio.sleep(0.05))
+            self.assertTrue(self.tracker.ready)
+            for order_book in self.tracker.order_books.values():
+                self.assertEqual(8, order_book.snapshot_uid)
+                self.assertEqual(102, order_book.get_price(True))
+                self.assertEqual([100, 98, 97, 96], [row.price for row in order_book.bid_entries()])
+
+            # The REST snapshots replace the cached ones, and the newer diffs are applied on top.
+            self.ev_loop.run_until_complete(asyncio.sleep(1.0))
+            for order_book in self.tracker.order_books.values():
+                self.assertEqual([100, 99], [row.price for row in order_book.bid_entries()])
+                self.assertEqual(101, order_book.get_price(True))
+
+            self.tracker.stop()
+            entry = snapshot_cache.load(self.trading_pairs[0])
+            self.assertEqual(11, entry.update_id)
+            self.assertEqual([100, 99], entry.bids[:, 0].tolist())
+
+            self.assertIsNone(OrderBookSnapshotCache(cache_dir, max_age=-1).load(self.trading_pairs[0]))
+
+    def test_snapshot_cache_update_gap(self):
+        with tempfile.TemporaryDirectory() as cache_dir:
+            # The first diff (update ID 9) does not continue from the cached snapshots (update ID 5).
+            self.tracker.snapshot_cache = self.save_snapshot_cache(cache_dir, 5)
+            self.tracker.start()
+            self.ev_loop.run_until_complete(asyncio.sleep(0.1))
+            self.assertFalse(self.tracker.ready)
+            self.assertEqual(0, len(self.tracker.order_books))
+
+            # The order books are initialized from the REST snapshots instead.
+            self.ev_loop.run_until_complete(asyncio.wait_for(self.wait_til_ready(), timeout=10))
+            for order_book in self.tracker.order_books.values():
+                self.assertEqual(10, order_book.snapshot_uid)
+                self.assertEqual([100, 99], [row.price for row in order_book.bid_entries()])
+                self.assertEqual(101, order_book.get_price(True))
+
+    def test_snapshot_cache_exchange_tracker(self):
+        # Exchange trackers route their diffs themselves, and promote the cached order books all the same.
+        self.tracker = BinanceOrderBookTracker(self.trading_pairs)
+        self.tracker._data_source = self.data_source
+        with tempfile.TemporaryDirectory() as cache_dir:
+            self.tracker.snapshot_cache = self.save_snapshot_cache(cache_dir, 8)
+            self.tracker.start()
+            self.ev_loop.run_until_complete(asyncio.sleep(0.05))
+            self.assertTrue(self.tracker.ready)
+            for order_book in self.tracker.order_books.values():
+                self.assertEqual(8, order_book.snapshot_uid)
+                self.assertEqual([100, 98, 97, 96], [row.price for row in order_book.bid_entries()])
+
+
+def main():
+    logging.basicConfig(level=logging.ERROR)
+    unittest.main()
+
+
+if __name__ == "__main__":
+    main()
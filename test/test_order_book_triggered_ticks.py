@@ -0,0 +1,83 @@
+#!/usr/bin/env python
+
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+
+import asyncio
+import logging
+import numpy as np
+import time
+import unittest
+
+from hummingbot.core.clock import Clock
+from hummingbot.core.clock_mode import ClockMode
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.strategy.strategy_base import StrategyBase
+
+
+class TickTriggeredStrategy(StrategyBase):
+    @classmethod
+    def logger(cls) -> logging.Logger:
+        return logging.getLogger(__name__)
+
+
+class OrderBookTriggeredTicksUnitTest(unittest.TestCase):
+    DEBOUNCE = 0.05
+    MIN_INTERVAL = 0.3
+
+    @classmethod
+    def setUpClass(cls):
+        cls.ev_loop: asyncio.BaseEventLoop = asyncio.get_event_loop()
+
+    def setUp(self):
+        self.order_book: OrderBook = OrderBook()
+        self.order_book.apply_numpy_snapshot(np.array([[99, 1, 1]], dtype=np.float64),
+                                             np.array([[101, 1, 1]], dtype=np.float64))
+        self.strategy: TickTriggeredStrategy = TickTriggeredStrategy()
+        self.strategy.add_tick_trigger_order_books([self.order_book], self.DEBOUNCE, self.MIN_INTERVAL)
+
+    def apply_bid(self, price: float):
+        self.order_book.apply_numpy_diffs(np.array([[price, 1, 2]], dtype=np.float64), np.empty((0, 3)))
+
+    def test_triggered_ticks(self):
+        clock: Clock = Clock(ClockMode.REALTIME)
+        self.strategy.start(clock)
+        start_timestamp: float = self.strategy.current_timestamp
+
+        # The first change ticks the strategy after the debounce delay, the burst that follows is held back until the
+        # minimum interval is over - and then makes a single tick.
+        self.ev_loop.run_until_complete(asyncio.sleep(self.MIN_INTERVAL))
+        self.apply_bid(100)
+        self.ev_loop.run_until_complete(asyncio.sleep(self.DEBOUNCE * 2))
+        first_tick: float = self.strategy.current_timestamp
+        self.assertGreater(first_tick, start_timestamp)
+        for price in (99.5, 100.5, 99.8):
+            self.apply_bid(price)
+        self.ev_loop.run_until_complete(asyncio.sleep(self.DEBOUNCE * 2))
+        self.assertEqual(first_tick, self.strategy.current_timestamp)
+        self.ev_loop.run_until_complete(asyncio.sleep(self.MIN_INTERVAL))
+        self.assertGreaterEqual(self.strategy.current_timestamp - first_tick, self.MIN_INTERVAL)
+        self.assertLessEqual(self.strategy.current_timestamp, time.time())
+
+        # No more ticks once the strategy is stopped.
+        self.strategy.stop(clock)
+        self.apply_bid(100.2)
+        self.ev_loop.run_until_complete(asyncio.sleep(self.DEBOUNCE * 2))
+        self.assertTrue(np.isnan(self.strategy.current_timestamp))
+
+    def test_backtest_mode(self):
+        # Back tests are driven by the clock alone.
+        clock: Clock = Clock(ClockMode.BACKTEST, start_time=1000.0)
+        self.strategy.start(clock)
+        self.apply_bid(100)
+        self.ev_loop.run_until_complete(asyncio.sleep(self.DEBOUNCE * 2))
+        self.assertEqual(1000.0, self.strategy.current_timestamp)
+
+
+def main():
+    logging.basicConfig(level=logging.ERROR)
+    unittest.main()
+
+
+if __name__ == "__main__":
+    main()
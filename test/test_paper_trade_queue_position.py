@@ -0,0 +1,179 @@
+#!/usr/bin/env python
+
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+
+import asyncio
+from decimal import Decimal
+import logging
+import numpy as np
+from typing import (
+    List,
+    Tuple
+)
+import unittest
+
+from hummingbot.core.clock import Clock
+from hummingbot.core.clock_mode import ClockMode
+from hummingbot.core.data_type.composite_order_book import CompositeOrderBook
+from hummingbot.core.event.event_logger import EventLogger
+from hummingbot.core.event.events import (
+    BuyOrderCompletedEvent,
+    MarketEvent,
+    OrderBookTradeEvent,
+    OrderFilledEvent,
+    OrderType,
+    TradeType
+)
+from hummingbot.market.paper_trade.market_config import MarketConfig
+from hummingbot.market.paper_trade.paper_trade_market import PaperTradeMarket
+from test.test_order_book_tracker import (
+    FakeOrderBookDataSource,
+    FakeOrderBookTracker
+)
+
+
+class FakeExchangeOrderBookTracker(FakeOrderBookTracker):
+    @property
+    def exchange_name(self) -> str:
+        return "binance"
+
+
+class FakeExchangeMarket:
+    @staticmethod
+    def split_trading_pair(trading_pair: str) -> Tuple[str, str]:
+        return tuple(trading_pair.split("-"))
+
+
+class PaperTradeQueuePositionUnitTest(unittest.TestCase):
+    trading_pair: str = "COIN-USDT"
+    events: List[MarketEvent] = [
+        MarketEvent.OrderFilled,
+        MarketEvent.BuyOrderCompleted,
+        MarketEvent.SellOrderCompleted
+    ]
+
+    @classmethod
+    def setUpClass(cls):
+        cls.ev_loop: asyncio.BaseEventLoop = asyncio.get_event_loop()
+
+    def setUp(self):
+        tracker: FakeExchangeOrderBookTracker = FakeExchangeOrderBookTracker(
+            FakeOrderBookDataSource([self.trading_pair]), [self.trading_pair])
+        self.market: PaperTradeMarket = PaperTradeMarket(tracker, MarketConfig.default_config(), FakeExchangeMarket)
+        tracker.start()
+        self.ev_loop.run_until_complete(asyncio.wait_for(tracker._order_books_initialized.wait(), timeout=5))
+        self.assertTrue(self.market.ready)
+        self.tracker: FakeExchangeOrderBookTracker = tracker
+
+        self.order_book: CompositeOrderBook = self.market.order_books[self.trading_pair]
+        self.order_book.apply_numpy_snapshot(np.array([[99, 10, 100], [100, 5, 100]], dtype=np.float64),
+                                             np.array([[101, 5, 100]], dtype=np.float64))
+        self.market.set_balance("COIN", 100)
+        self.market.set_balance("USDT", 10000)
+        self.clock: Clock = Clock(ClockMode.BACKTEST, tick_size=1.0, start_time=1000.0, end_time=2000.0)
+        self.clock.add_iterator(self.market)
+        self.clock.backtest_til(1000.0)
+
+        self.market_logger: EventLogger = EventLogger()
+        for event_tag in self.events:
+            self.market.add_listener(event_tag, self.market_logger)
+
+    def tearDown(self):
+        self.tracker.stop()
+
+    def apply_bid(self, price: float, amount: float):
+        self.order_book.apply_numpy_diffs(np.array([[price, amount, 101]], dtype=np.float64), np.empty((0, 3)))
+
+    def apply_trade(self, trade_type: TradeType, price: float, amount: float):
+        self.order_book.apply_trade(OrderBookTradeEvent(self.trading_pair, 1000.0, trade_type, price, amount))
+
+    def filled_amounts(self) -> List[Decimal]:
+        return [event.amount for event in self.market_logger.event_log if isinstance(event, OrderFilledEvent)]
+
+    def test_partial_fills(self):
+        order_id: str = self.market.buy(self.trading_pair, 2, OrderType.LIMIT, 100)
+        self.assertEqual(5, self.market.queue_positions[order_id].volume_ahead)
+
+        # Cancellations at the price level come off the volume ahead, additions go behind the order.
+        self.apply_bid(100, 3)
+        self.apply_bid(100, 6)
+        self.clock.backtest_til(1001.0)
+        self.assertEqual(3, self.market.queue_positions[order_id].volume_ahead)
+
+        # Trades at the order price after QUEUE_MATCH_WINDOW consume the volume ahead, and then fill the order.
+        self.clock.backtest_til(1001.0 + PaperTradeMarket.QUEUE_MATCH_WINDOW + 1)
+        self.apply_trade(TradeType.SELL, 100, 2)
+        self.assertEqual([], self.filled_amounts())
+        self.assertEqual(1, self.market.queue_positions[order_id].volume_ahead)
+        self.apply_trade(TradeType.SELL, 100, 2)
+        self.assertEqual([Decimal(1)], self.filled_amounts())
+        self.assertEqual(Decimal(1), self.market.queue_positions[order_id].filled_amount)
+        self.assertEqual(Decimal(100), self.market.on_hold_balances["USDT"])
+        self.assertEqual(Decimal(10000 - 100), self.market.get_balance("USDT"))
+        self.assertEqual(0, len(self.market_logger.events_of_type(BuyOrderCompletedEvent)))
+
+        # Trades past the order price fill the rest of it.
+        self.apply_trade(TradeType.SELL, 99.5, 0.1)
+        self.assertEqual([Decimal(1), Decimal(1)], self.filled_amounts())
+        completed_event: BuyOrderCompletedEvent = self.market_logger.events_of_type(BuyOrderCompletedEvent)[0]
+        self.assertEqual(Decimal(2), completed_event.base_asset_amount)
+        self.assertEqual(Decimal(200), completed_event.quote_asset_amount)
+        self.assertNotIn(order_id, self.market.queue_positions)
+        self.assertEqual(0, len(self.market.limit_orders))
+        self.assertEqual(Decimal(102), self.market.get_balance("COIN"))
+
+    def test_diff_before_trade(self):
+        order_id: str = self.market.buy(self.trading_pair, 2, OrderType.LIMIT, 100)
+        self.assertEqual(5, self.market.queue_positions[order_id].volume_ahead)
+
+        # The level decrease of a trade arrives before the trade, the trade volume is only taken off once.
+        self.apply_bid(100, 2)
+        self.apply_trade(TradeType.SELL, 100, 3)
+        self.assertEqual(2, self.market.queue_positions[order_id].volume_ahead)
+        self.assertEqual([], self.filled_amounts())
+
+        # The trade arrives before its level decrease.
+        self.apply_trade(TradeType.SELL, 100, 1)
+        self.assertEqual(1, self.market.queue_positions[order_id].volume_ahead)
+        self.apply_bid(100, 1)
+        self.clock.backtest_til(1001.0)
+        self.assertEqual(1, self.market.queue_positions[order_id].volume_ahead)
+
+        # The trade volume past the level decrease fills the order.
+        self.apply_bid(100, 0)
+        self.apply_trade(TradeType.SELL, 100, 2)
+        self.assertEqual([Decimal(1)], self.filled_amounts())
+        self.assertEqual(0, self.market.queue_positions[order_id].volume_ahead)
+
+    def test_orders_at_same_price(self):
+        first_order_id: str = self.market.sell(self.trading_pair, 1, OrderType.LIMIT, 101)
+        second_order_id: str = self.market.sell(self.trading_pair, 1, OrderType.LIMIT, 101)
+        self.assertEqual(2, len(self.market.limit_orders))
+
+        # The trade volume past the queue fills the orders in the order they were placed.
+        self.apply_trade(TradeType.BUY, 101, 6)
+        self.assertEqual([Decimal(1)], self.filled_amounts())
+        self.assertEqual(first_order_id, self.market_logger.event_log[0].order_id)
+        self.assertEqual([second_order_id], [order.client_order_id for order in self.market.limit_orders])
+        self.assertEqual(0, self.market.queue_positions[second_order_id].volume_ahead)
+
+        self.market.cancel(self.trading_pair, second_order_id)
+        self.assertEqual({}, self.market.queue_positions)
+        self.assertEqual({}, self.order_book.pop_level_minimums(False))
+
+    def test_crossed_order_book(self):
+        order_id: str = self.market.buy(self.trading_pair, 2, OrderType.LIMIT, 100)
+        self.order_book.apply_numpy_diffs(np.empty((0, 3)), np.array([[100, 5, 101]], dtype=np.float64))
+        self.clock.backtest_til(1001.0)
+        self.assertEqual([Decimal(2)], self.filled_amounts())
+        self.assertNotIn(order_id, self.market.queue_positions)
+
+
+def main():
+    logging.basicConfig(level=logging.ERROR)
+    unittest.main()
+
+
+if __name__ == "__main__":
+    main()
@@ -3,7 +3,12 @@ import time
 from decimal import Decimal
 from typing import List, Dict
 import unittest
-from hummingbot.client.performance_analysis import calculate_asset_delta_from_trades, calculate_trade_performance
+from hummingbot.client.performance_analysis import (
+    calculate_asset_delta_from_trades,
+    calculate_trade_performance,
+    calculate_trade_performance_from_asset_deltas,
+    TradePerformanceAccumulator
+)
 from hummingbot.core.event.events import TradeFee, OrderType
 from hummingbot.core.utils.async_utils import (
     safe_ensure_future,
@@ -315,3 +320,44 @@ class TestTradePerformanceAnalysis(unittest.TestCase):
         self.assertDictEqual(expected_trade_performance_stats, trade_performance_stats)
         self.assertDictEqual(expected_markettrading_pair_stats_1, market_trading_pair_stats[self.trading_pair_tuple_1])
         self.assertDictEqual(expected_markettrading_pair_stats_2, market_trading_pair_stats[self.trading_pair_tuple_2])
+
+    def test_trade_performance_accumulator(self):
+        test_trades = [
+            ("BUY", 100, 2),
+            ("SELL", 110, 0.9),
+            ("BUY", 105, 0.5),
+            ("SELL", 120, 1)
+        ]
+        start_time = int(time.time() * 1e3) - 100000
+        self.save_trade_fill_records(test_trades, self.trading_pair_tuple_1, OrderType.MARKET.name, start_time,
+                                     self.strategy_1)
+        self.save_trade_fill_records(test_trades[:2], self.trading_pair_tuple_2, OrderType.MARKET.name, start_time,
+                                     "strategy_2")
+        raw_queried_trades = self.get_trades_from_session(start_time)
+        m_name_1 = self.trading_pair_tuple_1.market.name
+        m_name_2 = self.trading_pair_tuple_2.market.name
+        starting_balances = {"DAI": {m_name_1: Decimal("1000"), m_name_2: Decimal("500")},
+                             "WETH": {m_name_1: Decimal("5"), m_name_2: Decimal("1")}}
+        market_trading_pair_tuples = [self.trading_pair_tuple_1, self.trading_pair_tuple_2]
+
+        accumulator = TradePerformanceAccumulator()
+        for trade in raw_queried_trades:
+            accumulator.add_trade(trade)
+            expected = calculate_trade_performance(
+                self.strategy_1, market_trading_pair_tuples, raw_queried_trades[:raw_queried_trades.index(trade) + 1],
+                starting_balances
+            )
+            # Calculating the performance modifies the stats, which must not change the accumulated amounts.
+            for _ in range(2):
+                actual = calculate_trade_performance_from_asset_deltas(
+                    market_trading_pair_tuples,
+                    accumulator.asset_delta_stats(self.strategy_1, market_trading_pair_tuples),
+                    starting_balances
+                )
+                self.assertEqual(expected, actual)
+
+        # Trades of other strategies are not counted.
+        self.assertEqual(0, accumulator.asset_delta_stats(self.strategy_1, market_trading_pair_tuples)[
+            self.trading_pair_tuple_2]["trade_count"])
+        self.assertEqual(2, accumulator.asset_delta_stats("strategy_2", market_trading_pair_tuples)[
+            self.trading_pair_tuple_2]["trade_count"])
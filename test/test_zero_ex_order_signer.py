@@ -0,0 +1,165 @@
+#!/usr/bin/env python
+
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+
+import asyncio
+from eth_account import Account
+from eth_account.messages import defunct_hash_message
+from eth_utils import remove_0x_prefix
+import logging
+from typing import (
+    Any,
+    Dict,
+    List,
+    Tuple
+)
+import unittest
+from unittest.mock import patch
+
+from zero_ex.contract_wrappers.order_conversions import jsdict_to_order
+from zero_ex.order_utils import generate_order_hash_hex as zero_ex_generate_order_hash_hex
+
+from hummingbot.wallet.ethereum.web3_wallet_backend import Web3WalletBackend
+from hummingbot.wallet.ethereum.zero_ex.zero_ex_custom_utils_v3 import (
+    Order,
+    fix_signature,
+    generate_domain_struct_hash,
+    generate_order_hash,
+    generate_order_hash_hex,
+    jsdict_order_to_struct
+)
+from hummingbot.wallet.ethereum.zero_ex.zero_ex_order_signer import ZeroExOrderSigner
+
+
+def local_is_valid_signature(provider: Any, data: str, signature: str, signer_address: str, chain_id: int = 1) -> bool:
+    """
+    Checks an ETH_SIGN signature by recovering its signer, like the exchange contract does - without a network call.
+    """
+    signature_bytes: bytes = bytes.fromhex(remove_0x_prefix(signature))
+    if len(signature_bytes) != 66 or signature_bytes[65] != 3:
+        return False
+    v, r, s = signature_bytes[0], signature_bytes[1:33], signature_bytes[33:65]
+    recovered_address: str = Account.recoverHash(defunct_hash_message(hexstr=data), vrs=(v, r, s))
+    return recovered_address.lower() == signer_address.lower()
+
+
+class ZeroExOrderSignerUnitTest(unittest.TestCase):
+    private_key: str = "0xf2f48ee19680706196e2e339e5da3491186e0c4c5030670656b0e0164837257d"
+    exchange_address: str = "0x61935CbDd02287B511119DDb11Aeb42F1593b7Ef"
+    chain_id: int = 1
+
+    @classmethod
+    def setUpClass(cls):
+        cls.ev_loop: asyncio.BaseEventLoop = asyncio.get_event_loop()
+        cls.address: str = Account.privateKeyToAccount(cls.private_key).address
+        cls.wallet_backend: Web3WalletBackend = Web3WalletBackend(cls.private_key, "http://localhost:8545", [])
+
+    def setUp(self):
+        self.signer: ZeroExOrderSigner = ZeroExOrderSigner(self.private_key, self.exchange_address, self.chain_id,
+                                                           max_workers=2)
+
+    def tearDown(self):
+        self.signer.stop()
+
+    def unsigned_order(self, salt: int) -> Dict[str, Any]:
+        return {
+            "chainId": self.chain_id,
+            "exchangeAddress": self.exchange_address.lower(),
+            "makerAddress": self.address.lower(),
+            "takerAddress": "0x0000000000000000000000000000000000000000",
+            "feeRecipientAddress": "0xa258b39954cef5cb142fd567a46cddb31a670124",
+            "senderAddress": "0x0000000000000000000000000000000000000000",
+            "makerAssetAmount": "1000000000000000000",
+            "takerAssetAmount": str(180000000000000000000 + salt),
+            "makerFee": "0",
+            "takerFee": "0",
+            "expirationTimeSeconds": "1600000000",
+            "salt": str(salt),
+            "makerAssetData": "0xf47261b0000000000000000000000000c02aaa39b223fe8d0a0e5c4f27ead9083c756cc2",
+            "takerAssetData": "0xf47261b00000000000000000000000006b175474e89094c44da98b954eedeac495271d0f",
+            "makerFeeAssetData": "0x",
+            "takerFeeAssetData": "0x"
+        }
+
+    def expected_signature(self, order_hash_hex: str) -> str:
+        # The signature of the connectors before ZeroExOrderSigner, with the contract check done locally.
+        with patch("hummingbot.wallet.ethereum.zero_ex.zero_ex_custom_utils_v3.is_valid_signature",
+                   local_is_valid_signature):
+            return fix_signature(None, self.address, order_hash_hex,
+                                 self.wallet_backend.sign_hash(hexstr=order_hash_hex), self.chain_id)
+
+    def test_order_hash(self):
+        # Inputs and expected result from @0x/order-utils/test/order_hash_test.ts
+        zero_order: Order = Order(
+            makerAddress="0x0000000000000000000000000000000000000000",
+            takerAddress="0x0000000000000000000000000000000000000000",
+            feeRecipientAddress="0x0000000000000000000000000000000000000000",
+            senderAddress="0x0000000000000000000000000000000000000000",
+            makerAssetAmount="0",
+            takerAssetAmount="0",
+            makerFee="0",
+            takerFee="0",
+            expirationTimeSeconds="0",
+            salt="0",
+            makerAssetData=bytes(20),
+            takerAssetData=bytes(20),
+            makerFeeAssetData=bytes(20),
+            takerFeeAssetData=bytes(20),
+        )
+        domain_struct_hash: bytes = generate_domain_struct_hash("0x1dc4c1cefef38a777b15aa20260a54e584b16c48", 1337)
+        self.assertEqual("cb36e4fedb36508fb707e2c05e21bffc7a72766ccae93f8ff096693fff7f1714",
+                         generate_order_hash(zero_order, domain_struct_hash).hex())
+
+        for salt in (0, 1, 1588888888123):
+            unsigned_order: Dict[str, Any] = self.unsigned_order(salt)
+            order_hash_hex: str = generate_order_hash(unsigned_order, self.signer.domain_struct_hash).hex()
+            # The hash of the Bamboo Relay connector, and of the Radar Relay connector with the 0x library.
+            self.assertEqual(generate_order_hash_hex(jsdict_order_to_struct(unsigned_order),
+                                                     self.exchange_address.lower(),
+                                                     self.chain_id),
+                             order_hash_hex)
+            self.assertEqual(zero_ex_generate_order_hash_hex(jsdict_to_order(unsigned_order),
+                                                             self.exchange_address.lower(),
+                                                             self.chain_id),
+                             order_hash_hex)
+
+    def test_sign_orders(self):
+        unsigned_orders: List[Dict[str, Any]] = [self.unsigned_order(salt) for salt in range(5)]
+        results: List[Tuple[str, str]] = self.ev_loop.run_until_complete(
+            asyncio.gather(*self.signer.sign_orders(unsigned_orders)))
+        batched_results: List[Tuple[str, str]] = self.ev_loop.run_until_complete(
+            asyncio.gather(*[self.signer.sign_order(unsigned_order) for unsigned_order in unsigned_orders]))
+        self.assertEqual(results, batched_results)
+
+        for unsigned_order, (order_hash_hex, signature) in zip(unsigned_orders, results):
+            self.assertEqual("0x" + generate_order_hash_hex(jsdict_order_to_struct(unsigned_order),
+                                                            self.exchange_address.lower(),
+                                                            self.chain_id),
+                             order_hash_hex)
+            self.assertEqual(self.expected_signature(order_hash_hex), signature)
+
+    def test_verify_signature(self):
+        signer: ZeroExOrderSigner = ZeroExOrderSigner(self.private_key, self.exchange_address, self.chain_id,
+                                                      max_workers=1, verify_provider=object())
+        try:
+            with patch("hummingbot.wallet.ethereum.zero_ex.zero_ex_order_signer.is_valid_signature",
+                       local_is_valid_signature):
+                order_hash_hex, signature = self.ev_loop.run_until_complete(
+                    signer.sign_order(self.unsigned_order(0)))
+                self.assertEqual(self.expected_signature(order_hash_hex), signature)
+            with patch("hummingbot.wallet.ethereum.zero_ex.zero_ex_order_signer.is_valid_signature",
+                       lambda *args: False):
+                with self.assertRaises(ValueError):
+                    self.ev_loop.run_until_complete(signer.sign_order(self.unsigned_order(1)))
+        finally:
+            signer.stop()
+
+
+def main():
+    logging.basicConfig(level=logging.ERROR)
+    unittest.main()
+
+
+if __name__ == "__main__":
+    main()